@@ -6,10 +6,13 @@ import Link from 'next/link'
 import { ChevronRight } from 'lucide-react'
 import RaportCharts from './RaportCharts'
 import KpiHero from './KpiHero'
+import { prisma } from '@/lib/prisma'
 
 const PUBLISHED = '2026-05-11'
 const DATA_DATE = 'marzec 2026'
 
+export const revalidate = 3600
+
 export const metadata: Metadata = {
   title: 'Raport: Dostępność DPS w Małopolsce 2026 | Kompas Seniora',
   description: 'Kompleksowa analiza dostępności i kosztów Domów Pomocy Społecznej w 22 powiatach Małopolski. Wskaźniki nasycenia, luka finansowa, trendy cenowe 2020–2026.',
@@ -76,7 +79,47 @@ function loadWojewodztwa(): WojRow[] {
   }))
 }
 
-function loadSaturation(): PowiatRow[] {
+// Wiersze z tabeli PowiatStats (scripts/refresh-powiat-stats.py) — jeden wiersz
+// na powiat, indeks (wojewodztwo, rok). Bierzemy najnowszy rok, jaki zapisał skrypt
+// (on sam wybiera ostatni rok z kostki GUS). CSV zostaje jako zapas, gdy tabela pusta.
+async function loadPowiatStats(): Promise<PowiatRow[]> {
+  try {
+    const latest = await prisma.powiatStats.findFirst({
+      where:   { wojewodztwo: 'małopolskie' },
+      orderBy: { rok: 'desc' },
+      select:  { rok: true },
+    })
+    if (!latest) return []
+    const rows = await prisma.powiatStats.findMany({
+      where: { wojewodztwo: 'małopolskie', rok: latest.rok },
+    })
+    return rows
+      .map(r => ({
+        powiat:               r.powiat,
+        dps_placowki:         r.dps_placowki,
+        dps_miejsca:          r.dps_miejsca,
+        pop_80plus_2024:      r.pop80 ?? 0,
+        pop_80plus_prog2035:  r.pop80_2035 ?? 0,
+        dostepnosc_2024:      r.dostepnosc ?? 0,
+        dostepnosc_2035:      r.dostepnosc_2035 ?? 0,
+        cena_dps_mediana:     r.cena_mediana,
+        n_placowek_z_cena:    r.n_cen,
+        emerytura_malopolska: r.emerytura ?? 0,
+        luka_miesieczna_zl:   r.luka,
+        luka_roczna_zl:       r.luka !== null ? r.luka * 12 : null,
+      }))
+      .filter(r => r.dostepnosc_2024 > 0)
+      .sort((a, b) => a.dostepnosc_2024 - b.dostepnosc_2024)
+  } catch (err) {
+    console.error('PowiatStats query failed, falling back to CSV:', err)
+    return []
+  }
+}
+
+async function loadSaturation(): Promise<PowiatRow[]> {
+  const fromDb = await loadPowiatStats()
+  if (fromDb.length > 0) return fromDb
+
   const file = path.join(process.cwd(), 'data', 'wskaznik_nasycenia_malopolska.csv')
   const content = fs.readFileSync(file, 'utf-8')
   const { data } = parse(content, { header: true, skipEmptyLines: true })
@@ -149,8 +192,8 @@ function formatPowiat(s: string) {
   return s.charAt(0).toUpperCase() + s.slice(1)
 }
 
-export default function RaportPage() {
-  const powiaty      = loadSaturation()
+export default async function RaportPage() {
+  const powiaty      = await loadSaturation()
   const emerytury    = loadEmerytury()
   const cenaDps      = loadCenaDps()
   const wojewodztwa  = loadWojewodztwa()
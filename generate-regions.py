@@ -1,8 +1,59 @@
 import re
+import sys
 import json
+from pathlib import Path
+
+import numpy as np
+
+# skrypt leży w katalogu głównym i (kopia) w src/data — scripts/ szukamy w górę
+HERE = Path(__file__).resolve().parent
+ROOT = next(p for p in (HERE, *HERE.parents) if (p / 'scripts' / 'geometry.py').exists())
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from geometry import centroid, polylabel
+
+SOURCE = ROOT / 'src' / 'data' / 'paths-output.txt'
+LABEL_PRECISION = 0.5
+
+
+def path_rings(d: str) -> list[np.ndarray]:
+    """
+    Ścieżka SVG z samych odcinków (M/m, L/l, H/h, V/v, Z/z) → pierścienie we
+    współrzędnych bezwzględnych. Liczby po „m” to kolejne odcinki względne.
+    """
+    rings, ring = [], []
+    x = y = 0.0
+    start = (0.0, 0.0)
+    for cmd, args in re.findall(r'([MmLlHhVvZz])([^MmLlHhVvZz]*)', d):
+        nums = [float(n) for n in re.findall(r'-?(?:\d+\.?\d*|\.\d+)(?:e-?\d+)?', args)]
+        if cmd in 'Zz':
+            if len(ring) >= 3:
+                rings.append(np.array(ring))
+            ring, (x, y) = [], start
+            continue
+        rel = cmd.islower()
+        if cmd in 'Hh':
+            steps = [((x if rel else 0) + n, y) for n in nums]
+        elif cmd in 'Vv':
+            steps = [(x, (y if rel else 0) + n) for n in nums]
+        else:
+            steps = []
+            for dx, dy in zip(nums[::2], nums[1::2]):
+                steps.append((x + dx, y + dy) if rel else (dx, dy))
+                x, y = steps[-1]
+        if cmd in 'Mm':
+            if len(ring) >= 3:
+                rings.append(np.array(ring))
+            ring, start = [], steps[0]
+        for x, y in steps:
+            ring.append((x, y))
+    if len(ring) >= 3:
+        rings.append(np.array(ring))
+    return rings
+
 
 # Wczytaj plik
-with open('paths-output.txt', 'r', encoding='utf-8') as f:
+with open(SOURCE, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Wyciągnij wszystkie regiony używając regex
@@ -14,15 +65,10 @@ for match in re.finditer(pattern, content, re.DOTALL):
     name = match.group(2)
     d = match.group(3)
     
-    # Oblicz prosty centroid (środek bounding box)
-    coords = re.findall(r'(-?\d+\.?\d*)', d)
-    coords = [float(c) for c in coords]
-    
-    x_coords = coords[::2]
-    y_coords = coords[1::2]
-    
-    centroid_x = (min(x_coords) + max(x_coords)) / 2
-    centroid_y = (min(y_coords) + max(y_coords)) / 2
+    # Środek ciężkości (ważony polem) i punkt na etykietę (biegun niedostępności)
+    rings = path_rings(d)
+    centroid_x, centroid_y = centroid(rings)
+    label_x, label_y = polylabel(rings, LABEL_PRECISION)
     
     # Określ status
     active = (region_id == 'PL-MA')
@@ -32,7 +78,8 @@ for match in re.finditer(pattern, content, re.DOTALL):
         'id': region_id,
         'name': name,
         'd': d,
-        'centroid': {'x': round(centroid_x, 2), 'y': round(centroid_y, 2)},
+        'centroid': {'x': round(float(centroid_x), 2), 'y': round(float(centroid_y), 2)},
+        'label': {'x': round(float(label_x), 2), 'y': round(float(label_y), 2)},
         'active': active,
         'upcoming': upcoming
     })
@@ -43,6 +90,7 @@ print('  id: string;')
 print('  name: string;')
 print('  d: string;')
 print('  centroid: { x: number; y: number };')
+print('  label: { x: number; y: number };')
 print('  active?: boolean;')
 print('  upcoming?: boolean;')
 print('}')
@@ -56,7 +104,8 @@ for i, region in enumerate(regions):
     print(f"    id: '{region['id']}',")
     print(f"    name: '{region['name']}',")
     print(f"    d: '{region['d']}',")
-    print(f"    centroid: {{ x: {region['centroid']['x']}, y: {region['centroid']['y']} }}", end='')
+    print(f"    centroid: {{ x: {region['centroid']['x']}, y: {region['centroid']['y']} }},")
+    print(f"    label: {{ x: {region['label']['x']}, y: {region['label']['y']} }}", end='')
     
     if region['active']:
         print(',')
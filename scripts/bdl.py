@@ -0,0 +1,310 @@
+"""
+Klient API GUS BDL (Bank Danych Lokalnych) — wspólny dla skryptów fetch-gus-*
+i monitorów.
+
+Każdy skrypt budował własne `requests.get` ze stałym `page-size`,
+`time.sleep(0.2)` między latami i jednym ręcznym retry. Żaden nie szedł za
+`links.next`, więc przy więcej niż 100 jednostkach (cała Polska: 380
+powiatów) wynik był po cichu ucinany, i żaden niczego nie pamiętał. Tu:
+
+  - stronicowanie — `page-size=100` (maksimum API) i dalej po `links.next`,
+    aż do ostatniej strony,
+  - limity — kubełek żetonów dla bdl.stat.gov.pl (scripts/rate_limit.py) w
+    tempie zależnym od tego, czy jest klucz `X-ClientId`; nagłówki
+    `X-Rate-Limit-Remaining` / `X-Rate-Limit-Reset` i `Retry-After`
+    wstrzymują zapytania do końca okna, zanim API zacznie odpowiadać 429,
+  - współbieżność adaptacyjna — kilka zapytań naraz; po 429 limit wątków
+    spada o połowę, po serii udanych odpowiedzi rośnie o jeden,
+  - ponowienia — 412 / 429 / 5xx i błędy sieci, wykładniczo z losowym
+    rozrzutem; po wyczerpaniu prób leci `requests.HTTPError` jak dotąd,
+  - cache na dysku `raw_dane/.bdl_cache/` — jeden plik JSON na (zmienna,
+    jednostka nadrzędna + poziom, rok), ze wszystkimi stronami. Dane
+    historyczne GUS praktycznie się nie zmieniają (`TTL_DAYS`), pusta
+    odpowiedź (rok jeszcze nieopublikowany) żyje krócej (`MISS_TTL_DAYS`).
+
+  client = BdlClient()
+  client.units(level=5)                               # powiaty całej Polski
+  client.data(76024, 2024, unit_level=5)              # [{id, name, values}]
+  client.data_many([(v, y, 5, None) for v in vars for y in years])
+
+Monitory tworzą klienta z `cache_dir=None` — mają zobaczyć świeżą odpowiedź.
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from rate_limit import HostLimiter
+
+BASE_URL  = "https://bdl.stat.gov.pl/api/v1"
+BDL_HOST  = "bdl.stat.gov.pl"
+API_KEY   = os.environ.get("GUS_BDL_KEY", "")
+CACHE_DIR = Path(__file__).resolve().parent.parent / "raw_dane" / ".bdl_cache"
+
+PAGE_SIZE     = 100          # maksimum API
+TIMEOUT       = 30
+TTL_DAYS      = 180
+MISS_TTL_DAYS = 7
+
+# limity BDL: anonimowo 5 zapytań/s, z kluczem 10/s (plus okna 15 min / 12 h)
+RATE_ANON = (5, 5)
+RATE_KEY  = (10, 10)
+WORKERS   = 4
+
+RETRY_STATUS = {412, 429, 500, 502, 503, 504}
+MAX_RETRIES  = 5
+BACKOFF      = 1.0           # s, podwajane przy każdej próbie
+MAX_BACKOFF  = 60.0
+QUOTA_LOW    = 2             # tyle zostało w oknie → czekamy na reset
+
+
+def _header_number(value: str | None) -> float | None:
+    """Najmniejsza liczba z nagłówka ("12" albo "95, 980" — kilka okien naraz)."""
+    if not value:
+        return None
+    numbers = []
+    for part in value.split(","):
+        try:
+            numbers.append(float(part.strip()))
+        except ValueError:
+            continue
+    return min(numbers) if numbers else None
+
+
+def merge_units(*results: list[dict]) -> list[dict]:
+    """Scala wyniki by-variable z kilku zapytań (np. per rok) — jedna pozycja na jednostkę."""
+    merged: dict[str, dict] = {}
+    for result in results:
+        for unit in result:
+            uid = unit["id"]
+            if uid not in merged:
+                merged[uid] = {"id": uid, "name": unit["name"], "values": []}
+            merged[uid]["values"].extend(unit.get("values", []))
+    return list(merged.values())
+
+
+class Concurrency:
+    """Bramka z ruchomym limitem równoległych zapytań (AIMD: +1 po serii sukcesów, /2 po 429)."""
+
+    def __init__(self, maximum: int, grow_after: int = 10):
+        self.maximum = maximum
+        self.limit = maximum
+        self.active = 0
+        self.streak = 0
+        self.grow_after = grow_after
+        self.cond = threading.Condition()
+
+    def __enter__(self):
+        with self.cond:
+            while self.active >= self.limit:
+                self.cond.wait()
+            self.active += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+
+    def success(self):
+        with self.cond:
+            self.streak += 1
+            if self.streak >= self.grow_after and self.limit < self.maximum:
+                self.limit += 1
+                self.streak = 0
+                self.cond.notify_all()
+
+    def throttled(self):
+        with self.cond:
+            self.limit = max(1, self.limit // 2)
+            self.streak = 0
+
+
+class BdlClient:
+    """
+    Klient BDL. Jeden obiekt można dzielić między wątki (wspólny kubełek,
+    bramka współbieżności i pauza po wyczerpaniu limitu).
+    """
+
+    def __init__(self, api_key: str = API_KEY, cache_dir: Path | None = CACHE_DIR,
+                 workers: int = WORKERS, session: requests.Session | None = None,
+                 base_url: str = BASE_URL, ttl_days: float = TTL_DAYS,
+                 miss_ttl_days: float = MISS_TTL_DAYS, log=print):
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.session = session or requests.Session()
+        self.session.headers["Accept"] = "application/json"
+        if api_key:
+            self.session.headers["X-ClientId"] = api_key
+        rate = RATE_KEY if api_key else RATE_ANON
+        self.limiter = HostLimiter({BDL_HOST: rate}, default=rate)
+        self.gate = Concurrency(workers)
+        self.workers = workers
+        self.ttl = ttl_days * 86400
+        self.miss_ttl = miss_ttl_days * 86400
+        self.log = log
+        self.resume_at = 0.0             # time.monotonic(), do kiedy wstrzymujemy zapytania
+        self.lock = threading.Lock()
+        self.stats = {"cache": 0, "zapytania": 0, "ponowienia": 0}
+
+    # ── HTTP ──────────────────────────────────────────────────────────────────
+
+    def _pause(self, seconds: float):
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+    def _wait_for_quota(self):
+        while True:
+            with self.lock:
+                wait = self.resume_at - time.monotonic()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def _read_quota(self, response: requests.Response):
+        remaining = _header_number(response.headers.get("X-Rate-Limit-Remaining"))
+        reset = _header_number(response.headers.get("X-Rate-Limit-Reset"))
+        if remaining is not None and remaining <= QUOTA_LOW and reset:
+            # reset bywa podany jako znacznik czasu albo liczba sekund
+            seconds = reset - time.time() if reset > 1e9 else reset
+            if seconds > 0:
+                self.log(f"   ⏳ BDL: limit zapytań prawie wyczerpany — pauza {seconds:.0f} s")
+                self._pause(seconds)
+
+    def get(self, url: str, params: dict | None = None) -> dict:
+        """Jedna strona odpowiedzi (JSON) — z limitem, ponowieniami i odczytem nagłówków limitu."""
+        if not url.startswith("http"):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_quota()
+            self.limiter.acquire(url)
+            with self.gate:
+                try:
+                    r = self.session.get(url, params=params, timeout=TIMEOUT)
+                except requests.RequestException:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    r = None
+            with self.lock:
+                self.stats["zapytania"] += 1
+
+            if r is not None:
+                self._read_quota(r)
+                if r.status_code not in RETRY_STATUS:
+                    r.raise_for_status()
+                    self.gate.success()
+                    return r.json()
+                if attempt == MAX_RETRIES:
+                    r.raise_for_status()
+                if r.status_code == 429:
+                    self.gate.throttled()
+                    retry_after = _header_number(r.headers.get("Retry-After"))
+                    if retry_after:
+                        self._pause(retry_after)
+
+            delay = min(MAX_BACKOFF, BACKOFF * 2 ** attempt) * random.uniform(0.5, 1.5)
+            status = r.status_code if r is not None else "błąd sieci"
+            self.log(f"   ↻ BDL {status} — ponowienie {attempt + 1}/{MAX_RETRIES} za {delay:.1f} s")
+            with self.lock:
+                self.stats["ponowienia"] += 1
+            time.sleep(delay)
+
+    def pages(self, path: str, params: dict) -> list[dict]:
+        """Wszystkie `results` zapytania — strona po stronie przez `links.next`."""
+        data = self.get(path, {**params, "page-size": PAGE_SIZE, "format": "json"})
+        results = list(data.get("results", []))
+        while (data.get("links") or {}).get("next"):
+            data = self.get(data["links"]["next"])
+            results.extend(data.get("results", []))
+        return results
+
+    # ── cache ─────────────────────────────────────────────────────────────────
+
+    def _cache_path(self, *key) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        name = "_".join(str(k) for k in key if k is not None)
+        digest = hashlib.sha256(f"{self.base_url}|{name}".encode()).hexdigest()[:8]
+        return self.cache_dir / f"{name}_{digest}.json"
+
+    def _cached(self, path: Path | None):
+        if path is None or not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        ttl = self.ttl if entry.get("results") else self.miss_ttl
+        if time.time() - entry.get("fetched", 0) > ttl:
+            return None
+        with self.lock:
+            self.stats["cache"] += 1
+        return entry["results"]
+
+    def _store(self, path: Path | None, url: str, params: dict, results: list):
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"url": url, "params": params, "fetched": time.time(),
+                                   "results": results}, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+    def _fetch(self, path: str, params: dict, key: tuple) -> list[dict]:
+        cache_path = self._cache_path(*key)
+        results = self._cached(cache_path)
+        if results is None:
+            results = self.pages(path, params)
+            self._store(cache_path, path, params, results)
+        return results
+
+    # ── zasoby API ────────────────────────────────────────────────────────────
+
+    def units(self, parent_id: str | None = None, level: int = 5) -> list[dict]:
+        """Jednostki terytorialne danego poziomu (2 = województwa, 5 = powiaty)."""
+        params = {"level": level}
+        if parent_id:
+            params["parent-id"] = parent_id
+        return self._fetch("units", params, ("units", parent_id, f"L{level}"))
+
+    def variable(self, variable_id: int) -> dict:
+        """Metadane zmiennej (m.in. `years` — lata z danymi). Zawsze z API."""
+        return self.get(f"variables/{variable_id}", {"format": "json"})
+
+    def data(self, variable_id: int, year: int | None = None, unit_level: int = 5,
+             parent_id: str | None = None) -> list[dict]:
+        """
+        Wartości zmiennej dla jednostek poziomu `unit_level` (opcjonalnie pod
+        `parent_id`) w roku `year` — None = wszystkie lata zmiennej.
+        """
+        params = {"unit-level": unit_level}
+        if parent_id:
+            params["unit-parentId"] = parent_id
+        if year is not None:
+            params["year"] = str(year)
+        key = (f"var{variable_id}", parent_id, f"L{unit_level}", year if year is not None else "all")
+        return self._fetch(f"data/by-variable/{variable_id}", params, key)
+
+    def data_iter(self, jobs: list[tuple]):
+        """
+        Wiele zapytań `data()` równolegle — `jobs` to krotki argumentów
+        (variable_id, year, unit_level, parent_id). Zwraca pary (krotka,
+        results) w kolejności ukończenia, więc wynik można zapisywać na bieżąco.
+        Trafienia z cache nie zajmują miejsca w bramce ani kubełka.
+        """
+        jobs = list(dict.fromkeys(jobs))
+        with ThreadPoolExecutor(self.workers) as pool:
+            futures = {pool.submit(self.data, *job): job for job in jobs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def data_many(self, jobs: list[tuple]) -> dict[tuple, list[dict]]:
+        """Jak `data_iter()`, ale wszystko naraz: {krotka: results}."""
+        return dict(self.data_iter(jobs))
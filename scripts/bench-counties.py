@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Mikro-benchmark przypisania punktów do powiatów: dotychczasowa pętla
+(`contains` po każdym wielokącie, `df.apply`) vs STRtree (scripts/counties.py).
+
+Dane syntetyczne: siatka nieregularnych wielokątów w obrysie Polski
+(domyślnie 380 — tyle, ile powiatów) i losowe punkty.
+
+Użycie:
+  python scripts/bench-counties.py
+  python scripts/bench-counties.py --points 50000 --counties 380
+"""
+
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+from shapely.geometry import Point, Polygon
+
+from counties import CountyIndex
+
+BBOX = (14.1, 49.0, 24.2, 54.9)   # lon/lat obrysu Polski
+
+
+def synthetic_features(n: int, vertices: int = 40, seed: int = 1) -> list[dict]:
+    """Komórki siatki z poszarpanymi brzegami (po `vertices` punktów na bok)."""
+    rng = np.random.default_rng(seed)
+    cols = int(np.ceil(np.sqrt(n)))
+    rows = int(np.ceil(n / cols))
+    w = (BBOX[2] - BBOX[0]) / cols
+    h = (BBOX[3] - BBOX[1]) / rows
+    features = []
+    for k in range(n):
+        x0, y0 = BBOX[0] + (k % cols) * w, BBOX[1] + (k // cols) * h
+        t = np.linspace(0, 1, vertices, endpoint=False)
+        ring = np.concatenate([
+            np.c_[x0 + t * w, np.full_like(t, y0)],
+            np.c_[np.full_like(t, x0 + w), y0 + t * h],
+            np.c_[x0 + w - t * w, np.full_like(t, y0 + h)],
+            np.c_[np.full_like(t, x0), y0 + h - t * h],
+        ]) + rng.normal(0, min(w, h) * 0.01, (4 * vertices, 2))
+        features.append({
+            'properties': {'terc': f"{k:04d}", 'name': f"powiat {k}"},
+            'geometry': Polygon(ring).buffer(0).__geo_interface__,
+        })
+    return features
+
+
+def assign_loop(df: pd.DataFrame, counties: list[dict]) -> pd.Series:
+    """Dotychczasowy algorytm z map_facilities_to_counties.py."""
+    def find_county(row):
+        p = Point(float(row['lng']), float(row['lat']))
+        for county in counties:
+            if county['polygon'].contains(p):
+                return county['name']
+        return None
+    return df.apply(find_county, axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark przypisania punktów do powiatów")
+    parser.add_argument('--points', type=int, default=20000)
+    parser.add_argument('--counties', type=int, default=380)
+    args = parser.parse_args()
+
+    features = synthetic_features(args.counties)
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({
+        'lng': rng.uniform(BBOX[0], BBOX[2], args.points),
+        'lat': rng.uniform(BBOX[1], BBOX[3], args.points),
+    })
+    print(f"{args.counties} wielokątów, {args.points} punktów")
+
+    start = time.perf_counter()
+    index = CountyIndex(features)
+    idx = index.assign(df['lng'], df['lat'])
+    fast = pd.Series(index.lookup(idx, index.names))
+    t_fast = time.perf_counter() - start
+    print(f"  STRtree (z budową indeksu): {t_fast:8.3f} s")
+
+    counties = [{'name': n, 'polygon': g} for n, g in zip(index.names, index.geoms)]
+    start = time.perf_counter()
+    slow = assign_loop(df, counties)
+    t_slow = time.perf_counter() - start
+    print(f"  pętla contains + apply:     {t_slow:8.3f} s   (×{t_slow / t_fast:.0f})")
+
+    same = (fast.fillna('') == slow.fillna('')).mean()
+    print(f"  zgodność wyników: {same:.2%}")
+
+
+if __name__ == '__main__':
+    main()
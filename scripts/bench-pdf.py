@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Mikro-benchmark odczytu wykazu DPS (PDF): dotychczasowa ścieżka monitora
+(osobne otwarcie na datę stanu + szeregowe extract_tables) vs `read_pdf`
+(jedno otwarcie, strony w puli procesów).
+
+Użycie:
+  python scripts/bench-pdf.py                          # data/wykaz_dps_malopolska_2026.pdf
+  python scripts/bench-pdf.py plik.pdf --workers 4 --repeat 3
+"""
+
+import os
+import time
+import argparse
+from io import BytesIO
+from pathlib import Path
+
+from monitors.pdf import read_pdf
+from monitors.dps_pdf import extract_pdf_rows, extract_doc_date
+
+DEFAULT_PDF = Path(__file__).parent.parent / "data" / "wykaz_dps_malopolska_2026.pdf"
+
+
+def old_path(data: bytes) -> tuple[int, str | None]:
+    """Jak monitor przed zmianą: PDF otwierany dwa razy, strony szeregowo."""
+    import pdfplumber
+    with pdfplumber.open(BytesIO(data)) as pdf:
+        header = pdf.pages[0].extract_text() or ""
+    with pdfplumber.open(BytesIO(data)) as pdf:
+        tables = [page.extract_tables() or [] for page in pdf.pages]
+    return len(extract_pdf_rows({"tables": tables})), extract_doc_date(header)
+
+
+def new_path(data: bytes, workers: int) -> tuple[int, str | None]:
+    content = read_pdf(data, workers=workers)
+    return len(extract_pdf_rows(content)), extract_doc_date(content["header"])
+
+
+def timed(fn, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark odczytu PDF (szeregowo vs równolegle)")
+    parser.add_argument("pdf", nargs="?", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = args.pdf.read_bytes()
+    print(f"📄 {args.pdf.name} ({len(data):,} B), rdzenie: {os.cpu_count()}, najlepszy z {args.repeat}\n")
+
+    variants = [("szeregowo, 2 otwarcia (stara ścieżka)", lambda: old_path(data)),
+                ("read_pdf, 1 proces", lambda: new_path(data, 1))]
+    if args.workers > 1:
+        variants.append((f"read_pdf, {args.workers} procesy", lambda: new_path(data, args.workers)))
+
+    baseline = None
+    for label, fn in variants:
+        seconds, (rows, doc_date) = timed(fn, args.repeat)
+        baseline = baseline or seconds
+        print(f"  {label:<40} {seconds:6.2f} s  ×{baseline / seconds:4.2f}  "
+              f"({rows} rekordów, stan na {doc_date})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Mikro-benchmark parsowania XLSX wolnych miejsc: pełny model openpyxl
+vs strumieniowy odczyt (scripts/monitors/xlsx.py).
+
+Każdy tryb działa w osobnym procesie, żeby szczytowe RSS (ru_maxrss)
+nie mieszało się między trybami.
+
+Użycie:
+  python scripts/bench-xlsx.py                       # archiwum raw_dane/malopolskie/
+  python scripts/bench-xlsx.py plik1.xlsx plik2.xlsx
+  python scripts/bench-xlsx.py --repeat 10
+"""
+
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+from pathlib import Path
+
+RAW_DANE_DIR = Path(__file__).parent.parent / "raw_dane" / "malopolskie"
+
+
+def parse_full(data: bytes):
+    """Dotychczasowy parser: load_workbook w trybie domyślnym + lista wszystkich wierszy."""
+    from io import BytesIO
+    import openpyxl
+    wb = openpyxl.load_workbook(BytesIO(data))
+    all_rows = [
+        [str(c).strip() if c is not None else "" for c in row]
+        for row in wb.active.iter_rows(values_only=True)
+    ]
+    title = next((c for row in all_rows[:8] for c in row if "stan na" in c.lower()), "")
+    header_idx = 0
+    for i, row in enumerate(all_rows[:6]):
+        if any("lp" in c.lower() or "powiat" in c.lower() for c in row if c):
+            header_idx = i
+            break
+    rows = [r for r in all_rows[header_idx + 1:] if any(c for c in r)]
+    return all_rows[header_idx], rows, title
+
+
+def parse_stream(data: bytes):
+    from monitors.malopolskie import parse_xlsx
+    return parse_xlsx(data)
+
+
+def worker(mode: str, files: list[str], repeat: int):
+    import openpyxl  # noqa: F401 — te same importy w obu trybach, żeby RSS był porównywalny
+    import monitors.malopolskie  # noqa: F401
+    parse = parse_full if mode == "full" else parse_stream
+    blobs = [Path(f).read_bytes() for f in files]
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    parse(blobs[0])  # rozgrzewka
+
+    start = time.perf_counter()
+    rows = 0
+    for _ in range(repeat):
+        for data in blobs:
+            rows += len(parse(data)[1])
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "mode": mode,
+        "seconds": elapsed,
+        "per_file_ms": elapsed / (repeat * len(blobs)) * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "base_rss_mb": base_rss / 1024,
+        "rows": rows,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsowania XLSX (pełny vs strumieniowy)")
+    parser.add_argument("files", nargs="*", help="pliki XLSX (domyślnie archiwum Małopolski)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--worker", choices=["full", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    files = args.files or [str(p) for p in sorted(RAW_DANE_DIR.glob("wolne_miejsca_dps_*.xlsx"))]
+    if not files:
+        print(f"❌ Brak plików XLSX w {RAW_DANE_DIR}")
+        sys.exit(1)
+
+    if args.worker:
+        worker(args.worker, files, args.repeat)
+        return
+
+    print(f"📊 {len(files)} plików × {args.repeat} powtórzeń\n")
+    results = {}
+    for mode in ("full", "stream"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--worker", mode, "--repeat", str(args.repeat), *files],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"{'tryb':<8} {'czas [s]':>9} {'ms/plik':>8} {'RSS szczyt [MB]':>16} {'przyrost [MB]':>14}")
+    for mode, r in results.items():
+        print(f"{mode:<8} {r['seconds']:>9.2f} {r['per_file_ms']:>8.1f} "
+              f"{r['peak_rss_mb']:>16.1f} {r['peak_rss_mb'] - r['base_rss_mb']:>14.1f}")
+
+    full, stream = results["full"], results["stream"]
+    if full["rows"] != stream["rows"]:
+        print(f"\n⚠️ Różna liczba wierszy: {full['rows']} vs {stream['rows']}")
+    print(f"\n⏱️  Przyspieszenie: ×{full['seconds'] / stream['seconds']:.2f}")
+    grow_full = full["peak_rss_mb"] - full["base_rss_mb"]
+    grow_stream = stream["peak_rss_mb"] - stream["base_rss_mb"]
+    print(f"💾 Przyrost RSS przy parsowaniu: {grow_full:.1f} MB → {grow_stream:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Mapa gmin z gotowymi wskaźnikami (kartogram dostępności opieki) — kafelki
+TopoJSON per województwo i dla całego kraju.
+
+Generatory map kończyły się na powiatach (geojson_to_svg.py) i województwach
+(POLAND_REGIONS), a wskaźniki liczy refresh-powiat-stats.py per powiat —
+mapa cieplna per gmina wymagałaby zapytania do bazy o każdą gminę. Tu jedno
+uruchomienie łączy:
+
+  - placówki z "Placowka" (jedno zapytanie) przypisane do gmin punktem
+    w wielokącie (counties.CountyIndex na granicach gmin), a bez współrzędnych —
+    kod TERYT gminy po miejscowości (localities.py, SIMC),
+  - populację GUS BDL na poziomie gmin (poziom 6): 80+ (76024 + 76025) i wiek
+    poprodukcyjny (72293: 60+ K / 65+ M — ta sama miara co w fetch-gus-bdl.py),
+    klientem bdl.py z cache w raw_dane/.bdl_cache/,
+  - granice gmin (counties.load_poland_gminy(), zapisywane raz w raw_dane/),
+    uproszczone na wspólnych łukach i rzutowane jak warstwy powiatów
+    (geojson_to_svg.Layer).
+
+Wynik:
+  public/data/gminy/PL-MA.<hash>.json  — TopoJSON gmin województwa (viewBox 600 px)
+  public/data/gminy/PL.<hash>.json     — wszystkie gminy kraju
+  src/data/gminy-manifest.ts           — spis kafelków, rok danych i wskaźniki
+                                         z progami klas (kwantyle w skali kraju)
+
+TopoJSON według specyfikacji: łuk wspólny dla sąsiednich gmin zapisany raz,
+współrzędne całkowite w jednostkach 0,1 px (`transform`) i przyrostowe, więc
+dekoduje je topojson-client (`feature()`), a rysuje d3-geo z `geoIdentity()`.
+Wskaźniki są w `properties` gminy — front nie pyta bazy.
+
+Użycie:
+  DATABASE_URL=... python scripts/build-gminy-map.py
+  DATABASE_URL=... python scripts/build-gminy-map.py --rok 2023 --projection puwg1992
+"""
+
+import sys
+import json
+import time
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+import gus
+from bdl import BdlClient
+from counties import CountyIndex, POLAND_GMINY_URL, load_poland_gminy
+from geojson_to_svg import (MIN_RING_AREA, PRECISION, PROJECTION, REGION_CODES, WIDTH,
+                            Layer, write_chunk)
+from geometry import PROJECTIONS
+from localities import load as load_localities, norm
+from monitors.core import DATABASE_URL, require
+
+ROOT        = Path(__file__).resolve().parent.parent
+TILES_DIR   = ROOT / 'public' / 'data' / 'gminy'
+TILES_URL   = '/data/gminy'
+MANIFEST_TS = ROOT / 'src' / 'data' / 'gminy-manifest.ts'
+NATIONAL    = "PL"
+
+# gminy są kilka razy mniejsze od powiatów — mniejsza tolerancja niż geojson_to_svg.TOLERANCE
+TOLERANCE = {"wojewodztwo": 0.25, "polska": 0.4}
+
+POP_ROK     = 2024
+GMINA_LEVEL = 6
+# miara → zmienne BDL sumowane per gmina (jak HIST_MEASURES w fetch-gus-bdl.py)
+POP_VARS = {"pop80": (76024, 76025), "poprod": (72293,)}
+# rodzaj gminy w TERYT: 4/5 — miasto / obszar wiejski gminy miejsko-wiejskiej,
+# 8/9 — dzielnica / delegatura; BDL podaje je obok całej gminy
+GMINA_PARTS = ('4', '5')
+CITY_PARTS  = ('8', '9')
+PER_10K     = 10_000
+
+FACILITIES_SQL = """
+    SELECT id, typ_placowki, liczba_miejsc, miejscowosc, gmina, powiat, wojewodztwo,
+           latitude, longitude
+    FROM "Placowka"
+"""
+# typ_placowki → przedrostek liczników w properties
+TYPES = {"DPS": "dps", "ŚDS": "sds"}
+COUNTS = ("placowki", "miejsca", "dps", "dps_miejsca", "sds", "sds_miejsca")
+
+# wskaźniki kartogramu: (klucz w properties, etykieta, jednostka)
+METRICS = [
+    ("dostepnosc",      "Miejsca w DPS na 10 tys. osób 80+",                  "miejsc / 10 tys."),
+    ("placowki_na_10k", "Placówki na 10 tys. osób w wieku poprodukcyjnym",    "placówek / 10 tys."),
+    ("pop80",           "Ludność 80+",                                         "osób"),
+]
+CLASSES = 5
+
+
+def gmina_code(terc: str) -> str:
+    """Kod TERYT gminy (7 znaków) z właściwości granic („1201011”, „1201011.0” itp.)."""
+    return "".join(c for c in str(terc) if c.isdigit())[:7]
+
+
+# ── placówki ──────────────────────────────────────────────────────────────────
+
+def load_facilities(conn) -> list[dict]:
+    cur = conn.cursor()
+    cur.execute(FACILITIES_SQL)
+    columns = [c[0] for c in cur.description]
+    rows = [dict(zip(columns, r)) for r in cur.fetchall()]
+    cur.close()
+    return rows
+
+
+def assign_gminy(rows: list[dict], index: CountyIndex, codes: list[str]) -> list[str | None]:
+    """Kod gminy każdej placówki: ze współrzędnych, a bez nich — po miejscowości (SIMC)."""
+    lons = np.array([np.nan if r["longitude"] is None else r["longitude"] for r in rows], dtype=float)
+    lats = np.array([np.nan if r["latitude"] is None else r["latitude"] for r in rows], dtype=float)
+    result = index.lookup(index.assign(lons, lats), codes)
+
+    localities = load_localities()
+    for i, r in enumerate(rows):
+        if result[i] is not None or not r["miejscowosc"]:
+            continue
+        loc = localities.resolve(r["miejscowosc"], powiat=r["powiat"], gmina=r["gmina"])
+        # SIMC bywa wyciągiem dla jednego województwa — ta sama nazwa gdzie indziej to nie trafienie
+        if loc and norm(loc["wojewodztwo"]) == norm(r["wojewodztwo"]):
+            result[i] = loc["teryt_gmina"]
+    return result
+
+
+def facility_stats(rows: list[dict], gminy: list[str | None]) -> dict[str, dict]:
+    """{kod gminy: liczniki COUNTS} — placówki wszystkich typów, osobno DPS i ŚDS."""
+    stats = defaultdict(lambda: dict.fromkeys(COUNTS, 0))
+    for r, code in zip(rows, gminy):
+        if code is None:
+            continue
+        s, miejsca = stats[code], r["liczba_miejsc"] or 0
+        s["placowki"] += 1
+        s["miejsca"] += miejsca
+        prefix = TYPES.get(r["typ_placowki"])
+        if prefix:
+            s[prefix] += 1
+            s[f"{prefix}_miejsca"] += miejsca
+    return stats
+
+
+# ── populacja ─────────────────────────────────────────────────────────────────
+
+def load_population(client: BdlClient, rok: int) -> dict[str, dict]:
+    """
+    {kod gminy: {pop80, poprod}} z BDL — jedno zapytanie ogólnopolskie na
+    zmienną. Części gmin pomijamy; miasto podzielone na dzielnice / delegatury
+    bez własnego wiersza dostaje ich sumę.
+    """
+    jobs = {var: (var, rok, GMINA_LEVEL, None) for var_ids in POP_VARS.values() for var in var_ids}
+    results = client.data_many(list(jobs.values()))
+
+    pop, city_parts = defaultdict(dict), defaultdict(dict)
+    for measure, var_ids in POP_VARS.items():
+        for var in var_ids:
+            for unit in results[jobs[var]]:
+                code = gus.gmina_teryt(unit["id"])
+                if code[-1] in GMINA_PARTS:
+                    continue
+                target = city_parts[code[:4] + "011"] if code[-1] in CITY_PARTS else pop[code]
+                for val in unit.get("values", []):
+                    if int(val["year"]) == rok and val.get("val") is not None:
+                        target[measure] = target.get(measure, 0) + int(val["val"])
+    for code, values in city_parts.items():
+        pop.setdefault(code, values)
+    return pop
+
+
+# ── wskaźniki ─────────────────────────────────────────────────────────────────
+
+def gmina_properties(name: str, counts: dict, population: dict) -> dict:
+    """Właściwości gminy w kafelku; brak danych = brak klucza."""
+    pop80, poprod = population.get("pop80"), population.get("poprod")
+    props = {
+        "name":            name,
+        **counts,
+        "pop80":           pop80,
+        "poprod":          poprod,
+        "dostepnosc":      round(counts["dps_miejsca"] / pop80 * PER_10K, 1) if pop80 else None,
+        "placowki_na_10k": round(counts["placowki"] / poprod * PER_10K, 2) if poprod else None,
+    }
+    return {k: v for k, v in props.items() if v is not None}
+
+
+def class_breaks(values: list[float]) -> list[float]:
+    """Progi CLASSES klas (kwantyle wartości dodatnich); zero to osobna klasa „brak”."""
+    v = np.array([x for x in values if x], dtype=float)
+    if not len(v):
+        return []
+    q = np.quantile(v, np.linspace(0, 1, CLASSES + 1)[1:-1])
+    return sorted(set(np.round(q, 1).tolist()))
+
+
+# ── TopoJSON ──────────────────────────────────────────────────────────────────
+
+def quantized_arc(arc: np.ndarray) -> list[list[int]]:
+    """Łuk w jednostkach 10^-PRECISION px: pierwszy punkt wprost, dalej przesunięcia."""
+    q = np.round(arc * 10 ** PRECISION).astype(np.int64)
+    q = q[np.r_[True, np.any(q[1:] != q[:-1], axis=1)]]
+    if len(q) < 2:
+        q = np.vstack((q, q))       # łuk zwinięty do punktu — specyfikacja wymaga dwóch pozycji
+    return np.vstack((q[:1], np.diff(q, axis=0))).tolist()
+
+
+def topojson(layer: Layer, ids: list[str], properties: list[dict]) -> str:
+    """Gminy warstwy jako TopoJSON — tylko łuki zachowanych pierścieni, numerowane od nowa."""
+    kept = [layer.topo.kept(layer.arcs, i, MIN_RING_AREA) for i in range(len(layer.features))]
+    used = sorted({r if r >= 0 else ~r for rings in kept for ring in rings for r in ring})
+    number = {arc: i for i, arc in enumerate(used)}
+
+    def ref(r):
+        return number[r] if r >= 0 else ~number[~r]
+
+    geometries = []
+    for code, rings, props in zip(ids, kept, properties):
+        polygons = [[[ref(r) for r in ring]] for ring in rings]
+        if not polygons:
+            geometry = {"type": None}
+        elif len(polygons) == 1:
+            geometry = {"type": "Polygon", "arcs": polygons[0]}
+        else:
+            geometry = {"type": "MultiPolygon", "arcs": polygons}
+        geometries.append({**geometry, "id": code, "properties": props})
+
+    step = 10 ** -PRECISION
+    topology = {
+        "type": "Topology",
+        "bbox": [0, 0, WIDTH, round(layer.height, 2)],
+        "transform": {"scale": [step, step], "translate": [0, 0]},
+        "objects": {"gminy": {"type": "GeometryCollection", "geometries": geometries}},
+        "arcs": [quantized_arc(layer.arcs[i]) for i in used],
+    }
+    return json.dumps(topology, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+# ── zapis ─────────────────────────────────────────────────────────────────────
+
+def write_manifest(entries: list[dict], metrics: list[dict], rok: int, projection: str):
+    rows = ",\n".join("  " + json.dumps(e, ensure_ascii=False, separators=(",", ":")) for e in entries)
+    metric_rows = ",\n".join("  " + json.dumps(m, ensure_ascii=False, separators=(",", ":")) for m in metrics)
+    MANIFEST_TS.write_text(
+        "/* eslint-disable */\n"
+        "// Wygenerowane przez scripts/build-gminy-map.py — nie edytować ręcznie\n"
+        "export interface GminyTile {\n"
+        "  id: string;                                   // PL-MA … albo PL (cały kraj)\n"
+        "  name: string;\n"
+        "  file: string;                                 // URL kafelka TopoJSON (nazwa z hashem treści)\n"
+        "  hash: string;\n"
+        "  bbox: [number, number, number, number];       // lon/lat: zachód, południe, wschód, północ\n"
+        "  viewBox: string;\n"
+        "  count: number;                                // liczba gmin\n"
+        "}\n\n"
+        "// properties gminy w kafelku (objects.gminy); brak danych GUS = brak klucza\n"
+        "export interface GminaProperties {\n"
+        "  name: string;\n"
+        "  placowki: number;\n"
+        "  miejsca: number;\n"
+        "  dps: number;\n"
+        "  dps_miejsca: number;\n"
+        "  sds: number;\n"
+        "  sds_miejsca: number;\n"
+        "  pop80?: number;\n"
+        "  poprod?: number;                              // wiek poprodukcyjny (60+ K / 65+ M)\n"
+        "  dostepnosc?: number;                          // miejsca w DPS na 10 tys. osób 80+\n"
+        "  placowki_na_10k?: number;\n"
+        "}\n\n"
+        "export interface GminaMetric {\n"
+        "  key: keyof GminaProperties;\n"
+        "  label: string;\n"
+        "  unit: string;\n"
+        "  breaks: number[];                             // progi klas; 0 / brak — osobna klasa\n"
+        "}\n\n"
+        f"export const GMINY_ROK = {rok};\n"
+        f"export const GMINY_PROJECTION = '{projection}';\n\n"
+        f"export const GMINY_METRICS: GminaMetric[] = [\n{metric_rows}\n];\n\n"
+        f"export const GMINY_TILES: GminyTile[] = [\n{rows}\n];\n",
+        encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kafelki TopoJSON gmin ze wskaźnikami dostępności")
+    parser.add_argument("--rok", type=int, default=POP_ROK, help=f"rok populacji GUS (domyślnie {POP_ROK})")
+    parser.add_argument("--projection", choices=sorted(PROJECTIONS), default=PROJECTION,
+                        help=f"rzutowanie (domyślnie {PROJECTION}, jak mapy powiatów)")
+    args = parser.parse_args()
+
+    if not DATABASE_URL:
+        print("❌ Brak DATABASE_URL w środowisku!")
+        sys.exit(1)
+
+    print(f"🗺️  Granice gmin: {POLAND_GMINY_URL}")
+    features = [f for f in load_poland_gminy()['features'] if f.get('geometry')]
+    index = CountyIndex(features)
+    codes = [gmina_code(t) for t in index.ids]
+
+    psycopg2 = require("psycopg2", "psycopg2-binary")
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        rows = load_facilities(conn)
+    finally:
+        conn.close()
+    start = time.perf_counter()
+    gminy = assign_gminy(rows, index, codes)
+    stats = facility_stats(rows, gminy)
+    missing = sum(1 for g in gminy if g is None)
+    print(f"🏠 Placówki: {len(rows)}, w {len(stats)} gminach; bez gminy: {missing} "
+          f"({time.perf_counter() - start:.2f} s)")
+
+    client = BdlClient()
+    pop = load_population(client, args.rok)
+    no_pop = sum(1 for c in codes if "pop80" not in pop.get(c, {}))
+    print(f"📊 Populacja GUS {args.rok}: {len(pop)} gmin; gminy z granic bez danych 80+: {no_pop}")
+
+    empty = dict.fromkeys(COUNTS, 0)
+    properties = [gmina_properties(name, stats.get(c, empty), pop.get(c, {}))
+                  for c, name in zip(codes, index.names)]
+    metrics = [{"key": key, "label": label, "unit": unit,
+                "breaks": class_breaks([p.get(key) for p in properties])} for key, label, unit in METRICS]
+
+    def tile(region_id, name, members, tolerance):
+        start = time.perf_counter()
+        layer = Layer([features[i] for i in members], tolerance, args.projection)
+        text = topojson(layer, [codes[i] for i in members], [properties[i] for i in members])
+        url, digest, size = write_chunk(region_id, text, TILES_DIR, TILES_URL)
+        print(f"  {region_id:<6} {name:<22} {len(members):>5} gmin  {size / 1024:>7.1f} KB  "
+              f"{time.perf_counter() - start:>5.1f} s  {url}")
+        return {"id": region_id, "name": name, "file": url, "hash": digest,
+                "bbox": [round(float(v), 4) for v in layer.bbox], "viewBox": layer.view_box,
+                "count": len(members)}, size
+
+    by_woj = defaultdict(list)
+    for i, code in enumerate(codes):
+        by_woj[code[:2]].append(i)
+
+    entry, total = tile(NATIONAL, "Polska", list(range(len(features))), TOLERANCE["polska"])
+    entries = [entry]
+    for code in sorted(gus.WOJEWODZTWA):
+        if not by_woj.get(code):
+            print(f"  ⚠️  Brak gmin dla: {gus.WOJEWODZTWA[code]}")
+            continue
+        entry, size = tile(REGION_CODES[code], gus.WOJEWODZTWA[code], by_woj[code], TOLERANCE["wojewodztwo"])
+        entries.append(entry)
+        total += size
+
+    write_manifest(entries, metrics, args.rok, args.projection)
+    print(f"✅ {len(entries)} kafelków w {TILES_DIR} ({total / 1024:.1f} KB), "
+          f"spis: {MANIFEST_TS.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
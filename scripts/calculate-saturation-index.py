@@ -7,7 +7,7 @@ Konwencja (standard): miejsc DPS na 10 000 mieszkańców 80+
 Uwzględnia tylko DPS (nie ŚDS — ŚDS to nie tylko seniorzy).
 
 Źródła:
-  - GUS BDL 2024: data/gus_populacja_malopolska.csv (80+)
+  - GUS BDL 2024: data/gus_populacja_malopolska.csv (80+) — przez kostkę scripts/gus.py
   - Baza Kompas Seniora: Neon PostgreSQL (DPS, liczba_miejsc)
   - Ceny DPS: PlacowkaCena (mediana per powiat)
   - Emerytury: data/gus_emerytury_wojewodztwa.csv (Małopolska)
@@ -19,61 +19,21 @@ Metodologia: https://kompas-seniora.pl/raport/metodologia
 
 import csv
 import os
+import numpy as np
 import psycopg2
 from dotenv import load_dotenv
 
+import gus
+
 load_dotenv()
 
-GUS_CSV      = "data/gus_populacja_malopolska.csv"
 EMERY_CSV    = "data/gus_emerytury_wojewodztwa.csv"
 OUTPUT       = "data/wskaznik_nasycenia_malopolska.csv"
+WOJEWODZTWO  = "małopolskie"
 ROK_GUS      = 2024
 ROK_EMERY    = 2025   # najnowsze dostępne
 PER_10K      = 10_000
 
-POWIAT_MAP = {
-    "bocheński":    "Powiat bocheński",
-    "brzeski":      "Powiat brzeski",
-    "chrzanowski":  "Powiat chrzanowski",
-    "dąbrowski":    "Powiat dąbrowski",
-    "gorlicki":     "Powiat gorlicki",
-    "krakowski":    "Powiat krakowski",
-    "limanowski":   "Powiat limanowski",
-    "m. Kraków":    "Powiat m. Kraków",
-    "m. Nowy Sącz": "Powiat m. Nowy Sącz",
-    "m. Tarnów":    "Powiat m. Tarnów",
-    "miechowski":   "Powiat miechowski",
-    "myślenicki":   "Powiat myślenicki",
-    "nowosądecki":  "Powiat nowosądecki",
-    "nowotarski":   "Powiat nowotarski",
-    "olkuski":      "Powiat olkuski",
-    "oświęcimski":  "Powiat oświęcimski",
-    "proszowicki":  "Powiat proszowicki",
-    "suski":        "Powiat suski",
-    "tarnowski":    "Powiat tarnowski",
-    "tatrzański":   "Powiat tatrzański",
-    "wadowicki":    "Powiat wadowicki",
-    "wielicki":     "Powiat wielicki",
-}
-
-
-def load_gus_80plus(rok: int) -> dict[str, int]:
-    data = {}
-    with open(GUS_CSV, encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if int(row["rok"]) == rok and row["miara"] == "80plus" and row["typ"] == "historyczny":
-                data[row["powiat"]] = int(row["populacja"])
-    return data
-
-
-def load_gus_forecast(miara: str, rok: int) -> dict[str, int]:
-    data = {}
-    with open(GUS_CSV, encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if int(row["rok"]) == rok and row["miara"] == miara and row["typ"] == "prognoza":
-                data[row["powiat"]] = int(row["populacja"])
-    return data
-
 
 def load_emerytura_malopolska(rok: int) -> float | None:
     with open(EMERY_CSV, encoding="utf-8") as f:
@@ -134,42 +94,47 @@ def load_db_data() -> dict[str, dict]:
     return result
 
 
+def r1(x: float) -> float | None:
+    return None if np.isnan(x) else round(float(x), 1)
+
+
 if __name__ == "__main__":
     print("=== Wskaźnik dostępności DPS — Małopolska ===\n")
 
-    pop_80_2024   = load_gus_80plus(ROK_GUS)
-    pop_80_f2030  = load_gus_forecast("80plus", 2030)
-    pop_80_f2035  = load_gus_forecast("80plus", 2035)
-    pop_65_f2035  = load_gus_forecast("65plus", 2035)   # kontekst
-    emerytura     = load_emerytura_malopolska(ROK_EMERY)
-    db_data       = load_db_data()
+    cube      = gus.load()
+    emerytura = load_emerytura_malopolska(ROK_EMERY)
+    db_data   = load_db_data()
 
-    print(f"GUS 80+ {ROK_GUS}: {len(pop_80_2024)} powiatów")
+    print(f"GUS 80+ {ROK_GUS}: {int((~np.isnan(cube.pop('80plus', ROK_GUS))).sum())} powiatów")
     print(f"Emerytura Małopolska {ROK_EMERY}: {emerytura:,.0f} zł")
     print(f"Baza DB (DPS): {len(db_data)} powiatów\n")
 
-    rows_out = []
+    # Wektory w kolejności powiatów z bazy — jedno wyszukanie indeksów w kostce
+    db_powiaty = sorted(db_data)
+    idx = cube.take([(WOJEWODZTWO, p) for p in db_powiaty])
+    for p in np.array(db_powiaty)[idx < 0]:
+        print(f"  ⚠️  Brak mapowania: {p}")
 
-    for db_powiat, caps in sorted(db_data.items()):
-        gus_name   = POWIAT_MAP.get(db_powiat)
-        if not gus_name:
-            print(f"  ⚠️  Brak mapowania: {db_powiat}")
-            continue
+    pop_80   = np.nan_to_num(cube.lookup(cube.pop("80plus", ROK_GUS), idx))
+    pop_f30  = np.nan_to_num(cube.lookup(cube.pop("80plus", 2030, typ="prognoza"), idx))
+    pop_f35  = np.nan_to_num(cube.lookup(cube.pop("80plus", 2035, typ="prognoza"), idx))
+    miejsca  = np.array([db_data[p]["dps_miejsca"] for p in db_powiaty], dtype=float)
 
-        pop_80   = pop_80_2024.get(gus_name, 0)
-        pop_f30  = pop_80_f2030.get(gus_name, 0)
-        pop_f35  = pop_80_f2035.get(gus_name, 0)
-        miejsca  = caps["dps_miejsca"]
-        mediana  = caps["cena_mediana"]
+    # Wskaźnik: miejsc DPS na 10 000 osób 80+
+    # Wyższy = lepsza dostępność
+    def wsk(pop):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where((pop > 0) & (miejsca > 0), miejsca / pop * PER_10K, np.nan)
 
-        # Wskaźnik: miejsc DPS na 10 000 osób 80+
-        # Wyższy = lepsza dostępność
-        def wsk(pop):
-            return round(miejsca / pop * PER_10K, 1) if pop and miejsca else None
+    dost_24, dost_30, dost_35 = wsk(pop_80), wsk(pop_f30), wsk(pop_f35)
 
-        dostepnosc_2024 = wsk(pop_80)
-        dostepnosc_2030 = wsk(pop_f30)
-        dostepnosc_2035 = wsk(pop_f35)
+    rows_out = []
+
+    for i, db_powiat in enumerate(db_powiaty):
+        if idx[i] < 0:
+            continue
+        caps    = db_data[db_powiat]
+        mediana = caps["cena_mediana"]
 
         # Luka finansowa: cena DPS - emerytura (ile brakuje miesięcznie)
         luka_mies = round(mediana - emerytura) if mediana and emerytura else None
@@ -179,15 +144,15 @@ if __name__ == "__main__":
             "powiat":              db_powiat,
             # DPS
             "dps_placowki":        caps["dps_placowki"],
-            "dps_miejsca":         miejsca,
+            "dps_miejsca":         caps["dps_miejsca"],
             # Populacja 80+
-            "pop_80plus_2024":     pop_80,
-            "pop_80plus_prog2030": pop_f30,
-            "pop_80plus_prog2035": pop_f35,
+            "pop_80plus_2024":     int(pop_80[i]),
+            "pop_80plus_prog2030": int(pop_f30[i]),
+            "pop_80plus_prog2035": int(pop_f35[i]),
             # Wskaźnik dostępności (miejsc/10k seniorów 80+) — wyższy = lepszy
-            "dostepnosc_2024":     dostepnosc_2024,
-            "dostepnosc_2030":     dostepnosc_2030,
-            "dostepnosc_2035":     dostepnosc_2035,
+            "dostepnosc_2024":     r1(dost_24[i]),
+            "dostepnosc_2030":     r1(dost_30[i]),
+            "dostepnosc_2035":     r1(dost_35[i]),
             # Ceny DPS
             "cena_dps_mediana":    mediana,
             "cena_dps_srednia":    caps["cena_srednia"],
@@ -0,0 +1,110 @@
+"""
+Przypisanie punktów do powiatów — indeks przestrzenny (STRtree) zamiast pętli.
+
+`map_facilities_to_counties.py` sprawdzał każdy punkt z każdym wielokątem
+(`contains` w pętli, `df.apply` po wierszach). Dla 380 powiatów i dziesiątek
+tysięcy placówek to setki milionów testów. Tu:
+
+  - wielokąty powiatów trafiają do `shapely.STRtree` (drzewo prostokątów
+    ograniczających),
+  - wszystkie punkty idą jednym wywołaniem `tree.query(points, "intersects")`
+    — drzewo odsiewa powiaty po prostokątach, dokładny test robi GEOS w C,
+  - wynik to tablica indeksów powiatów (-1 = poza mapą / brak współrzędnych).
+
+Granice: `malopolskie-counties.geojson` (src/data) albo cała Polska — ten sam
+plik powiatów, który pobiera `geojson_to_svg.py` (zapisywany raz w raw_dane/);
+indeks działa tak samo na gminach (`load_poland_gminy()`, kody TERYT gmin).
+
+  index = CountyIndex.from_geojson(load_poland_counties())
+  idx = index.assign(lons, lats)           # numpy, jedna partia
+  index.names[idx[0]], index.ids[idx[0]]
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import requests
+from shapely import STRtree, points as make_points
+from shapely.geometry import shape
+
+ROOT = Path(__file__).resolve().parent.parent
+MALOPOLSKIE_GEOJSON = ROOT / 'src' / 'data' / 'malopolskie-counties.geojson'
+
+# powiaty całej Polski (properties: terc, name) — źródło także dla geojson_to_svg.py
+POLAND_COUNTIES_URL  = "https://raw.githubusercontent.com/jusuff/PolandGeoJson/main/data/poland.counties.json"
+POLAND_COUNTIES_PATH = ROOT / 'raw_dane' / 'poland.counties.json'
+# gminy całej Polski z tego samego zbioru (terc — 7 znaków TERYT) — build-gminy-map.py
+POLAND_GMINY_URL  = "https://raw.githubusercontent.com/jusuff/PolandGeoJson/main/data/poland.municipalities.json"
+POLAND_GMINY_PATH = ROOT / 'raw_dane' / 'poland.municipalities.json'
+
+NAME_KEYS = ('name', 'JPT_NAZWA_', 'nazwa')
+ID_KEYS   = ('terc', 'id', 'JPT_KOD_JE')
+
+
+def _load_cached(url: str, path: Path, what: str, refresh: bool) -> dict:
+    if refresh or not path.exists():
+        print(f"📥 Pobieram granice {what}: {url}")
+        r = requests.get(url, timeout=60)
+        r.raise_for_status()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(r.content)
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def load_poland_counties(refresh: bool = False) -> dict:
+    """GeoJSON powiatów Polski — z raw_dane/, a przy pierwszym użyciu (albo `refresh`) z sieci."""
+    return _load_cached(POLAND_COUNTIES_URL, POLAND_COUNTIES_PATH, "powiatów", refresh)
+
+
+def load_poland_gminy(refresh: bool = False) -> dict:
+    """GeoJSON gmin Polski — jak `load_poland_counties()`."""
+    return _load_cached(POLAND_GMINY_URL, POLAND_GMINY_PATH, "gmin", refresh)
+
+
+def _prop(props: dict, keys: tuple) -> str:
+    return next((str(props[k]) for k in keys if props.get(k) not in (None, '')), '')
+
+
+class CountyIndex:
+    def __init__(self, features: list[dict]):
+        self.names = [_prop(f['properties'], NAME_KEYS) for f in features]
+        self.ids   = [_prop(f['properties'], ID_KEYS) for f in features]
+        self.geoms = [shape(f['geometry']) for f in features]
+        self.tree  = STRtree(self.geoms)
+
+    @classmethod
+    def from_geojson(cls, source: dict | Path | str, prefix: str | None = None) -> 'CountyIndex':
+        """Indeks z pliku / słownika GeoJSON; `prefix` — tylko kody TERC od niego (np. '12')."""
+        data = source if isinstance(source, dict) else json.loads(Path(source).read_text(encoding='utf-8'))
+        features = data['features']
+        if prefix:
+            features = [f for f in features if _prop(f['properties'], ID_KEYS).startswith(prefix)]
+        return cls(features)
+
+    def __len__(self) -> int:
+        return len(self.geoms)
+
+    def assign(self, lons, lats) -> np.ndarray:
+        """
+        Indeks powiatu dla każdego punktu (-1 — poza wszystkimi / brak współrzędnych).
+        Punkt na wspólnej granicy dostaje powiat o niższym indeksie.
+        """
+        lons = np.asarray(lons, dtype=float)
+        lats = np.asarray(lats, dtype=float)
+        result = np.full(len(lons), -1, dtype=np.int64)
+        valid = np.flatnonzero(~(np.isnan(lons) | np.isnan(lats)))
+        if not len(valid) or not len(self.geoms):
+            return result
+        pts = make_points(lons[valid], lats[valid])
+        point_idx, county_idx = self.tree.query(pts, predicate='intersects')
+        # przy kilku trafieniach (granica) zostaje najniższy indeks powiatu
+        order = np.lexsort((county_idx, point_idx))
+        point_idx, county_idx = point_idx[order], county_idx[order]
+        first = np.r_[True, point_idx[1:] != point_idx[:-1]]
+        result[valid[point_idx[first]]] = county_idx[first]
+        return result
+
+    def lookup(self, idx: np.ndarray, values: list[str], missing=None) -> list:
+        """Indeksy z `assign()` → nazwy / kody (`values` = self.names albo self.ids)."""
+        return [values[i] if i >= 0 else missing for i in idx]
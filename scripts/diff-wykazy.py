@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Porównanie zapisanych wykazów urzędowych z tabelą "Placowka" — wszystkie naraz.
+
+Bierze najnowsze pliki z raw_dane/ (wykaz DPS w PDF, wykaz Senior+ i ŚDS w XLSX),
+sprowadza je do {klucz: wiersz} i porównuje przez odwzorowania z
+scripts/monitors/wykaz_diff.py — jednym zapytaniem do bazy dla wszystkich
+wykazów. Wynik PDF-a brany z magazynu raw_dane/.store (bez ponownego parsowania).
+
+Użycie:
+  DATABASE_URL=... python scripts/diff-wykazy.py                 # podsumowanie
+  DATABASE_URL=... python scripts/diff-wykazy.py dps-malopolskie --report
+  DATABASE_URL=... python scripts/diff-wykazy.py --sds "raw_dane/malopolskie/Wykaz ŚDS.xlsx"
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+
+import requests
+
+from monitors.core import DATABASE_URL, RAW_DANE, require
+from monitors.dps_pdf import DpsPdfMonitor, extract_pdf_rows
+from monitors.pdf import read_pdf
+from monitors.senior_plus import SeniorPlusMonitor, parse_xlsx as parse_senior_plus
+from monitors.wykaz_diff import (
+    WYKAZY, DPS_MALOPOLSKA, SDS_MALOPOLSKA, SENIOR_PLUS_MALOPOLSKA,
+    diff_all, count_diffs, report_sections, sql_patch,
+)
+from monitors.xlsx import iter_rows
+
+SDS_GLOB = "Wykaz środowiskowych domów samopomocy*.xlsx"
+
+
+def parse_sds_xlsx(path: Path) -> dict:
+    """
+    Wykaz ŚDS (MUW Kraków): {l.p.: {nazwa, telefon, miejsca}}.
+    Czytamy do sekcji „Kluby Samopomocy” — dalej numeracja zaczyna się od nowa.
+    """
+    rows = {}
+    for row in iter_rows(path):
+        lp = row[0].strip().rstrip(".")
+        if lp.lower().startswith("kluby"):
+            break
+        if not lp.isdigit() or len(row) < 11:
+            continue
+        adres = [line.strip() for line in row[2].splitlines() if line.strip()]
+        tel = re.search(r"tel[. ]*([\d /\-]+)", row[10])
+        rows[int(lp)] = {
+            "nazwa": adres[0] if adres else "",
+            "telefon": re.sub(r"\s+", " ", tel.group(1)).strip(" /-") if tel else None,
+            "miejsca": int(row[6]) if row[6].isdigit() else None,
+        }
+    return rows
+
+
+def latest(paths: list[Path]) -> Path | None:
+    return paths[-1] if paths else None
+
+
+def load_sources(session, sds: Path | None) -> list[tuple]:
+    """[(Wykaz, wiersze, plik)] dla wykazów, które mają zapisany plik."""
+    sources = []
+
+    dps = DpsPdfMonitor(session)
+    path = latest(dps.archived())
+    if path:
+        sources.append((DPS_MALOPOLSKA, extract_pdf_rows(dps.store.parse_file(path, read_pdf)), path))
+
+    senior = SeniorPlusMonitor(session)
+    path = latest(senior.archived())
+    if path:
+        rows, _ = senior.store.parse_file(path, parse_senior_plus)
+        sources.append((SENIOR_PLUS_MALOPOLSKA, rows, path))
+
+    path = sds or latest(sorted((RAW_DANE / "malopolskie").glob(SDS_GLOB)))
+    if path:
+        sources.append((SDS_MALOPOLSKA, parse_sds_xlsx(path), path))
+
+    return sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie wykazów urzędowych z bazą")
+    parser.add_argument("names", nargs="*", help=f"wykazy: {', '.join(WYKAZY)}")
+    parser.add_argument("--sds", type=Path, help="plik XLSX wykazu ŚDS (domyślnie najnowszy w raw_dane)")
+    parser.add_argument("--report", action="store_true", help="wypisz sekcje raportu i SQL patch")
+    args = parser.parse_args()
+
+    unknown = [n for n in args.names if n not in WYKAZY]
+    if unknown:
+        parser.error(f"nieznane wykazy: {', '.join(unknown)}")
+    if not DATABASE_URL:
+        print("❌ Brak DATABASE_URL w środowisku!")
+        sys.exit(1)
+
+    sources = [s for s in load_sources(requests.Session(), args.sds)
+               if not args.names or s[0].name in args.names]
+    for wykaz, rows, path in sources:
+        print(f"📄 {wykaz.name}: {path.name} ({len(rows)} rekordów)")
+
+    psycopg2 = require("psycopg2", "psycopg2-binary")
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        results = diff_all(conn, [(wykaz, rows) for wykaz, rows, _ in sources])
+    finally:
+        conn.close()
+
+    print("\n── Podsumowanie ──")
+    for name, diffs in results.items():
+        counts = "  ".join(f"{k}: {len(v)}" for k, v in diffs.items())
+        print(f"  {name:<24} razem: {count_diffs(diffs):>4}  {counts}")
+
+    if args.report:
+        for wykaz, _, _ in sources:
+            diffs = results[wykaz.name]
+            print(f"\n# {wykaz.name}\n")
+            print("\n".join(report_sections(wykaz, diffs)))
+            print(sql_patch(wykaz, diffs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Indeks placówek z tabeli "Placowka" do dopasowywania nazw z zewnętrznych
+wykazów (XLSX wolnych miejsc, PDF-y urzędów wojewódzkich).
+
+Dotychczas każdy wiersz XLSX był porównywany SequenceMatcherem z każdym DPS-em
+w bazie (O(N·M)), a nazwa z bazy normalizowana od nowa przy każdym porównaniu.
+Przy ~90 DPS-ach Małopolski to nie przeszkadza, przy wszystkich województwach
+(tysiące wierszy × tysiące placówek) już tak. Indeks liczy raz:
+
+  - znormalizowane nazwy i gotowe SequenceMatchery (tablica b2j po stronie bazy),
+  - odwrócony indeks trigramów znakowych,
+  - słowniki id → placówka, nazwa → placówka(i), powiat / adres / miejscowość → placówki.
+
+`match()` bierze z indeksu trigramów tylko placówki o wspólnym fragmencie nazwy,
+ocenia je od najbardziej obiecujących i odrzuca tanimi górnymi ograniczeniami
+(`real_quick_ratio`, `quick_ratio`) te, które nie mogą pobić najlepszego wyniku.
+Pełny `ratio()` liczymy dla nielicznych. Oceniane są tylko placówki o wspólnym
+trigramie z zapytaniem: zapytanie bez żadnego wspólnego trigramu daje
+(None, 0.0), gdzie dawna pętla zwracała najlepszy (słaby) wynik ze wszystkich.
+
+Użycie:
+  matcher = FacilityMatcher(db_rows, manual_by_id=..., manual_by_name=...)
+  row, score = matcher.match("Dom Pomocy Społecznej w Konarach, ul. ...")
+"""
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+NGRAM = 3
+
+
+# ── normalizacja ──────────────────────────────────────────────────────────────
+
+def norm_name(s: str) -> str:
+    """Normalizuj nazwę: małe litery, bez adresu (po przecinku), bez nadmiarowych spacji."""
+    s = re.sub(r'\s+', ' ', (s or '').strip().lower())
+    s = re.sub(r',.*$', '', s)   # usuń adres po pierwszym przecinku
+    s = re.sub(r'\bul\.\s*\S+.*$', '', s)  # usuń "ul. ..." z końca
+    s = s.strip().rstrip('.,- ')
+    return s
+
+
+def norm_ulica(s: str) -> str:
+    """Normalizuj adres do 'ostatnie_słowo_ulicy numer' dla porównania."""
+    s = re.sub(r'\s+', ' ', (s or '').lower().strip())
+    # Usuń prefix: ul., os., al., pl.
+    s = re.sub(r'^(ul\.|os\.|al\.|pl\.)\s*', '', s)
+    # Usuń tytuły i inicjały: dr., prof., im., św., A., J.
+    s = re.sub(r'\b(dr|prof|im|św|o)\b\.?\s*', '', s)
+    s = re.sub(r'\b[a-z]\.\s*', '', s)
+    s = s.strip()
+    # Wyciągnij: ostatnie słowo (≥4 liter) przed numerem + numer
+    m = re.search(r'(\w{4,})\s+(\d+[a-z]?)\b', s)
+    return f"{m.group(1)} {m.group(2)}" if m else s
+
+
+def similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def ngrams(s: str, n: int = NGRAM) -> set[str]:
+    """Trigramy znakowe (z odstępem na brzegach, żeby krótkie słowa też miały wagę)."""
+    s = f" {s} "
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+# ── indeks ────────────────────────────────────────────────────────────────────
+
+class FacilityMatcher:
+    """
+    Indeks placówek do dopasowań po nazwie, adresie i pojemności.
+
+    `rows` — słowniki z kolumnami co najmniej: id, nazwa, powiat
+    (opcjonalnie ulica, miejscowosc, liczba_miejsc). Kolejność wierszy rozstrzyga remisy
+    tak jak dotychczasowa pętla — wygrywa placówka wcześniejsza na liście.
+    """
+
+    def __init__(self, rows: list[dict], manual_by_id: dict[str, int] | None = None,
+                 manual_by_name: dict[str, str] | None = None, normalize=norm_name):
+        self.rows = rows
+        self.normalize = normalize
+        self.manual_by_id = manual_by_id or {}
+        self.manual_by_name = manual_by_name or {}
+
+        self.norms = [normalize(r['nazwa']) for r in rows]
+        self.by_id = {r['id']: r for r in rows}
+        self.by_norm: dict[str, dict] = {}
+        self.by_norm_all: dict[str, list[dict]] = defaultdict(list)
+        self.by_powiat: dict[str, list[dict]] = defaultdict(list)
+        self.by_ulica: dict[str, list[dict]] = defaultdict(list)
+        self.by_miejscowosc: dict[str, list[dict]] = defaultdict(list)
+        self.grams: dict[str, list[int]] = defaultdict(list)
+        self.matchers: list[SequenceMatcher] = []
+
+        for i, (r, norm) in enumerate(zip(rows, self.norms)):
+            self.by_norm.setdefault(norm, r)
+            self.by_norm_all[norm].append(r)
+            self.by_powiat[r.get('powiat') or ''].append(r)
+            r.setdefault('ulica_key', norm_ulica(r.get('ulica') or ''))
+            if r['ulica_key']:
+                self.by_ulica[r['ulica_key']].append(r)
+            if r.get('miejscowosc'):
+                self.by_miejscowosc[r['miejscowosc'].strip().lower()].append(r)
+            for g in ngrams(norm):
+                self.grams[g].append(i)
+            # seq2 (strona bazy) liczona raz — dla zapytania podmieniamy tylko seq1
+            self.matchers.append(SequenceMatcher(None, "", norm))
+
+        self.sizes = [len(ngrams(norm)) for norm in self.norms]
+
+    def manual(self, norm: str) -> dict | None:
+        """Ręczne mapowania: podciąg nazwy → ID, potem podciąg → nazwa w bazie."""
+        for key, db_id in self.manual_by_id.items():
+            if key in norm and db_id in self.by_id:
+                return self.by_id[db_id]
+        for key, target in self.manual_by_name.items():
+            if key in norm and target in self.by_norm:
+                return self.by_norm[target]
+        return None
+
+    def candidates(self, norm: str) -> list[int]:
+        """Placówki mające wspólny trigram z `norm`, od najwyższego współczynnika Dice'a."""
+        grams = ngrams(norm)
+        shared: dict[int, int] = defaultdict(int)
+        for g in grams:
+            for i in self.grams.get(g, ()):
+                shared[i] += 1
+        n = len(grams)
+        return sorted(shared, key=lambda i: (-shared[i] / (n + self.sizes[i]), i))
+
+    def match(self, nazwa: str, accept=None) -> tuple[dict | None, float]:
+        """
+        Najlepsze dopasowanie po nazwie — zwraca (db_row, score).
+        `accept(db_row)` zawęża kandydatów (np. do powiatu z wykazu).
+        """
+        norm = self.normalize(nazwa)
+        row = self.manual(norm)
+        if row is not None:
+            return row, 1.0
+
+        best, best_i, best_score = None, -1, 0.0
+        for i in self.candidates(norm):
+            if accept is not None and not accept(self.rows[i]):
+                continue
+            m = self.matchers[i]
+            m.set_seq1(norm)
+            # górne ograniczenia ratio() — tanie, pozwalają pominąć słabych kandydatów
+            if m.real_quick_ratio() < best_score or m.quick_ratio() < best_score:
+                continue
+            score = m.ratio()
+            if score > best_score or (score == best_score and best is not None and i < best_i):
+                best, best_i, best_score = self.rows[i], i, score
+        return best, best_score
+
+    def by_address(self, ulica_key: str, powiaty: tuple[str, ...]) -> list[dict]:
+        """Placówki o znormalizowanym adresie `ulica_key` w podanych powiatach."""
+        return [d for d in self.by_ulica.get(ulica_key, ()) if d['powiat'] in powiaty]
+
+    def match_address(self, nazwa: str, adres: str, accept=None) -> tuple[dict | None, float]:
+        """
+        Dopasowanie po adresie, a dopiero potem po nazwie — dla wykazów, w których
+        nazwa bywa ogólna („Dom Pomocy Społecznej”), ale adres jest zawsze podany.
+
+        Adres rozstrzyga, gdy pod `norm_ulica(adres)` jest jedna placówka (albo
+        kilka — wtedy wygrywa najbliższa nazwą). Klucz adresu to tylko ulica
+        i numer, bez miejscowości, więc `accept` obowiązuje każde trafienie po
+        adresie — ta sama „Kościuszki 5” w innym powiecie to nie ta placówka.
+        Bez trafienia po adresie — `match(nazwa, accept)`; kilka placówek o tej
+        samej nazwie to brak dopasowania (None, score), a nie zgadywanie.
+        """
+        key = norm_ulica(adres)
+        found = self.by_ulica.get(key, ()) if key else ()
+        if accept is not None:
+            found = [d for d in found if accept(d)]
+        if found:
+            norm = self.normalize(nazwa)
+            best = max(found, key=lambda d: similarity(norm, self.normalize(d['nazwa'])))
+            return best, 1.0
+
+        row, score = self.match(nazwa, accept)
+        if row is not None:
+            twins = [d for d in self.by_norm_all.get(self.normalize(row['nazwa']), ())
+                     if accept is None or accept(d)]
+            if len(twins) > 1:
+                return None, score
+        return row, score
+
+    def by_locality(self, miejscowosc: str, powiat: str = "") -> dict | None:
+        """Jedyna placówka w miejscowości (z zawężeniem do powiatu, gdy podany)."""
+        found = self.by_miejscowosc.get((miejscowosc or '').strip().lower(), [])
+        if powiat:
+            in_powiat = [d for d in found if (d.get('powiat') or '').lower() == powiat.lower()]
+            found = in_powiat or found
+        return found[0] if len(found) == 1 else None
+
+    def by_capacity(self, powiat: str, liczba_miejsc: int) -> list[dict]:
+        return [d for d in self.by_powiat.get(powiat, ()) if d.get('liczba_miejsc') == liczba_miejsc]
@@ -1,38 +1,55 @@
 """
-Pobiera z GUS BDL dane demograficzne per powiat dla Małopolski:
+Pobiera z GUS BDL dane demograficzne per powiat — dla wybranych województw
+albo całej Polski:
   1. Wiek poprodukcyjny (60+K/65+M) — zmienna 72293, lata 2015–2024
   2. Populacja 80+ (80-84 + 85+) — zmienne 76024+76025, lata 2015–2024
   3. Prognozy 65+ per powiat — 2025, 2030, 2035, 2040
   4. Prognozy 80+ per powiat — 2025, 2030, 2035, 2040
 
-Wynik: data/gus_populacja_malopolska.csv
+Wynik (długi format: powiat, rok, typ, miara):
+  data/gus_populacja_malopolska.csv   — tylko Małopolska (domyślnie)
+  data/gus_populacja_polska.csv       — każdy inny wybór województw
+
+Zapis jest przyrostowy: dopisujemy tylko trójki (teryt, rok, miara), których
+w pliku jeszcze nie ma, a zapytania idą tylko o (miarę, rok, województwo) z
+brakami. Zapytania równolegle per województwo i zmienna (scripts/bdl.py, z
+cache w raw_dane/.bdl_cache/); dla wszystkich 16 województw — jedno zapytanie
+ogólnopolskie na zmienną i rok zamiast szesnastu. Wiersze trafiają do pliku
+na bieżąco, w miarę kończenia zapytań.
 
 Uruchom: python3 scripts/fetch-gus-bdl.py
-Opcjonalnie: GUS_BDL_KEY=twoj_klucz python3 scripts/fetch-gus-bdl.py
+         python3 scripts/fetch-gus-bdl.py --woj 24 10 wielkopolskie
+         python3 scripts/fetch-gus-bdl.py --woj all
+Opcjonalnie: GUS_BDL_KEY=twoj_klucz python3 scripts/fetch-gus-bdl.py --woj all
 
 Źródło: GUS BDL https://bdl.stat.gov.pl/api/v1
 """
 
-import requests
 import csv
 import os
-import time
+import sys
+import argparse
 import datetime
+from collections import defaultdict
+
+import numpy as np
 
-API_KEY = os.environ.get("GUS_BDL_KEY", "")
-BASE_URL = "https://bdl.stat.gov.pl/api/v1"
-MALOPOLSKA_ID = "011200000000"
-OUTPUT = "data/gus_populacja_malopolska.csv"
+import gus
+from bdl import BdlClient
 
-headers = {"X-ClientId": API_KEY, "Accept": "application/json"} if API_KEY else {"Accept": "application/json"}
+OUTPUT        = "data/gus_populacja_malopolska.csv"
+OUTPUT_POLSKA = "data/gus_populacja_polska.csv"
+MALOPOLSKA    = "12"
+FIELDS = ["teryt_powiat", "powiat", "rok", "typ", "miara", "populacja",
+          "zrodlo_var_id", "zrodlo_url", "pobrano"]
 
 HIST_YEARS = list(range(2015, 2025))
 
-# Zmienne historyczne
-HIST_VARS = {
-    "wiek_poprodukcyjny": 72293,   # 60+K / 65+M ogółem (P2577)
-    "80_84":              76024,   # 80–84 ogółem (P2137)
-    "85plus":             76025,   # 85+ ogółem (P2137)
+# Miary historyczne: miara → (zmienne sumowane per powiat/rok, opis źródła)
+# 80+ = 80–84 (76024) + 85+ (76025), oba z P2137
+HIST_MEASURES = {
+    "wiek_poprodukcyjny": ((72293,), "https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/2577"),  # 60+K / 65+M (P2577)
+    "80plus":             ((76024, 76025), "https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/2137"),
 }
 
 # Prognozy (subject P4359, co 45 zmiennych na rok)
@@ -42,176 +59,192 @@ FORECAST_VARS = {
     "65plus": {2025: 1722486, 2030: 1722531, 2035: 1722576, 2040: 1722621},
     "80plus": {2025: 1722487, 2030: 1722532, 2035: 1722577, 2040: 1722622},
 }
-
-
-def get_malopolska_powiats() -> tuple[dict, set]:
-    r = requests.get(
-        f"{BASE_URL}/units",
-        params={"parent-id": MALOPOLSKA_ID, "level": 5, "page-size": 100, "format": "json"},
-        headers=headers, timeout=30,
-    )
-    r.raise_for_status()
-    powiats = [u for u in r.json()["results"] if u["id"].startswith("01121")]
-    unit_map = {u["id"]: u["name"] for u in powiats}
-    return unit_map, set(unit_map.keys())
-
-
-def fetch_batch(variable_id: int, years: list[int]) -> list:
-    """Pobiera dane dla wszystkich lat naraz (batch). Fallback do per-rok przy 412."""
-    params = {
-        "unit-level": 5, "unit-parentId": MALOPOLSKA_ID,
-        "year": [str(y) for y in years],
-        "page-size": 100, "format": "json",
-    }
-    r = requests.get(f"{BASE_URL}/data/by-variable/{variable_id}",
-                     params=params, headers=headers, timeout=30)
-    if r.status_code == 412:
-        # API nie obsługuje wielu lat dla tej zmiennej — fallback rok po roku
-        return fetch_year_by_year(variable_id, years)
-    r.raise_for_status()
-    return r.json()["results"]
-
-
-def fetch_year_by_year(variable_id: int, years: list[int]) -> list:
-    merged: dict[str, dict] = {}
-    for year in years:
-        r = requests.get(
-            f"{BASE_URL}/data/by-variable/{variable_id}",
-            params={"unit-level": 5, "unit-parentId": MALOPOLSKA_ID,
-                    "year": str(year), "page-size": 100, "format": "json"},
-            headers=headers, timeout=30,
-        )
-        r.raise_for_status()
-        for unit in r.json().get("results", []):
-            uid = unit["id"]
-            if uid not in merged:
-                merged[uid] = {"id": uid, "name": unit["name"], "values": []}
-            merged[uid]["values"].extend(unit.get("values", []))
-        time.sleep(0.2)
-    return list(merged.values())
-
-
-def fetch_single_year(variable_id: int) -> list:
-    r = requests.get(
-        f"{BASE_URL}/data/by-variable/{variable_id}",
-        params={"unit-level": 5, "unit-parentId": MALOPOLSKA_ID,
-                "page-size": 100, "format": "json"},
-        headers=headers, timeout=30,
-    )
-    r.raise_for_status()
-    return r.json()["results"]
-
-
-if __name__ == "__main__":
+FORECAST_URL = "https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/4359"
+
+
+def parse_woj(values: list[str]) -> list[str]:
+    """Kody TERYT województw z argumentów: "12", "małopolskie" albo "all"."""
+    by_name = {name: code for code, name in gus.WOJEWODZTWA.items()}
+    codes = []
+    for v in values:
+        v = v.strip().lower()
+        if v in ("all", "wszystkie", "polska"):
+            return sorted(gus.WOJEWODZTWA)
+        code = v.zfill(2) if v.isdigit() else by_name.get(v)
+        if code not in gus.WOJEWODZTWA:
+            sys.exit(f"❌ Nieznane województwo: {v!r} (kod TERYT, nazwa albo 'all')")
+        codes.append(code)
+    return sorted(set(codes))
+
+
+def woj_unit_id(powiat_id: str) -> str:
+    """Id jednostki BDL województwa z id powiatu ("011212161000" → "011200000000")."""
+    return powiat_id[:4].ljust(12, "0")
+
+
+def load_powiats(client: BdlClient, codes: list[str]) -> dict[str, dict[str, str]]:
+    """{kod województwa: {id powiatu: nazwa}} — jedna lista powiatów całego kraju."""
+    powiats = defaultdict(dict)
+    for unit in client.units(level=5):
+        code = gus.woj_code(unit["id"])
+        if code in codes:
+            powiats[code][unit["id"]] = unit["name"]
+    return powiats
+
+
+def existing_keys(path: str) -> set[tuple]:
+    """(teryt, rok, miara, typ) już zapisane w pliku wynikowym."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames and reader.fieldnames != FIELDS:
+            sys.exit(f"❌ {path}: inny układ kolumn niż {FIELDS}")
+        return {(r["teryt_powiat"], int(r["rok"]), r["miara"], r["typ"]) for r in reader}
+
+
+class Batch:
+    """Jedna miara × rok × obszar: zmienne do zsumowania i to, co z nich już przyszło."""
+
+    def __init__(self, miara: str, typ: str, rok: int, parent_id: str | None,
+                 var_ids: tuple, year: int | None, url: str):
+        self.miara = miara
+        self.typ = typ
+        self.rok = rok
+        self.parent_id = parent_id
+        self.var_ids = var_ids
+        self.year = year                 # rok zapytania (None — prognoza: wszystkie lata zmiennej)
+        self.url = url
+        self.results = {}
+
+    def jobs(self) -> list[tuple]:
+        return [(var_id, self.year, 5, self.parent_id) for var_id in self.var_ids]
+
+    @property
+    def complete(self) -> bool:
+        return len(self.results) == len(self.var_ids)
+
+    def rows(self, names: dict[str, str], pobrano: str) -> list[dict]:
+        """Wiersze CSV: suma zmiennych per (powiat, rok wartości); tylko powiaty z `names`."""
+        totals = defaultdict(int)
+        for results in self.results.values():
+            for unit in results:
+                if unit["id"] not in names:
+                    continue
+                for val in unit.get("values", []):
+                    if val.get("val"):
+                        totals[(unit["id"], int(val["year"]))] += int(val["val"])
+        return [{
+            "teryt_powiat":  uid,
+            "powiat":        names[uid],
+            "rok":           self.rok if self.typ == "prognoza" else year,
+            "typ":           self.typ,
+            "miara":         self.miara,
+            "populacja":     v,
+            "zrodlo_var_id": "+".join(str(var_id) for var_id in self.var_ids),
+            "zrodlo_url":    self.url,
+            "pobrano":       pobrano,
+        } for (uid, year), v in sorted(totals.items()) if v > 0]
+
+
+def plan(codes: list[str], powiats: dict[str, dict[str, str]], have: set[tuple],
+         years: list[int]) -> list[Batch]:
+    """Partie z brakami w pliku. Wszystkie województwa → jedno zapytanie na cały kraj."""
+    if codes == sorted(gus.WOJEWODZTWA):
+        areas = {None: [uid for code in codes for uid in powiats[code]]}
+    else:
+        areas = {woj_unit_id(next(iter(powiats[code]))): list(powiats[code]) for code in codes if powiats[code]}
+
+    specs = [(miara, "historyczny", rok, var_ids, rok, url)
+             for miara, (var_ids, url) in HIST_MEASURES.items() for rok in years]
+    specs += [(miara, "prognoza", rok, (var_id,), None, FORECAST_URL)
+              for miara, year_vars in FORECAST_VARS.items() for rok, var_id in year_vars.items()]
+
+    batches = []
+    for parent_id, uids in areas.items():
+        for miara, typ, rok, var_ids, year, url in specs:
+            if any((uid, rok, miara, typ) not in have for uid in uids):
+                batches.append(Batch(miara, typ, rok, parent_id, var_ids, year, url))
+    return batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Populacja GUS BDL per powiat (przyrostowo)")
+    parser.add_argument("--woj", nargs="+", default=[MALOPOLSKA],
+                        help="kody TERYT / nazwy województw albo 'all' (domyślnie 12 — małopolskie)")
+    parser.add_argument("--output", help=f"plik wynikowy (domyślnie {OUTPUT} albo {OUTPUT_POLSKA})")
+    parser.add_argument("--od-nowa", action="store_true", help="zapisz plik od zera zamiast dopisywać braki")
+    args = parser.parse_args()
+
+    codes = parse_woj(args.woj)
+    output = args.output or (OUTPUT if codes == [MALOPOLSKA] else OUTPUT_POLSKA)
     pobrano = datetime.date.today().isoformat()
-    print("=== GUS BDL — populacja Małopolska per powiat ===\n")
-
-    print("1. Pobieram listę 22 powiatów Małopolski...")
-    unit_map, malopolska_ids = get_malopolska_powiats()
-    print(f"   {len(unit_map)} powiatów")
-
-    rows = []
-
-    # ── Dane historyczne ──────────────────────────────────────────────────────
-    print(f"\n2. Dane historyczne {HIST_YEARS[0]}–{HIST_YEARS[-1]}...")
-
-    # Zbieramy 80-84 i 85+ osobno, potem sumujemy per powiat/rok
-    pop_80_84: dict[tuple, int] = {}
-    pop_85plus: dict[tuple, int] = {}
+    print(f"=== GUS BDL — populacja per powiat: {', '.join(gus.WOJEWODZTWA[c] for c in codes)} ===\n")
+
+    client = BdlClient()
+
+    print("1. Lista powiatów...")
+    powiats = load_powiats(client, codes)
+    names = {uid: name for code in codes for uid, name in powiats[code].items()}
+    print(f"   {len(names)} powiatów w {len(powiats)} województwach")
+    for code in codes:
+        if not powiats.get(code):
+            print(f"   ⚠️  Brak powiatów w BDL dla: {gus.WOJEWODZTWA[code]}")
+
+    if args.od_nowa and os.path.exists(output):
+        os.remove(output)
+    have = existing_keys(output)
+    batches = plan(codes, powiats, have, HIST_YEARS)
+    print(f"\n2. W pliku {output}: {len(have)} rekordów; do pobrania {len(batches)} partii "
+          f"(miara × rok × obszar)")
+
+    # ── Pobieranie i zapis na bieżąco ─────────────────────────────────────────
+    by_job = defaultdict(list)
+    for batch in batches:
+        for job in batch.jobs():
+            by_job[job].append(batch)
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+    added = defaultdict(int)
+    with open(output, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        for job, results in client.data_iter(list(by_job)):
+            for batch in by_job[job]:
+                batch.results[job[0]] = results
+                if not batch.complete:
+                    continue
+                rows = [r for r in batch.rows(names, pobrano)
+                        if (r["teryt_powiat"], r["rok"], r["miara"], r["typ"]) not in have]
+                writer.writerows(rows)
+                f.flush()
+                have.update((r["teryt_powiat"], r["rok"], r["miara"], r["typ"]) for r in rows)
+                added[(batch.miara, batch.typ)] += len(rows)
+
+    for (miara, typ), n in sorted(added.items()):
+        print(f"   [{miara} / {typ}] +{n} rekordów")
+    print(f"\n✅ Dopisano {sum(added.values())} rekordów → {output} (razem {len(have)})")
+    print(f"   BDL: {client.stats['zapytania']} zapytań, {client.stats['cache']} z cache, "
+          f"{client.stats['ponowienia']} ponowień")
+
+    # Kostka populacji dla skryptów analitycznych (scripts/gus.py) — przebudowa z nowego CSV
+    cube = gus.load()
+    print(f"🧊 Kostka GUS: {len(cube)} powiatów × {len(cube.years)} lat × {len(cube.measures)} miar → {gus.CUBE_CACHE}")
+
+    # Podgląd: populacja 80+ w najnowszym roku per województwo
+    rok = cube.latest_year("80plus")
+    if rok:
+        pop = cube.pop("80plus", rok)
+        wojewodztwa = np.array(cube.wojewodztwa)
+        print(f"\nPodgląd — populacja 80+ {rok} per województwo:")
+        for code in codes:
+            woj = gus.WOJEWODZTWA[code]
+            mask = wojewodztwa == woj
+            if mask.any():
+                print(f"  {woj:22} {int(np.nansum(pop[mask])):>10,}")
 
-    for var_name, var_id in HIST_VARS.items():
-        print(f"   [{var_name}] zmienna {var_id}...")
-        results = fetch_batch(var_id, HIST_YEARS)
-        count = 0
 
-        for result in results:
-            uid = result["id"]
-            if uid not in malopolska_ids:
-                continue
-            for val in result.get("values", []):
-                if not val.get("val"):
-                    continue
-                key = (uid, int(val["year"]))
-                if var_name == "wiek_poprodukcyjny":
-                    rows.append({
-                        "teryt_powiat":  uid,
-                        "powiat":        unit_map[uid],
-                        "rok":           int(val["year"]),
-                        "typ":           "historyczny",
-                        "miara":         "wiek_poprodukcyjny",
-                        "populacja":     int(val["val"]),
-                        "zrodlo_var_id": var_id,
-                        "zrodlo_url":    f"https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/2577",
-                        "pobrano":       pobrano,
-                    })
-                elif var_name == "80_84":
-                    pop_80_84[key] = int(val["val"])
-                elif var_name == "85plus":
-                    pop_85plus[key] = int(val["val"])
-                count += 1
-        print(f"   → {count} wartości")
-
-    # Sumuj 80+ = 80-84 + 85+
-    all_keys = set(pop_80_84) | set(pop_85plus)
-    count_80 = 0
-    for (uid, rok) in sorted(all_keys):
-        v = pop_80_84.get((uid, rok), 0) + pop_85plus.get((uid, rok), 0)
-        if v > 0:
-            rows.append({
-                "teryt_powiat":  uid,
-                "powiat":        unit_map[uid],
-                "rok":           rok,
-                "typ":           "historyczny",
-                "miara":         "80plus",
-                "populacja":     v,
-                "zrodlo_var_id": "76024+76025",
-                "zrodlo_url":    "https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/2137",
-                "pobrano":       pobrano,
-            })
-            count_80 += 1
-    print(f"   [80+] zsumowane: {count_80} rekordów")
-
-    # ── Prognozy ─────────────────────────────────────────────────────────────
-    print(f"\n3. Prognozy 65+ i 80+ na lata 2025–2040...")
-    for miara, year_vars in FORECAST_VARS.items():
-        for rok, var_id in year_vars.items():
-            results = fetch_single_year(var_id)
-            count = 0
-            for result in results:
-                uid = result["id"]
-                if uid not in malopolska_ids:
-                    continue
-                for val in result.get("values", []):
-                    if val.get("val"):
-                        rows.append({
-                            "teryt_powiat":  uid,
-                            "powiat":        unit_map[uid],
-                            "rok":           rok,
-                            "typ":           "prognoza",
-                            "miara":         miara,
-                            "populacja":     int(val["val"]),
-                            "zrodlo_var_id": var_id,
-                            "zrodlo_url":    "https://bdl.stat.gov.pl/BDL/metadane/podgrup-opis/4359",
-                            "pobrano":       pobrano,
-                        })
-                        count += 1
-            print(f"   [{miara}] {rok}: {count} powiatów")
-            time.sleep(0.2)
-
-    # ── Zapis ─────────────────────────────────────────────────────────────────
-    os.makedirs("data", exist_ok=True)
-    fields = ["teryt_powiat", "powiat", "rok", "typ", "miara", "populacja",
-              "zrodlo_var_id", "zrodlo_url", "pobrano"]
-    with open(OUTPUT, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"\n✅ Zapisano {len(rows)} rekordów → {OUTPUT}")
-
-    # Podgląd 80+ 2024
-    print("\nPodgląd — populacja 80+ per powiat 2024:")
-    hist_80_2024 = [(r["powiat"], r["populacja"]) for r in rows
-                    if r["rok"] == 2024 and r["miara"] == "80plus"]
-    for powiat, pop in sorted(hist_80_2024, key=lambda x: -x[1]):
-        print(f"  {powiat:35} {pop:>8,}")
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,11 @@ Wynik:
 Uruchom: python3 scripts/fetch-gus-emerytury.py
 """
 
-import requests
 import csv
 import os
 import datetime
 
-BASE_URL = "https://bdl.stat.gov.pl/api/v1"
-API_KEY  = os.environ.get("GUS_BDL_KEY", "")
+from bdl import BASE_URL, BdlClient, merge_units
 
 # Zmienna 155058 = przeciętna emerytura ZUS (bez rent)
 # Zmienna 155057 = razem (emerytury + renty) — dla kontekstu
@@ -46,26 +44,10 @@ SOURCE_META = {
 }
 
 
-def fetch_variable(var_id: int, years: list) -> list:
-    """Pobiera dane rok po roku i scala wyniki (API nie obsługuje wielu lat naraz)."""
-    headers = {"X-ClientId": API_KEY} if API_KEY else {}
-    merged: dict[str, dict] = {}  # id → {id, name, values: []}
-
-    for year in years:
-        r = requests.get(
-            f"{BASE_URL}/data/by-variable/{var_id}",
-            params={"unit-level": 2, "year": str(year), "page-size": 50, "format": "json"},
-            headers=headers,
-            timeout=30,
-        )
-        r.raise_for_status()
-        for unit in r.json().get("results", []):
-            uid = unit["id"]
-            if uid not in merged:
-                merged[uid] = {"id": uid, "name": unit["name"], "values": []}
-            merged[uid]["values"].extend(unit.get("values", []))
-
-    return list(merged.values())
+def fetch_variable(client: BdlClient, var_id: int, years: list) -> list:
+    """Dane rok po roku (API nie obsługuje wielu lat naraz) — równolegle, scalone per województwo."""
+    results = client.data_many([(var_id, year, 2, None) for year in years])
+    return merge_units(*(results[(var_id, year, 2, None)] for year in years))
 
 
 if __name__ == "__main__":
@@ -74,11 +56,12 @@ if __name__ == "__main__":
     print(f"API:    {SOURCE_META['url_api']}")
     print()
 
+    client = BdlClient()
     rows = []
 
     for var_name, var_id in VARIABLES.items():
         print(f"Pobieranie: {var_name} (zmienna {var_id})...")
-        results = fetch_variable(var_id, YEARS)
+        results = fetch_variable(client, var_id, YEARS)
         count = 0
         for result in results:
             for val in result.get("values", []):
@@ -0,0 +1,224 @@
+"""
+Geokodowanie adresów przez Nominatim z trwałym cache w SQLite.
+
+Scraper UTW, import Senior+ i import MDDPS pytały Nominatim niezależnie,
+ze stałym `sleep` między zapytaniami i bez pamięci między uruchomieniami.
+Tu wszystkie trzy dzielą jeden cache `raw_dane/.geocode_cache.sqlite`:
+
+  - klucz — znormalizowany adres (ulica po `clean_street`, miejscowość,
+    region, a gdy podany — powiat; ASCII, małe litery), więc „ul. Szkolna 43,
+    pok. 2” i „ul. Szkolna 43” to ten sam wpis, a Zawada w dwóch powiatach — dwa,
+  - wartość — współrzędne, wariant zapytania, który dał wynik („ulica” /
+    „miejscowosc”), treść zapytania i czas pobrania,
+  - TTL — trafienia ważne `TTL_DAYS`, braki wyniku krócej (`MISS_TTL_DAYS`),
+    żeby poprawiony w OSM adres w końcu się znalazł.
+
+Zapytania wychodzą tylko dla adresów spoza cache, pod limitem hosta
+(scripts/rate_limit.py: max 1 zapytanie / 1,1 s) — ponowny import znanych
+adresów nie czeka ani sekundy. Z `localities` (scripts/localities.py) sam
+środek miejscowości bierzemy offline z TERYT zamiast z Nominatim
+(wariant „teryt”).
+
+  geo = Geocoder()
+  lat, lon = geo.geocode("ul. Szkolna 43", "Dobczyce", region="małopolskie")
+"""
+
+import re
+import time
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+
+import requests
+
+from rate_limit import HostLimiter
+
+CACHE_DB = Path(__file__).resolve().parent.parent / 'raw_dane' / '.geocode_cache.sqlite'
+
+NOMINATIM_URL     = 'https://nominatim.openstreetmap.org/search'
+NOMINATIM_HEADERS = {'User-Agent': 'geocoder-research/1.0'}
+
+TTL_DAYS      = 365   # współrzędne budynków praktycznie się nie zmieniają
+MISS_TTL_DAYS = 30    # brak wyniku — spróbuj ponownie po miesiącu
+
+# polityka OSM: max 1 zapytanie/s — jeden kubełek na cały proces
+limiter = HostLimiter({'nominatim.openstreetmap.org': (1 / 1.1, 1)})
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS geocode (
+        key      TEXT PRIMARY KEY,
+        hit      INTEGER NOT NULL,
+        variant  TEXT,
+        query    TEXT,
+        lat      REAL,
+        lon      REAL,
+        fetched  REAL NOT NULL
+    )
+"""
+
+
+# ── normalizacja ──────────────────────────────────────────────────────────────
+
+def clean_street(ulica: str) -> str:
+    """Usuwa śmieci z pola ulicy przed geocodingiem."""
+    original = ulica
+    # Jeśli zaczyna się od kodu pocztowego (np. "32-600 Oświęcim, ul. Foo 1")
+    # — wyciągnij ul./al. fragment z oryginału
+    if re.match(r'^\d{2}-\d{3}', ulica.strip()):
+        m = re.search(r'(ul\.|os\.|al\.|pl\.)\s*[\w\s]+\s+[\d\w/]+', ulica, re.IGNORECASE)
+        return m.group(0).strip() if m else ''
+    # Usuń numery pokojów, piętra, opisy
+    ulica = re.sub(r'\s*(pok\.?|pokój|piętro|parter|p\.)\s*[\w\d\-/]*', '', ulica, flags=re.IGNORECASE)
+    # Usuń kody pocztowe w środku/na końcu (np. "ul. Foo 1 32-600 Kraków")
+    ulica = re.sub(r'\s*\d{2}-\d{3}.*$', '', ulica)
+    # Usuń opisy za średnikiem lub w nawiasach
+    ulica = re.sub(r'\s*[;(].*$', '', ulica)
+    # Jeśli nadal jest "Dom Kultury X ul. Foo 1" — wyciągnij ul./al. fragment
+    m = re.search(r'(ul\.|os\.|al\.|pl\.)\s*[\w\s]+\s+[\d\w/]+', ulica, re.IGNORECASE)
+    if m:
+        ulica = m.group(0)
+    return ulica.strip() or original.strip()
+
+def ascii_query(s: str) -> str:
+    """Nominatim nie radzi sobie z polskimi znakami — normalizuj przed zapytaniem."""
+    s = s.replace('ł', 'l').replace('Ł', 'L')
+    return unicodedata.normalize('NFD', s).encode('ascii', 'ignore').decode('ascii')
+
+def address_parts(ulica: str | None, miejscowosc: str,
+                  region: str | None = None) -> tuple[str, str, str]:
+    """(ulica, miejscowość, region) w postaci do zapytania: oczyszczone, ASCII."""
+    street = ascii_query(clean_street(ulica)) if ulica else ''
+    city   = ascii_query(re.sub(r'\s*,.*$', '', miejscowosc or '').strip())
+    return street, city, ascii_query(region or '')
+
+def cache_key(street: str, city: str, region: str, powiat: str | None = None) -> str:
+    """Klucz cache; bez powiatu taki sam jak dawniej (stare wpisy zostają ważne)."""
+    parts = [street, city, region]
+    if powiat:
+        parts.append(re.sub(r'^(powiat|miasto|m\.)\s+', '', ascii_query(powiat).strip().lower()))
+    return '|'.join(re.sub(r'\s+', ' ', p).strip().lower() for p in parts)
+
+
+# ── cache + Nominatim ────────────────────────────────────────────────────────
+
+class Geocoder:
+    """
+    Geokoder z cache. Jeden obiekt można dzielić między wątki
+    (połączenie SQLite pod blokadą, zapytania pod wspólnym limitem).
+    """
+
+    def __init__(self, path: Path = CACHE_DB, session: requests.Session | None = None,
+                 ttl_days: float = TTL_DAYS, miss_ttl_days: float = MISS_TTL_DAYS,
+                 localities=None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(SCHEMA)
+        self.lock = threading.Lock()
+        self.session = session or requests.Session()
+        self.session.headers.update(NOMINATIM_HEADERS)
+        self.ttl = ttl_days * 86400
+        self.miss_ttl = miss_ttl_days * 86400
+        self.localities = localities
+        self.stats = {'cache': 0, 'zapytania': 0, 'teryt': 0}
+
+    def lookup(self, key: str) -> tuple | None:
+        """Ważny wpis cache: (hit, variant, lat, lon) albo None."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT hit, variant, lat, lon, fetched FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        hit, variant, lat, lon, fetched = row
+        if time.time() - fetched > (self.ttl if hit else self.miss_ttl):
+            return None
+        return bool(hit), variant, lat, lon
+
+    def remember(self, key: str, variant: str | None, query: str | None,
+                 coords: tuple[float, float] | None):
+        lat, lon = coords or (None, None)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO geocode (key, hit, variant, query, lat, lon, fetched)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, coords is not None, variant, query, lat, lon, time.time()),
+            )
+            self.db.commit()
+
+    def search(self, query: str) -> tuple[float, float] | None:
+        limiter.acquire(NOMINATIM_URL)
+        self.stats['zapytania'] += 1
+        r = self.session.get(
+            NOMINATIM_URL,
+            params={'q': query, 'format': 'json', 'limit': 1, 'countrycodes': 'pl'},
+            timeout=10,
+        )
+        r.raise_for_status()
+        data = r.json()
+        return (float(data[0]['lat']), float(data[0]['lon'])) if data else None
+
+    def geocode(self, ulica: str | None, miejscowosc: str, region: str | None = None,
+                fallback: bool = True, powiat: str | None = None) -> tuple[float | None, float | None]:
+        """
+        (lat, lon) adresu: najpierw ulica + miejscowość, potem sama miejscowość
+        (z regionem, gdy podany; z TERYT, gdy jest `localities` — `powiat`
+        rozstrzyga miejscowości o tej samej nazwie). `fallback=False` — tylko
+        dokładny adres (dla jednego miasta środek miasta nic nie mówi).
+        """
+        street, city, reg = address_parts(ulica, miejscowosc, region)
+        key = cache_key(street, city, reg, powiat)
+        suffix = f", {reg}, Poland" if reg else ", Poland"
+        variants = ([('ulica', f"{street}, {city}{suffix}")] if street else []) \
+            + [('miejscowosc', f"{city}{suffix}")]
+
+        cached = self.lookup(key)
+        if cached is not None:
+            self.stats['cache'] += 1
+        else:
+            centroid = self.locality_centroid(miejscowosc, powiat) if fallback else None
+            if centroid and not street:
+                self.stats['teryt'] += 1
+                return centroid
+            if centroid:
+                variants[-1] = ('teryt', centroid)
+            cached = self.fetch(key, variants)
+            if cached is None:
+                return None, None   # błąd sieci — bez zapisu w cache
+        hit, variant, lat, lon = cached
+        if hit and (fallback or variant == 'ulica' or not street):
+            return lat, lon
+        return None, None
+
+    def locality_centroid(self, miejscowosc: str, powiat: str | None) -> tuple[float, float] | None:
+        """Środek miejscowości z TERYT (tylko na poziomie miejscowości, nie gminy/powiatu)."""
+        if self.localities is None:
+            return None
+        loc = self.localities.resolve(miejscowosc, powiat=powiat)
+        if loc and loc['precision'] == 'miejscowosc':
+            return loc['lat'], loc['lon']
+        return None
+
+    def fetch(self, key: str, variants: list[tuple[str, str | tuple]]) -> tuple | None:
+        """
+        Kolejne warianty zapytania do pierwszego wyniku; wynik (także brak) trafia do cache.
+        Wariant „teryt” niesie gotowe współrzędne zamiast zapytania.
+        """
+        for variant, query in variants:
+            if variant == 'teryt':
+                self.stats['teryt'] += 1
+                self.remember(key, variant, None, query)
+                return True, variant, query[0], query[1]
+            try:
+                coords = self.search(query)
+            except Exception as e:
+                print(f"    ⚠️  geocoding error ({query[:40]}): {e}")
+                return None
+            if coords:
+                self.remember(key, variant, query, coords)
+                return True, variant, coords[0], coords[1]
+        self.remember(key, None, None, None)
+        return False, None, None, None
+
+    def close(self):
+        self.db.close()
@@ -1,107 +1,314 @@
 # -*- coding: utf-8 -*-
+"""
+Warstwy mapy powiatów (SVG path) z GeoJSON powiatów Polski — cały kraj,
+w częściach ładowanych na żądanie.
+
+Jedno uruchomienie daje:
+  public/data/mapy/PL-MA.<hash>.json   — powiaty województwa na viewBoxie 600 px
+                                         (jeden plik na województwo: PL-DS … PL-ZP)
+  public/data/mapy/PL.<hash>.json      — wszystkie powiaty kraju na jednym viewBoxie
+  src/data/mapy-manifest.ts            — spis części: plik, hash, bbox (lon/lat),
+                                         viewBox, liczba powiatów, kontur województwa
+                                         na mapie kraju i punkt na etykietę
+  src/data/malopolskie-counties.ts     — Małopolska jako moduł TS, jak dotąd
+                                         (MalopolskieMap.tsx importuje go wprost)
+
+Front pobiera tylko część oglądanego województwa (`fetch(chunk.file)`), a
+nazwa pliku zawiera hash treści — niezmieniona część ma tę samą nazwę i zostaje
+w cache przeglądarki / CDN na stałe. Stare wersje części są usuwane. Kontury
+województw w manifeście zastępują ręczny paths-output.txt (generate-regions.py).
+
+Geometria:
+  - granice upraszcza scripts/geometry.py na wspólnych łukach (sąsiednie
+    powiaty dostają tę samą granicę — bez szczelin), tolerancja w pikselach
+    per przybliżenie (`TOLERANCE`); kontury województw to suma łuków ich powiatów,
+  - ścieżki mają współrzędne względne („l”) zaokrąglone do `PRECISION` miejsc
+    — przy 600 px 0,1 px jest poniżej tego, co widać,
+  - JSON bez wcięć, jeden powiat w wierszu,
+  - `centroid` to środek ciężkości ważony polem, a `label` — biegun
+    niedostępności (punkt na etykietę, zawsze wewnątrz powiatu); oba z pełnej
+    geometrii, w pikselach viewBoxu, zapamiętane w raw_dane/poland.counties.labels.json,
+  - rzutowanie (`--projection`, geometry.PROJECTIONS): domyślnie lon/lat wprost
+    jak dotąd, do wyboru Web Mercator albo PUWG-1992; nazwa idzie do manifestu
+    (MAP_PROJECTION), żeby punkty z mapy (placówki) trafiały w te same piksele.
+
+Rzutowanie, bbox i zapis ścieżek idą tablicami NumPy per pierścień — liczby
+na tekst z tablicy gotowych napisów (`token_table`) zamiast formatowania
+każdej współrzędnej w pętli; przy ~2500 gminach to sekundy, nie minuty.
+
+Uruchom: python scripts/geojson_to_svg.py [--projection puwg1992]
+"""
+import argparse
 import json
-import os
-import urllib.request
-import ssl
-
-def download_and_convert():
-    # Rozwiązanie problemów z certyfikatami SSL na macOS
-    context = ssl._create_unverified_context()
-
-    # Ustalanie ścieżek projektu
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    output_path = os.path.join(project_root, 'src', 'data', 'malopolskie-counties.ts')
-
-    # Adres pliku GeoJSON z powiatami całej Polski (od jusuff)
-    url = "https://raw.githubusercontent.com/jusuff/PolandGeoJson/main/data/poland.counties.json"
-    
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+import gus
+from counties import POLAND_COUNTIES_PATH, POLAND_COUNTIES_URL, load_poland_counties
+from geometry import PROJECTIONS, LabelCache, Topology, exterior_rings, label_points
+from monitors.store import sha256
+
+WIDTH      = 600
+PRECISION  = 1          # miejsca po przecinku w ścieżkach (0,1 px)
+PROJECTION = "lonlat"   # geometry.PROJECTIONS: lonlat | mercator | puwg1992
+
+# tolerancja upraszczania [px viewBoxu] per przybliżenie; pierścienie mniejsze
+# niż MIN_RING_AREA [px²] (drobne wyspy, enklawy) odpadają
+TOLERANCE     = {"wojewodztwo": 0.35, "polska": 0.6}
+MIN_RING_AREA = 0.5
+LABEL_PRECISION = 0.5   # dokładność bieguna niedostępności [px]
+LABELS_PATH = POLAND_COUNTIES_PATH.with_suffix('.labels.json')
+HASH_LEN    = 10
+
+# TERYT województwa → kod ISO 3166-2 (jak w poland-regions.ts)
+REGION_CODES = {
+    "02": "PL-DS", "04": "PL-KP", "06": "PL-LU", "08": "PL-LB",
+    "10": "PL-LD", "12": "PL-MA", "14": "PL-MZ", "16": "PL-OP",
+    "18": "PL-PK", "20": "PL-PD", "22": "PL-PM", "24": "PL-SL",
+    "26": "PL-SK", "28": "PL-WN", "30": "PL-WP", "32": "PL-ZP",
+}
+NATIONAL = "PL"
+
+ROOT         = Path(__file__).resolve().parent.parent
+CHUNKS_DIR   = ROOT / 'public' / 'data' / 'mapy'
+CHUNKS_URL   = '/data/mapy'
+MANIFEST_TS  = ROOT / 'src' / 'data' / 'mapy-manifest.ts'
+# moduły TS dla komponentów, które importują warstwę wprost: kod → (plik, stała)
+TS_MODULES = {"12": (ROOT / 'src' / 'data' / 'malopolskie-counties.ts', "MALOPOLSKIE_COUNTIES")}
+
+
+# ── ścieżki ───────────────────────────────────────────────────────────────────
+
+def fmt(v: int) -> str:
+    """Liczba w jednostkach 10^-PRECISION → tekst bez zbędnych zer („-35” → „-3.5”, „20” → „2”)."""
+    s = f"{abs(v) / 10 ** PRECISION:.{PRECISION}f}".rstrip("0").rstrip(".") if PRECISION else str(abs(v))
+    return ("-" if v < 0 else "") + s
+
+
+@lru_cache(maxsize=None)
+def token_table(half: int) -> np.ndarray:
+    """Teksty liczb -half … half z separatorem („ 3.5”, „-2” — przed minusem spacja zbędna)."""
+    return np.array([s if s[0] == "-" else " " + s for s in map(fmt, range(-half, half + 1))], dtype=object)
+
+
+def pairs(coords: np.ndarray) -> str:
+    """Ciąg par „x y”; przed minusem separator zbędny („3 -2-1 4”)."""
+    v = coords.ravel()
+    if not len(v):
+        return ""
+    half = max(4096, 1 << int(np.abs(v).max()).bit_length())
+    return "".join(token_table(half)[v + half].tolist()).lstrip(" ")
+
+
+def svg_path(rings: list[np.ndarray]) -> str:
+    """
+    Pierścienie (px) → „M x y l dx dy … z m …”. Przesunięcia liczymy na
+    zaokrąglonych współrzędnych całkowitych, więc błąd się nie kumuluje.
+    """
+    parts, prev = [], None
+    for ring in rings:
+        q = np.round(ring * 10 ** PRECISION).astype(np.int64)
+        q = q[np.r_[True, np.any(q[1:] != q[:-1], axis=1)]]
+        if len(q) > 1 and (q[0] == q[-1]).all():
+            q = q[:-1]
+        if len(q) < 3:
+            continue
+        start = q[0] if prev is None else q[0] - prev
+        parts.append(("M" if prev is None else "m") + pairs(start) + "l" + pairs(np.diff(q, axis=0)) + "z")
+        prev = q[0]
+    return "".join(parts)
+
+
+def xy(point) -> dict:
+    return {"x": round(float(point[0]), 1), "y": round(float(point[1]), 1)}
+
+
+# ── warstwa ───────────────────────────────────────────────────────────────────
+
+class Layer:
+    """
+    Obszary jednego widoku (powiaty albo gminy województwa / kraju): rzutowanie
+    na WIDTH px i topologia łuków.
+    """
+
+    def __init__(self, features: list[dict], tolerance: float, projection: str = PROJECTION):
+        self.features = features
+        self.projection = projection
+        self.forward = PROJECTIONS[projection]
+        self.rings = [[np.asarray(ring, dtype=float)[:, :2] for ring in exterior_rings(f['geometry']) if len(ring)]
+                      for f in features]
+        coords = np.concatenate([ring for feature in self.rings for ring in feature])
+        self.bbox = (*coords.min(axis=0), *coords.max(axis=0))          # lon/lat (manifest)
+        planar = self.forward(coords)
+        self.origin = planar.min(axis=0)
+        width, height = planar.max(axis=0) - self.origin
+        self.scale = WIDTH / width
+        self.height = height * self.scale
+
+        self.topo = Topology(self.rings)
+        self.arcs = self.topo.simplify(self.project, tolerance)
+
+    def project(self, coords: np.ndarray) -> np.ndarray:
+        """lon/lat (n, 2) → piksele viewBoxu (y w dół)."""
+        planar = self.forward(coords)
+        return np.column_stack(((planar[:, 0] - self.origin[0]) * self.scale,
+                                self.height - (planar[:, 1] - self.origin[1]) * self.scale))
+
+    @property
+    def view_box(self) -> str:
+        return f"0 0 {WIDTH} {self.height:.2f}"
+
+    def cache_key(self, source_hash: str, what: str) -> str:
+        min_x, min_y = self.origin
+        return (f"{source_hash}:{what}:{len(self.features)}:{self.projection}:"
+                f"{min_x:.6f},{min_y:.6f},{self.scale:.9g}:{LABEL_PRECISION}")
+
+    def counties(self, labels: LabelCache, source_hash: str) -> list[dict]:
+        """Powiaty (id, name, centroid, label, d); punkty etykiet z pełnej geometrii."""
+        points = labels.get(self.cache_key(source_hash, "powiaty"), lambda: label_points(
+            [[self.project(ring) for ring in feature] for feature in self.rings],
+            LABEL_PRECISION))
+        return [{
+            "id": str(f['properties'].get('terc', '')),
+            "name": f['properties'].get('name', 'Nieznany'),
+            "centroid": xy(points[i, :2]),
+            "label": xy(points[i, 2:]),
+            "d": svg_path(self.topo.rings(self.arcs, i, MIN_RING_AREA)),
+        } for i, f in enumerate(self.features)]
+
+    def outlines(self, groups: list[list[int]], labels: LabelCache, source_hash: str) -> list[dict]:
+        """Kontury grup powiatów (województw) z łuków tej warstwy: d i punkt na etykietę."""
+        merged = [self.topo.merge(group) for group in groups]
+        full = [self.project(arc) for arc in self.topo.arcs]
+        points = labels.get(self.cache_key(source_hash, "wojewodztwa"),
+                            lambda: label_points([self.topo.rings(full, m) for m in merged], LABEL_PRECISION))
+        return [{"outline": svg_path(self.topo.rings(self.arcs, m, MIN_RING_AREA)), "label": xy(points[i, 2:])}
+                for i, m in enumerate(merged)]
+
+
+# ── zapis ─────────────────────────────────────────────────────────────────────
+
+def chunk_json(region_id: str, name: str, layer: Layer, counties: list[dict]) -> str:
+    rows = ",\n".join(json.dumps(c, ensure_ascii=False, separators=(",", ":")) for c in counties)
+    head = json.dumps({"id": region_id, "name": name, "viewBox": layer.view_box}, ensure_ascii=False,
+                      separators=(",", ":"))
+    return head[:-1] + ',"counties":[\n' + rows + "\n]}\n"
+
+
+def write_chunk(region_id: str, text: str, directory: Path | None = None,
+                url: str | None = None) -> tuple[str, str, int]:
+    """
+    Zapis części pod nazwą z hashem treści; inne wersje tej części znikają.
+    Domyślnie do CHUNKS_DIR / CHUNKS_URL. Zwraca (url, hash, bajty).
+    """
+    directory, url = directory or CHUNKS_DIR, url or CHUNKS_URL
+    data = text.encode('utf-8')
+    digest = sha256(data)[:HASH_LEN]
+    name = f"{region_id}.{digest}.json"
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    if not path.exists() or path.read_bytes() != data:
+        path.write_bytes(data)
+    for old in directory.glob(f"{region_id}.*.json"):
+        if old.name != name:
+            old.unlink()
+    return f"{url}/{name}", digest, len(data)
+
+
+def write_ts(path: Path, const: str, counties: list[dict], view_box: str) -> int:
+    rows = ",\n".join("  " + json.dumps(c, ensure_ascii=False, separators=(",", ":")) for c in counties)
+    text = ("/* eslint-disable */\n"
+            f"export const {const} = [\n{rows}\n];\n"
+            f"export const MAP_META = {{ viewBox: '{view_box}' }};\n")
+    path.write_text(text, encoding='utf-8')
+    return len(text.encode('utf-8'))
+
+
+def write_manifest(entries: list[dict], view_box: str, projection: str):
+    rows = ",\n".join("  " + json.dumps(e, ensure_ascii=False, separators=(",", ":")) for e in entries)
+    MANIFEST_TS.write_text(
+        "/* eslint-disable */\n"
+        "// Wygenerowane przez scripts/geojson_to_svg.py — nie edytować ręcznie\n"
+        "export interface MapChunk {\n"
+        "  id: string;                                   // PL-MA … albo PL (cały kraj)\n"
+        "  name: string;\n"
+        "  file: string;                                 // URL części (nazwa z hashem treści)\n"
+        "  hash: string;\n"
+        "  bbox: [number, number, number, number];       // lon/lat: zachód, południe, wschód, północ\n"
+        "  viewBox: string;                              // viewBox ścieżek w części\n"
+        "  count: number;                                // liczba powiatów\n"
+        "  outline?: string;                             // kontur województwa na mapie kraju (MAP_VIEWBOX)\n"
+        "  label?: { x: number; y: number };\n"
+        "}\n\n"
+        f"export const MAP_VIEWBOX = '{view_box}';\n"
+        f"export const MAP_PROJECTION = '{projection}';   // geometry.PROJECTIONS w scripts/\n\n"
+        f"export const MAP_CHUNKS: MapChunk[] = [\n{rows}\n];\n",
+        encoding='utf-8')
+
+
+def download_and_convert(projection: str = PROJECTION):
+    # Plik GeoJSON z powiatami całej Polski (od jusuff) — pobierany raz do raw_dane/,
+    # ten sam, którego używa map_facilities_to_counties.py --polska
     print(f"--- START ---")
-    print(f"Pobieranie danych z: {url}...")
-    
+    print(f"Dane: {POLAND_COUNTIES_URL}")
+    print(f"Rzutowanie: {projection}")
+
     try:
-        with urllib.request.urlopen(url, context=context) as response:
-            all_data = json.loads(response.read().decode())
+        all_data = load_poland_counties()
     except Exception as e:
         print(f"!!! BŁĄD POBIERANIA: {e}")
         return
 
-    # Filtrowanie: Szukamy powiatów z małopolskiego (TERC zaczyna się od 12)
-    malopolska_features = []
-    for f in all_data['features']:
-        props = f['properties']
-        terc_code = str(props.get('terc', ''))
-        
-        if terc_code.startswith('12'):
-            malopolska_features.append(f)
-
-    if not malopolska_features:
-        print("!!! BŁĄD: Nie znaleziono powiatów dla Małopolski.")
-        return
+    features = all_data['features']
+    by_woj: dict[str, list[int]] = {}
+    for i, f in enumerate(features):
+        by_woj.setdefault(str(f['properties'].get('terc', ''))[:2], []).append(i)
+    codes = [code for code in sorted(gus.WOJEWODZTWA) if by_woj.get(code)]
+    for code in sorted(set(gus.WOJEWODZTWA) - set(codes)):
+        print(f"!!! BŁĄD: Nie znaleziono powiatów dla: {gus.WOJEWODZTWA[code]}")
+
+    labels = LabelCache(LABELS_PATH)
+    source_hash = sha256(POLAND_COUNTIES_PATH.read_bytes())[:16]
+
+    def bbox(layer):
+        return [round(float(v), 4) for v in layer.bbox]
+
+    # kraj: wszystkie powiaty + kontury województw z tych samych łuków
+    national = Layer(features, TOLERANCE["polska"], projection)
+    outlines = dict(zip(codes, national.outlines([by_woj[c] for c in codes], labels, source_hash)))
+    counties = national.counties(labels, source_hash)
+    url, digest, size = write_chunk(NATIONAL, chunk_json(NATIONAL, "Polska", national, counties))
+    entries = [{"id": NATIONAL, "name": "Polska", "file": url, "hash": digest, "bbox": bbox(national),
+                "viewBox": national.view_box, "count": len(counties)}]
+    total = size
+    print(f"  {NATIONAL:<6} {'Polska':<22} {len(counties):>4} powiatów  {size / 1024:>7.1f} KB  {url}")
+
+    for code in codes:
+        woj, region_id = gus.WOJEWODZTWA[code], REGION_CODES[code]
+        layer = Layer([features[i] for i in by_woj[code]], TOLERANCE["wojewodztwo"], projection)
+        counties = layer.counties(labels, source_hash)
+        url, digest, size = write_chunk(region_id, chunk_json(region_id, woj, layer, counties))
+        entries.append({"id": region_id, "name": woj, "file": url, "hash": digest, "bbox": bbox(layer),
+                        "viewBox": layer.view_box, "count": len(counties), **outlines[code]})
+        total += size
+        print(f"  {region_id:<6} {woj:<22} {len(counties):>4} powiatów  {size / 1024:>7.1f} KB  {url}")
+        if code in TS_MODULES:
+            path, const = TS_MODULES[code]
+            write_ts(path, const, counties, layer.view_box)
+            print(f"         + {path.relative_to(ROOT)}")
+
+    write_manifest(entries, national.view_box, projection)
+    labels.save()
+
+    print(f"--- SUKCES ---")
+    print(f"Wygenerowano {len(entries)} części w {CHUNKS_DIR} ({total / 1024:.1f} KB), "
+          f"spis: {MANIFEST_TS.relative_to(ROOT)}")
 
-    print(f"Znaleziono {len(malopolska_features)} powiatów. Przeliczam koordynaty...")
-
-    # Obliczanie granic mapy (viewBox)
-    all_coords = []
-    for f in malopolska_features:
-        geom = f['geometry']
-        if geom['type'] == 'Polygon':
-            polys = [geom['coordinates'][0]]
-        else:
-            polys = [p[0] for p in geom['coordinates']]
-        for poly in polys:
-            all_coords.extend(poly)
-
-    min_x = min(p[0] for p in all_coords)
-    max_x = max(p[0] for p in all_coords)
-    min_y = min(p[1] for p in all_coords)
-    max_y = max(p[1] for p in all_coords)
-
-    # Parametry SVG
-    width = 600
-    scale = width / (max_x - min_x)
-    height = (max_y - min_y) * scale
-
-    counties_ts = []
-    for f in malopolska_features:
-        props = f['properties']
-        geom = f['geometry']
-        polygons = geom['coordinates'] if geom['type'] == 'Polygon' else [p[0] for p in geom['coordinates']]
-        
-        paths = []
-        c_x, c_y, total_p = 0, 0, 0
-        
-        for poly in polygons:
-            path_parts = []
-            for i, p in enumerate(poly):
-                x = (p[0] - min_x) * scale
-                y = height - (p[1] - min_y) * scale
-                path_parts.append(f"{'M' if i==0 else 'L'}{x:.2f},{y:.2f}")
-                c_x += x; c_y += y; total_p += 1
-            paths.append(" ".join(path_parts) + "Z")
-
-        counties_ts.append({
-            "id": str(props.get('terc', '')),
-            "name": props.get('name', 'Nieznany'),
-            "centroid": {
-                "x": c_x/total_p if total_p > 0 else 0, 
-                "y": c_y/total_p if total_p > 0 else 0
-            },
-            "d": " ".join(paths)
-        })
-
-    # Zapis pliku wyjściowego .ts
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("/* eslint-disable */\n")
-            f.write("export const MALOPOLSKIE_COUNTIES = " + json.dumps(counties_ts, indent=2, ensure_ascii=False) + ";\n")
-            f.write(f"export const MAP_META = {{ viewBox: '0 0 {width} {height:.2f}' }};\n")
-        
-        print(f"--- SUKCES ---")
-        print(f"Wygenerowano: {output_path}")
-        print(f"Liczba powiatów: {len(counties_ts)}")
-    except Exception as e:
-        print(f"!!! BŁĄD ZAPISU: {e}")
 
 if __name__ == "__main__":
-    download_and_convert()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Warstwy mapy powiatów (SVG path) z GeoJSON")
+    parser.add_argument("--projection", choices=sorted(PROJECTIONS), default=PROJECTION,
+                        help=f"rzutowanie (domyślnie {PROJECTION})")
+    download_and_convert(parser.parse_args().projection)
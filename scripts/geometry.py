@@ -0,0 +1,422 @@
+"""
+Geometria warstw mapy (scripts/geojson_to_svg.py): topologia granic i upraszczanie.
+
+geojson_to_svg.py zapisywał każdy wierzchołek granicy z pliku źródłowego —
+dwa razy, bo granica dwóch powiatów należy do obu. Upraszczanie każdego
+wielokąta osobno rozsunęłoby wspólne granice (szczeliny i nakładki między
+powiatami), więc robimy to jak TopoJSON:
+
+  - pierścienie dzielimy w węzłach (punkty, w których spotykają się trzy
+    obszary albo granica przestaje być wspólna) na łuki,
+  - łuk wspólny dla dwóch powiatów jest jeden (drugi powiat odwołuje się do
+    niego w odwrotnym kierunku: indeks `~i`, jak w TopoJSON),
+  - każdy łuk upraszczamy raz (Douglas–Peucker, końce łuku zostają), więc
+    sąsiedzi dostają identyczną, uproszczoną granicę,
+  - `merge()` skleja obszary (powiaty → województwo) z tych samych łuków:
+    zostają łuki użyte w grupie raz, więc kontur województwa pokrywa się
+    z granicami jego powiatów i sąsiednich województw.
+
+Tolerancja jest w jednostkach docelowych (piksele viewBoxu) — łuki
+upraszczamy po rzutowaniu, więc ta sama topologia daje warstwy dla różnych
+przybliżeń. Pierścienie i łuki to tablice NumPy (n, 2); węzły szukamy naraz
+dla wszystkich wierzchołków warstwy (sortowanie zamiast słownika punkt po
+punkcie), więc warstwa gmin (~2500 obszarów) liczy się tak samo jak powiatów.
+
+Rzutowanie (`PROJECTIONS`, lon/lat → x na wschód, y na północ):
+  - "lonlat"   — stopnie wprost, jak dotąd (Polska wychodzi spłaszczona
+                 w pionie o ~cos 52°),
+  - "mercator" — Web Mercator (EPSG:3857), jak podkłady kafelkowe,
+  - "puwg1992" — PUWG-1992 (EPSG:2180), układ map urzędowych (GUGiK, PRG).
+
+Punkty etykiet (też w jednostkach po rzutowaniu):
+  - `centroid()` — środek ciężkości ważony polem (średnia wierzchołków, jak
+    dotąd, ciągnie w stronę szczegółowych granic: rzek, gór),
+  - `polylabel()` — biegun niedostępności: punkt wewnątrz obszaru najdalej od
+    granicy (algorytm polylabel z Mapboxa; odległości do wszystkich krawędzi
+    naraz w NumPy) — dla obszarów wklęsłych środek ciężkości bywa poza nimi,
+  - `LabelCache` — wyniki w pliku JSON obok źródła, pod odciskiem źródła
+    i rzutowania; ponowne generowanie warstw liczy tylko to, co się zmieniło.
+
+  xy = PROJECTIONS["puwg1992"](coords)            # (n, 2) lon/lat → metry
+  topo = Topology([exterior_rings(f['geometry']) for f in features])
+  arcs = topo.simplify(project, tolerance=0.5)   # project: (n, 2) lon/lat → px
+  rings = topo.rings(arcs, 0)                    # pierścienie pierwszego obszaru
+  labels = LabelCache(path).get(key, lambda: label_points(projected_features))
+"""
+
+import heapq
+import json
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import numpy as np
+
+
+def exterior_rings(geometry: dict) -> list[list]:
+    """Zewnętrzne pierścienie Polygon / MultiPolygon (otwory pomijamy — jak dotąd na mapie)."""
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates'][0]]
+    return [p[0] for p in geometry['coordinates']]
+
+
+# ── rzutowanie ────────────────────────────────────────────────────────────────
+
+GRS80_A = 6378137.0
+GRS80_F = 1 / 298.257222101
+
+
+def lonlat(coords: np.ndarray) -> np.ndarray:
+    """Stopnie bez zmian (prostokątna siatka lon/lat)."""
+    return np.asarray(coords, dtype=float)[:, :2]
+
+
+def mercator(coords: np.ndarray) -> np.ndarray:
+    """Web Mercator (EPSG:3857) — metry na sferze o promieniu równikowym."""
+    lon, lat = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+    return np.column_stack((GRS80_A * lon, GRS80_A * np.log(np.tan(np.pi / 4 + lat / 2))))
+
+
+def puwg1992(coords: np.ndarray) -> np.ndarray:
+    """
+    PUWG-1992 (EPSG:2180): Gauss–Krüger na elipsoidzie GRS80, południk 19°,
+    skala 0,9993, przesunięcia 500 000 / −5 300 000 m. Wynik (wschód, północ) —
+    w EPSG:2180 osie mają odwrotne nazwy (x to północ). Szeregi Snydera
+    (Map Projections, 1987, wzory 8-9, 8-10) — na mapę 600 px z ogromnym zapasem.
+    """
+    e2 = GRS80_F * (2 - GRS80_F)
+    ep2 = e2 / (1 - e2)
+    lam = np.radians(coords[:, 0] - 19.0)
+    phi = np.radians(coords[:, 1])
+    sin, cos, tan = np.sin(phi), np.cos(phi), np.tan(phi)
+
+    n = GRS80_A / np.sqrt(1 - e2 * sin ** 2)
+    t, c, a = tan ** 2, ep2 * cos ** 2, lam * cos
+    m = GRS80_A * ((1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256) * phi
+                   - (3 * e2 / 8 + 3 * e2 ** 2 / 32 + 45 * e2 ** 3 / 1024) * np.sin(2 * phi)
+                   + (15 * e2 ** 2 / 256 + 45 * e2 ** 3 / 1024) * np.sin(4 * phi)
+                   - (35 * e2 ** 3 / 3072) * np.sin(6 * phi))
+    k0 = 0.9993
+    x = k0 * n * (a + (1 - t + c) * a ** 3 / 6
+                  + (5 - 18 * t + t ** 2 + 72 * c - 58 * ep2) * a ** 5 / 120)
+    y = k0 * (m + n * tan * (a ** 2 / 2 + (5 - t + 9 * c + 4 * c ** 2) * a ** 4 / 24
+                             + (61 - 58 * t + t ** 2 + 600 * c - 330 * ep2) * a ** 6 / 720))
+    return np.column_stack((x + 500000.0, y - 5300000.0))
+
+
+PROJECTIONS = {"lonlat": lonlat, "mercator": mercator, "puwg1992": puwg1992}
+
+
+# ── topologia ─────────────────────────────────────────────────────────────────
+
+def _clean_ring(ring) -> np.ndarray:
+    """
+    Punkty pierścienia (n, 2) bez powtórzeń pod rząd i bez punktu zamykającego,
+    zawsze przeciwnie do ruchu wskazówek zegara — wspólny łuk sąsiadów idzie
+    wtedy w przeciwnych kierunkach, a kontur sumy obszarów ma jedną orientację.
+    """
+    if len(ring) == 0:
+        return np.zeros((0, 2))
+    pts = np.asarray(ring, dtype=float)[:, :2]
+    pts = pts[np.r_[True, np.any(pts[1:] != pts[:-1], axis=1)]]
+    if len(pts) > 1 and (pts[0] == pts[-1]).all():
+        pts = pts[:-1]
+    if len(pts) >= 3:
+        x, y = pts[:, 0], pts[:, 1]
+        if np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) < 0:
+            pts = pts[::-1]
+    return np.ascontiguousarray(pts)
+
+
+def douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Łamana uproszczona algorytmem Douglasa–Peuckera; pierwszy i ostatni punkt zostają.
+    Łuk zamknięty (pierwszy == ostatni) dzieli się w punkcie najdalszym od początku.
+    """
+    n = len(points)
+    if n < 3:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, n - 1)]
+    while stack:
+        s, e = stack.pop()
+        if e - s < 2:
+            continue
+        a, seg = points[s], points[s + 1:e]
+        dx, dy = points[e] - a
+        length = np.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(seg[:, 0] - a[0], seg[:, 1] - a[1])
+        else:
+            dist = np.abs(dx * (seg[:, 1] - a[1]) - dy * (seg[:, 0] - a[0])) / length
+        i = int(dist.argmax())
+        if dist[i] > tolerance:
+            keep[s + 1 + i] = True
+            stack += [(s, s + 1 + i), (s + 1 + i, e)]
+    return points[keep]
+
+
+def ring_area(ring: np.ndarray) -> float:
+    """Pole pierścienia (wzór Gaussa, wartość bezwzględna)."""
+    x, y = ring[:, 0], ring[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))) / 2
+
+
+class Topology:
+    """
+    Łuki wspólne dla obszarów. `features[i]` — lista pierścieni obszaru i
+    (tablice (n, 2) albo listy punktów [x, y]); `self.refs[i]` — dla każdego
+    pierścienia lista odwołań do łuków (`~k` = łuk k w odwrotnym kierunku).
+    """
+
+    def __init__(self, features: list[list]):
+        rings = [[_clean_ring(r) for r in feature] for feature in features]
+        flat = [r for feature in rings for r in feature]
+        ends = np.cumsum([len(r) for r in flat])
+        cuts = iter(np.split(self._junctions(flat), ends[:-1]) if flat else [])
+
+        self.arcs: list[np.ndarray] = []
+        self._index: dict[bytes, int] = {}
+        self.refs = [[self._split(r, c) for r, c in zip(feature, cuts) if len(r) >= 3] for feature in rings]
+
+    def __len__(self) -> int:
+        return len(self.arcs)
+
+    @staticmethod
+    def _junctions(rings: list[np.ndarray]) -> np.ndarray:
+        """
+        Maska węzłów dla wierzchołków wszystkich pierścieni po kolei: punkt,
+        który występuje z więcej niż jedną parą sąsiadów (kolejność pary bez znaczenia).
+        """
+        # punkt → numer (x + iy jako jedna liczba: sortowanie 1D zamiast wierszy)
+        p = np.concatenate(rings)
+        points, ids = np.unique(p[:, 0] + 1j * p[:, 1], return_inverse=True)
+        ids = ids.ravel()
+        per_ring = np.split(ids, np.cumsum([len(r) for r in rings])[:-1])
+        prev = np.concatenate([np.roll(r, 1) for r in per_ring])
+        nxt = np.concatenate([np.roll(r, -1) for r in per_ring])
+        pair = np.minimum(prev, nxt).astype(np.int64) * len(points) + np.maximum(prev, nxt)
+
+        order = np.lexsort((pair, ids))
+        ids_s, pair_s = ids[order], pair[order]
+        other_pair = (ids_s[1:] == ids_s[:-1]) & (pair_s[1:] != pair_s[:-1])
+        is_junction = np.zeros(len(points), dtype=bool)
+        is_junction[ids_s[1:][other_pair]] = True
+        return is_junction[ids]
+
+    def _arc(self, points: np.ndarray) -> int:
+        """Odwołanie do łuku: istniejącego (także w odwrotnym kierunku) albo nowego."""
+        key = points.tobytes()
+        if key in self._index:
+            return self._index[key]
+        rev = points[::-1].tobytes()
+        if rev in self._index:
+            return ~self._index[rev]
+        self._index[key] = len(self.arcs)
+        self.arcs.append(points)
+        return len(self.arcs) - 1
+
+    def _split(self, ring: np.ndarray, is_junction: np.ndarray) -> list[int]:
+        n = len(ring)
+        cuts = np.flatnonzero(is_junction)
+        if not len(cuts):
+            # pierścień bez węzłów (wyspa, obszar bez sąsiadów) — jeden łuk zamknięty,
+            # zaczęty od najmniejszego punktu, żeby ten sam pierścień dał ten sam klucz
+            k = int(np.lexsort((ring[:, 1], ring[:, 0]))[0])
+            return [self._arc(np.concatenate((ring[k:], ring[:k + 1])))]
+        start = int(cuts[0])
+        ring = np.concatenate((ring[start:], ring[:start + 1]))
+        cuts = [int(i) - start for i in cuts] + [n]
+        return [self._arc(ring[s:e + 1]) for s, e in zip(cuts, cuts[1:])]
+
+    def simplify(self, project, tolerance: float) -> list[np.ndarray]:
+        """Łuki po rzutowaniu `project` ((n, 2) → (n, 2)), uproszczone z tolerancją w jednostkach wyniku."""
+        return [douglas_peucker(project(arc), tolerance) for arc in self.arcs]
+
+    def merge(self, features: list[int]) -> list[list[int]]:
+        """
+        Kontur sumy obszarów `features` jako pierścienie odwołań do łuków: łuki
+        użyte w grupie raz (wewnętrzne granice — dwa razy — odpadają), sklejane
+        koniec → początek. Otwory w sumie (enklawy spoza grupy) też wychodzą
+        jako pierścienie.
+        """
+        uses = Counter(r if r >= 0 else ~r for f in features for ring in self.refs[f] for r in ring)
+        outer = [r for f in features for ring in self.refs[f] for r in ring if uses[r if r >= 0 else ~r] == 1]
+
+        def ends(r):
+            arc = self.arcs[r if r >= 0 else ~r]
+            first, last = tuple(arc[0].tolist()), tuple(arc[-1].tolist())
+            return (first, last) if r >= 0 else (last, first)
+
+        by_start = defaultdict(list)
+        for r in outer:
+            by_start[ends(r)[0]].append(r)
+        used, rings = set(), []
+        for r in outer:
+            if r in used:
+                continue
+            ring = [r]
+            used.add(r)
+            while ends(ring[-1])[1] != ends(ring[0])[0]:
+                nxt = next((c for c in by_start[ends(ring[-1])[1]] if c not in used), None)
+                if nxt is None:
+                    break
+                ring.append(nxt)
+                used.add(nxt)
+            rings.append(ring)
+        return rings
+
+    def kept(self, arcs: list[np.ndarray], feature: int | list[list[int]],
+             min_area: float = 0.0) -> list[list[int]]:
+        """
+        Pierścienie obszaru `feature` (indeks albo wynik `merge()`) jako odwołania
+        do łuków — bez zdegenerowanych (< 3 punktów po uproszczeniu `arcs`) i mniejszych
+        niż `min_area`, poza największym, żeby żaden obszar nie zniknął z mapy.
+        """
+        refs = self.refs[feature] if isinstance(feature, int) else feature
+        if not refs:
+            return []
+        rings = [self._ring(arcs, ring) for ring in refs]
+        areas = [ring_area(r) if len(r) >= 4 else 0.0 for r in rings]
+        largest = int(np.argmax(areas))
+        return [ring for i, ring in enumerate(refs)
+                if i == largest or (len(rings[i]) >= 4 and areas[i] >= min_area)]
+
+    def rings(self, arcs: list[np.ndarray], feature: int | list[list[int]],
+              min_area: float = 0.0) -> list[np.ndarray]:
+        """Pierścienie obszaru złożone z (uproszczonych) łuków `arcs` — te, które zostawia `kept()`."""
+        return [self._ring(arcs, ring) for ring in self.kept(arcs, feature, min_area)]
+
+    @staticmethod
+    def _ring(arcs: list[np.ndarray], refs: list[int]) -> np.ndarray:
+        parts = [arcs[r] if r >= 0 else arcs[~r][::-1] for r in refs]
+        return np.concatenate([parts[0]] + [p[1:] for p in parts[1:]])
+
+
+# ── punkty etykiet ────────────────────────────────────────────────────────────
+
+def centroid(rings: list[np.ndarray]) -> np.ndarray:
+    """Środek ciężkości pierścieni ważony polem (przy zerowym polu — średnia wierzchołków)."""
+    pts = [np.asarray(r, dtype=float) for r in rings if len(r)]
+    total, moment = 0.0, np.zeros(2)
+    for r in pts:
+        x, y = r[:, 0], r[:, 1]
+        x1, y1 = np.roll(x, -1), np.roll(y, -1)
+        cross = x * y1 - x1 * y
+        area = cross.sum() / 2
+        if area == 0:
+            continue
+        c = np.array([((x + x1) * cross).sum(), ((y + y1) * cross).sum()]) / (6 * area)
+        total += abs(area)
+        moment += abs(area) * c
+    if total == 0:
+        return np.concatenate(pts).mean(axis=0) if pts else np.zeros(2)
+    return moment / total
+
+
+def _edges(rings: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Krawędzie wszystkich pierścieni: końce a (m, 2) i b (m, 2)."""
+    a = np.concatenate([r for r in rings])
+    b = np.concatenate([np.roll(r, -1, axis=0) for r in rings])
+    return a, b
+
+
+def signed_distance(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Odległość punktów (k, 2) od granicy o krawędziach a→b — dodatnia wewnątrz,
+    ujemna na zewnątrz (parzystość przecięć, więc otwory i wyspy też działają).
+    """
+    p = points[:, None, :]                                    # (k, 1, 2) × (m, 2)
+    ab = b - a
+    len2 = (ab ** 2).sum(axis=1)
+    t = np.clip(((p - a) * ab).sum(axis=2) / np.where(len2 == 0, 1, len2), 0, 1)
+    dist = np.sqrt((((a + t[..., None] * ab) - p) ** 2).sum(axis=2)).min(axis=1)
+
+    px, py = points[:, :1], points[:, 1:]
+    ax, ay, bx, by = a[:, 0], a[:, 1], b[:, 0], b[:, 1]
+    crosses = (ay > py) != (by > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_at = (bx - ax) * (py - ay) / (by - ay) + ax
+    inside = (crosses & (px < x_at)).sum(axis=1) % 2 == 1
+    return np.where(inside, dist, -dist)
+
+
+def polylabel(rings: list[np.ndarray], precision: float = 1.0) -> np.ndarray:
+    """
+    Biegun niedostępności (Mapbox polylabel): siatka komórek nad prostokątem
+    ograniczającym, dzielona tylko tam, gdzie lepszy punkt jest jeszcze możliwy.
+    `precision` — w jednostkach współrzędnych.
+    """
+    rings = [np.asarray(r, dtype=float) for r in rings if len(r) >= 3]
+    if not rings:
+        return np.zeros(2)
+    a, b = _edges(rings)
+    lo, hi = a.min(axis=0), a.max(axis=0)
+    size = float((hi - lo).min())
+    if size == 0:
+        return lo
+
+    h = size / 2
+    xs = np.arange(lo[0], hi[0], size) + h
+    ys = np.arange(lo[1], hi[1], size) + h
+    cells = np.array([(x, y) for x in xs for y in ys])
+    candidates = np.vstack([cells, centroid(rings), (lo + hi) / 2])
+    dist = signed_distance(candidates, a, b)
+
+    best = int(dist.argmax())
+    best_pt, best_d = candidates[best], dist[best]
+    queue = [(-(d + h * np.sqrt(2)), float(d), float(x), float(y), h)
+             for (x, y), d in zip(cells, dist[:len(cells)])]
+    heapq.heapify(queue)
+    while queue:
+        neg_max, d, x, y, h = heapq.heappop(queue)
+        if -neg_max - best_d <= precision:
+            break
+        h /= 2
+        children = np.array([(x - h, y - h), (x + h, y - h), (x - h, y + h), (x + h, y + h)])
+        for (cx, cy), cd in zip(children, signed_distance(children, a, b)):
+            if cd > best_d:
+                best_pt, best_d = np.array([cx, cy]), cd
+            heapq.heappush(queue, (-(cd + h * np.sqrt(2)), float(cd), float(cx), float(cy), h))
+    return best_pt
+
+
+def label_points(features: list[list[np.ndarray]], precision: float = 0.5) -> np.ndarray:
+    """(n, 4): środek ciężkości (x, y) i biegun niedostępności (x, y) każdego obszaru."""
+    out = np.zeros((len(features), 4))
+    for i, rings in enumerate(features):
+        out[i, :2] = centroid(rings)
+        out[i, 2:] = polylabel(rings, precision)
+    return out
+
+
+class LabelCache:
+    """
+    Punkty etykiet w pliku JSON (obok pliku źródłowego). Klucz to odcisk
+    źródła + parametrów rzutowania — inny klucz liczy od nowa, stare wpisy
+    z tego samego pliku znikają przy zapisie.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.entries: dict[str, list] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except ValueError:
+                self.entries = {}
+        self.used: dict[str, list] = {}
+        self.changed = False
+
+    def get(self, key: str, compute) -> np.ndarray:
+        if key not in self.entries:
+            self.entries[key] = np.round(compute(), 2).tolist()
+            self.changed = True
+        self.used[key] = self.entries[key]
+        return np.array(self.entries[key], dtype=float).reshape(-1, 4)
+
+    def save(self):
+        if self.changed or self.used.keys() != self.entries.keys():
+            self.path.write_text(json.dumps(self.used, separators=(",", ":")), encoding='utf-8')
+            self.entries = dict(self.used)
+            self.changed = False
@@ -0,0 +1,184 @@
+"""
+Populacja GUS BDL per powiat jako kostka NumPy: powiat × rok × miara × typ.
+
+fetch-gus-bdl.py zapisuje długi CSV (jeden wiersz = powiat, rok, typ, miara),
+a skrypty analityczne przeszukiwały go od nowa dla każdej miary i roku.
+Tu CSV czytamy raz, do gęstej tablicy `values[powiat, rok, miara, typ]`
+(float, NaN = brak danych), a zapytania to wycinki tablicy:
+
+  cube = load()
+  cube.pop("80plus", 2024)                      # wektor w kolejności cube.teryt
+  cube.pop("80plus", 2035, typ="prognoza")
+  cube.series("80plus")                         # powiat × rok
+  i = cube.index[("małopolskie", "m. Kraków")]  # konwencja Placowka.powiat
+
+Kostka jest zapisywana obok danych (raw_dane/.gus_cube.npz) i wczytywana
+z pliku, dopóki źródłowe CSV się nie zmienią (rozmiar + mtime). Dla 380
+powiatów × ~30 lat × kilku miar to ułamek megabajta.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+ROOT       = Path(__file__).resolve().parent.parent
+DATA_DIR   = ROOT / "data"
+GUS_GLOB   = "gus_populacja_*.csv"
+CUBE_CACHE = ROOT / "raw_dane" / ".gus_cube.npz"
+
+# kod TERYT województwa → nazwa jak w "Placowka".wojewodztwo
+WOJEWODZTWA = {
+    "02": "dolnośląskie", "04": "kujawsko-pomorskie", "06": "lubelskie", "08": "lubuskie",
+    "10": "łódzkie", "12": "małopolskie", "14": "mazowieckie", "16": "opolskie",
+    "18": "podkarpackie", "20": "podlaskie", "22": "pomorskie", "24": "śląskie",
+    "26": "świętokrzyskie", "28": "warmińsko-mazurskie", "30": "wielkopolskie",
+    "32": "zachodniopomorskie",
+}
+
+TYPY        = ("historyczny", "prognoza")
+POP_COLUMNS = {"teryt_powiat", "powiat", "rok", "typ", "miara", "populacja"}
+
+
+def powiat_name(bdl_name: str) -> str:
+    """Nazwa jednostki BDL → konwencja "Placowka" ("Powiat m. Kraków" → "m. Kraków")."""
+    return bdl_name.strip().removeprefix("Powiat ")
+
+
+def woj_code(teryt: str) -> str:
+    """Kod TERYT województwa z 12-znakowego id jednostki BDL (znaki 3–4)."""
+    return teryt[2:4]
+
+
+def gmina_teryt(bdl_id: str) -> str:
+    """
+    Kod TERYT gminy (woj, powiat, gmina, rodzaj — 7 znaków) z id jednostki BDL
+    poziomu 6: "011212161011" → "1261011" (znaki 5–7 to region i podregion).
+    """
+    return bdl_id[2:4] + bdl_id[7:12]
+
+
+class PopulationCube:
+    def __init__(self, teryt: np.ndarray, names: np.ndarray, years: np.ndarray,
+                 measures: np.ndarray, values: np.ndarray):
+        self.teryt    = teryt                  # id jednostek BDL, posortowane
+        self.names    = names                  # nazwy BDL ("Powiat bocheński")
+        self.years    = years
+        self.measures = measures
+        self.values   = values                 # [powiat, rok, miara, typ]
+
+        self.wojewodztwa = [WOJEWODZTWA.get(woj_code(t), "") for t in teryt]
+        self.powiaty     = [powiat_name(n) for n in names]
+        self.index   = {(w, p): i for i, (w, p) in enumerate(zip(self.wojewodztwa, self.powiaty))}
+        self.by_teryt = {t: i for i, t in enumerate(teryt)}
+        self._year   = {int(y): i for i, y in enumerate(years)}
+        self._measure = {m: i for i, m in enumerate(measures)}
+
+    def __len__(self) -> int:
+        return len(self.teryt)
+
+    # ── zapytania ────────────────────────────────────────────────────────────
+
+    def pop(self, measure: str, year: int, typ: str = "historyczny") -> np.ndarray:
+        """Populacja wszystkich powiatów (kolejność `teryt`) — NaN, gdy brak danych."""
+        if year not in self._year or measure not in self._measure:
+            return np.full(len(self), np.nan)
+        return self.values[:, self._year[year], self._measure[measure], TYPY.index(typ)]
+
+    def series(self, measure: str, typ: str = "historyczny") -> np.ndarray:
+        """Tablica powiat × rok (kolumny jak `years`)."""
+        if measure not in self._measure:
+            return np.full((len(self), len(self.years)), np.nan)
+        return self.values[:, :, self._measure[measure], TYPY.index(typ)]
+
+    def latest_year(self, measure: str, typ: str = "historyczny") -> int | None:
+        has = ~np.isnan(self.series(measure, typ)).all(axis=0)
+        return int(self.years[has][-1]) if has.any() else None
+
+    def take(self, keys: list[tuple[str, str]]) -> np.ndarray:
+        """Indeksy powiatów dla kluczy (województwo, powiat); -1 — brak w kostce."""
+        return np.array([self.index.get(k, -1) for k in keys], dtype=np.int64)
+
+    def lookup(self, values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """`values[idx]` z NaN dla idx = -1 (np. wektor z `pop()` dla kluczy z `take()`)."""
+        out = np.full(len(idx), np.nan)
+        ok = idx >= 0
+        out[ok] = values[idx[ok]]
+        return out
+
+    # ── budowa / zapis ───────────────────────────────────────────────────────
+
+    @classmethod
+    def from_rows(cls, rows) -> "PopulationCube":
+        """Kostka z wierszy w układzie CSV (teryt_powiat, powiat, rok, typ, miara, populacja)."""
+        rows = list(rows)
+        names = {}
+        for r in rows:
+            names[r["teryt_powiat"]] = r["powiat"]
+        teryt    = np.array(sorted(names), dtype=str)
+        years    = np.array(sorted({int(r["rok"]) for r in rows}), dtype=np.int64)
+        measures = np.array(sorted({r["miara"] for r in rows}), dtype=str)
+
+        t_idx = {t: i for i, t in enumerate(teryt)}
+        y_idx = {int(y): i for i, y in enumerate(years)}
+        m_idx = {m: i for i, m in enumerate(measures)}
+        values = np.full((len(teryt), len(years), len(measures), len(TYPY)), np.nan)
+        if rows:
+            coords = np.array([(t_idx[r["teryt_powiat"]], y_idx[int(r["rok"])],
+                                m_idx[r["miara"]], TYPY.index(r["typ"])) for r in rows])
+            values[tuple(coords.T)] = [float(r["populacja"]) for r in rows]
+        return cls(teryt, np.array([names[t] for t in teryt], dtype=str), years, measures, values)
+
+    @classmethod
+    def from_csv(cls, paths: list[Path]) -> "PopulationCube":
+        """Jeden przebieg po każdym pliku; pliki w innym układzie kolumn są pomijane."""
+        rows = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                if POP_COLUMNS <= set(reader.fieldnames or ()):
+                    rows.extend(reader)
+        return cls.from_rows(rows)
+
+    def save(self, path: Path = CUBE_CACHE, stamp: str = ""):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(tmp, teryt=self.teryt, names=self.names, years=self.years,
+                            measures=self.measures, values=self.values, stamp=np.array(stamp))
+        tmp.replace(path)
+
+    @classmethod
+    def from_npz(cls, path: Path) -> tuple["PopulationCube", str]:
+        with np.load(path, allow_pickle=False) as z:
+            cube = cls(z["teryt"], z["names"], z["years"], z["measures"], z["values"])
+            return cube, str(z["stamp"])
+
+    def rows(self):
+        """Wiersze w układzie CSV (bez pustych komórek) — np. do eksportu."""
+        for i, t, m, k in zip(*np.nonzero(~np.isnan(self.values))):
+            yield {
+                "teryt_powiat": self.teryt[i], "powiat": self.names[i], "rok": int(self.years[t]),
+                "typ": TYPY[k], "miara": self.measures[m], "populacja": int(self.values[i, t, m, k]),
+            }
+
+
+def sources_stamp(paths: list[Path]) -> str:
+    return json.dumps([(p.name, p.stat().st_size, p.stat().st_mtime_ns) for p in paths])
+
+
+def load(paths: list[Path] | None = None, cache: Path | None = CUBE_CACHE) -> PopulationCube:
+    """Kostka z data/gus_populacja_*.csv — z cache .npz, gdy pliki źródłowe się nie zmieniły."""
+    paths = sorted(paths if paths is not None else DATA_DIR.glob(GUS_GLOB))
+    stamp = sources_stamp(paths)
+    if cache is not None and cache.exists():
+        try:
+            cube, cached_stamp = PopulationCube.from_npz(cache)
+            if cached_stamp == stamp:
+                return cube
+        except (OSError, ValueError, KeyError):
+            pass
+    cube = PopulationCube.from_csv(paths)
+    if cache is not None:
+        cube.save(cache, stamp)
+    return cube
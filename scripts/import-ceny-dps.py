@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Import średnich kosztów utrzymania w DPS (uchwały / obwieszczenia wojewodów)
+do tabeli "PlacowkaCena".
+
+parser_pdf_malopolska.py kończył na CSV z umownym `ID_Placowki` (slug powiatu
+i nazwy) — ceny do bazy trzeba było wpisywać ręcznym SQL-em. Tu:
+
+  - wejście: pliki ceny_dps_{województwo}_{rok}.csv (koszty_dps.CENA_FIELDS)
+    albo wprost PDF uchwały (koszty_dps.parse_pdf, wtedy --woj / --rok / --url),
+  - dopasowanie do "Placowka" indeksem FacilityMatcher (facility_matcher.py):
+    najpierw adres (ulica + numer), potem nazwa — nazwa tylko wtedy, gdy zgadza
+    się powiat, bo w uchwałach połowa pozycji to po prostu „Dom Pomocy Społecznej”,
+  - porównanie z tym, co już jest w "PlacowkaCena" dla (placowkaId, rok,
+    typ_kosztu): nowe / zmienione / bez zmian / niedopasowane,
+  - zapis nowych i zmienionych jednym INSERT … ON CONFLICT, wszystkie pliki
+    w jednej transakcji (błąd w dowolnym pliku — nic nie zostaje zapisane).
+    Zmiana kwoty czyści flagę `anomalia`; po imporcie warto puścić
+    `python scripts/walidacja_anomalii.py --db`.
+
+Użycie:
+  DATABASE_URL=... python scripts/import-ceny-dps.py scripts/ceny_dps_malopolskie_2025.csv
+  DATABASE_URL=... python scripts/import-ceny-dps.py ceny_dps_*.csv --dry-run    # sam raport zmian
+  DATABASE_URL=... python scripts/import-ceny-dps.py uchwala.pdf --woj śląskie --url https://...
+"""
+
+import csv
+import sys
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+from facility_matcher import FacilityMatcher
+from koszty_dps import cena_rows, parse_pdf
+from localities import norm_unit
+from monitors.core import DATABASE_URL, require
+from monitors.vacancies import load_facilities
+
+# ostrzej niż przy wolnych miejscach (0.75): „DPS im. św. Brata Alberta” i „DPS
+# im. św. Jana Pawła II” to już 0.76, a cena przypisana złej placówce jest gorsza
+# niż brak ceny (adres i tak rozstrzyga większość pozycji)
+MATCH_THRESHOLD = 0.85
+
+EXISTING_SQL = """
+    SELECT pc."placowkaId", pc.rok, pc.typ_kosztu, pc.kwota, pc.zrodlo
+    FROM "PlacowkaCena" pc
+    JOIN "Placowka" p ON p.id = pc."placowkaId"
+    WHERE p.wojewodztwo = %s AND pc.rok = %s
+"""
+
+UPSERT_SQL = """
+    INSERT INTO "PlacowkaCena"
+      ("placowkaId", rok, typ_kosztu, kwota, zrodlo, data_pobrania, "createdAt", "updatedAt")
+    VALUES %s
+    ON CONFLICT ("placowkaId", rok, typ_kosztu)
+    DO UPDATE SET
+      kwota         = EXCLUDED.kwota,
+      zrodlo        = COALESCE(EXCLUDED.zrodlo, "PlacowkaCena".zrodlo),
+      data_pobrania = EXCLUDED.data_pobrania,
+      anomalia      = CASE WHEN "PlacowkaCena".kwota IS DISTINCT FROM EXCLUDED.kwota
+                           THEN NULL ELSE "PlacowkaCena".anomalia END,
+      "updatedAt"   = NOW()
+"""
+UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, NOW(), NOW(), NOW())"
+
+
+# ── wejście ───────────────────────────────────────────────────────────────────
+
+def read_rows(path: Path, wojewodztwo: str | None, rok: int | None, zrodlo: str | None,
+              workers: int | None = None) -> list[dict]:
+    """Wiersze cen (CENA_FIELDS) z CSV parsera albo wprost z PDF uchwały."""
+    if path.suffix.lower() == ".pdf":
+        if not wojewodztwo:
+            sys.exit(f"❌ {path}: dla PDF podaj --woj")
+        records, rok_pdf = parse_pdf(path, workers=workers)
+        if not (rok or rok_pdf):
+            sys.exit(f"❌ {path}: brak roku w nagłówku PDF — podaj --rok")
+        return cena_rows(records, wojewodztwo.strip().lower(), rok or rok_pdf, zrodlo=zrodlo)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for r in rows:
+        r["wojewodztwo"] = (wojewodztwo or r["wojewodztwo"]).strip().lower()
+        r["rok"] = rok or int(r["rok"])
+        r["kwota"] = float(r["kwota"]) if r["kwota"] else None
+        r["typ_kosztu"] = r.get("typ_kosztu") or "podstawowy"
+        r["zrodlo"] = zrodlo or r.get("zrodlo") or None
+    return [r for r in rows if r["kwota"] is not None]
+
+
+# ── dopasowanie i różnice ─────────────────────────────────────────────────────
+
+def match_prices(rows: list[dict], matcher: FacilityMatcher,
+                 threshold: float = MATCH_THRESHOLD) -> tuple[dict[tuple, dict], list[tuple[dict, float]]]:
+    """
+    ({(placowkaId, rok, typ_kosztu): wiersz}, [(niedopasowany wiersz, score)]).
+    Dwie pozycje uchwały trafiające w tę samą placówkę (np. dwa profile pod
+    jednym adresem) — zostaje pierwsza, druga idzie do niedopasowanych.
+    """
+    matched, unmatched = {}, []
+    for row in rows:
+        powiat = norm_unit(row["powiat"])
+
+        def same_powiat(db_row):
+            return not powiat or norm_unit(db_row["powiat"]) == powiat
+
+        db_row, score = matcher.match_address(row["nazwa"], row["adres"], accept=same_powiat)
+        if db_row is None or score < threshold:
+            unmatched.append((row, score))
+            continue
+        key = (db_row["id"], row["rok"], row["typ_kosztu"])
+        if key in matched:
+            print(f"  ⚠️  Druga pozycja dla placówki {db_row['id']} ({db_row['nazwa'][:40]}): "
+                  f"l.p. {row.get('lp') or '?'} — pomijam")
+            unmatched.append((row, score))
+            continue
+        row["placowka"] = db_row["nazwa"]
+        matched[key] = row
+    return matched, unmatched
+
+
+def diff_prices(matched: dict[tuple, dict], existing: dict[tuple, tuple]) -> dict[str, list[tuple]]:
+    """Podział na nowe / zmienione / bez zmian: [(klucz, wiersz, dotychczasowa kwota)]."""
+    diff = defaultdict(list)
+    for key, row in matched.items():
+        if key not in existing:
+            diff["nowe"].append((key, row, None))
+            continue
+        kwota, zrodlo = existing[key]
+        changed = round(kwota, 2) != row["kwota"] or (row["zrodlo"] and row["zrodlo"] != zrodlo)
+        diff["zmienione" if changed else "bez zmian"].append((key, row, kwota))
+    return diff
+
+
+def load_existing(cur, wojewodztwo: str, rok: int) -> dict[tuple, tuple]:
+    cur.execute(EXISTING_SQL, (wojewodztwo, rok))
+    return {(pid, r, typ): (kwota, zrodlo) for pid, r, typ, kwota, zrodlo in cur.fetchall()}
+
+
+def print_diff(diff: dict[str, list[tuple]], unmatched: list[tuple[dict, float]]):
+    for key, row, _ in diff["nowe"]:
+        print(f"  + [{key[0]:>5}] {row['placowka'][:50]:<50} {row['kwota']:>10.2f}")
+    for key, row, old in diff["zmienione"]:
+        print(f"  ~ [{key[0]:>5}] {row['placowka'][:50]:<50} {old:>10.2f} → {row['kwota']:.2f}")
+    for row, score in unmatched:
+        print(f"  ❌ [{score:.2f}] l.p. {row.get('lp') or '?':>3} {row['powiat']}: {row['nazwa'][:50]}")
+
+
+# ── zapis ─────────────────────────────────────────────────────────────────────
+
+def upsert_prices(cur, changes: list[tuple]):
+    """Nowe i zmienione ceny jednym poleceniem (bez commit — robi to wywołujący)."""
+    if not changes:
+        return
+    extras = require("psycopg2.extras", "psycopg2-binary")
+    values = [(*key, row["kwota"], row["zrodlo"]) for key, row, _ in changes]
+    extras.execute_values(cur, UPSERT_SQL, values, template=UPSERT_TEMPLATE, page_size=len(values))
+
+
+def import_file(conn, path: Path, rows: list[dict], dry_run: bool) -> dict[str, int]:
+    """Dopasowanie, raport i zapis jednego pliku (jedno województwo × rok)."""
+    stats = {"wierszy": len(rows), "nowe": 0, "zmienione": 0, "bez zmian": 0, "niedopasowane": 0}
+    if not rows:
+        print(f"⚠️  {path}: brak wierszy z kwotą — pomijam")
+        return stats
+    groups = {(r["wojewodztwo"], r["rok"]) for r in rows}
+    if len(groups) > 1:
+        sys.exit(f"❌ {path}: wiele województw / lat w jednym pliku: {sorted(groups)}")
+    (wojewodztwo, rok), = groups
+
+    cur = conn.cursor()
+    db = load_facilities(conn, wojewodztwo)
+    print(f"\n📄 {path} — {wojewodztwo} {rok}: {len(rows)} pozycji, DPS w bazie: {len(db)}")
+    matched, unmatched = match_prices(rows, FacilityMatcher(db))
+    diff = diff_prices(matched, load_existing(cur, wojewodztwo, rok))
+    print_diff(diff, unmatched)
+
+    for k in ("nowe", "zmienione", "bez zmian"):
+        stats[k] = len(diff[k])
+    stats["niedopasowane"] = len(unmatched)
+    if not dry_run:
+        upsert_prices(cur, diff["nowe"] + diff["zmienione"])
+    cur.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import kosztów utrzymania w DPS do "PlacowkaCena"')
+    parser.add_argument("files", nargs="+", type=Path, help="ceny_dps_*.csv albo PDF uchwały")
+    parser.add_argument("--woj", help="województwo (wymagane dla PDF; dla CSV nadpisuje kolumnę)")
+    parser.add_argument("--rok", type=int, help="rok kosztów (dla PDF domyślnie z nagłówka)")
+    parser.add_argument("--url", help="URL dokumentu źródłowego (PlacowkaCena.zrodlo)")
+    parser.add_argument("--workers", type=int, help="procesy do stron PDF")
+    parser.add_argument("--dry-run", action="store_true", help="tylko raport zmian, bez zapisu")
+    args = parser.parse_args()
+
+    if not DATABASE_URL:
+        print("❌ Brak DATABASE_URL w środowisku!")
+        sys.exit(1)
+
+    inputs = [(path, read_rows(path, args.woj, args.rok, args.url, args.workers)) for path in args.files]
+
+    psycopg2 = require("psycopg2", "psycopg2-binary")
+    conn = psycopg2.connect(DATABASE_URL)
+    results = {}
+    try:
+        for path, rows in inputs:
+            results[path] = import_file(conn, path, rows, args.dry_run)
+        if args.dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print("\n── Podsumowanie ──")
+    for path, s in results.items():
+        print(f"  {path.name:<40} " + "  ".join(f"{k}: {v:>4}" for k, v in s.items()))
+    total = sum(s["nowe"] + s["zmienione"] for s in results.values())
+    print(f"{'🔎 (dry-run) do zapisu' if args.dry_run else '✅ Zapisano'}: {total} cen")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,10 @@ Uruchomienie:
 """
 
 import os
-import time
-import requests
 import psycopg2
 
+from geocoder import Geocoder
+
 DATABASE_URL = os.environ['DATABASE_URL']
 
 MDDPS = [
@@ -122,29 +122,11 @@ MDDPS = [
 ]
 
 
-def geocode(ulica: str) -> tuple[float, float] | None:
-    url = 'https://nominatim.openstreetmap.org/search'
-    params = {
-        'q': f'{ulica}, Kraków, Polska',
-        'format': 'json',
-        'limit': 1,
-    }
-    headers = {'User-Agent': 'geocoder-research/1.0'}
-    try:
-        r = requests.get(url, params=params, headers=headers, timeout=10)
-        r.raise_for_status()
-        data = r.json()
-        if data:
-            return float(data[0]['lat']), float(data[0]['lon'])
-    except Exception as e:
-        print(f'  geocoding error: {e}')
-    return None
-
-
 def main():
     conn = psycopg2.connect(DATABASE_URL)
     cur = conn.cursor()
 
+    geo = Geocoder()
     inserted = skipped = errors = 0
 
     for fac in MDDPS:
@@ -162,11 +144,9 @@ def main():
             continue
 
         # Geocode
-        coords = geocode(fac['ulica'])
-        time.sleep(1.2)
-        lat = coords[0] if coords else None
-        lon = coords[1] if coords else None
-        print(f'  coords: {lat}, {lon}' if coords else '  ⚠️  brak geolokalizacji')
+        # tylko dokładny adres — środek Krakowa nic nie mówi
+        lat, lon = geo.geocode(fac['ulica'], 'Kraków', region='małopolskie', fallback=False)
+        print(f'  coords: {lat}, {lon}' if lat else '  ⚠️  brak geolokalizacji')
 
         try:
             cur.execute(
@@ -200,6 +180,7 @@ def main():
     print(f'\n{"="*50}')
     print(f'Wynik: {inserted} dodano, {skipped} pominięto, {errors} błędów')
     print(f'Łącznie w liście: {len(MDDPS)}')
+    print(f'Geokodowanie: {geo.stats["cache"]} z cache, {geo.stats["zapytania"]} zapytań do Nominatim')
 
 
 if __name__ == '__main__':
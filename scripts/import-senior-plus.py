@@ -2,25 +2,27 @@
 """
 Jednorazowy import ośrodków Senior+ do tabeli Placowka.
 Pobiera plik XLSX z MUW Małopolska, geokoduje adresy przez Nominatim
-i upsertuje rekordy (sprawdza duplikaty po nazwie + miejscowości).
+(z cache — scripts/geocoder.py; sam środek miejscowości offline z TERYT),
+uzupełnia gminę i powiat z TERYT (scripts/localities.py) i upsertuje rekordy
+(sprawdza duplikaty po nazwie + miejscowości).
 
 Uruchomienie: DATABASE_URL=... python3 scripts/import-senior-plus.py
 """
 
 import os
 import sys
-import time
 import urllib3
 import requests
-import openpyxl
-from io import BytesIO
 from datetime import datetime
 
+from geocoder import Geocoder
+from localities import load as load_localities
+from monitors.xlsx import iter_rows
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
 XLSX_URL = "https://www.malopolska.uw.gov.pl/Docs/Wykaz%20funkcjonuj%C4%85cych%20o%C5%9Brodk%C3%B3w%20Senior%20w%20Ma%C5%82opolsce.xlsx"
-NOMINATIM_DELAY = 1.2  # sekundy między requestami (polityka Nominatim: max 1 req/s)
 
 try:
     import psycopg2
@@ -39,10 +41,8 @@ def download_xlsx() -> bytes:
 
 
 def parse_xlsx(data: bytes) -> list[dict]:
-    wb = openpyxl.load_workbook(BytesIO(data))
-    ws = wb.active
     rows = []
-    for i, row in enumerate(ws.iter_rows(min_row=2, values_only=True)):
+    for i, row in enumerate(iter_rows(data, min_row=2, text=False)):
         lp, rodzaj, liczba_miejsc, jst, woj, ulica, kod, miasto, tel, email, rok = row
         if lp is None:
             continue
@@ -63,52 +63,37 @@ def parse_xlsx(data: bytes) -> list[dict]:
     return rows
 
 
-def geocode(ulica: str | None, miejscowosc: str, kod: str | None) -> tuple[float | None, float | None]:
-    """Geokoduje adres przez Nominatim OSM. Zwraca (lat, lon)."""
-    parts = []
-    if ulica:
-        parts.append(ulica)
-    parts.append(miejscowosc)
-    if kod:
-        parts.append(kod)
-    parts.append("Polska")
-    q = ", ".join(parts)
-
-    headers = {"User-Agent": "geocoder-research/1.0"}
-    params = {"q": q, "format": "json", "limit": 1, "countrycodes": "pl"}
-    try:
-        r = requests.get("https://nominatim.openstreetmap.org/search",
-                         params=params, headers=headers, timeout=10)
-        data = r.json()
-        if data:
-            return float(data[0]["lat"]), float(data[0]["lon"])
-        # Fallback: sama miejscowość
-        r2 = requests.get("https://nominatim.openstreetmap.org/search",
-                          params={"q": f"{miejscowosc}, małopolskie, Polska",
-                                  "format": "json", "limit": 1, "countrycodes": "pl"},
-                          headers=headers, timeout=10)
-        data2 = r2.json()
-        if data2:
-            return float(data2[0]["lat"]), float(data2[0]["lon"])
-    except Exception as e:
-        print(f"    ⚠️ Błąd geokodowania: {e}")
-    return None, None
-
-
 def get_powiat_from_jst(jst: str | None) -> str:
     """Wyciąga nazwę powiatu z nazwy JST (np. 'Gmina Andrychów' → 'wadowicki')."""
     if not jst:
         return "małopolskie"
     # Zostawiamy surową nazwę JST — admin może poprawić
-    # Wycinamy prefix "Gmina " / "Powiat " / "Miasto "
+    # Wycinamy prefix "Gmina " / "Powiat " / "Miasto " i sufiks " (miasto)"
     name = jst.strip()
     for prefix in ["Gmina Miasto ", "Gmina ", "Powiat ", "Miasto "]:
         if name.startswith(prefix):
             name = name[len(prefix):]
             break
+    if name.endswith(" (miasto)"):
+        name = name[:-len(" (miasto)")]
     return name
 
 
+def locate(localities, row: dict) -> tuple[str, str | None]:
+    """
+    (powiat, gmina) z TERYT — JST rozstrzyga miejscowości o tej samej nazwie.
+    Gdy JST to powiat, powiat ze źródła zostaje; TERYT uzupełnia tylko gminę.
+    """
+    jst = row["jst_nazwa"] or ""
+    is_powiat = jst.startswith("Powiat ")
+    loc = localities.resolve(row["miejscowosc"],
+                             powiat=jst if is_powiat else None,
+                             gmina=None if is_powiat else jst)
+    if is_powiat or loc is None:
+        return get_powiat_from_jst(jst), loc["gmina"] if loc else None
+    return loc["powiat"], loc["gmina"]
+
+
 def build_nazwa(row: dict) -> str:
     rodzaj = row["typ_placowki"]
     jst = get_powiat_from_jst(row["jst_nazwa"])
@@ -123,6 +108,8 @@ def import_to_db(rows: list[dict]):
     conn = psycopg2.connect(DATABASE_URL)
     cur = conn.cursor()
     now = datetime.utcnow()
+    localities = load_localities()
+    geo = Geocoder(localities=localities)
 
     inserted = 0
     updated = 0
@@ -131,6 +118,7 @@ def import_to_db(rows: list[dict]):
     for i, row in enumerate(rows):
         nazwa = build_nazwa(row)
         miejscowosc = row["miejscowosc"]
+        powiat, gmina = locate(localities, row)
 
         # Sprawdź duplikat
         cur.execute(
@@ -141,21 +129,21 @@ def import_to_db(rows: list[dict]):
 
         # Geokoduj
         print(f"  [{i+1}/{len(rows)}] {nazwa} ({miejscowosc}) → geokodowanie...")
-        lat, lon = geocode(row["ulica"], miejscowosc, row["kod_pocztowy"])
+        lat, lon = geo.geocode(row["ulica"], miejscowosc, region="małopolskie", powiat=powiat)
         if lat:
             print(f"    📍 {lat:.4f}, {lon:.4f}")
         else:
             print(f"    ⚠️ brak współrzędnych")
-        time.sleep(NOMINATIM_DELAY)
 
         if existing:
             cur.execute("""
                 UPDATE "Placowka"
                 SET latitude = %s, longitude = %s, rok_powstania = %s, jst_nazwa = %s,
+                    powiat = %s, gmina = %s,
                     liczba_miejsc = %s, telefon = %s, email = %s,
                     "updatedAt" = %s, zrodlo_dane = %s
                 WHERE id = %s
-            """, (lat, lon, row["rok_powstania"], row["jst_nazwa"],
+            """, (lat, lon, row["rok_powstania"], row["jst_nazwa"], powiat, gmina,
                   row["liczba_miejsc"], row["telefon"], row["email"],
                   now, "MUW Senior+ XLSX 2025", existing[0]))
             updated += 1
@@ -163,13 +151,13 @@ def import_to_db(rows: list[dict]):
             cur.execute("""
                 INSERT INTO "Placowka" (
                     nazwa, typ_placowki, ulica, miejscowosc, kod_pocztowy,
-                    powiat, wojewodztwo, telefon, email,
+                    gmina, powiat, wojewodztwo, telefon, email,
                     liczba_miejsc, rok_powstania, jst_nazwa,
                     latitude, longitude,
                     verified, "createdAt", "updatedAt", zrodlo_dane
                 ) VALUES (
                     %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s,
+                    %s, %s, %s, %s, %s,
                     %s, %s, %s,
                     %s, %s,
                     false, %s, %s, %s
@@ -180,7 +168,8 @@ def import_to_db(rows: list[dict]):
                 row["ulica"],
                 miejscowosc,
                 row["kod_pocztowy"],
-                get_powiat_from_jst(row["jst_nazwa"]),
+                gmina,
+                powiat,
                 "małopolskie",
                 row["telefon"],
                 row["email"],
@@ -202,6 +191,8 @@ def import_to_db(rows: list[dict]):
     conn.close()
 
     print(f"\n✅ GOTOWE: {inserted} dodanych, {updated} zaktualizowanych, {skipped} pominiętych")
+    print(f"   Geokodowanie: {geo.stats['cache']} z cache, {geo.stats['teryt']} z TERYT, "
+          f"{geo.stats['zapytania']} zapytań do Nominatim")
 
 
 if __name__ == "__main__":
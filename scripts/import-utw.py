@@ -6,6 +6,8 @@ Uruchomienie:
   export $(grep -v '^#' .env | xargs) && python3 scripts/import-utw.py
 
 Sprawdza duplikaty po (nazwa, miejscowosc) — bezpieczne wielokrotne uruchomienie.
+Gmina i powiat z TERYT (scripts/localities.py); wpisy bez współrzędnych dostają
+środek miejscowości z TERYT zamiast pustych pól.
 """
 
 import csv
@@ -14,6 +16,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from localities import load as load_localities
+
 try:
     import psycopg2
 except ImportError:
@@ -35,6 +39,7 @@ def main():
     conn = psycopg2.connect(DATABASE_URL)
     cur  = conn.cursor()
     now  = datetime.utcnow()
+    localities = load_localities()
 
     inserted = skipped = errors = 0
 
@@ -55,12 +60,19 @@ def main():
         lat = float(row['latitude'])  if row['latitude']  else None
         lon = float(row['longitude']) if row['longitude'] else None
 
+        loc = localities.resolve(miejscowosc, powiat=row['powiat'])
+        # powiat ze źródła zostaje — TERYT tylko uzupełnia brak
+        powiat = row['powiat'] or (loc['powiat'] if loc else None)
+        gmina  = loc['gmina']  if loc else None
+        if lat is None and loc and loc['precision'] == 'miejscowosc':
+            lat, lon = loc['lat'], loc['lon']
+
         try:
             cur.execute("""
                 INSERT INTO "Placowka" (
                     nazwa, typ_placowki,
                     ulica, miejscowosc, kod_pocztowy,
-                    powiat, wojewodztwo,
+                    gmina, powiat, wojewodztwo,
                     telefon, email, www,
                     latitude, longitude,
                     verified, "createdAt", "updatedAt",
@@ -68,7 +80,7 @@ def main():
                 ) VALUES (
                     %s, 'UTW',
                     %s, %s, %s,
-                    %s, %s,
+                    %s, %s, %s,
                     %s, %s, %s,
                     %s, %s,
                     false, %s, %s,
@@ -79,7 +91,8 @@ def main():
                 row['ulica']       or None,
                 miejscowosc,
                 row['kod_pocztowy'] or None,
-                row['powiat']      or None,
+                gmina,
+                powiat,
                 row['wojewodztwo'] or 'małopolskie',
                 row['telefon']     or None,
                 row['email']       or None,
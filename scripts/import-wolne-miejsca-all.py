@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Import wolnych miejsc DPS z pozostałych województw do tabeli PlacowkaWolneMiejsca.
+
+Dla każdego monitora z ustawionym `wojewodztwo` (scripts/monitors/) bierze
+najnowszy zapisany plik z raw_dane/<województwo>/, parsuje go parserem monitora
+(wynik z magazynu raw_dane/.store — bez ponownego parsowania), sprowadza wiersze
+do wspólnego schematu (monitors/vacancies.py), dopasowuje do "Placowka"
+(facility_matcher.py) i zapisuje jednym poleceniem INSERT … ON CONFLICT.
+
+Małopolska ma własny importer (dopasowanie po adresie w Krakowie i po pojemności
+w Nowym Sączu / Tarnowie): scripts/import-wolne-miejsca.py — zapis tym samym kodem.
+
+Użycie:
+  DATABASE_URL=... python scripts/import-wolne-miejsca-all.py           # wszystkie
+  DATABASE_URL=... python scripts/import-wolne-miejsca-all.py lodzkie podkarpackie
+  python scripts/import-wolne-miejsca-all.py lodzkie --file raw_dane/lodzkie/wolne_miejsca_2025-03.xls
+  python scripts/import-wolne-miejsca-all.py --dry-run                  # bez zapisu do bazy
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import requests
+
+from monitors import PLUGINS
+from monitors.core import DATABASE_URL, require
+from monitors.vacancies import load_facilities, match_rows, record_values, upsert_records, NUMERIC
+from facility_matcher import FacilityMatcher
+
+VACANCY_PLUGINS = {name: p for name, p in PLUGINS.items() if p.wojewodztwo}
+
+
+def merge_records(matched: list[tuple[int, dict]], data_stanu) -> list[tuple]:
+    """
+    Rekordy do zapisu. Kilka wierszy pliku dopasowanych do tej samej placówki
+    i typu opieki (np. filie DPS-u w jednej miejscowości) sumujemy.
+    """
+    merged: dict[tuple, dict] = {}
+    for placowka_id, row in matched:
+        key = (placowka_id, row['typ_opieki'])
+        if key not in merged:
+            merged[key] = dict(row)
+            continue
+        acc = merged[key]
+        for col in NUMERIC:
+            if row[col] is not None:
+                acc[col] = (acc[col] or 0) + row[col]
+    return [record_values(pid, data_stanu, row) for (pid, _), row in merged.items()]
+
+
+def import_region(monitor, path: Path, conn, dry_run: bool) -> dict:
+    monitor.log(f"Plik: {path}")
+    parsed = monitor.store.parse_file(path, monitor.parse)
+    data_stanu, rows = monitor.vacancies(parsed)
+    stats = {"rows": len(rows), "matched": 0, "no_match": 0, "inserted": 0, "updated": 0}
+
+    if not data_stanu:
+        monitor.log("⚠️ Nie udało się odczytać daty stanu z pliku — pomijam.")
+        return stats
+    monitor.log(f"Data stanu: {data_stanu}, wierszy: {len(rows)}")
+
+    if conn is None:
+        return stats
+
+    db = load_facilities(conn, monitor.wojewodztwo)
+    monitor.log(f"DPS w bazie ({monitor.wojewodztwo}): {len(db)}")
+    if not db:
+        stats["no_match"] = len(rows)
+        return stats
+
+    matched, unmatched = match_rows(rows, FacilityMatcher(db), log=monitor.log)
+    stats["matched"], stats["no_match"] = len(matched), len(unmatched)
+
+    records = merge_records(matched, data_stanu)
+    if dry_run:
+        monitor.log(f"Dry run — {len(records)} rekordów do zapisu, bez zmian w bazie.")
+        return stats
+
+    stats["inserted"], stats["updated"] = upsert_records(conn, records)
+    conn.commit()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import wolnych miejsc DPS (wszystkie województwa)")
+    parser.add_argument("names", nargs="*", help=f"monitory: {', '.join(VACANCY_PLUGINS)}")
+    parser.add_argument("--file", type=Path, help="konkretny plik (tylko z jednym monitorem)")
+    parser.add_argument("--dry-run", action="store_true", help="parsuj i dopasuj, bez zapisu")
+    args = parser.parse_args()
+
+    unknown = [n for n in args.names if n not in VACANCY_PLUGINS]
+    if unknown:
+        parser.error(f"nieznane monitory: {', '.join(unknown)}")
+    names = args.names or list(VACANCY_PLUGINS)
+    if args.file and len(names) != 1:
+        parser.error("--file wymaga wskazania jednego monitora")
+
+    conn = None
+    if DATABASE_URL:
+        psycopg2 = require("psycopg2", "psycopg2-binary")
+        conn = psycopg2.connect(DATABASE_URL)
+    elif not args.dry_run:
+        print("❌ Brak DATABASE_URL (użyj --dry-run, żeby tylko sparsować pliki)")
+        sys.exit(1)
+    else:
+        print("ℹ️ Brak DATABASE_URL — tylko parsowanie, bez dopasowania do bazy.")
+
+    session = requests.Session()
+    results = {}
+    for name in names:
+        monitor = VACANCY_PLUGINS[name](session)
+        files = [args.file] if args.file else monitor.archived()
+        if not files:
+            monitor.log("Brak zapisanych plików — pomijam.")
+            continue
+        results[name] = import_region(monitor, files[-1], conn, args.dry_run)
+
+    if conn is not None:
+        conn.close()
+
+    print("\n── Podsumowanie ──")
+    for name, s in results.items():
+        print(f"  {name:<20} wierszy: {s['rows']:>4}  dopasowane: {s['matched']:>4}  "
+              f"brak: {s['no_match']:>4}  nowe: {s['inserted']:>4}  zaktualizowane: {s['updated']:>4}")
+
+
+if __name__ == "__main__":
+    main()
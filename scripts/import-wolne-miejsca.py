@@ -2,7 +2,7 @@
 """
 Import wolnych miejsc DPS z XLSX MUW Małopolska do bazy danych.
 Matchuje placówki po nazwie (powiaty) lub adresie (Kraków).
-Uruchamiany po wykryciu nowego pliku przez monitor-wolne-miejsca.py.
+Uruchamiany po wykryciu nowego pliku przez monitor Małopolski (scripts/monitors/malopolskie.py).
 
 Użycie:
   python3 scripts/import-wolne-miejsca.py raw_dane/malopolskie/wolne_miejsca_dps_2026-05-09.xlsx
@@ -14,10 +14,12 @@ import sys
 import json
 import datetime
 import psycopg2
-import openpyxl
 from io import BytesIO
 from pathlib import Path
-from difflib import SequenceMatcher
+
+from monitors.xlsx import iter_rows, split_table
+from monitors.vacancies import record_values, upsert_records
+from facility_matcher import FacilityMatcher, norm_name, norm_ulica
 
 RAW_DANE_DIR = Path(__file__).parent.parent / "raw_dane" / "malopolskie"
 DATABASE_URL  = open(Path(__file__).parent.parent / ".env").read()
@@ -54,24 +56,6 @@ CITY_POWIATY = {"m. kraków", "m. nowy sącz", "m. tarnów"}
 
 # ── normalizacja ──────────────────────────────────────────────────────────────
 
-def norm_name(s: str) -> str:
-    """Normalizuj nazwę: małe litery, bez adresu (po przecinku), bez nadmiarowych spacji."""
-    s = re.sub(r'\s+', ' ', (s or '').strip().lower())
-    s = re.sub(r',.*$', '', s)   # usuń adres po pierwszym przecinku
-    s = re.sub(r'\bul\.\s*\S+.*$', '', s)  # usuń "ul. ..." z końca
-    s = s.strip().rstrip('.,- ')
-    return s
-
-
-def norm_typ(s: str) -> str:
-    """Normalizuj typ opieki."""
-    return re.sub(r'\s+', ' ', (s or '').strip().lower())
-
-
-def similarity(a: str, b: str) -> float:
-    return SequenceMatcher(None, a, b).ratio()
-
-
 def parse_int(v) -> int | None:
     try:
         n = int(str(v).strip())
@@ -101,45 +85,30 @@ def parse_date_from_title(title: str) -> datetime.date | None:
 def parse_xlsx(path: Path) -> tuple[datetime.date | None, list[dict]]:
     """
     Parsuje XLSX/XLS i zwraca (data_stanu, lista wierszy danych).
-    Każdy wiersz: { powiat, nazwa_xlsx, typ, liczba_miejsc, wolne_ogolem,
+    Każdy wiersz: { powiat, nazwa_xlsx, typ_opieki, liczba_miejsc, wolne_ogolem,
                     wolne_kobiety, wolne_mezczyzni, oczekujacych, czas_oczekiwania_dni }
     """
     if path.suffix.lower() == '.xls':
         import pandas as pd
         df = pd.read_excel(path, header=None)
-        all_rows = [
+        all_rows = (
             [str(c).strip() if c is not None and str(c) != 'nan' else "" for c in row]
             for row in df.values.tolist()
-        ]
+        )
     else:
-        wb = openpyxl.load_workbook(path)
-        ws = wb.active
-        all_rows = [
-            [str(c).strip() if c is not None else "" for c in row]
-            for row in ws.iter_rows(values_only=True)
-        ]
-
-    # Tytuł z datą (szukaj w pierwszych 8 wierszach - .xls może mieć puste nagłówki)
-    title = next((c for row in all_rows[:8] for c in row if "stan na" in c.lower()), "")
+        all_rows = iter_rows(path)
+
+    # Jedno przejście: tytuł z datą (pierwsze 8 wierszy - .xls może mieć puste nagłówki),
+    # wiersz nagłówkowy (zawiera "LP" lub "Powiat"), potem niepuste wiersze danych
+    title, _, data_rows = split_table(all_rows, default_header=1)
     data_stanu = parse_date_from_title(title)
     print(f"Data stanu: {data_stanu}  (z tytułu: '{title[:60]}')")
 
-    # Znajdź wiersz nagłówkowy (zawiera "LP" lub "Powiat")
-    header_idx = 1
-    for i, row in enumerate(all_rows[:6]):
-        if any("lp" in c.lower() or "powiat" in c.lower() for c in row if c):
-            header_idx = i
-            break
-
     results = []
     current_powiat = ""
     current_nazwa  = ""
 
-    for row in all_rows[header_idx + 1:]:
-        # Pomiń całkowicie puste wiersze
-        if not any(c for c in row):
-            continue
-
+    for row in data_rows:
         # Kol 0: LP (np. "1.", "2.") — aktualizuj powiat gdy nowy LP
         lp   = row[0].rstrip(". ").strip()
         pow_ = row[1].strip()
@@ -163,7 +132,7 @@ def parse_xlsx(path: Path) -> tuple[datetime.date | None, list[dict]]:
             "powiat":               current_powiat,
             "nazwa_xlsx":           current_nazwa,
             "is_new_facility":      is_new_facility,  # True = nowa placówka, False = kolejny typ tej samej
-            "typ":                  typ,
+            "typ_opieki":           typ,
             "liczba_miejsc":        parse_int(row[4]) if len(row) > 4 else None,
             "wolne_ogolem":         parse_int(row[8]) if len(row) > 8 else None,
             "wolne_kobiety":        parse_int(row[9]) if len(row) > 9 else None,
@@ -178,20 +147,6 @@ def parse_xlsx(path: Path) -> tuple[datetime.date | None, list[dict]]:
 
 # ── matchowanie ───────────────────────────────────────────────────────────────
 
-def norm_ulica(s: str) -> str:
-    """Normalizuj adres do 'ostatnie_słowo_ulicy numer' dla porównania."""
-    s = re.sub(r'\s+', ' ', (s or '').lower().strip())
-    # Usuń prefix: ul., os., al., pl.
-    s = re.sub(r'^(ul\.|os\.|al\.|pl\.)\s*', '', s)
-    # Usuń tytuły i inicjały: dr., prof., im., św., A., J.
-    s = re.sub(r'\b(dr|prof|im|św|o)\b\.?\s*', '', s)
-    s = re.sub(r'\b[a-z]\.\s*', '', s)
-    s = s.strip()
-    # Wyciągnij: ostatnie słowo (≥4 liter) przed numerem + numer
-    m = re.search(r'(\w{4,})\s+(\d+[a-z]?)\b', s)
-    return f"{m.group(1)} {m.group(2)}" if m else s
-
-
 def load_db_facilities(conn) -> list[dict]:
     cur = conn.cursor()
     cur.execute("""
@@ -209,32 +164,8 @@ def load_db_facilities(conn) -> list[dict]:
     return rows
 
 
-def find_best_match_by_name(nazwa_xlsx: str, db: list[dict]) -> tuple[dict | None, float]:
-    """Fuzzy match po nazwie — zwraca (db_row, score)."""
-    norm_xlsx = norm_name(nazwa_xlsx)
-
-    # Mapowania przez ID (niejednoznaczne nazwy DB lub Gmina-based)
-    for key, db_id in MANUAL_MAPPINGS_BY_ID.items():
-        if key in norm_xlsx:
-            for d in db:
-                if d['id'] == db_id:
-                    return d, 1.0
-
-    # Mapowania przez nazwę DB
-    for key, target in MANUAL_MAPPINGS.items():
-        if key in norm_xlsx:
-            for d in db:
-                if norm_name(d['nazwa']) == target:
-                    return d, 1.0
-
-    best_score = 0.0
-    best = None
-    for d in db:
-        score = similarity(norm_xlsx, norm_name(d['nazwa']))
-        if score > best_score:
-            best_score = score
-            best = d
-    return best, best_score
+def build_matcher(db: list[dict]) -> FacilityMatcher:
+    return FacilityMatcher(db, manual_by_id=MANUAL_MAPPINGS_BY_ID, manual_by_name=MANUAL_MAPPINGS)
 
 
 def extract_xlsx_ulica(xlsx_name: str) -> str:
@@ -243,7 +174,7 @@ def extract_xlsx_ulica(xlsx_name: str) -> str:
     return m.group(0).strip() if m else ""
 
 
-def match_krakow_by_address(xlsx_name: str, db: list[dict]) -> dict | None:
+def match_krakow_by_address(xlsx_name: str, matcher: FacilityMatcher) -> dict | None:
     """
     Dla Krakowa: matchuj po adresie (ul./os. + numer).
     Działa dla obu powiatów: 'm. Kraków' i 'krakowski'.
@@ -255,11 +186,7 @@ def match_krakow_by_address(xlsx_name: str, db: list[dict]) -> dict | None:
     if not key:
         return None
 
-    krakow_db = [
-        d for d in db
-        if d['powiat'] in ('m. Kraków', 'krakowski')
-    ]
-    candidates = [d for d in krakow_db if d['ulica_key'] == key]
+    candidates = matcher.by_address(key, ('m. Kraków', 'krakowski'))
     if len(candidates) == 1:
         return candidates[0]
     if len(candidates) > 1:
@@ -268,7 +195,7 @@ def match_krakow_by_address(xlsx_name: str, db: list[dict]) -> dict | None:
 
 
 def match_city_by_capacity(group_total: int | None, powiat_norm: str,
-                            db: list[dict]) -> dict | None:
+                            matcher: FacilityMatcher) -> dict | None:
     """Dla Nowego Sącza i Tarnowa: matchuj po sumie liczba_miejsc grupy."""
     if group_total is None or group_total == 0:
         return None
@@ -281,46 +208,10 @@ def match_city_by_capacity(group_total: int | None, powiat_norm: str,
     if not db_powiat:
         return None
 
-    candidates = [
-        d for d in db
-        if d['powiat'] == db_powiat and d['liczba_miejsc'] == group_total
-    ]
+    candidates = matcher.by_capacity(db_powiat, group_total)
     return candidates[0] if len(candidates) == 1 else None
 
 
-# ── import do bazy ────────────────────────────────────────────────────────────
-
-def upsert_record(conn, placowka_id: int, data_stanu: datetime.date, row: dict):
-    """INSERT lub UPDATE rekordu wolnych miejsc."""
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO "PlacowkaWolneMiejsca"
-          ("placowkaId", data_stanu, typ_opieki, liczba_miejsc,
-           wolne_ogolem, wolne_kobiety, wolne_mezczyzni,
-           oczekujacych, czas_oczekiwania_dni, "createdAt")
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-        ON CONFLICT ("placowkaId", data_stanu, typ_opieki)
-        DO UPDATE SET
-          liczba_miejsc        = EXCLUDED.liczba_miejsc,
-          wolne_ogolem         = EXCLUDED.wolne_ogolem,
-          wolne_kobiety        = EXCLUDED.wolne_kobiety,
-          wolne_mezczyzni      = EXCLUDED.wolne_mezczyzni,
-          oczekujacych         = EXCLUDED.oczekujacych,
-          czas_oczekiwania_dni = EXCLUDED.czas_oczekiwania_dni
-    """, (
-        placowka_id,
-        data_stanu,
-        norm_typ(row['typ']),
-        row['liczba_miejsc'],
-        row['wolne_ogolem'],
-        row['wolne_kobiety'],
-        row['wolne_mezczyzni'],
-        row['oczekujacych'],
-        row['czas_oczekiwania_dni'],
-    ))
-    cur.close()
-
-
 # ── main ─────────────────────────────────────────────────────────────────────
 
 def main():
@@ -343,10 +234,12 @@ def main():
 
     conn = psycopg2.connect(DATABASE_URL)
     db = load_db_facilities(conn)
+    matcher = build_matcher(db)
     print(f"DPS w bazie: {len(db)}")
 
     stats = {"matched_name": 0, "matched_address": 0, "matched_capacity": 0, "no_match": 0}
     unmatched = []
+    records: list[tuple] = []   # zapis do bazy jednym poleceniem na końcu
 
     # ── Podziel po powiatu: miasta (Kraków/NS/Tarnów) vs reszta ────────────
     def is_city_row(r: dict) -> bool:
@@ -364,7 +257,7 @@ def main():
         cache_key = f"{powiat_norm}|{nazwa}"
 
         if cache_key not in matched_cache:
-            db_row, score = find_best_match_by_name(nazwa, db)
+            db_row, score = matcher.match(nazwa)
             if score >= 0.75:
                 matched_cache[cache_key] = db_row
                 stats["matched_name"] += 1
@@ -378,7 +271,7 @@ def main():
         if db_row is None:
             stats["no_match"] += 1
             continue
-        upsert_record(conn, db_row['id'], data_stanu, row)
+        records.append(record_values(db_row['id'], data_stanu, row))
 
     # ── 2. Kraków — grupuj po adresie, matchuj po ulicy ────────────────────
     krakow_rows = [r for r in city_rows if r['powiat'].strip().lower() == "m. kraków"]
@@ -397,12 +290,12 @@ def main():
     for addr_key in krakow_order:
         group = krakow_groups[addr_key]
         # Użyj nazwy z pierwszego wiersza do wyciągnięcia adresu
-        db_row = match_krakow_by_address(group[0]['nazwa_xlsx'], db)
+        db_row = match_krakow_by_address(group[0]['nazwa_xlsx'], matcher)
         if db_row:
             stats["matched_address"] += 1
             print(f"  ✅ [adres {addr_key}] {db_row['nazwa'][:50]}")
             for r in group:
-                upsert_record(conn, db_row['id'], data_stanu, r)
+                records.append(record_values(db_row['id'], data_stanu, r))
         else:
             stats["no_match"] += len(group)
             print(f"  ❌ [adres {addr_key}] brak dopasowania w Krakowie")
@@ -417,12 +310,12 @@ def main():
             return
         group_total = sum(r['liczba_miejsc'] or 0 for r in group)
         powiat_norm = group[0]['powiat'].strip().lower()
-        db_row = match_city_by_capacity(group_total, powiat_norm, db)
+        db_row = match_city_by_capacity(group_total, powiat_norm, matcher)
         if db_row:
             stats["matched_capacity"] += 1
             print(f"  ✅ [pojemność {group_total}] {db_row['nazwa'][:50]}")
             for r in group:
-                upsert_record(conn, db_row['id'], data_stanu, r)
+                records.append(record_values(db_row['id'], data_stanu, r))
         else:
             stats["no_match"] += len(group)
             print(f"  ❌ [pojemność {group_total}] brak dopasowania ({powiat_norm})")
@@ -435,6 +328,7 @@ def main():
             current_group.append(row)
     flush_city_group(current_group)
 
+    inserted, updated = upsert_records(conn, records)
     conn.commit()
     conn.close()
 
@@ -446,6 +340,7 @@ def main():
     print(f"   Po adresie:   {stats['matched_address']} (Kraków)")
     print(f"   Po pojemności:{stats['matched_capacity']} (Nowy Sącz / Tarnów)")
     print(f"   Brak dopasowania: {stats['no_match']}")
+    print(f"Rekordy wolnych miejsc: {inserted} nowych, {updated} zaktualizowanych")
     if unmatched:
         print()
         print("Niedopasowane:")
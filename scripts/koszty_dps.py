@@ -0,0 +1,197 @@
+"""
+Uchwały / obwieszczenia wojewodów o średnim miesięcznym koszcie utrzymania
+mieszkańca DPS (art. 60 ust. 2 ustawy o pomocy społecznej) — odczyt tabel.
+
+parser_pdf_malopolska.py czytał plik przez tabula-py (start JVM przy każdym
+wywołaniu) ze sztywnym obszarem strony, a kolumny zgadywał, szukając ceny od
+prawej strony wiersza. Tu:
+
+  - tabele z pdfplumber przez `monitors.pdf.read_pdf` — jedno otwarcie
+    pliku, strony w puli procesów (przy jednym rdzeniu — zwykła pętla),
+  - kolumny rozpoznajemy po tekście nagłówka (`COLUMN_PATTERNS`: "l.p.",
+    "powiat", "nazwa i adres", "typ", "koszt"), więc inny układ tabeli
+    w innym województwie nie wymaga zmian w kodzie; tabele bez nagłówka
+    (ciąg dalszy na kolejnej stronie) dziedziczą układ poprzedniej,
+  - komórki wieloliniowe sklejamy (z przeniesieniami „Społecznej-” bez
+    spacji), nazwę od adresu oddzielamy po pierwszej linii z ulicą / kodem
+    pocztowym, a wiersz przecięty końcem strony (bez l.p.) doklejamy do
+    poprzedniego.
+
+Wynik to wiersze w układzie "PlacowkaCena" (rok, kwota, typ_kosztu, zrodlo)
+z polami do dopasowania placówki (wojewodztwo, powiat, nazwa, adres):
+
+  records = parse_pdf(data)                       # wiersze tabeli
+  rows = cena_rows(records, "małopolskie", 2025, zrodlo=URL)
+"""
+
+import re
+from pathlib import Path
+
+from monitors.pdf import read_pdf
+
+# nagłówek kolumny → pole; kolejność ma znaczenie ("nazwa i adres" to nazwa, nie adres)
+COLUMN_PATTERNS = [
+    ("kwota",  re.compile(r"koszt|kwot", re.I)),
+    ("typ",    re.compile(r"\btyp|rodzaj|profil", re.I)),
+    ("nazwa",  re.compile(r"nazwa", re.I)),
+    ("adres",  re.compile(r"adres", re.I)),
+    ("powiat", re.compile(r"powiat", re.I)),
+    ("lp",     re.compile(r"^\s*l\.?\s*p\.?\s*$", re.I)),
+]
+REQUIRED = {"nazwa", "kwota"}
+
+ADDRESS_LINE = re.compile(r"^(ul\.|al\.|os\.|pl\.|ulica|aleja)\s", re.I)
+POSTAL_CODE  = re.compile(r"\b\d{2}-\d{3}\b")
+# „Miejscowość 123” / „Ojców Nr 64” — adres bez ulicy
+LOCALITY_WORD = r"[A-ZĄĆĘŁŃÓŚŹŻ][^\s\d]*"
+LOCALITY      = (rf"{LOCALITY_WORD}(?:\s+(?:{LOCALITY_WORD}|nad|pod|koło))*"
+                 r"\s+(?:[Nn]r\.?\s*)?\d+[a-zA-Z]?(?:/\d+)?")
+LOCALITY_LINE = re.compile(rf"^{LOCALITY}$")
+# ta sama miejscowość doklejona do nazwy: „w Wapiennem Wapienne 70” → „w Wapiennem” + „Wapienne 70”
+LOCALITY_TAIL = re.compile(rf"^(.*?\bw\s+{LOCALITY_WORD})\s+({LOCALITY})$")
+ROK_HEADER   = re.compile(r"\bw\s+(20\d{2})\s*r\.", re.I)
+
+CENA_FIELDS = ["wojewodztwo", "powiat", "nazwa", "adres", "typ_opieki",
+               "rok", "kwota", "typ_kosztu", "zrodlo", "strona", "lp"]
+
+
+# ── komórki ───────────────────────────────────────────────────────────────────
+
+def cell_lines(cell) -> list[str]:
+    return [line.strip() for line in str(cell or "").replace("\r", "\n").split("\n") if line.strip()]
+
+
+def join_lines(lines: list[str]) -> str:
+    """Linie komórki w jeden tekst; „Społecznej-” + „Regionalne” → „Społecznej-Regionalne”."""
+    text = ""
+    for line in lines:
+        text += line if not text or text.endswith("-") else " " + line
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def parse_kwota(text) -> float | None:
+    """„6 499,00 zł” → 6499.0; None, gdy w komórce nie ma kwoty."""
+    s = re.sub(r"(zł|pln|\*|\(|\))", "", str(text or "").lower())
+    s = re.sub(r"[\s ]", "", s)
+    if s.count(",") == 1 and "." not in s:
+        s = s.replace(",", ".")
+    elif s.count(",") == 1 and s.count(".") >= 1:
+        s = s.replace(".", "").replace(",", ".")       # 6.499,00
+    if s.count(".") > 1:
+        s = s.replace(".", "", s.count(".") - 1)
+    try:
+        value = round(float(s), 2)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def split_nazwa_adres(lines: list[str]) -> tuple[str, str]:
+    """
+    Nazwa = linie przed adresem. Adres zaczyna się od linii z ulicą, a bez
+    niej — od linii, która w całości jest „Miejscowość 123”, tuż przed kodem
+    pocztowym, albo od kodu. Gdy „Miejscowość 123” jest ogonem linii nazwy
+    („… w Wapiennem Wapienne 70”), linia jest dzielona na nazwę i adres.
+    """
+    start = next((i for i, line in enumerate(lines) if ADDRESS_LINE.match(line)), None)
+    if start is None:
+        postal = next((i for i, line in enumerate(lines) if POSTAL_CODE.search(line)), None)
+        if postal is not None:
+            start = postal
+            prev = lines[postal - 1] if postal else ""
+            tail = LOCALITY_TAIL.match(prev)
+            if postal > 1 and LOCALITY_LINE.match(prev):
+                start = postal - 1
+            elif tail:
+                lines = [*lines[:postal - 1], tail[1], tail[2], *lines[postal:]]
+    if not start:
+        return join_lines(lines), ""
+    return join_lines(lines[:start]), join_lines(lines[start:])
+
+
+# ── tabele ────────────────────────────────────────────────────────────────────
+
+def detect_columns(row: list) -> dict[str, int] | None:
+    """{pole: indeks kolumny} z wiersza nagłówka; None, gdy to nie nagłówek."""
+    columns = {}
+    for i, cell in enumerate(row):
+        text = join_lines(cell_lines(cell))
+        for field, pattern in COLUMN_PATTERNS:
+            if field not in columns and pattern.search(text):
+                columns[field] = i
+                break
+    return columns if REQUIRED <= set(columns) else None
+
+
+def extract_records(content: dict) -> list[dict]:
+    """Wiersze tabel z wyniku `read_pdf` (strony w kolejności)."""
+    records = []
+    columns = None
+    for page_no, page_tables in enumerate(content["tables"], start=1):
+        for table in page_tables:
+            for row in table:
+                header = detect_columns(row)
+                if header:
+                    columns = header
+                    continue
+                if not columns or len(row) <= max(columns.values()):
+                    continue
+
+                def lines(field):
+                    return cell_lines(row[columns[field]]) if field in columns else []
+
+                lp = join_lines(lines("lp")).rstrip(".")
+                kwota = parse_kwota(join_lines(lines("kwota")))
+                if not lp and kwota is None and records and records[-1]["strona"] < page_no:
+                    # wiersz przecięty końcem strony — ciąg dalszy komórek poprzedniego
+                    prev = records[-1]
+                    for field in ("nazwa", "typ", "powiat"):
+                        prev["_" + field] += lines(field)
+                    continue
+                if kwota is None:
+                    continue
+                records.append({
+                    "lp": lp, "strona": page_no, "kwota": kwota,
+                    "_nazwa": lines("nazwa"), "_adres": lines("adres"),
+                    "_typ": lines("typ"), "_powiat": lines("powiat"),
+                })
+
+    for r in records:
+        nazwa, adres = split_nazwa_adres(r.pop("_nazwa"))
+        adres_col = join_lines(r.pop("_adres"))
+        r["nazwa"] = nazwa
+        r["adres"] = adres_col or adres
+        r["typ"] = join_lines(r.pop("_typ"))
+        r["powiat"] = join_lines(r.pop("_powiat"))
+    return records
+
+
+def extract_rok(header: str) -> int | None:
+    """Rok kosztów z nagłówka („… mieszkańca w 2025 r.”)."""
+    m = ROK_HEADER.search(header or "")
+    return int(m.group(1)) if m else None
+
+
+def parse_pdf(source: bytes | str | Path, workers: int | None = None) -> tuple[list[dict], int | None]:
+    """(wiersze tabeli, rok z nagłówka) — `source` to zawartość PDF albo ścieżka."""
+    data = source if isinstance(source, bytes) else Path(source).read_bytes()
+    content = read_pdf(data, workers=workers)
+    return extract_records(content), extract_rok(content["header"])
+
+
+def cena_rows(records: list[dict], wojewodztwo: str, rok: int, zrodlo: str | None = None,
+              typ_kosztu: str = "podstawowy") -> list[dict]:
+    """Wiersze w układzie "PlacowkaCena" + pola do dopasowania placówki (CENA_FIELDS)."""
+    return [{
+        "wojewodztwo": wojewodztwo,
+        "powiat":      r["powiat"],
+        "nazwa":       r["nazwa"],
+        "adres":       r["adres"],
+        "typ_opieki":  r["typ"],
+        "rok":         rok,
+        "kwota":       r["kwota"],
+        "typ_kosztu":  typ_kosztu,
+        "zrodlo":      zrodlo,
+        "strona":      r["strona"],
+        "lp":          r["lp"],
+    } for r in records]
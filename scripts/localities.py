@@ -0,0 +1,224 @@
+"""
+Offline resolver miejscowości: nazwa → TERYT (SIMC/TERC), gmina, powiat, współrzędne.
+
+Importery dopisywały powiat „na oko” (np. z nazwy JST) i po współrzędne
+miejscowości szły do Nominatim. Tu wszystko jest lokalne:
+
+  - SIMC (data/teryt-malopolska.csv — wyciąg dla Małopolski; pełny SIMC w tym
+    samym układzie kolumn też zadziała) — miejscowości z symbolami SYM/SYMPOD,
+  - TERC (raw_dane/malopolskie/TERC_Adresowy_*/…csv, cała Polska) — nazwy
+    gmin, powiatów i województw dla kodów z SIMC.
+
+Indeks to słownik znormalizowana nazwa → indeksy krotek rekordów, więc
+`resolve()` to kilka odczytów ze słownika (mikrosekundy). Przy kilku
+miejscowościach o tej samej nazwie zawężamy po powiecie / gminie, a potem
+wybieramy najważniejszą (miasto > wieś > osada/przysiółek > część miejscowości).
+
+Współrzędne: SIMC i TERC ich nie zawierają. Środek miejscowości bierzemy z
+(w kolejności): pliku `data/simc-centroidy.csv` (SYM;lat;lon — np. wyciąg z PRG,
+jeśli go dodamy), wpisów „miejscowość” z cache geokodera (scripts/geocoder.py)
+i mediany znanych współrzędnych placówek w tej miejscowości. Gdy brak —
+mediana dla gminy, potem dla powiatu (`precision` mówi, który poziom).
+
+  loc = LocalityResolver().resolve("Biecz", powiat="gorlicki")
+  loc["gmina"], loc["powiat"], loc["sym"], loc["lat"], loc["precision"]
+"""
+
+import csv
+import re
+import sqlite3
+import statistics
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from geocoder import ascii_query, CACHE_DB as GEOCODE_DB
+
+ROOT = Path(__file__).resolve().parent.parent
+SIMC_CSV      = ROOT / 'data' / 'teryt-malopolska.csv'
+TERC_CSV      = ROOT / 'raw_dane' / 'malopolskie' / 'TERC_Adresowy_2026-02-16' / 'TERC_Adresowy_2026-02-16.csv'
+CENTROIDS_CSV = ROOT / 'data' / 'simc-centroidy.csv'
+
+# znane współrzędne placówek: (plik, kolumna lat, kolumna lon, miejscowość, powiat)
+POINT_SOURCES = [
+    (ROOT / 'raw_dane' / 'utw_malopolska.csv', 'latitude', 'longitude', 'miejscowosc', 'powiat'),
+    (ROOT / 'data' / 'placowki.csv', 'geo_lat', 'geo_long', 'miasto_wies', 'powiat'),
+]
+
+# SIMC RM → ranga przy niejednoznacznej nazwie (mniejsza = ważniejsza)
+RM_RANK = {'96': 0, '98': 0, '01': 1, '02': 2, '03': 2, '04': 2, '05': 2, '07': 2, '00': 3, '99': 3}
+RM_TYP = {
+    '00': 'część miejscowości', '01': 'wieś', '02': 'kolonia', '03': 'przysiółek',
+    '04': 'osada', '05': 'osada leśna', '07': 'schronisko turystyczne',
+    '96': 'miasto', '98': 'delegatura', '99': 'część miasta',
+}
+CITY_GMINA = ('8', '9')   # dzielnica / delegatura — gminą jest całe miasto
+
+
+def norm(s: str | None) -> str:
+    """Nazwa do porównań: ASCII, małe litery, pojedyncze spacje (jak nazwa_normalized w TerytLocation)."""
+    return re.sub(r'\s+', ' ', ascii_query(s or '').lower()).strip()
+
+def norm_unit(s: str | None) -> str:
+    """
+    Powiat / gmina do porównań — bez przedrostków „powiat”, „gmina”, „m.”, „miasto”
+    i bez przyrostka „(miasto)” (wykaz Senior+: „Kraków (miasto)”).
+    """
+    s = norm(s)
+    s = re.sub(r'^(powiat|gmina miasto|gmina|miasto|m\.)\s+', '', s)
+    s = re.sub(r'\s*\(miasto\)$', '', s)
+    return s
+
+
+def load_terc(path: Path = TERC_CSV) -> dict[tuple, str]:
+    """{(woj, pow, gmi, rodz): nazwa} — klucze z pustymi częściami dla powiatu / województwa."""
+    terc = {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for r in csv.DictReader(f, delimiter=';'):
+            terc[(r['WOJ'], r['POW'], r['GMI'], r['RODZ'])] = r['NAZWA']
+    return terc
+
+
+class LocalityResolver:
+    def __init__(self, simc_path: Path = SIMC_CSV, terc_path: Path = TERC_CSV,
+                 points: bool = True):
+        self.terc = load_terc(terc_path)
+        self.records: list[tuple] = []
+        self.by_name: dict[str, list[int]] = defaultdict(list)
+        self.by_sym: dict[str, int] = {}
+        with open(simc_path, newline='', encoding='utf-8-sig') as f:
+            for r in csv.DictReader(f, delimiter=';'):
+                rec = (r['NAZWA'], r['SYM'], r['SYMPOD'], r['RM'],
+                       r['WOJ'], r['POW'], r['GMI'], r['RODZ_GMI'])
+                i = len(self.records)
+                self.records.append(rec)
+                self.by_name[norm(rec[0])].append(i)
+                self.by_sym[rec[1]] = i
+        # ranga liczona raz — kolejność kandydatów gotowa do wyboru
+        for idx in self.by_name.values():
+            idx.sort(key=lambda i: (RM_RANK.get(self.records[i][3], 2), self.records[i][1]))
+
+        self.centroids: dict[str, tuple[float, float]] = {}
+        self.unit_points: dict[tuple, list[tuple[float, float]]] = defaultdict(list)
+        if points:
+            self._load_points()
+
+    # ── TERC ──────────────────────────────────────────────────────────────────
+
+    def powiat_name(self, woj: str, pow_: str) -> str:
+        name = self.terc.get((woj, pow_, '', ''), '')
+        # miasta na prawach powiatu — konwencja bazy: „m. Kraków”
+        return f"m. {name}" if pow_ >= '61' else name
+
+    def gmina_name(self, woj: str, pow_: str, gmi: str, rodz: str) -> str:
+        if rodz in CITY_GMINA:
+            return self.terc.get((woj, pow_, '', ''), '')
+        return self.terc.get((woj, pow_, gmi, rodz), '')
+
+    # ── wyszukiwanie ─────────────────────────────────────────────────────────
+
+    def as_dict(self, i: int) -> dict:
+        nazwa, sym, sympod, rm, woj, pow_, gmi, rodz = self.records[i]
+        lat, lon, precision = self.centroid(i)
+        parent = self.records[self.by_sym[sympod]][0] if sympod != sym and sympod in self.by_sym else None
+        return {
+            'nazwa':       nazwa,
+            'typ':         RM_TYP.get(rm, rm),
+            'sym':         sym,
+            'sympod':      sympod,
+            'nadrzedna':   parent,
+            'gmina':       self.gmina_name(woj, pow_, gmi, rodz),
+            'powiat':      self.powiat_name(woj, pow_),
+            'wojewodztwo': self.terc.get((woj, '', '', ''), '').lower(),
+            'teryt_gmina': f"{woj}{pow_}011" if rodz in CITY_GMINA else f"{woj}{pow_}{gmi}{rodz}",
+            'lat':         lat,
+            'lon':         lon,
+            'precision':   precision,
+        }
+
+    def candidates(self, nazwa: str, powiat: str | None = None,
+                   gmina: str | None = None) -> list[int]:
+        """
+        Indeksy rekordów o nazwie `nazwa` (od najważniejszego), zawężone do powiatu / gminy.
+        Podany powiat / gmina to warunek, nie podpowiedź: gdy żadna miejscowość
+        go nie spełnia, wynik jest pusty (Zawada w zakopiańskim to nie Zawada w olkuskim).
+        """
+        found = self.by_name.get(norm(nazwa), [])
+        if powiat:
+            p = norm_unit(powiat)
+            found = [i for i in found if norm_unit(self.powiat_name(*self.records[i][4:6])) == p]
+        if gmina:
+            g = norm_unit(gmina)
+            found = [i for i in found if norm_unit(self.gmina_name(*self.records[i][4:8])) == g]
+        return found
+
+    def resolve(self, nazwa: str, powiat: str | None = None, gmina: str | None = None) -> dict | None:
+        """Miejscowość jako słownik (TERYT, gmina, powiat, współrzędne) albo None."""
+        found = self.candidates(re.sub(r'\s*,.*$', '', nazwa or ''), powiat, gmina)
+        return self.as_dict(found[0]) if found else None
+
+    # ── współrzędne ──────────────────────────────────────────────────────────
+
+    def _load_points(self):
+        if CENTROIDS_CSV.exists():
+            with open(CENTROIDS_CSV, newline='', encoding='utf-8-sig') as f:
+                for r in csv.DictReader(f, delimiter=';'):
+                    self.centroids[r['SYM']] = (float(r['lat']), float(r['lon']))
+
+        # miejscowości już zgeokodowane przez Nominatim (wariant „miejscowość”)
+        if GEOCODE_DB.exists():
+            db = sqlite3.connect(GEOCODE_DB)
+            try:
+                rows = db.execute(
+                    "SELECT key, lat, lon FROM geocode WHERE hit = 1 AND variant = 'miejscowosc'"
+                ).fetchall()
+            except sqlite3.Error:
+                rows = []
+            db.close()
+            for key, lat, lon in rows:
+                city = key.split('|')[1]
+                found = self.by_name.get(city)
+                if found:
+                    self.centroids.setdefault(self.records[found[0]][1], (lat, lon))
+
+        # znane placówki — mediana na miejscowość, a także na gminę i powiat
+        per_sym: dict[str, list[tuple[float, float]]] = defaultdict(list)
+        for path, lat_col, lon_col, city_col, powiat_col in POINT_SOURCES:
+            if not path.exists():
+                continue
+            with open(path, newline='', encoding='utf-8') as f:
+                for r in csv.DictReader(f):
+                    try:
+                        point = (float(r[lat_col]), float(r[lon_col]))
+                    except (TypeError, ValueError):
+                        continue
+                    found = self.candidates(r.get(city_col) or '', r.get(powiat_col))
+                    if not found:
+                        continue
+                    i = found[0]
+                    per_sym[self.records[i][1]].append(point)
+                    woj, pow_, gmi, rodz = self.records[i][4:8]
+                    self.unit_points[(woj, pow_, gmi)].append(point)
+                    self.unit_points[(woj, pow_)].append(point)
+        for sym, points in per_sym.items():
+            self.centroids.setdefault(sym, _median(points))
+
+    def centroid(self, i: int) -> tuple[float | None, float | None, str | None]:
+        nazwa, sym, sympod, rm, woj, pow_, gmi, rodz = self.records[i]
+        for s in (sym, sympod):
+            if s in self.centroids:
+                return (*self.centroids[s], 'miejscowosc')
+        for key, level in (((woj, pow_, gmi), 'gmina'), ((woj, pow_), 'powiat')):
+            if key in self.unit_points:
+                return (*_median(self.unit_points[key]), level)
+        return None, None, None
+
+
+def _median(points: list[tuple[float, float]]) -> tuple[float, float]:
+    return statistics.median(p[0] for p in points), statistics.median(p[1] for p in points)
+
+
+@lru_cache(maxsize=1)
+def load() -> LocalityResolver:
+    """Wspólna instancja dla skryptu (wczytanie SIMC + TERC to ~0,1 s)."""
+    return LocalityResolver()
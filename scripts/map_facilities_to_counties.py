@@ -1,63 +1,154 @@
 # -*- coding: utf-8 -*-
-import pandas as pd
-import json
-from shapely.geometry import Point, shape
+"""
+Przypisanie placówek do powiatów po współrzędnych (punkt w wielokącie).
+
+Wszystkie punkty naraz przez indeks przestrzenny (scripts/counties.py) —
+bez pętli po powiatach. Wiersze bez współrzędnych dostają powiat z TERYT
+po miejscowości (scripts/localities.py).
+
+Użycie:
+  python scripts/map_facilities_to_counties.py                   # CSV, Małopolska
+  python scripts/map_facilities_to_counties.py --polska          # granice całej Polski
+  DATABASE_URL=... python scripts/map_facilities_to_counties.py --db --polska
+      # cała tabela "Placowka" jednym zapytaniem + lista niezgodności z polem powiat
+"""
+import argparse
 import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from counties import CountyIndex, MALOPOLSKIE_GEOJSON, load_poland_counties
+from localities import load as load_localities, norm_unit
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+# Ścieżki dopasowane do Twojej struktury src/data
+FACILITIES_PATHS = [
+    os.path.join(project_root, 'src', 'data', 'placowki.csv'),
+    os.path.join(project_root, 'data', 'placowki.csv'),
+]
+OUTPUT_PATH    = os.path.join(project_root, 'src', 'data', 'placowki_z_powiatami.csv')
+DB_OUTPUT_PATH = os.path.join(project_root, 'raw_dane', 'placowka_powiaty.csv')
+
+# (długość, szerokość) — różne nagłówki w różnych plikach
+COORD_COLUMNS = [('lng', 'lat'), ('geo_long', 'geo_lat'), ('longitude', 'latitude')]
+OUTSIDE = "Poza Małopolską"
+
+
+def coords(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    for lon_col, lat_col in COORD_COLUMNS:
+        if lon_col in df.columns and lat_col in df.columns:
+            return (pd.to_numeric(df[lon_col], errors='coerce').to_numpy(),
+                    pd.to_numeric(df[lat_col], errors='coerce').to_numpy())
+    nan = np.full(len(df), np.nan)
+    return nan, nan
+
+
+def load_db() -> pd.DataFrame:
+    """Cała tabela "Placowka" jednym zapytaniem."""
+    database_url = os.environ.get('DATABASE_URL', '')
+    if not database_url:
+        sys.exit("❌ Brak DATABASE_URL w środowisku!")
+    import psycopg2
+    conn = psycopg2.connect(database_url)
+    try:
+        return pd.read_sql_query(
+            'SELECT id, nazwa, typ_placowki, miejscowosc, gmina, powiat, wojewodztwo,'
+            ' latitude, longitude FROM "Placowka" ORDER BY id', conn)
+    finally:
+        conn.close()
 
-def map_facilities():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    
-    # Ścieżki dopasowane do Twojej struktury src/data
-    geojson_path = os.path.join(project_root, 'src', 'data', 'malopolskie-counties.geojson')
-    facilities_path = os.path.join(project_root, 'src', 'data', 'placowki.csv')
-    output_path = os.path.join(project_root, 'src', 'data', 'placowki_z_powiatami.csv')
-
-    print(f"--- START MAPOWANIA (BEZ GEOPANDAS) ---")
-    
-    if not os.path.exists(geojson_path):
-        print(f"!!! BŁĄD: Brak pliku GeoJSON w {geojson_path}")
-        return
-    if not os.path.exists(facilities_path):
-        print(f"!!! BŁĄD: Brak pliku CSV w {facilities_path}")
-        return
-
-    # 1. Wczytaj granice powiatów z GeoJSON
-    with open(geojson_path, 'r', encoding='utf-8') as f:
-        geojson_data = json.load(f)
-
-    counties = []
-    for feature in geojson_data['features']:
-        # Pobieramy nazwę (obsługujemy różne formaty kluczy)
-        props = feature['properties']
-        name = props.get('name') or props.get('JPT_NAZWA_') or props.get('nazwa')
-        
-        counties.append({
-            'name': name,
-            'polygon': shape(feature['geometry']) # Zamiana JSON na obiekt geograficzny
-        })
-
-    # 2. Wczytaj placówki
-    df = pd.read_csv(facilities_path)
-    
-    # Funkcja sprawdzająca punkt w wielokącie
-    def find_county(row):
-        try:
-            # Tworzymy punkt z lat/lng (upewnij się, że takie masz nagłówki w CSV!)
-            p = Point(float(row['lng']), float(row['lat']))
-            for county in counties:
-                if county['polygon'].contains(p):
-                    return county['name']
-        except Exception as e:
-            return None
-        return "Poza Małopolską"
+
+def map_facilities(df: pd.DataFrame, index: CountyIndex, outside: str = OUTSIDE) -> pd.DataFrame:
+    lons, lats = coords(df)
+    start = time.perf_counter()
+    idx = index.assign(lons, lats)
+    print(f"Przypisano {int((idx >= 0).sum())}/{len(df)} punktów "
+          f"({len(index)} powiatów, {time.perf_counter() - start:.3f} s)")
+
+    df['powiat_nazwa'] = index.lookup(idx, index.names, outside)
+    df['powiat_teryt'] = index.lookup(idx, index.ids)
+
+    # Bez współrzędnych — powiat z TERYT po miejscowości (offline); tak samo pusta gmina
+    localities = load_localities()
+    city_col = 'miasto_wies' if 'miasto_wies' in df.columns else 'miejscowosc'
+    if 'gmina' not in df.columns:
+        df['gmina'] = None
+    no_coords = np.isnan(lons) | np.isnan(lats)
+    no_gmina = ~df['gmina'].map(lambda g: isinstance(g, str) and bool(g.strip())).to_numpy()
+    for i in np.flatnonzero(no_coords | no_gmina):
+        nazwa, gmina = df[city_col].iat[i], df['gmina'].iat[i]
+        loc = localities.resolve(nazwa, gmina=gmina if isinstance(gmina, str) else None) \
+            if isinstance(nazwa, str) else None
+        if loc is None:
+            continue
+        if no_coords[i]:
+            df.iat[i, df.columns.get_loc('powiat_nazwa')] = loc['powiat']
+            df.iat[i, df.columns.get_loc('powiat_teryt')] = loc['teryt_gmina'][:4]
+        if no_gmina[i]:
+            df.iat[i, df.columns.get_loc('gmina')] = loc['gmina']
+    if no_coords.any():
+        print(f"Bez współrzędnych: {int(no_coords.sum())} (powiat z TERYT po miejscowości)")
+    return df
+
+
+def report_mismatches(df: pd.DataFrame):
+    """Placówki, których pole powiat nie zgadza się z powiatem ze współrzędnych."""
+    localities = load_localities()
+
+    def teryt_powiat(code):
+        return localities.powiat_name(code[:2], code[2:4]) if isinstance(code, str) and len(code) >= 4 else None
+
+    expected = df['powiat_teryt'].map(teryt_powiat)
+    mismatch = expected.notna() & (expected.map(norm_unit) != df['powiat'].map(norm_unit))
+    print(f"\nNiezgodny powiat: {int(mismatch.sum())} placówek")
+    for label, row in df[mismatch].head(50).iterrows():
+        print(f"  id={row['id']:5d}  {str(row['nazwa'])[:45]:<45}  {row['powiat']!s:<20} → {expected[label]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Przypisanie placówek do powiatów po współrzędnych")
+    parser.add_argument('--csv', help="plik CSV z placówkami (domyślnie src/data albo data/placowki.csv)")
+    parser.add_argument('--db', action='store_true', help='cała tabela "Placowka" z bazy')
+    parser.add_argument('--polska', action='store_true', help='granice powiatów całej Polski')
+    args = parser.parse_args()
+
+    print(f"--- START MAPOWANIA ---")
+
+    # 1. Granice powiatów
+    if args.polska:
+        index = CountyIndex.from_geojson(load_poland_counties())
+        outside = "Poza Polską"
+    else:
+        if not MALOPOLSKIE_GEOJSON.exists():
+            print(f"!!! BŁĄD: Brak pliku GeoJSON w {MALOPOLSKIE_GEOJSON}")
+            return
+        index = CountyIndex.from_geojson(MALOPOLSKIE_GEOJSON)
+        outside = OUTSIDE
+
+    # 2. Placówki
+    if args.db:
+        df, output_path = load_db(), DB_OUTPUT_PATH
+    else:
+        facilities_path = args.csv or next((p for p in FACILITIES_PATHS if os.path.exists(p)), None)
+        if not facilities_path or not os.path.exists(facilities_path):
+            print(f"!!! BŁĄD: Brak pliku CSV z placówkami ({', '.join(FACILITIES_PATHS)})")
+            return
+        df, output_path = pd.read_csv(facilities_path), OUTPUT_PATH
 
     print(f"Przetwarzam {len(df)} placówek...")
-    df['powiat_nazwa'] = df.apply(find_county, axis=1)
+    df = map_facilities(df, index, outside)
+    if args.db:
+        report_mismatches(df)
 
     # 3. Zapisz wynik
     df.to_csv(output_path, index=False, encoding='utf-8')
     print(f"--- SUKCES: Wynik zapisano w {output_path} ---")
 
+
 if __name__ == "__main__":
-    map_facilities()
\ No newline at end of file
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Monitor źródeł danych — jedno wejście dla wszystkich wtyczek z scripts/monitors/.
+
+Użycie:
+  python scripts/monitor-all.py                  # monitory zaplanowane na dziś
+  python scripts/monitor-all.py lodzkie lubuskie # wybrane monitory
+  python scripts/monitor-all.py --all            # wszystkie
+  python scripts/monitor-all.py --list           # lista monitorów i harmonogram
+
+FORCE_CHECK=true (lub --force) wymusza pełne sprawdzenie mimo braku zmian.
+Kod wyjścia 1, gdy którykolwiek monitor zakończył się błędem.
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+import datetime
+
+from monitors import PLUGINS
+from monitors.engine import run_monitors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitor źródeł danych Kompas Seniora")
+    parser.add_argument("names", nargs="*", help=f"monitory: {', '.join(PLUGINS)}")
+    parser.add_argument("--all", action="store_true", help="uruchom wszystkie monitory")
+    parser.add_argument("--force", action="store_true", help="wymuś sprawdzenie (jak FORCE_CHECK=true)")
+    parser.add_argument("--list", action="store_true", help="pokaż monitory i dni uruchomień")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, plugin in PLUGINS.items():
+            days = ", ".join(str(d) for d in plugin.days)
+            print(f"  {name:<20} {plugin.region:<22} dni: {days}")
+        return
+
+    unknown = [n for n in args.names if n not in PLUGINS]
+    if unknown:
+        parser.error(f"nieznane monitory: {', '.join(unknown)}")
+
+    if args.all:
+        selected = list(PLUGINS.values())
+    elif args.names:
+        selected = [PLUGINS[n] for n in args.names]
+    else:
+        day = datetime.date.today().day
+        selected = [p for p in PLUGINS.values() if day in p.days]
+
+    if not selected:
+        print("Brak monitorów zaplanowanych na dziś.")
+        return
+
+    force = args.force or os.environ.get("FORCE_CHECK", "false").lower() == "true"
+    print(f"Uruchamiam: {', '.join(p.name for p in selected)}{' (wymuszone)' if force else ''}")
+
+    results = asyncio.run(run_monitors(selected, force=force))
+
+    print("\n── Podsumowanie ──")
+    for name, ok in results.items():
+        print(f"  {'✅' if ok else '❌'} {name}")
+
+    if not all(results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,9 +10,10 @@ Uruchamiany przez GitHub Actions: .github/workflows/slaskie-dps-monitor.yml
 import os
 import re
 import sys
-import hashlib
 import requests
 
+from monitors.http_cache import HttpCache
+
 # Strona z linkiem do PDF (sprawdzamy nagłówki HTTP żeby wykryć zmianę pliku)
 PDF_URL = "https://www.katowice.uw.gov.pl/files/146/Rejestr_dom__w_pomocy_spo__ecznej__aktualizacja_z_dnia_12_03_2026.pdf"
 # Strona nadrzędna do sprawdzenia nowego linku jeśli PDF zmieni URL
@@ -27,34 +28,13 @@ FORCE_CHECK = os.environ.get('FORCE_CHECK', '').lower() in ('1', 'true', 'yes')
 
 def get_pdf_hash(url: str) -> str | None:
     """
-    Sprawdza nagłówki HTTP pliku PDF (Last-Modified, Content-Length, ETag).
-    Jeśli nagłówki niedostępne — pobiera pierwsze 64KB i hashuje.
+    Odcisk pliku z nagłówków HTTP (Last-Modified, ETag, Content-Length),
+    a gdy niedostępne — hash pierwszych 64KB. Wspólna implementacja:
+    scripts/monitors/http_cache.py (HttpCache.fingerprint).
     """
-    try:
-        # Najpierw HEAD request (szybkie, bez pobierania)
-        r = requests.head(url, headers=HEADERS, timeout=20, verify=False, allow_redirects=True)
-        sig_parts = []
-        for h in ['Last-Modified', 'ETag', 'Content-Length']:
-            val = r.headers.get(h, '')
-            if val:
-                sig_parts.append(f"{h}:{val}")
-                print(f"   {h}: {val}")
-
-        if sig_parts:
-            return hashlib.sha256('\n'.join(sig_parts).encode()).hexdigest()[:16]
-
-        # Fallback: pobierz pierwsze 64KB PDF i hashuj
-        print("   (nagłówki niedostępne — pobieranie fragmentu PDF)")
-        r2 = requests.get(url, headers={**HEADERS, 'Range': 'bytes=0-65535'},
-                          timeout=30, verify=False, stream=True)
-        chunk = b''
-        for c in r2.iter_content(65536):
-            chunk += c
-            break
-        return hashlib.sha256(chunk).hexdigest()[:16]
-    except Exception as e:
-        print(f"❌ Błąd sprawdzania PDF: {e}")
-        return None
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    return HttpCache(session).fingerprint(url, verify=False)
 
 
 def read_sentinel() -> str | None:
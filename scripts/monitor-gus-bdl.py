@@ -7,7 +7,7 @@ Harmonogram: 1. każdego miesiąca o 9:00 UTC.
 - Gdy dane dostępne (≥15/22 powiatów ma val > 0): tworzy GitHub Issue.
 - Gdy dane niedostępne: kończy cicho (brak spamu).
 - Gdy Issue z tym tytułem już istnieje (open): nie tworzy duplikatu.
-- Gdy błąd sieciowy: jeden retry, potem loguje i kończy z kodem 1.
+- Gdy błąd sieciowy: ponowienia z backoffem (scripts/bdl.py), potem loguje i kończy z kodem 1.
 
 Zmienne środowiskowe:
   GITHUB_TOKEN      — token GitHub (dostępny automatycznie w Actions)
@@ -19,12 +19,12 @@ Zmienne środowiskowe:
 import os
 import sys
 import datetime
-import time
 import requests
 
+from bdl import BdlClient
+
 # ── konfiguracja ─────────────────────────────────────────────────────────────
 
-BASE_URL       = "https://bdl.stat.gov.pl/api/v1"
 VARIABLE_ID    = 72293          # Ludność w wieku poprodukcyjnym ogółem
 MALOPOLSKA_ID  = "011200000000"
 TARGET_YEAR    = "2025"
@@ -45,40 +45,10 @@ ISSUE_LABELS  = ["data-monitoring", "gus-data", "data-update"]
 
 # ── helpers ──────────────────────────────────────────────────────────────────
 
-def gus_headers() -> dict:
-    h = {"Accept": "application/json"}
-    if API_KEY:
-        h["X-ClientId"] = API_KEY
-    return h
-
-
-def fetch_with_retry(url: str, params: dict, timeout: int = 30) -> dict:
-    """Odpytuje API GUS — jeden retry po 5 s przy błędzie sieciowym."""
-    for attempt in (1, 2):
-        try:
-            r = requests.get(url, params=params, headers=gus_headers(), timeout=timeout)
-            r.raise_for_status()
-            return r.json()
-        except requests.RequestException as exc:
-            if attempt == 1:
-                print(f"  Próba {attempt} nieudana: {exc} — retry za 5 s...")
-                time.sleep(5)
-            else:
-                raise
-
-
 def fetch_variable_data(variable_id: int, year: str) -> list:
-    """Zwraca listę wyników dla zmiennej per powiat w Małopolsce."""
-    url = f"{BASE_URL}/data/by-variable/{variable_id}"
-    params = {
-        "unit-level":    5,
-        "unit-parentId": MALOPOLSKA_ID,
-        "year":          year,
-        "page-size":     30,
-        "format":        "json",
-    }
-    data = fetch_with_retry(url, params)
-    return data.get("results", [])
+    """Zwraca listę wyników dla zmiennej per powiat w Małopolsce (bez cache — zawsze świeże)."""
+    client = BdlClient(api_key=API_KEY, cache_dir=None)
+    return client.data(variable_id, int(year), unit_level=5, parent_id=MALOPOLSKA_ID)
 
 
 def has_open_issue(title: str) -> bool:
@@ -202,7 +172,7 @@ def main():
     try:
         results = fetch_variable_data(VARIABLE_ID, TARGET_YEAR)
     except requests.RequestException as exc:
-        print(f"Błąd sieciowy po 2 próbach: {exc}")
+        print(f"Błąd sieciowy po wszystkich próbach: {exc}")
         sys.exit(1)
 
     print(f"API zwróciło {len(results)} powiatów")
@@ -20,12 +20,12 @@ import os
 import sys
 import csv
 import datetime
-import time
 import requests
 
+from bdl import BdlClient
+
 # ── konfiguracja ──────────────────────────────────────────────────────────────
 
-BASE_URL      = "https://bdl.stat.gov.pl/api/v1"
 VARIABLE_ID   = 155058       # Przeciętna emerytura ZUS brutto per województwo
 LOCAL_CSV     = "data/gus_emerytury_wojewodztwa.csv"
 WSKAZNIK      = "emerytura_zus"
@@ -41,47 +41,17 @@ HIGHLIGHT_WOJE = {"MAŁOPOLSKIE", "ŚLĄSKIE", "MAZOWIECKIE"}
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
-def gus_headers() -> dict:
-    h = {"Accept": "application/json"}
-    if API_KEY:
-        h["X-ClientId"] = API_KEY
-    return h
-
-
 def fetch_latest_year_api() -> tuple[int, dict[str, float]]:
-    """Zwraca (najnowszy_rok, {województwo: wartość}) z GUS BDL."""
-    for attempt in (1, 2):
-        try:
-            r = requests.get(
-                f"{BASE_URL}/variables/{VARIABLE_ID}",
-                params={"format": "json"},
-                headers=gus_headers(),
-                timeout=20,
-            )
-            r.raise_for_status()
-            available_years = sorted(r.json().get("years", []))
-            if not available_years:
-                raise ValueError("Brak listy lat w odpowiedzi API")
-            latest_year = available_years[-1]
-            break
-        except requests.RequestException as exc:
-            if attempt == 1:
-                print(f"  Retry za 5s ({exc})")
-                time.sleep(5)
-            else:
-                raise
-
-    # Pobierz wartości dla najnowszego roku
-    r = requests.get(
-        f"{BASE_URL}/data/by-variable/{VARIABLE_ID}",
-        params={"unit-level": 2, "year": str(latest_year), "page-size": 50, "format": "json"},
-        headers=gus_headers(),
-        timeout=20,
-    )
-    r.raise_for_status()
-
+    """Zwraca (najnowszy_rok, {województwo: wartość}) z GUS BDL (bez cache — zawsze świeże)."""
+    client = BdlClient(api_key=API_KEY, cache_dir=None)
+    available_years = sorted(client.variable(VARIABLE_ID).get("years", []))
+    if not available_years:
+        raise ValueError("Brak listy lat w odpowiedzi API")
+    latest_year = available_years[-1]
+
+    # Wartości dla najnowszego roku
     values = {}
-    for unit in r.json().get("results", []):
+    for unit in client.data(VARIABLE_ID, latest_year, unit_level=2):
         for v in unit.get("values", []):
             if v.get("attrId") == 1 and v.get("val"):
                 values[unit["name"]] = round(float(v["val"]), 2)
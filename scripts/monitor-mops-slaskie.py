@@ -11,9 +11,10 @@ Uruchomienie ręczne:
 """
 import os
 import sys
-import hashlib
 import requests
 
+from monitors.http_cache import HttpCache
+
 # Strona z wykazem OPS śląskiego
 PDF_URL = "https://www.katowice.uw.gov.pl/download/441"
 PAGE_URL = "https://www.katowice.uw.gov.pl/wydzial/wydzial-rodziny-i-polityki-spolecznej"
@@ -28,33 +29,14 @@ FORCE_CHECK      = os.environ.get('FORCE_CHECK', '').lower() in ('1', 'true', 'y
 
 
 def get_file_hash(url: str) -> str | None:
-    """Sprawdza nagłówki HTTP lub pobiera fragment do hasha."""
-    try:
-        r = requests.head(url, headers=HEADERS, timeout=20, verify=False, allow_redirects=True)
-        parts = []
-        for h in ['Last-Modified', 'ETag', 'Content-Length']:
-            v = r.headers.get(h, '')
-            if v:
-                parts.append(f"{h}:{v}")
-                print(f"   {h}: {v}")
-
-        if parts:
-            return hashlib.sha256('\n'.join(parts).encode()).hexdigest()[:16]
-
-        # Fallback: pierwsze 64KB
-        print("   (nagłówki niedostępne — pobieranie fragmentu)")
-        r2 = requests.get(url, headers={**HEADERS, 'Range': 'bytes=0-65535'},
-                          timeout=30, verify=False, stream=True)
-        chunk = b''
-        for c in r2.iter_content(chunk_size=8192):
-            chunk += c
-            if len(chunk) >= 65536:
-                break
-        return hashlib.sha256(chunk).hexdigest()[:16]
-
-    except Exception as e:
-        print(f"   ⚠️  Błąd: {e}")
-        return None
+    """
+    Odcisk pliku z nagłówków HTTP (Last-Modified, ETag, Content-Length),
+    a gdy niedostępne — hash pierwszych 64KB. Wspólna implementacja:
+    scripts/monitors/http_cache.py (HttpCache.fingerprint).
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    return HttpCache(session).fingerprint(url, verify=False)
 
 
 def read_sentinel() -> str | None:
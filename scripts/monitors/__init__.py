@@ -0,0 +1,31 @@
+"""
+Monitory źródeł danych (wolne miejsca DPS, wykaz DPS, Senior+).
+
+Każde źródło to mała wtyczka — podklasa `Monitor` z własnym wyszukiwaniem
+URL, parserem i raportem. Uruchamianie: `python scripts/monitor-all.py`.
+"""
+
+from .core import Monitor, MonitorError
+from .malopolskie import MalopolskieMonitor
+from .kujawsko_pomorskie import KujawskoPomorskieMonitor
+from .lodzkie import LodzkieMonitor
+from .lubuskie import LubuskieMonitor
+from .podkarpackie import PodkarpackieMonitor
+from .wielkopolskie import WielkopolskieMonitor
+from .senior_plus import SeniorPlusMonitor
+from .dps_pdf import DpsPdfMonitor
+
+PLUGINS: dict[str, type[Monitor]] = {
+    m.name: m for m in (
+        MalopolskieMonitor,
+        KujawskoPomorskieMonitor,
+        LodzkieMonitor,
+        LubuskieMonitor,
+        PodkarpackieMonitor,
+        WielkopolskieMonitor,
+        SeniorPlusMonitor,
+        DpsPdfMonitor,
+    )
+}
+
+__all__ = ["Monitor", "MonitorError", "PLUGINS"]
@@ -0,0 +1,399 @@
+"""
+Wspólne elementy monitorów: pobieranie, hash, pliki stanu, dziennik, GitHub Issues.
+
+Każdy monitor to podklasa `Monitor` — definiuje źródło (URL lub wyszukiwanie
+linku na stronie BIP), parser i raport. Cały przebieg (pominięcie gdy plik już
+pobrany w tym miesiącu → pobranie → porównanie hasha → zapis → parsowanie →
+Issue → dziennik) jest tutaj, w `Monitor.run()`.
+"""
+
+import os
+import re
+import sys
+import datetime
+import importlib
+from pathlib import Path
+
+import requests
+
+from .http_cache import HttpCache, Fetch
+from .store import Store, sha256
+
+REPO = os.environ.get("GITHUB_REPOSITORY", "Kaczor4444/kompas-seniora")
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
+DATABASE_URL = os.environ.get("DATABASE_URL", "").strip()
+RAW_DANE = Path(__file__).resolve().parent.parent.parent / "raw_dane"
+
+USER_AGENT = "Mozilla/5.0"
+FOOTER = "*Wygenerowano automatycznie przez GitHub Actions / Kompas Seniora*"
+
+
+class MonitorError(Exception):
+    """Błąd przerywający monitor — kończy się otwartym Issue z alertem."""
+
+    def __init__(self, title: str, body: str, labels: list[str] | None = None):
+        super().__init__(title)
+        self.title = title
+        self.body = body
+        self.labels = labels
+
+
+# ── helpers ──────────────────────────────────────────────────────────────────
+
+def require(module: str, package: str | None = None):
+    """Importuje moduł, a gdy go brak — instaluje przez pip (jak dotychczas w monitorach)."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        import subprocess
+        subprocess.run([sys.executable, "-m", "pip", "install", package or module], check=True)
+        return importlib.import_module(module)
+
+
+def today_pl() -> str:
+    return datetime.date.today().strftime("%d.%m.%Y")
+
+
+def now_utc() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M UTC")
+
+
+def create_github_issue(session: requests.Session, title: str, body: str,
+                        labels: list[str], auto_close: bool = False,
+                        log=print) -> str | None:
+    if not GITHUB_TOKEN:
+        log(f"Brak GITHUB_TOKEN — pomijam tworzenie Issue: {title}")
+        return None
+    headers = {
+        "Authorization": f"Bearer {GITHUB_TOKEN}",
+        "Accept": "application/vnd.github+json",
+    }
+    r = session.post(
+        f"https://api.github.com/repos/{REPO}/issues",
+        headers=headers,
+        json={"title": title, "body": body, "labels": labels},
+        timeout=15,
+    )
+    if not r.ok:
+        log(f"Błąd tworzenia Issue: {r.status_code} {r.text}")
+        return None
+
+    issue = r.json()
+    url = issue["html_url"]
+    log(f"Issue utworzone: {url}")
+
+    if auto_close:
+        rc = session.patch(
+            f"https://api.github.com/repos/{REPO}/issues/{issue['number']}",
+            headers=headers,
+            json={"state": "closed"},
+            timeout=15,
+        )
+        if rc.ok:
+            log("Issue zamknięte automatycznie.")
+        else:
+            log(f"Błąd zamykania Issue: {rc.status_code}")
+
+    return url
+
+
+# ── Monitor ──────────────────────────────────────────────────────────────────
+
+class Monitor:
+    """
+    Bazowy monitor pliku z danymi. Podklasy ustawiają atrybuty źródła
+    i nadpisują `find_url`, `parse`, `summary`, `build_report`.
+    """
+
+    name = ""                 # identyfikator w CLI, np. "lodzkie"
+    region = ""               # nazwa w raportach, np. "Łódzkie"
+    short = ""                # nazwa w tytułach Issue (domyślnie = region)
+    raw_dir_name = ""         # katalog w raw_dane/
+    labels: list[str] = ["data-monitoring"]
+    days: tuple[int, ...] = ()  # dni miesiąca, w które monitor uruchamia się z harmonogramu
+    page_url = ""             # strona BIP, na której szukamy linku (opcjonalnie)
+    url = ""                  # stały URL pliku (gdy nie szukamy na stronie)
+    file_label = "XLS"        # "XLS" / "XLSX" / "PDF" — w komunikatach
+    file_pattern = ""         # wzorzec nazwy zapisanego pliku, np. "wolne_miejsca_{date}.xls"
+    verify = True             # weryfikacja SSL (MUW i UW Poznań mają problemy z certyfikatem)
+    timeout = 30
+    hash_name = ".wolne_miejsca_hash"
+    month_name = ".wolne_miejsca_month"   # None = bez pomijania „już pobrane w tym miesiącu”
+    log_name = "wolne_miejsca_log.md"
+    log_title = ""
+    wojewodztwo = ""          # jak w Placowka.wojewodztwo — gdy ustawione, `vacancies()` zasila PlacowkaWolneMiejsca
+    parse_version = 1         # podbić po zmianie `parse` — wyniki w magazynie (monitors/store.py) zostaną odświeżone
+
+    def __init__(self, session: requests.Session, force: bool = False):
+        self.session = session
+        self.force = force
+        self.previous = None
+        self.cache = HttpCache(session)
+        self.store = Store()
+
+    # ── ścieżki i stan ──
+
+    @property
+    def raw_dir(self) -> Path:
+        return RAW_DANE / self.raw_dir_name
+
+    @property
+    def hash_file(self) -> Path:
+        return self.raw_dir / self.hash_name
+
+    @property
+    def month_file(self) -> Path | None:
+        return self.raw_dir / self.month_name if self.month_name else None
+
+    @property
+    def log_file(self) -> Path:
+        return self.raw_dir / self.log_name
+
+    @property
+    def title_name(self) -> str:
+        return self.short or self.region
+
+    def log(self, msg: str):
+        print(f"[{self.name}] {msg}", flush=True)
+
+    def last_known_hash(self) -> str | None:
+        return self.hash_file.read_text().strip() if self.hash_file.exists() else None
+
+    def is_known(self, digest: str) -> bool:
+        """Czy plik o pełnym SHA-256 `digest` to ostatnio zapisana wersja?
+        Starsze sentinele trzymają 12-znakowy prefiks — porównujemy prefiksem."""
+        known = self.last_known_hash()
+        return bool(known) and digest.startswith(known)
+
+    def already_found_this_month(self) -> bool:
+        """Czy nowy plik był już pobrany w bieżącym miesiącu?"""
+        if not self.month_file or not self.month_file.exists():
+            return False
+        return self.month_file.read_text().strip() == datetime.date.today().strftime("%Y-%m")
+
+    def mark_found_this_month(self):
+        if self.month_file:
+            self.month_file.write_text(datetime.date.today().strftime("%Y-%m"))
+
+    def archived(self) -> list[Path]:
+        """Zapisane pliki monitora (nazwa wg `file_pattern`), od najstarszego."""
+        date_re = r"\d{4}-\d{2}(?:-\d{2})?"
+        pattern = re.compile(re.escape(self.file_pattern).replace(re.escape("{date}"), date_re))
+        return sorted(p for p in self.raw_dir.glob("*") if pattern.fullmatch(p.name))
+
+    def file_name(self, data: bytes, url: str) -> str:
+        return self.file_pattern.format(date=datetime.date.today().strftime("%Y-%m-%d"))
+
+    def save_file(self, data: bytes, digest: str, url: str) -> Path:
+        """Zapisuje plik w katalogu województwa i w magazynie treści, ustawia sentinel."""
+        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        path = self.raw_dir / self.file_name(data, url)
+        path.write_bytes(data)
+        self.store.put(data, path.suffix)
+        self.hash_file.write_text(digest)
+        return path
+
+    def update_log(self, path: Path, h: str, issue_url: str | None = None):
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        issue_link = f"[Issue]({issue_url})" if issue_url else "-"
+        entry = f"| {now} | [{path.name}]({path.name}) | `{h}` | {issue_link} |\n"
+
+        if not self.log_file.exists():
+            self.log_file.write_text(
+                f"# {self.log_title}\n\n"
+                "| Data pobrania | Plik | Hash (SHA-256) | Issue |\n"
+                "|---|---|---|---|\n"
+                + entry
+            )
+        else:
+            with self.log_file.open("a", encoding="utf-8") as f:
+                f.write(entry)
+
+    # ── sieć ──
+
+    def request_kwargs(self) -> dict:
+        if not self.verify:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        return {"timeout": self.timeout, "verify": self.verify,
+                "headers": {"User-Agent": USER_AGENT}}
+
+    def download(self, url: str) -> bytes:
+        r = self.session.get(url, **self.request_kwargs())
+        r.raise_for_status()
+        return r.content
+
+    def fetch(self, url: str) -> Fetch:
+        """Warunkowe pobranie pliku danych — 304 gdy nie zmienił się od ostatniej wersji."""
+        return self.cache.get(url, known_hash=self.last_known_hash(), force=self.force,
+                              **self.request_kwargs())
+
+    def issue(self, title: str, body: str, auto_close: bool = False,
+              labels: list[str] | None = None) -> str | None:
+        return create_github_issue(self.session, title, body, labels or self.labels,
+                                   auto_close=auto_close, log=self.log)
+
+    # ── punkty rozszerzeń ──
+
+    def find_url(self, html: str) -> str | None:
+        """Szuka linku do pliku na stronie BIP (dla monitorów z `page_url`)."""
+        return None
+
+    def fallback_url(self) -> str | None:
+        """URL używany, gdy strona BIP nie odpowiada lub nie ma linku (None = błąd)."""
+        return None
+
+    def parse(self, data: bytes) -> dict:
+        raise NotImplementedError
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        """(data stanu, wiersze w schemacie monitors/vacancies.py) — dla monitorów wolnych miejsc."""
+        raise NotImplementedError
+
+    def summary(self, parsed: dict) -> str:
+        """Krótki opis do tytułu Issue, np. '42 wolnych miejsc'."""
+        return ""
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        raise NotImplementedError
+
+    def source_lines(self) -> str:
+        return f"- **BIP:** {self.page_url}" if self.page_url else f"- **Źródło:** {self.url}"
+
+    # ── przebieg ──
+
+    def resolve_url(self) -> str:
+        if not self.page_url:
+            return self.url
+
+        today = today_pl()
+        fallback = self.fallback_url()
+        self.log(f"Pobieram stronę BIP: {self.page_url}")
+        try:
+            html = self.download(self.page_url).decode("utf-8", errors="replace")
+        except Exception as e:
+            if fallback:
+                self.log(f"Błąd pobierania strony BIP: {e} — używam fallback URL")
+                return fallback
+            raise MonitorError(
+                f"⚠️ Wolne miejsca DPS {self.title_name} {today} — błąd pobierania strony",
+                f"Sprawdzono {today} o {now_utc()}.\n\n```\n{e}\n```\n\n- **Strona:** {self.page_url}",
+            )
+
+        found = self.find_url(html)
+        if found:
+            self.log(f"Znaleziono {self.file_label}: {found}")
+            return found
+        if fallback:
+            self.log(f"Nie znaleziono URL w BIP — używam fallback: {fallback}")
+            return fallback
+        raise MonitorError(
+            f"⚠️ Wolne miejsca DPS {self.title_name} {today} — nie znaleziono {self.file_label}",
+            (
+                f"Sprawdzono {today} o {now_utc()}.\n\n"
+                f"Nie znaleziono linku do pliku {self.file_label} z wolnymi miejscami.\n\n"
+                f"Może zmienił się format strony.\n\n- **Strona:** {self.page_url}"
+            ),
+        )
+
+    def on_unchanged(self, url: str, h: str):
+        today = today_pl()
+        self.log(f"{self.file_label} bez zmian.")
+        self.issue(
+            f"✅ Wolne miejsca DPS {self.title_name} {today} — brak nowego pliku",
+            (
+                f"Sprawdzono {today} o {now_utc()}.\n\n"
+                f"Plik {self.file_label} nie zmienił się.\n\n"
+                f"- **Hash:** `{h}`\n- **URL:** {url}"
+            ),
+            auto_close=True,
+        )
+
+    def run(self) -> bool:
+        """Pełny przebieg monitora. Zwraca False, gdy zakończył się błędem."""
+        try:
+            self.check()
+            return True
+        except MonitorError as e:
+            self.log(f"❌ {e.title}")
+            self.issue(e.title, e.body, labels=e.labels)
+            return False
+
+    def check(self):
+        today = today_pl()
+
+        if self.already_found_this_month() and not self.force:
+            self.log("Nowy plik już pobrany w tym miesiącu — pomijam.")
+            self.issue(
+                f"✅ Wolne miejsca DPS {self.title_name} {today} — dane już aktualne",
+                (
+                    f"Sprawdzono {today} o {now_utc()}.\n\n"
+                    f"Nowy plik {self.file_label} już pobrany w tym miesiącu.\n\n"
+                    f"{self.source_lines()}"
+                ),
+                auto_close=True,
+            )
+            return
+
+        url = self.resolve_url()
+        self.log(f"Pobieranie {self.file_label}: {url}")
+        try:
+            fetch = self.fetch(url)
+        except Exception as e:
+            raise MonitorError(
+                f"⚠️ Wolne miejsca DPS {self.title_name} {today} — błąd pobierania {self.file_label}",
+                (
+                    f"Sprawdzono {today} o {now_utc()}.\n\n"
+                    f"**Nie udało się pobrać pliku {self.file_label}.**\n\n"
+                    f"```\n{e}\n```\n\n- **URL:** {url}\n{self.source_lines()}"
+                ),
+            )
+
+        known = self.last_known_hash()
+        if fetch.not_modified:
+            self.log(f"HTTP 304 — {self.file_label} bez zmian, pomijam pobieranie.")
+            self.on_unchanged(url, known[:12])
+            return
+
+        data = fetch.content
+        digest = sha256(data)
+        is_new = not self.is_known(digest)
+        self.log(f"Hash: {digest[:12]} | Poprzedni: {known and known[:12]} | Nowy plik: {is_new}")
+
+        if not is_new and not self.force:
+            self.cache.commit(fetch)
+            self.on_unchanged(url, digest[:12])
+            return
+
+        self.process_new(data, digest, url, is_new)
+        self.cache.commit(fetch)
+
+    def load_previous(self):
+        """Dane poprzedniego pliku do trendu (wywoływane przed zapisem nowego)."""
+        return None
+
+    def process_new(self, data: bytes, digest: str, url: str, is_new: bool):
+        today = today_pl()
+        h = digest[:12]
+        self.previous = self.load_previous()
+        path = self.save_file(data, digest, url)
+        self.mark_found_this_month()
+        self.log(f"Zapisano: {path}")
+
+        self.log(f"Parsowanie {self.file_label}...")
+        try:
+            parsed = self.store.parse_cached(data, self.parse, path.suffix)
+        except Exception as e:
+            raise MonitorError(
+                f"⚠️ Wolne miejsca DPS {self.title_name} {today} — błąd parsowania {self.file_label}",
+                (
+                    f"{self.file_label} pobrany poprawnie, ale nie udało się go sparsować.\n\n"
+                    f"```\n{e}\n```\n\n- **URL:** {url}"
+                ),
+            )
+
+        summary = self.summary(parsed)
+        self.log(f"Sparsowano: {summary}")
+        report = self.build_report(parsed, is_new, url, h, path)
+        issue_url = self.issue(f"🆕 Wolne miejsca DPS {self.title_name} {today} — {summary}", report)
+        self.update_log(path, h, issue_url)
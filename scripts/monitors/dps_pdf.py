@@ -0,0 +1,294 @@
+"""
+Wykaz DPS Małopolska (PDF, MUW Kraków) — porównanie z bazą danych.
+
+Harmonogram: 1. i 15. każdego miesiąca.
+- Gdy nowy PDF: walidacja struktury, porównanie z tabelą Placowka,
+  Issue z raportem rozbieżności i sugerowanym SQL patchem.
+- Gdy PDF bez zmian: zamknięty Issue informacyjny.
+- Gdy podejrzany wynik parsowania: otwarty Issue, bez SQL patcha.
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, MonitorError, FOOTER, DATABASE_URL, require, today_pl, now_utc
+from .store import sha256
+from .pdf import read_pdf
+from .wykaz_diff import DPS_MALOPOLSKA, diff_all, report_sections, sql_patch, count_diffs
+
+PDF_URL = "https://www.malopolska.uw.gov.pl/doc/wykaz%20dps.pdf"
+
+
+def extract_doc_date(header: str) -> str | None:
+    """Wyciąga datę stanu z nagłówka PDF (np. 'wg stanu na 24.06. 2026 r.')."""
+    m = re.search(r"wg stanu na\s+(\d{1,2})\.(\d{2})\.\s*(\d{4})", header or "", re.IGNORECASE)
+    if m:
+        day, month, year = m.group(1).zfill(2), m.group(2), m.group(3)
+        return f"{year}-{month}-{day}"
+    return None
+
+
+def extract_pdf_rows(content: dict) -> dict:
+    """Wiersze wykazu {l.p.: {...}} z tabel `read_pdf` (strony w kolejności)."""
+    rows = {}
+    for page_tables in content["tables"]:
+        for table in page_tables:
+            for row in table:
+                lp = (row[0] or "").strip().rstrip(".")
+                if not lp or lp == "l.p.":
+                    continue
+                try:
+                    num = int(lp)
+                except ValueError:
+                    continue
+
+                def cell(idx):
+                    return row[idx] if idx < len(row) else None
+
+                def norm_cell(c):
+                    return (c or "").strip().replace("\n", " ")
+
+                def extract_tel(c):
+                    m = re.search(r"tel[./\s]+(?:fax\s+)?([\d\s/]+)", c or "")
+                    return re.sub(r"\s+", " ", m.group(1).strip().rstrip("/")) if m else None
+
+                def extract_email(c):
+                    m = re.search(r"[\w.\-+]+@[\w.\-]+\.[a-z]{2,}", c or "")
+                    return m.group(0).lower() if m else None
+
+                def extract_miejsca(c):
+                    nums = re.findall(r"(\d+)\s*miejsc", c or "")
+                    if nums:
+                        return sum(int(n) for n in nums)
+                    m = re.match(r"^\s*(\d+)\s*$", (c or "").strip())
+                    return int(m.group(1)) if m else None
+
+                rows[num] = {
+                    "powiat":    norm_cell(cell(1)),
+                    "nazwa":     norm_cell(cell(2)),
+                    "telefon":   extract_tel(cell(3)),
+                    "email":     extract_email(cell(3)),
+                    "profil":    norm_cell(cell(4)),
+                    "miejsca":   extract_miejsca(cell(6)),
+                }
+    return rows
+
+
+def build_report(diffs: dict, pdf_rows: dict, is_new_file: bool, pdf_path: str) -> str:
+    today = datetime.date.today().strftime("%d.%m.%Y")
+    total = count_diffs(diffs)
+    status = "🆕 Nowy plik PDF" if is_new_file else "📄 Plik bez zmian (hash identyczny)"
+
+    lines = [
+        f"# Raport monitoringu DPS Małopolska — {today}",
+        "",
+        f"**Status pliku:** {status}",
+        f"**Źródło:** {PDF_URL}",
+        f"**Plik lokalny:** `{pdf_path}`",
+        f"**Rekordów w PDF:** {len(pdf_rows)}",
+        f"**Łączne rozbieżności:** {total}",
+        "",
+    ]
+
+    def section(title, items, fmt):
+        if not items:
+            return [f"### {title}\n✅ Brak rozbieżności\n"]
+        rows = [f"### {title} ({len(items)})\n"]
+        for it in items:
+            rows.append(fmt(it))
+        rows.append("")
+        return rows
+
+    lines += section(
+        "🔴 Brakujące w bazie (są w PDF, nie ma w DB)",
+        diffs["missing_in_db"],
+        lambda x: f"- **l.p. {x['lp']}** — {x['pdf']}"
+    )
+    lines += section(
+        "🟡 Extra w bazie (są w DB, nie ma w PDF)",
+        diffs["extra_in_db"],
+        lambda x: f"- **l.p. {x['lp']}** — {x['db']}"
+    )
+    lines += report_sections(DPS_MALOPOLSKA, diffs)
+
+    if total == 0:
+        lines.append("## ✅ Baza danych jest zgodna z aktualnym wykazem PDF.")
+    else:
+        lines.append(f"## ⚠️ Znaleziono {total} rozbieżności do sprawdzenia.")
+        lines.append("")
+        lines.append("## 🛠️ Sugerowany SQL patch")
+        lines.append("> Przejrzyj przed wykonaniem. Uruchom: `psql $DATABASE_URL` i wklej poniżej.")
+        lines.append("")
+        lines.append(sql_patch(DPS_MALOPOLSKA, diffs))
+
+    lines.append(f"\n---\n{FOOTER}")
+    return "\n".join(lines)
+
+
+def validate_pdf_rows(pdf_rows: dict) -> list[str]:
+    """
+    Sprawdza czy parsowanie PDF dało sensowne wyniki.
+    Zmiana układu kolumn w pliku MUW → puste pola bez błędu parsera.
+    Zwraca listę komunikatów błędów (pusta = OK).
+    """
+    errors = []
+    n = len(pdf_rows)
+
+    if n < 80:
+        errors.append(f"Za mało rekordów: **{n}** (oczekiwane ≥80) — możliwa zmiana formatu PDF lub niekompletne parsowanie.")
+    if n > 105:
+        errors.append(f"Za dużo rekordów: **{n}** (oczekiwane ≤105) — możliwe zduplikowane wiersze.")
+
+    with_email = sum(1 for r in pdf_rows.values() if r.get('email'))
+    if n > 0 and with_email / n < 0.30:
+        errors.append(
+            f"Tylko **{with_email}/{n}** rekordów ma email ({with_email/n*100:.0f}%) — "
+            f"prawdopodobna zmiana układu kolumn w PDF."
+        )
+
+    with_name = sum(1 for r in pdf_rows.values() if r.get('nazwa') and len(r['nazwa']) > 5)
+    if n > 0 and with_name / n < 0.70:
+        errors.append(
+            f"Tylko **{with_name}/{n}** rekordów ma nazwę ({with_name/n*100:.0f}%) — "
+            f"prawdopodobna zmiana układu kolumn w PDF."
+        )
+
+    return errors
+
+
+class DpsPdfMonitor(Monitor):
+    name = "dps-pdf"
+    region = "DPS Małopolska"
+    raw_dir_name = "malopolskie"
+    labels = ["data-monitoring"]
+    days = (1, 15)
+    url = PDF_URL
+    file_label = "PDF"
+    file_pattern = "wykaz dps malopolska {date}.pdf"
+    verify = False
+    hash_name = ".pdf_hash"
+    month_name = None
+    log_name = "pobrane.md"
+
+    doc_date: str | None = None   # data stanu z nagłówka — ustawiana przy parsowaniu w check()
+
+    def file_name(self, data: bytes, url: str) -> str:
+        doc_date = self.doc_date or datetime.date.today().strftime("%Y-%m-%d")
+        return self.file_pattern.format(date=doc_date)
+
+    def update_log(self, path: Path, h: str, issue_url: str | None = None):
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        issue_link = f" | [Issue]({issue_url})" if issue_url else ""
+        entry = f"| {now} | [{path.name}]({path.name}) | `{h}` | [źródło PDF]({PDF_URL}){issue_link} |\n"
+
+        if not self.log_file.exists():
+            self.log_file.write_text(
+                "# Dziennik pobrań — wykaz DPS Małopolska\n\n"
+                "| Data pobrania | Plik | Hash (SHA-256) | Źródło | Raport |\n"
+                "|---|---|---|---|---|\n"
+                + entry
+            )
+        else:
+            with self.log_file.open("a", encoding="utf-8") as f:
+                f.write(entry)
+
+    def on_unchanged(self, url: str, h: str):
+        today = today_pl()
+        self.log("PDF bez zmian — tworzę zamknięty Issue informacyjny.")
+        self.issue(
+            f"✅ DPS Monitor {today} — brak zmian w PDF",
+            (
+                f"Sprawdzono {today} o {now_utc()}.\n\n"
+                f"Plik PDF nie zmienił się od ostatniego sprawdzenia.\n\n"
+                f"- **Hash (SHA-256):** `{h}`\n"
+                f"- **Źródło:** {PDF_URL}"
+            ),
+            auto_close=True,
+        )
+
+    def check(self):
+        today = today_pl()
+        self.log("Pobieranie PDF...")
+        try:
+            fetch = self.fetch(PDF_URL)
+        except Exception as e:
+            raise MonitorError(
+                f"⚠️ DPS Monitor {today} — błąd pobierania PDF",
+                (
+                    f"Sprawdzono {today} o {now_utc()}.\n\n"
+                    f"**Nie udało się pobrać pliku PDF z MUW Małopolska.**\n\n"
+                    f"```\n{e}\n```\n\n"
+                    f"- **URL:** {PDF_URL}\n\n"
+                    f"Sprawdź czy strona MUW jest dostępna. "
+                    f"Następna próba: zgodnie z harmonogramem."
+                ),
+            )
+
+        known = self.last_known_hash()
+        if fetch.not_modified:
+            self.log("HTTP 304 — PDF bez zmian, pomijam pobieranie.")
+            self.on_unchanged(PDF_URL, known[:12])
+            return
+
+        data = fetch.content
+        digest = sha256(data)
+        h = digest[:12]
+        is_new = not self.is_known(digest)
+        self.log(f"Hash: {h} | Poprzedni: {known and known[:12]} | Nowy: {is_new}")
+
+        if not is_new and not self.force:
+            self.cache.commit(fetch)
+            self.on_unchanged(PDF_URL, h)
+            return
+
+        # jedno otwarcie PDF: data stanu (nazwa pliku) i tabele; wynik trafia do magazynu
+        self.log("Parsowanie PDF...")
+        content = self.store.parse_cached(data, read_pdf, ".pdf")
+        self.doc_date = extract_doc_date(content["header"])
+        pdf_rows = extract_pdf_rows(content)
+
+        path = self.save_file(data, digest, PDF_URL)
+        self.log(f"Zapisano: {path}")
+        self.update_log(path, h)
+        self.log(f"Znaleziono {len(pdf_rows)} rekordów w PDF")
+
+        # walidacja struktury — jeśli coś nie gra, alert i wyjście BEZ SQL patcha
+        validation_errors = validate_pdf_rows(pdf_rows)
+        if validation_errors:
+            err_list = "\n".join(f"- {e}" for e in validation_errors)
+            raise MonitorError(
+                f"🔴 DPS Monitor {today} — anomalia struktury PDF (sprawdź ręcznie)",
+                (
+                    f"Sprawdzono {today} o {now_utc()}.\n\n"
+                    f"**Parsowanie PDF dało podejrzane wyniki — możliwa zmiana układu kolumn.**\n\n"
+                    f"## Wykryte problemy\n\n{err_list}\n\n"
+                    f"## Co zrobić\n\n"
+                    f"1. Otwórz ręcznie: [{PDF_URL}]({PDF_URL})\n"
+                    f"2. Sprawdź czy tabela ma tę samą strukturę kolumn co wcześniej\n"
+                    f"3. Jeśli zmieniła się — zaktualizuj `extract_pdf_rows()` w `scripts/monitors/dps_pdf.py`\n\n"
+                    f"**SQL patch NIE został wygenerowany** — dane są podejrzane i nie powinny trafić do bazy.\n\n"
+                    f"- **Hash PDF:** `{h}`\n"
+                    f"- **Źródło:** {PDF_URL}"
+                ),
+            )
+
+        self.log("Porównanie z bazą danych...")
+        psycopg2 = require("psycopg2", "psycopg2-binary")
+        conn = psycopg2.connect(DATABASE_URL)
+        try:
+            diffs = diff_all(conn, [(DPS_MALOPOLSKA, pdf_rows)])[DPS_MALOPOLSKA.name]
+        finally:
+            conn.close()
+        total = count_diffs(diffs)
+        report = build_report(diffs, pdf_rows, is_new, path.name)
+
+        if total == 0:
+            title = f"✅ DPS Monitor {today} — baza zgodna z PDF"
+        else:
+            title = f"⚠️ DPS Monitor {today} — {total} rozbieżności do sprawdzenia"
+
+        issue_url = self.issue(title, report)
+        self.update_log(path, h, issue_url)
+        self.cache.commit(fetch)
+        self.log(f"\nRaport:\n{report}")
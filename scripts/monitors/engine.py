@@ -0,0 +1,48 @@
+"""
+Równoległe uruchamianie monitorów.
+
+Wszystkie monitory dzielą jedną sesję `requests` (pula połączeń per host),
+a pobieranie i parsowanie biegnie współbieżnie w wątkach pod asyncio —
+czas całego przebiegu ≈ najwolniejsze źródło zamiast sumy wszystkich.
+"""
+
+import asyncio
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .core import Monitor, USER_AGENT
+
+
+def make_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=2, backoff_factor=2, status_forcelist=(502, 503, 504),
+                          allowed_methods=("GET", "HEAD")),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+async def run_monitors(plugins: list[type[Monitor]], force: bool = False) -> dict[str, bool]:
+    """Uruchamia monitory współbieżnie. Zwraca {nazwa: sukces}."""
+    session = make_session(max(4, len(plugins) * 2))
+    monitors = [p(session, force=force) for p in plugins]
+
+    async def run_one(m: Monitor) -> bool:
+        try:
+            return await asyncio.to_thread(m.run)
+        except Exception as e:
+            m.log(f"❌ Nieoczekiwany błąd: {e!r}")
+            return False
+
+    try:
+        results = await asyncio.gather(*(run_one(m) for m in monitors))
+    finally:
+        session.close()
+    return {m.name: ok for m, ok in zip(monitors, results)}
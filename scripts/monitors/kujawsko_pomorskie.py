@@ -0,0 +1,203 @@
+"""
+Wolne miejsca DPS — Kujawsko-Pomorskie (BIP UW Bydgoszcz).
+
+Format pliku: jeden roczny XLS z kolumnami I–XII dla:
+  - Liczba mieszkańców (cols 4–15)
+  - Liczba oczekujących (cols 16–27)
+  - Liczba wolnych miejsc (cols 28–39)
+
+Harmonogram: 5. i 20. każdego miesiąca.
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, require, today_pl
+from .vacancies import vacancy_row, parse_data_stanu
+
+BIP_PAGE_URL = "https://bip.bydgoszcz.uw.gov.pl/67/rejestr-domow-pomocy-spolecznej.html"
+FALLBACK_XLS_URL = "https://bip.bydgoszcz.uw.gov.pl/download/attachment/1810/dps_wolne_miejsca_{year}.xls"
+
+MONTH_NAMES = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII']
+POLISH_MONTHS = {
+    'I': 'styczeń', 'II': 'luty', 'III': 'marzec', 'IV': 'kwiecień',
+    'V': 'maj', 'VI': 'czerwiec', 'VII': 'lipiec', 'VIII': 'sierpień',
+    'IX': 'wrzesień', 'X': 'październik', 'XI': 'listopad', 'XII': 'grudzień',
+}
+
+
+def find_xls_url_from_page(html: str) -> str | None:
+    """Szuka linku do aktualnego XLS na stronie BIP."""
+    pattern = r'href=["\']([^"\']*download[^"\']*dps_wolne_miejsca[^"\']*\.xls)["\']'
+    m = re.search(pattern, html, re.IGNORECASE)
+    if m:
+        url = m.group(1)
+        if url.startswith('/'):
+            return 'https://bip.bydgoszcz.uw.gov.pl' + url
+        return url
+    return None
+
+
+def safe_int(v) -> int:
+    try:
+        return int(float(str(v))) if str(v).strip() not in ('', 'None') else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def parse_xls(data: bytes) -> dict:
+    """
+    Parsuje roczny XLS K-P. Zwraca:
+      - date_header: "stan na dzień 31 maja 2026 r."
+      - latest_month: indeks (0=I, 4=V …) ostatniego miesiąca z danymi
+      - rows: lista dict {powiat, nazwa, wolne, oczek, category}
+      - totals_by_category: dict {category: {wolne, oczek}}
+      - grand_total_wolne, grand_total_oczek
+    """
+    xlrd = require("xlrd")
+
+    wb = xlrd.open_workbook(file_contents=data)
+    sh = wb.sheets()[0]
+
+    # Row 0: date header in col 1
+    date_header = str(sh.cell_value(0, 1)).strip()
+
+    # Find last non-empty month in wolne section (cols 28–39 = months 0–11)
+    # Skip RAZEM rows (they have SUM formulas = 0.0 for all months, even future ones)
+    # xlrd cell_type: 0=empty, 2=number
+    latest_month_idx = 0
+    for col in range(28, 40):
+        for r in range(3, sh.nrows):
+            powiat_cell = str(sh.cell_value(r, 1)).strip().upper()
+            if powiat_cell in ('RAZEM', 'POWIAT', ''):
+                continue
+            if sh.cell_type(r, col) == 2:  # type 2 = number (not empty)
+                m_idx = col - 28
+                if m_idx > latest_month_idx:
+                    latest_month_idx = m_idx
+                break
+
+    current_category = ''
+    rows = []
+    totals_by_category: dict = {}
+    wolne_col = 28 + latest_month_idx
+    oczek_col = 16 + latest_month_idx
+
+    for r in range(3, sh.nrows):
+        # Section separator in col 0
+        cat_raw = str(sh.cell_value(r, 0)).strip()
+        if cat_raw and not cat_raw.replace('.', '').replace('0', '').strip() == '':
+            # Only use if it looks like a category name (not a row number)
+            if any(c.isalpha() for c in cat_raw):
+                current_category = cat_raw.title()
+                totals_by_category.setdefault(current_category, {'wolne': 0, 'oczek': 0})
+                continue
+
+        powiat = str(sh.cell_value(r, 1)).strip()
+        nazwa = str(sh.cell_value(r, 2)).strip()
+
+        if not powiat or powiat in ('Powiat', 'RAZEM', 'Razem'):
+            continue
+        if 'sporządziła' in nazwa.lower() or 'wydział' in nazwa.lower():
+            continue
+
+        wolne = safe_int(sh.cell_value(r, wolne_col))
+        oczek = safe_int(sh.cell_value(r, oczek_col))
+
+        rows.append({
+            'powiat': powiat.replace('\n', ' ').strip(),
+            'nazwa': nazwa.replace('\n', ' ').strip()[:60],
+            'wolne': wolne,
+            'oczek': oczek,
+            'category': current_category,
+        })
+
+        if current_category:
+            totals_by_category.setdefault(current_category, {'wolne': 0, 'oczek': 0})
+            totals_by_category[current_category]['wolne'] += wolne
+            totals_by_category[current_category]['oczek'] += oczek
+
+    return {
+        'date_header': date_header,
+        'latest_month': MONTH_NAMES[latest_month_idx],
+        'rows': rows,
+        'totals_by_category': totals_by_category,
+        'grand_total_wolne': sum(r['wolne'] for r in rows),
+        'grand_total_oczek': sum(r['oczek'] for r in rows),
+    }
+
+
+class KujawskoPomorskieMonitor(Monitor):
+    name = "kujawsko-pomorskie"
+    region = "Kujawsko-Pomorskie"
+    short = "K-P"
+    raw_dir_name = "kujawsko-pomorskie"
+    labels = ["data-monitoring", "wolne-miejsca-kp"]
+    days = (5, 20)
+    page_url = BIP_PAGE_URL
+    file_pattern = "dps_wolne_miejsca_{date}.xls"
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Kujawsko-Pomorskie"
+    wojewodztwo = "kujawsko-pomorskie"
+
+    def find_url(self, html: str) -> str | None:
+        return find_xls_url_from_page(html)
+
+    def fallback_url(self) -> str | None:
+        return FALLBACK_XLS_URL.format(year=datetime.date.today().year)
+
+    def parse(self, data: bytes) -> dict:
+        return parse_xls(data)
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        return parse_data_stanu(parsed['date_header']), [
+            vacancy_row(r['nazwa'], r['powiat'], r['category'],
+                        wolne_ogolem=r['wolne'], oczekujacych=r['oczek'])
+            for r in parsed['rows']
+        ]
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['grand_total_wolne']} wolnych miejsc ({parsed['latest_month']})"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        status = "🆕 Nowy plik XLS — dane zaktualizowane" if is_new else "📄 Plik bez zmian"
+        month_pl = POLISH_MONTHS.get(parsed['latest_month'], parsed['latest_month'])
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Kujawsko-Pomorskie — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+            f"**Dane z pliku:** {parsed['date_header']}",
+            f"**Najnowszy miesiąc:** {month_pl} ({parsed['latest_month']})",
+            f"**Źródło:** [{url}]({url})",
+            f"**Strona BIP:** [{BIP_PAGE_URL}]({BIP_PAGE_URL})",
+            f"**Hash:** `{h}`",
+            "",
+            f"## Podsumowanie — {month_pl}",
+            "",
+            "| | Wartość |",
+            "|---|---|",
+            f"| Łącznie wolnych miejsc | **{parsed['grand_total_wolne']}** |",
+            f"| Łącznie oczekujących | **{parsed['grand_total_oczek']}** |",
+            f"| Liczba DPS | **{len(parsed['rows'])}** |",
+            "",
+            "## Wolne miejsca wg profilu opieki",
+            "",
+            "| Profil | Wolne | Oczekujący |",
+            "|---|---|---|",
+        ]
+        for cat, totals in parsed['totals_by_category'].items():
+            lines.append(f"| {cat} | {totals['wolne']} | {totals['oczek']} |")
+
+        lines += [
+            "",
+            "## Szczegóły per placówka",
+            "",
+            "| Powiat | Nazwa | Wolne | Oczekujący |",
+            "|---|---|---|---|",
+        ]
+        for row in parsed['rows']:
+            lines.append(f"| {row['powiat']} | {row['nazwa']} | {row['wolne']} | {row['oczek']} |")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
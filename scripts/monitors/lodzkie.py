@@ -0,0 +1,168 @@
+"""
+Wolne miejsca DPS — Łódzkie (gov.pl, UW Łódź).
+
+Format pliku: XLS, 4 kolumny:
+  Lp. | Powiat | Nazwa i adres | Liczba wolnych miejsc
+Ostatnia linia: "SUMA" z sumą wolnych miejsc.
+
+Harmonogram: nieregularny (~kwartalnie). Sprawdzamy 12. i 22. każdego miesiąca.
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, require, today_pl
+from .vacancies import vacancy_row, parse_data_stanu
+
+BIP_PAGE_URL = "https://www.gov.pl/web/uw-lodzki/wolne-miejsca-w-domach-pomocy-spolecznej"
+BASE_URL = "https://www.gov.pl"
+# Szukaj linku attachment z tekstem "Wykaz wolnych miejsc"
+ATTACHMENT_PATTERN = re.compile(
+    r'href="(/attachment/[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})"[^>]*>\s*Wykaz wolnych miejsc',
+    re.IGNORECASE,
+)
+
+
+def find_xls_url(html: str) -> str | None:
+    matches = ATTACHMENT_PATTERN.findall(html)
+    if not matches:
+        return None
+    path = matches[-1]
+    return BASE_URL + path if not path.startswith("http") else path
+
+
+def cell_int(val: str) -> int:
+    """Parse Excel float string ('8.0') to int."""
+    v = val.strip()
+    try:
+        return int(float(v)) if v else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def parse_xls(data: bytes) -> dict:
+    """
+    Parsuje XLS wolnych miejsc Łódzkie.
+
+    Kolumny: Lp. | Powiat | Nazwa i adres | Liczba wolnych miejsc
+    Wiersz nagłówka: zawiera datę stanu w kolumnie 3 (np. "...stan na dzień 31.03.2025 r.")
+    Ostatni wiersz: puste Lp., puste Powiat i Nazwa, suma w kolumnie 3.
+    """
+    xlrd = require("xlrd")
+
+    workbook = xlrd.open_workbook(file_contents=data)
+    sheet = workbook.sheet_by_index(0)
+
+    rows = []
+    date_header = ""
+    total_wolne = 0
+
+    for row_idx in range(sheet.nrows):
+        row = [str(sheet.cell_value(row_idx, c)).strip() for c in range(sheet.ncols)]
+
+        # Data stanu — w nagłówku (Lp='Lp') lub w dowolnej komórce
+        if not date_header:
+            for cell in row:
+                m = re.search(r"stan[u]?\s+na\s+(?:dzień\s+)?(\d{1,2}[.\s\n]+\d{1,2}[.\s\n]+\d{4})", cell, re.IGNORECASE)
+                if m:
+                    date_header = re.sub(r"\s+", "", m.group(1)).strip(".")
+                    break
+
+        lp_raw = row[0] if row else ""
+        lp_clean = re.sub(r"\.0$", "", lp_raw).strip()
+
+        # Wiersz z danymi: Lp. to liczba naturalna
+        if re.match(r"^\d+$", lp_clean):
+            rows.append({
+                "lp": lp_clean,
+                "powiat": (row[1] if len(row) > 1 else "").replace("\n", " "),
+                "nazwa": (row[2] if len(row) > 2 else "").replace("\n", " "),
+                "wolne": cell_int(row[3]) if len(row) > 3 else 0,
+            })
+            continue
+
+        # Ostatni wiersz — puste Lp., tylko suma w ostatniej kolumnie
+        if len(row) > 3 and lp_clean == "" and all(v == "" for v in row[:3]) and row[3]:
+            total_wolne = cell_int(row[3])
+
+    # Fallback jeśli suma nie znaleziona w osobnym wierszu
+    if total_wolne == 0 and rows:
+        total_wolne = sum(r["wolne"] for r in rows)
+
+    return {
+        "date_header": date_header,
+        "rows": rows,
+        "total_wolne": total_wolne,
+    }
+
+
+class LodzkieMonitor(Monitor):
+    name = "lodzkie"
+    region = "Łódzkie"
+    raw_dir_name = "lodzkie"
+    labels = ["data-monitoring", "wolne-miejsca-lodzkie"]
+    days = (12, 22)
+    page_url = BIP_PAGE_URL
+    timeout = 60
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Łódzkie"
+    wojewodztwo = "łódzkie"
+
+    def find_url(self, html: str) -> str | None:
+        return find_xls_url(html)
+
+    def archived(self) -> list[Path]:
+        return sorted(self.raw_dir.glob("wolne_miejsca_*.xls*"))
+
+    def file_name(self, data: bytes, url: str) -> str:
+        # Rozszerzenie na podstawie URL
+        ext = ".xlsx" if url.lower().endswith(".xlsx") else ".xls"
+        return f"wolne_miejsca_{datetime.date.today():%Y-%m-%d}{ext}"
+
+    def parse(self, data: bytes) -> dict:
+        return parse_xls(data)
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        return parse_data_stanu(parsed['date_header']), [
+            vacancy_row(r['nazwa'], r['powiat'], wolne_ogolem=r['wolne'])
+            for r in parsed['rows']
+        ]
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['total_wolne']} wolnych miejsc"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        status = "🆕 Nowy XLS — dane zaktualizowane" if is_new else "📄 XLS bez zmian"
+        dps_with = sum(1 for r in parsed["rows"] if r["wolne"] > 0)
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Łódzkie — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+        ]
+        if parsed["date_header"]:
+            lines.append(f"**Dane z pliku:** stan na {parsed['date_header']}")
+        lines += [
+            f"**Źródło:** [{url}]({url})",
+            f"**Strona:** [{BIP_PAGE_URL}]({BIP_PAGE_URL})",
+            f"**Hash:** `{h}`",
+            "",
+            "## Podsumowanie",
+            "",
+            "| | Wartość |",
+            "|---|---|",
+            f"| Łącznie wolnych miejsc | **{parsed['total_wolne']}** |",
+            f"| DPS z wolnymi miejscami | **{dps_with} / {len(parsed['rows'])}** |",
+            f"| Plik zawiera dane z | **{parsed['date_header'] or '?'}** |",
+            "",
+            "## Szczegóły per placówka",
+            "",
+            "| # | Powiat | Nazwa DPS | Wolne |",
+            "|---|---|---|---|",
+        ]
+        for row in parsed["rows"]:
+            marker = " ✅" if row["wolne"] > 0 else ""
+            lines.append(f"| {row['lp']} | {row['powiat']} | {row['nazwa']} | {row['wolne']}{marker} |")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
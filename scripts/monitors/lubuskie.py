@@ -0,0 +1,190 @@
+"""
+Wolne miejsca DPS — Lubuskie (BIP UW Gorzów Wlkp.).
+
+Format pliku: PDF (1 strona), tabela:
+  Nazwa DPS | Profil | Ogólna liczba miejsc | Liczba miejsc wolnych
+Ostatnia linia: "SUMA" z sumą miejsc i wolnych.
+
+Harmonogram: 12. i 22. każdego miesiąca (PDF wychodzi ~10. za poprzedni miesiąc).
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, today_pl
+from .pdf import read_pdf
+from .vacancies import vacancy_row, parse_data_stanu
+
+BIP_PAGE_URL = "https://bip.lubuskie.uw.gov.pl/polityka_spoleczna/pliki_polityka_spoleczna"
+PDF_URL_PATTERN = re.compile(
+    r'https://bip\.lubuskie\.uw\.gov\.pl/download/Wykaz-wolnych-miejsc-w-domach-pomocy-spolecznej[^"\'>\s]+\.pdf',
+    re.IGNORECASE,
+)
+
+# Linie które nigdy nie zawierają danych liczbowych DPS
+HEADER_PHRASES = [
+    "wolne miejsca w domach", "stan na:", "gorzów wielkopolski,",
+    "dom pomocy profil", "społecznej dla osób", "ogólna liczba",
+    "brak możliwości przyjmowania", "pobytu całodobowego",
+]
+
+
+def find_pdf_url(html: str) -> str | None:
+    """Znajdź najnowszy link do PDF wolnych miejsc na stronie BIP."""
+    matches = PDF_URL_PATTERN.findall(html)
+    # Weź ostatni (najnowszy) wynik
+    return matches[-1] if matches else None
+
+
+def extract_city_name(text: str) -> str | None:
+    """Wyciągnij nazwę miejscowości z tekstu (jeśli zaczyna się wielką literą)."""
+    text = text.strip()
+    if not text or text.startswith("-"):
+        return None
+    # Musi zaczynać się wielką literą (miasto/wieś)
+    if not re.match(r"^[A-ZŁŚÓŹĆĘĄŃŻ]", text):
+        return None
+    # Weź tekst do pierwszego myślnika lub końca
+    m = re.match(r"^([A-ZŁŚÓŹĆĘĄŃŻ][A-Za-z0-9ąćęłńóśźżĄĆĘŁŃÓŚŹŻ\s\.]+?)(?:\s*[-–]|$)", text)
+    return m.group(1).strip() if m else None
+
+
+def parse_pdf(data: bytes) -> dict:
+    """
+    Parsuje PDF wolnych miejsc Lubuskie.
+
+    PDF ma nieregularne łamanie linii — nazwa DPS może być na oddzielnej linii
+    od liczb. Strategia:
+    - linie kończące się "liczba liczba" → wiersz danych
+    - linie z samymi dwiema liczbami → wiersz danych (nazwa z poprzednich linii)
+    - pozostałe linie z wielką literą → aktualizacja current_name
+    """
+    rows = []
+    date_header = ""
+    total_miejsca = 0
+    total_wolne = 0
+    current_name = ""
+
+    for text in read_pdf(data, text=True, tables=False)["texts"]:
+        # Data stanu
+        m = re.search(r"stan na[:\s]+(.+?\d{4}\s*r\.?)", text, re.IGNORECASE)
+        if m:
+            date_header = m.group(1).strip()
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            # SUMA — wyciągnij totale (format "SUMA 2.246 20")
+            if re.match(r"^SUMA\b", line, re.IGNORECASE):
+                # Usuń separatory tysięczne (kropki) i znajdź liczby
+                nums = [int(n) for n in re.findall(r"\d+", line.replace(".", ""))]
+                if len(nums) >= 2:
+                    total_miejsca = nums[-2]
+                    total_wolne = nums[-1]
+                continue
+
+            # Linia z samymi dwiema liczbami: "180 7"
+            m_only = re.match(r"^(\d+)\s+(\d+)\s*$", line)
+            if m_only:
+                rows.append({
+                    "nazwa": current_name,
+                    "miejsca": int(m_only.group(1)),
+                    "wolne": int(m_only.group(2)),
+                })
+                continue
+
+            # Linia kończąca się dwiema liczbami: "Tursk - ... 180 7"
+            m_data = re.search(r"\s+(\d+)\s+(\d+)\s*$", line)
+            if m_data:
+                city = extract_city_name(line[: m_data.start()].strip())
+                if city:
+                    current_name = city
+                rows.append({
+                    "nazwa": current_name,
+                    "miejsca": int(m_data.group(1)),
+                    "wolne": int(m_data.group(2)),
+                })
+                continue
+
+            # Linia bez liczb — pomiń nagłówki, sprawdź czy nazwa miejscowości
+            if any(p in line.lower() for p in HEADER_PHRASES):
+                continue
+            city = extract_city_name(line)
+            if city:
+                current_name = city
+
+    # Fallback na wypadek braku SUMA
+    if total_wolne == 0 and rows:
+        total_wolne = sum(r["wolne"] for r in rows)
+        total_miejsca = sum(r["miejsca"] for r in rows)
+
+    return {
+        "date_header": date_header,
+        "rows": rows,
+        "total_miejsca": total_miejsca,
+        "total_wolne": total_wolne,
+    }
+
+
+class LubuskieMonitor(Monitor):
+    name = "lubuskie"
+    region = "Lubuskie"
+    raw_dir_name = "lubuskie"
+    labels = ["data-monitoring", "wolne-miejsca-lubuskie"]
+    days = (12, 22)
+    page_url = BIP_PAGE_URL
+    file_label = "PDF"
+    file_pattern = "wolne_miejsca_{date}.pdf"
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Lubuskie"
+    wojewodztwo = "lubuskie"
+
+    def find_url(self, html: str) -> str | None:
+        return find_pdf_url(html)
+
+    def parse(self, data: bytes) -> dict:
+        return parse_pdf(data)
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        return parse_data_stanu(parsed['date_header']), [
+            vacancy_row(r['nazwa'], liczba_miejsc=r['miejsca'], wolne_ogolem=r['wolne'])
+            for r in parsed['rows']
+        ]
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['total_wolne']} wolnych miejsc"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        status = "🆕 Nowy PDF — dane zaktualizowane" if is_new else "📄 PDF bez zmian"
+        dps_with = sum(1 for r in parsed["rows"] if r["wolne"] > 0)
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Lubuskie — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+            f"**Dane z pliku:** {parsed['date_header']}",
+            f"**Źródło:** [{url}]({url})",
+            f"**Strona BIP:** [{BIP_PAGE_URL}]({BIP_PAGE_URL})",
+            f"**Hash:** `{h}`",
+            "",
+            "## Podsumowanie",
+            "",
+            "| | Wartość |",
+            "|---|---|",
+            f"| Łącznie wolnych miejsc | **{parsed['total_wolne']}** |",
+            f"| Łącznie miejsc ogółem | **{parsed['total_miejsca']}** |",
+            f"| DPS z wolnymi miejscami | **{dps_with} / {len(parsed['rows'])}** |",
+            "",
+            "## Szczegóły per placówka",
+            "",
+            "| Nazwa DPS | Miejsca ogółem | Wolne |",
+            "|---|---|---|",
+        ]
+        for row in parsed["rows"]:
+            marker = " ✅" if row["wolne"] > 0 else ""
+            lines.append(f"| {row['nazwa']} | {row['miejsca']} | {row['wolne']}{marker} |")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
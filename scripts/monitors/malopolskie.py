@@ -0,0 +1,247 @@
+"""
+Wolne miejsca DPS — Małopolska (MUW Kraków).
+
+Plik XLSX pod stałym adresem, aktualizowany co miesiąc.
+Harmonogram: 1., 8. i 15. każdego miesiąca.
+- Gdy nowy plik: pełny raport + trend wolnych miejsc.
+- Gdy plik bez zmian: zamknięty Issue informacyjny, a gdy dane starsze niż
+  45 dni — otwarty alert o stagnacji.
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, today_pl, now_utc
+from .xlsx import iter_rows, split_table
+
+XLSX_URL = "https://www.malopolska.uw.gov.pl/doc/wolne_miejsca_w_dps.xlsx"
+STAGNATION_DAYS = 45
+
+
+def parse_xlsx(data: bytes) -> tuple[list[str], list[list], str]:
+    """Zwraca (nagłówki, wiersze_danych, tytuł) z pierwszego arkusza XLSX."""
+    title, headers, rows = split_table(iter_rows(data))
+    return headers, list(rows), title
+
+
+def parse_data_stanu(title: str) -> datetime.date | None:
+    """Wyciąga datę stanu z tytułu XLSX: 'stan na dzień 30 kwietnia 2026'."""
+    months = {
+        'stycznia': 1, 'lutego': 2, 'marca': 3, 'kwietnia': 4,
+        'maja': 5, 'czerwca': 6, 'lipca': 7, 'sierpnia': 8,
+        'września': 9, 'października': 10, 'listopada': 11, 'grudnia': 12,
+    }
+    m = re.search(r'(\d{1,2})\s+(\w+)\s+(\d{4})', title.lower())
+    if m:
+        month = months.get(m.group(2))
+        if month:
+            try:
+                return datetime.date(int(m.group(3)), month, int(m.group(1)))
+            except ValueError:
+                pass
+    return None
+
+
+def wolne_col(headers: list) -> int | None:
+    for i, h in enumerate(headers):
+        if any(k in h.lower() for k in ["wolne", "miejsc"]):
+            return i
+    return None
+
+
+def get_wolne_total(headers: list, rows: list) -> int | None:
+    """Suma wolnych miejsc z wierszy powiatowych (LP = cyfra) — bez podwójnego liczenia."""
+    col_idx = wolne_col(headers)
+    if col_idx is None:
+        return None
+
+    total = 0
+    for row in rows:
+        lp = row[0].rstrip(". ").strip()
+        if not lp.isdigit():
+            continue
+        val = row[col_idx] if col_idx < len(row) else ""
+        try:
+            total += int(val)
+        except (ValueError, TypeError):
+            pass
+    return total
+
+
+def count_summary(headers: list, rows: list, prev_total: int | None = None) -> str:
+    total = get_wolne_total(headers, rows)
+    col_idx = wolne_col(headers)
+    powiats_with = 0
+    powiats_total = 0
+
+    for row in rows:
+        lp = row[0].rstrip(". ").strip()
+        if not lp.isdigit():
+            continue
+        powiats_total += 1
+        val = row[col_idx] if (col_idx is not None and col_idx < len(row)) else ""
+        try:
+            if int(val) > 0:
+                powiats_with += 1
+        except (ValueError, TypeError):
+            pass
+
+    if total is None:
+        return f"Łącznie wierszy danych: **{len(rows)}**"
+
+    trend = ""
+    if prev_total is not None:
+        diff = total - prev_total
+        sign = "+" if diff >= 0 else ""
+        arrow = "📈" if diff > 0 else ("📉" if diff < 0 else "➡️")
+        trend = f" {arrow} **{sign}{diff}** vs poprzedni okres"
+
+    return (
+        f"Liczba powiatów: **{powiats_total}** | "
+        f"Powiaty z wolnymi miejscami: **{powiats_with}** | "
+        f"Łączna liczba wolnych miejsc: **{total}**{trend}"
+    )
+
+
+class MalopolskieMonitor(Monitor):
+    name = "malopolskie"
+    region = "Małopolska"
+    raw_dir_name = "malopolskie"
+    labels = ["data-monitoring", "wolne-miejsca"]
+    days = (1, 8, 15)
+    url = XLSX_URL
+    file_label = "XLSX"
+    file_pattern = "wolne_miejsca_dps_{date}.xlsx"
+    verify = False
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Małopolska"
+
+    def find_previous_xlsx(self) -> Path | None:
+        files = self.archived()
+        return files[-2] if len(files) >= 2 else (files[0] if files else None)
+
+    def find_latest_xlsx(self) -> Path | None:
+        files = self.archived()
+        return files[-1] if files else None
+
+    def parsed_file(self, xlsx_path: Path) -> dict:
+        """Wynik parsowania archiwalnego pliku — z magazynu, bez ponownego czytania XLSX."""
+        return self.store.parse_file(xlsx_path, self.parse)
+
+    def days_since_data_stanu(self, xlsx_path: Path) -> int | None:
+        """Ile dni minęło od daty stanu w pliku XLSX."""
+        try:
+            d = self.parsed_file(xlsx_path)["data_stanu"]
+            if d:
+                return (datetime.date.today() - datetime.date.fromisoformat(d)).days
+        except Exception:
+            pass
+        return None
+
+    def on_unchanged(self, url: str, h: str):
+        today = today_pl()
+        latest = self.find_latest_xlsx()
+        days = self.days_since_data_stanu(latest) if latest else None
+
+        if days is not None and days > STAGNATION_DAYS:
+            # stagnacja: otwarty Issue, wymaga uwagi
+            self.log(f"⚠️ Brak aktualizacji od {days} dni — tworzę otwarty alert.")
+            self.issue(
+                f"🟠 Wolne miejsca DPS — brak aktualizacji od {days} dni",
+                (
+                    f"Sprawdzono {today} o {now_utc()}.\n\n"
+                    f"**Plik XLSX nie zmienił się od {days} dni.**\n\n"
+                    f"Ostatnie dane mają stan z: `{latest.name if latest else 'nieznany'}`.\n"
+                    f"MUW Małopolska aktualizuje plik co miesiąc — tak długa przerwa może oznaczać "
+                    f"problem ze źródłem lub zmianę adresu pliku.\n\n"
+                    f"- **Hash (SHA-256):** `{h}`\n"
+                    f"- **Źródło:** [{url}]({url})\n\n"
+                    f"Sprawdź ręcznie czy plik jest dostępny i czy dane są aktualne."
+                ),
+            )
+            return
+
+        self.log("Plik bez zmian — tworzę zamknięty Issue informacyjny.")
+        days_info = f" (dane sprzed {days} dni)" if days is not None else ""
+        self.issue(
+            f"✅ Wolne miejsca DPS {today} — brak nowego pliku",
+            (
+                f"Sprawdzono {today} o {now_utc()}.\n\n"
+                f"Plik XLSX nie zmienił się od ostatniego sprawdzenia{days_info}.\n\n"
+                f"- **Hash (SHA-256):** `{h}`\n"
+                f"- **Źródło:** {url}"
+            ),
+            auto_close=True,
+        )
+
+    def load_previous(self) -> tuple[int | None, int | None]:
+        """(liczba rekordów, suma wolnych miejsc) poprzedniego pliku — do trendu."""
+        prev_path = self.find_previous_xlsx()
+        if not prev_path or not prev_path.exists():
+            return None, None
+        try:
+            prev = self.parsed_file(prev_path)
+            prev_count, prev_total = len(prev["rows"]), prev["total"]
+            self.log(f"Poprzedni plik: {prev_path.name} ({prev_count} rekordów, {prev_total} wolnych miejsc)")
+            return prev_count, prev_total
+        except Exception as e:
+            self.log(f"Nie udało się wczytać poprzedniego pliku: {e}")
+            return None, None
+
+    def parse(self, data: bytes) -> dict:
+        headers, rows, title = parse_xlsx(data)
+        d = parse_data_stanu(title)
+        return {"headers": headers, "rows": rows, "title": title,
+                "data_stanu": d.isoformat() if d else None,
+                "total": get_wolne_total(headers, rows)}
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['total']} wolnych miejsc"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        headers, rows, title = parsed["headers"], parsed["rows"], parsed["title"]
+        prev_count, prev_total = self.previous or (None, None)
+        status = "🆕 Nowy plik XLSX — dane zaktualizowane" if is_new else "📄 Plik bez zmian"
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Małopolska — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+        ]
+        if title:
+            lines.append(f"**Dane z pliku:** {title}")
+        lines += [
+            f"**Źródło:** [{url}]({url})",
+            f"**Hash:** `{h}`",
+            f"**Plik:** `{path.name}`",
+            "",
+            count_summary(headers, rows, prev_total),
+            "",
+        ]
+
+        if prev_count is not None:
+            diff = len(rows) - prev_count
+            sign = "+" if diff >= 0 else ""
+            lines.append(f"**Zmiana liczby rekordów:** {sign}{diff}")
+            lines.append("")
+
+        if rows:
+            lines.append("## Dane z pliku")
+            lines.append("")
+            lines.append("| " + " | ".join(headers) + " |")
+            lines.append("|" + "|".join(["---"] * len(headers)) + "|")
+            for row in rows:
+                padded = row[:len(headers)] + [""] * max(0, len(headers) - len(row))
+                clean = [c.replace("\n", " ") for c in padded]
+                lines.append("| " + " | ".join(clean) + " |")
+        else:
+            lines.append("⚠️ Plik jest pusty lub nie udało się wczytać danych.")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
+
+    def process_new(self, data: bytes, h: str, url: str, is_new: bool):
+        super().process_new(data, h, url, is_new)
+        # Import do bazy — wyłączony w fazie testowej (2-3 miesiące).
+        # Po weryfikacji raportów: python scripts/import-wolne-miejsca.py <plik>
+        self.log("ℹ️ Import do bazy pominięty — faza testowa raportów.")
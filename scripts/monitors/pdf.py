@@ -0,0 +1,87 @@
+"""
+Odczyt PDF-ów urzędowych (pdfplumber) — jedno otwarcie, strony równolegle.
+
+`page.extract_tables()` to czysta praca CPU (kilkaset ms na stronę wykazu),
+więc przy wielostronicowych plikach strony rozdzielamy między procesy.
+Każdy proces roboczy otwiera PDF raz (initializer), wyniki scalamy w kolejności
+stron. Przy jednym rdzeniu albo krótkim pliku — zwykła pętla, bez puli.
+
+  content = read_pdf(data)            # nagłówek + tabele
+  content = read_pdf(data, text=True) # + tekst każdej strony
+
+Wynik to zwykły słownik (JSON), więc można go trzymać w magazynie
+(`Store.parse_cached(data, read_pdf, ".pdf")`):
+
+  {"metadata": {...}, "pages": 6, "header": "tekst 1. strony",
+   "texts": ["…", …], "tables": [[tabela, …] dla każdej strony]}
+"""
+
+import os
+import multiprocessing
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import require
+
+PARSE_VERSION = 1        # wersja wyniku `read_pdf` w magazynie (monitors/store.py) — podbić po zmianie
+PARALLEL_MIN_PAGES = 3   # krótsze pliki nie zwracają kosztu startu procesów
+
+_pdf = None              # PDF otwarty raz w każdym procesie roboczym
+
+
+def _open(data: bytes):
+    pdfplumber = require("pdfplumber")
+    return pdfplumber.open(BytesIO(data))
+
+
+def _init_worker(data: bytes):
+    global _pdf
+    _pdf = _open(data)
+
+
+def _extract(page, text: bool, tables: bool) -> tuple[str | None, list]:
+    result = (
+        (page.extract_text() or "") if text else None,
+        (page.extract_tables() or []) if tables else [],
+    )
+    page.close()  # zwalnia bufor obiektów strony
+    return result
+
+
+def _extract_pages(indices: list[int], text: bool, tables: bool) -> list[tuple]:
+    return [(i, *_extract(_pdf.pages[i], text, tables)) for i in indices]
+
+
+def read_pdf(data: bytes, text: bool = False, tables: bool = True,
+             workers: int | None = None) -> dict:
+    """
+    Metadane, tekst pierwszej strony i tabele (oraz tekst wszystkich stron,
+    gdy `text=True`) w jednym przejściu. `workers` — liczba procesów
+    (domyślnie liczba rdzeni; 1 = bez puli).
+    """
+    with _open(data) as pdf:
+        metadata = {k: str(v) for k, v in (pdf.metadata or {}).items()}
+        n = len(pdf.pages)
+        workers = min(workers or os.cpu_count() or 1, n)
+        parallel = workers > 1 and n >= PARALLEL_MIN_PAGES
+        header = (pdf.pages[0].extract_text() or "") if n else ""
+        if not parallel:
+            results = [(i, *_extract(page, text, tables)) for i, page in enumerate(pdf.pages)]
+
+    if parallel:
+        # strony rozdzielone naprzemiennie — pierwsze (często gęstsze) nie trafiają do jednego procesu
+        chunks = [list(range(w, n, workers)) for w in range(workers)]
+        # spawn: monitory działają w wątkach, a fork procesu z wątkami bywa zawodny
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=ctx,
+                                 initializer=_init_worker, initargs=(data,)) as pool:
+            parts = pool.map(_extract_pages, chunks, [text] * workers, [tables] * workers)
+            results = sorted(r for part in parts for r in part)
+
+    return {
+        "metadata": metadata,
+        "pages": n,
+        "header": header,
+        "texts": [t for _, t, _ in results] if text else [],
+        "tables": [tbl for _, _, tbl in results],
+    }
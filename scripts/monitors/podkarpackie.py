@@ -0,0 +1,162 @@
+"""
+Wolne miejsca DPS — Podkarpackie (UW Rzeszów).
+
+Format pliku: jeden snapshot na plik, kolumny:
+  Lp | Nazwa i siedziba | Powiat | Ilość miejsc | Wolne wg. {data} | Typ | Tel | Kierownik
+
+Harmonogram: 5. i 20. każdego miesiąca.
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, require, today_pl
+from .vacancies import vacancy_row, parse_data_stanu
+
+BIP_PAGE_URL = (
+    "https://rzeszow.uw.gov.pl/dla-instytucji/pomoc-spoleczna/"
+    "wykaz-jednostek-udzielajacych-wsparcia-potrzebujacym/"
+    "wykaz-domow-pomocy-spolecznej-ktore-uzyskaly-zezwolenie-wojewody-"
+    "prowadzonych-przez-jednostki-samorzadu-terytorialnego-lub-na-zlecenie-"
+    "jst-dzialajacych-na-terenie-wojewodztwa-podkarpackieg"
+)
+FALLBACK_XLS_URL = "https://rzeszow.uw.gov.pl/wp-content/uploads/{year}/{month:02d}/frekwencja-DPS-{year}.xls"
+
+
+def find_xls_url_from_page(html: str) -> str | None:
+    """Szuka linku do aktualnego XLS na stronie BIP."""
+    pattern = r'href=["\']([^"\']*frekwencja-DPS-\d{4}\.xls)["\']'
+    m = re.search(pattern, html, re.IGNORECASE)
+    if m:
+        url = m.group(1)
+        if url.startswith('/'):
+            return 'https://rzeszow.uw.gov.pl' + url
+        return url
+    return None
+
+
+def safe_int(v) -> int:
+    try:
+        return int(float(str(v))) if str(v).strip() not in ('', 'None') else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def parse_xls(data: bytes) -> dict:
+    """
+    Parsuje snapshot XLS Podkarpackie. Kolumny:
+      0=Lp, 1=Nazwa, 2=Powiat, 3=Ilość miejsc, 4=Wolne wg. {data}, 5=Typ, 6=Tel, 7=Kierownik
+    """
+    xlrd = require("xlrd")
+
+    wb = xlrd.open_workbook(file_contents=data)
+    sh = wb.sheets()[0]
+
+    # Row 2: headers — col 4 contains "ilość wolnych miejsc wg. DD.MM.YYYY"
+    date_header = str(sh.cell_value(2, 4)).strip()
+
+    rows = []
+    powiaty_wolne: dict = {}
+
+    for r in range(3, sh.nrows):
+        lp = str(sh.cell_value(r, 0)).strip().rstrip('.')
+        if not lp.replace('.', '').isdigit():
+            continue
+
+        powiat = str(sh.cell_value(r, 2)).replace('\n', ' ').strip()
+        wolne = safe_int(sh.cell_value(r, 4))
+
+        rows.append({
+            'lp': lp,
+            'nazwa': str(sh.cell_value(r, 1)).replace('\n', ' ').strip()[:60],
+            'powiat': powiat,
+            'miejsca': safe_int(sh.cell_value(r, 3)),
+            'wolne': wolne,
+            'typ': str(sh.cell_value(r, 5)).replace('\n', ' ').strip(),
+        })
+
+        if powiat:
+            powiaty_wolne[powiat] = powiaty_wolne.get(powiat, 0) + wolne
+
+    return {
+        'date_header': date_header,
+        'rows': rows,
+        'powiaty_wolne': powiaty_wolne,
+        'powiaty_with': sum(1 for v in powiaty_wolne.values() if v > 0),
+        'grand_total_wolne': sum(r['wolne'] for r in rows),
+    }
+
+
+class PodkarpackieMonitor(Monitor):
+    name = "podkarpackie"
+    region = "Podkarpackie"
+    raw_dir_name = "podkarpackie"
+    labels = ["data-monitoring", "wolne-miejsca-podkarpackie"]
+    days = (5, 20)
+    page_url = BIP_PAGE_URL
+    file_pattern = "frekwencja-DPS-{date}.xls"
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Podkarpackie"
+    wojewodztwo = "podkarpackie"
+
+    def find_url(self, html: str) -> str | None:
+        return find_xls_url_from_page(html)
+
+    def fallback_url(self) -> str | None:
+        today = datetime.date.today()
+        return FALLBACK_XLS_URL.format(year=today.year, month=today.month)
+
+    def parse(self, data: bytes) -> dict:
+        return parse_xls(data)
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        return parse_data_stanu(parsed['date_header']), [
+            vacancy_row(r['nazwa'], r['powiat'], r['typ'],
+                        liczba_miejsc=r['miejsca'], wolne_ogolem=r['wolne'])
+            for r in parsed['rows']
+        ]
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['grand_total_wolne']} wolnych miejsc"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        status = "🆕 Nowy plik XLS — dane zaktualizowane" if is_new else "📄 Plik bez zmian"
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Podkarpackie — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+            f"**Dane z pliku:** {parsed['date_header']}",
+            f"**Źródło:** [{url}]({url})",
+            f"**Strona BIP:** [{BIP_PAGE_URL}]({BIP_PAGE_URL})",
+            f"**Hash:** `{h}`",
+            "",
+            "## Podsumowanie",
+            "",
+            "| | Wartość |",
+            "|---|---|",
+            f"| Łącznie wolnych miejsc | **{parsed['grand_total_wolne']}** |",
+            f"| Liczba DPS | **{len(parsed['rows'])}** |",
+            f"| Powiaty z wolnymi miejscami | **{parsed['powiaty_with']}** |",
+            "",
+            "## Wolne miejsca wg powiatu",
+            "",
+            "| Powiat | Wolne |",
+            "|---|---|",
+        ]
+        for powiat, wolne in sorted(parsed['powiaty_wolne'].items(), key=lambda x: -x[1]):
+            if wolne > 0:
+                lines.append(f"| {powiat} | {wolne} |")
+
+        lines += [
+            "",
+            "## Szczegóły per placówka",
+            "",
+            "| Lp | Nazwa | Powiat | Miejsca | Wolne | Typ |",
+            "|---|---|---|---|---|---|",
+        ]
+        for row in parsed['rows']:
+            lines.append(f"| {row['lp']} | {row['nazwa']} | {row['powiat']} | {row['miejsca']} | {row['wolne']} | {row['typ']} |")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
@@ -0,0 +1,200 @@
+"""
+Ośrodki Senior+ — wykaz XLSX z MUW Małopolska.
+
+Harmonogram: 1. każdego miesiąca.
+- Gdy nowy plik (hash zmieniony): pełny raport + upsert do bazy + GitHub Issue.
+- Gdy plik bez zmian: brak Issue (nie zaśmieca listy).
+- Gdy błąd pobierania: otwarty Issue z alertem.
+"""
+
+import datetime
+from pathlib import Path
+
+from .core import Monitor, MonitorError, DATABASE_URL
+from .store import sha256
+from .xlsx import iter_rows
+
+PARSE_VERSION = 1   # wersja wyniku `parse_xlsx` w magazynie (monitors/store.py) — podbić po zmianie
+
+XLSX_URL = "https://www.malopolska.uw.gov.pl/Docs/Wykaz%20funkcjonuj%C4%85cych%20o%C5%9Brodk%C3%B3w%20Senior%20w%20Ma%C5%82opolsce.xlsx"
+
+
+def parse_xlsx(data: bytes) -> tuple[list[dict], dict]:
+    rows = []
+    stats = {"Klub Senior+": 0, "Dzienny Dom Senior+": 0, "total": 0}
+
+    for row in iter_rows(data, min_row=2, text=False):
+        lp, rodzaj, liczba_miejsc, jst, woj, ulica, kod, miasto, tel, email, rok = row
+        if lp is None:
+            continue
+        typ = str(rodzaj).strip() if rodzaj else ""
+        rows.append({
+            "lp": int(lp),
+            "typ_placowki": typ,
+            "liczba_miejsc": int(liczba_miejsc) if liczba_miejsc else None,
+            "jst_nazwa": str(jst).strip() if jst else None,
+            "ulica": str(ulica).strip() if ulica else None,
+            "kod_pocztowy": str(kod).strip() if kod else None,
+            "miejscowosc": str(miasto).strip() if miasto else "",
+            "telefon": str(tel).strip() if tel else None,
+            "email": str(email).strip() if email else None,
+            "rok_powstania": int(rok) if rok else None,
+        })
+        if typ in stats:
+            stats[typ] += 1
+        stats["total"] += 1
+
+    return rows, stats
+
+
+def upsert_to_db(rows: list[dict], log=print) -> tuple[int, int]:
+    if not DATABASE_URL:
+        log("⚠️ Brak DATABASE_URL — pomijam import do bazy")
+        return 0, 0
+
+    try:
+        import psycopg2
+    except ImportError:
+        log("⚠️ Brak psycopg2 — pomijam import do bazy")
+        return 0, 0
+
+    conn = psycopg2.connect(DATABASE_URL)
+    cur = conn.cursor()
+    now = datetime.datetime.utcnow()
+    inserted = 0
+    updated = 0
+
+    for row in rows:
+        cur.execute(
+            'SELECT id FROM "Placowka" WHERE typ_placowki = %s AND miejscowosc = %s AND ulica = %s',
+            (row["typ_placowki"], row["miejscowosc"], row["ulica"])
+        )
+        existing = cur.fetchone()
+        if existing:
+            cur.execute("""
+                UPDATE "Placowka"
+                SET liczba_miejsc=%s, telefon=%s, email=%s, rok_powstania=%s,
+                    jst_nazwa=%s, "updatedAt"=%s, zrodlo_dane=%s
+                WHERE id=%s
+            """, (row["liczba_miejsc"], row["telefon"], row["email"],
+                  row["rok_powstania"], row["jst_nazwa"], now,
+                  f"MUW Senior+ XLSX {now.year}", existing[0]))
+            updated += 1
+        else:
+            cur.execute("""
+                INSERT INTO "Placowka"
+                (nazwa, typ_placowki, ulica, miejscowosc, kod_pocztowy, powiat,
+                 wojewodztwo, telefon, email, liczba_miejsc, rok_powstania,
+                 jst_nazwa, verified, "createdAt", "updatedAt", zrodlo_dane)
+                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,false,%s,%s,%s)
+            """, (
+                f"{row['typ_placowki']} — {row['jst_nazwa'] or row['miejscowosc']}",
+                row["typ_placowki"], row["ulica"], row["miejscowosc"],
+                row["kod_pocztowy"], row["jst_nazwa"] or "małopolskie",
+                "małopolskie", row["telefon"], row["email"],
+                row["liczba_miejsc"], row["rok_powstania"], row["jst_nazwa"],
+                now, now, f"MUW Senior+ XLSX {now.year}",
+            ))
+            inserted += 1
+
+    conn.commit()
+    cur.close()
+    conn.close()
+    return inserted, updated
+
+
+class SeniorPlusMonitor(Monitor):
+    name = "senior-plus"
+    region = "Senior+ Małopolska"
+    raw_dir_name = "malopolskie"
+    labels = ["monitor", "senior-plus", "dane"]
+    days = (1,)
+    url = XLSX_URL
+    file_label = "XLSX"
+    file_pattern = "senior_plus_{date}.xlsx"
+    verify = False
+    hash_name = ".senior_plus_hash"
+    month_name = None
+    log_name = "senior_plus_log.md"
+
+    def update_log(self, h: str, stats: dict, path: Path):
+        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        today = datetime.date.today().isoformat()
+        entry = (
+            f"\n## {today} — hash `{h}`\n"
+            f"- Łącznie: {stats['total']} ośrodków\n"
+            f"- Klub Senior+: {stats['Klub Senior+']}\n"
+            f"- Dzienny Dom Senior+: {stats['Dzienny Dom Senior+']}\n"
+            f"- Plik: {path.name}\n"
+        )
+        existing = self.log_file.read_text() if self.log_file.exists() else "# Senior+ Monitor Log\n"
+        self.log_file.write_text(existing + entry)
+
+    def check(self):
+        today = datetime.date.today().isoformat()
+        self.log(f"🔍 Senior+ Monitor — {today}")
+        self.log(f"   URL: {self.url}")
+
+        try:
+            fetch = self.fetch(self.url)
+        except Exception as e:
+            raise MonitorError(
+                f"🚨 Senior+ Monitor — błąd pobierania XLSX ({today})",
+                f"Nie udało się pobrać pliku wykazu ośrodków Senior+:\n\n```\n{e}\n```\n\nURL: `{self.url}`",
+                ["monitor", "błąd"],
+            )
+
+        if fetch.not_modified:
+            self.log("✅ HTTP 304 — plik bez zmian, brak akcji")
+            return
+
+        data = fetch.content
+        digest = sha256(data)
+        h = digest[:12]
+        prev_h = self.last_known_hash()
+        self.log(f"   Hash: {h} | Poprzedni: {prev_h[:12] if prev_h else 'brak'}")
+
+        if self.is_known(digest) and not self.force:
+            self.cache.commit(fetch)
+            self.log("✅ Plik bez zmian — brak akcji")
+            return
+
+        self.log(f"🆕 {'Wymuszony check' if self.force else 'Nowy plik wykryty'}!")
+        rows, stats = parse_xlsx(data)
+        path = self.save_file(data, digest, self.url)
+        self.update_log(h, stats, path)
+
+        inserted, updated_count = upsert_to_db(rows, log=self.log)
+
+        report_lines = [
+            f"## Wykaz ośrodków Senior+ Małopolska — aktualizacja {today}",
+            "",
+            f"**Źródło:** [MUW Małopolska]({self.url})",
+            f"**Hash pliku:** `{h}`",
+            "",
+            "### Statystyki",
+            "| Typ | Liczba |",
+            "|-----|--------|",
+            f"| Klub Senior+ | {stats['Klub Senior+']} |",
+            f"| Dzienny Dom Senior+ | {stats['Dzienny Dom Senior+']} |",
+            f"| **ŁĄCZNIE** | **{stats['total']}** |",
+            "",
+            "### Import do bazy danych",
+            f"- Nowe rekordy: {inserted}",
+            f"- Zaktualizowane: {updated_count}",
+            "",
+            "### Pierwsze 5 rekordów",
+            "| Lp. | Typ | Miejscowość | JST | Rok |",
+            "|-----|-----|-------------|-----|-----|",
+        ]
+        for row in rows[:5]:
+            report_lines.append(
+                f"| {row['lp']} | {row['typ_placowki']} | {row['miejscowosc']} | {row['jst_nazwa'] or '—'} | {row['rok_powstania'] or '—'} |"
+            )
+
+        self.issue(
+            f"📋 Senior+ Monitor — nowy wykaz ({today}, {stats['total']} ośrodków)",
+            "\n".join(report_lines),
+        )
+        self.cache.commit(fetch)
+        self.log(f"✅ Zakończono: {stats['total']} ośrodków, {inserted} nowych, {updated_count} zaktualizowanych")
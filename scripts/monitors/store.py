@@ -0,0 +1,96 @@
+"""
+Magazyn plików adresowany treścią (pełny SHA-256).
+
+  raw_dane/.store/<ab>/<sha256><ext>   — surowy plik (zapisywany raz, duplikaty pomijane)
+  raw_dane/.store/<ab>/<sha256>.<parser>.v<N>.json
+                                       — wynik parsowania (zwarty JSON)
+
+Wynik jest kluczowany także nazwą parsera i jego wersją (`parse_version`
+klasy monitora albo `PARSE_VERSION` modułu z funkcją parsującą, domyślnie 1).
+Po zmianie parsera wystarczy podbić wersję — stary wynik przestaje pasować
+i plik jest parsowany ponownie; dwa różne parsery tej samej treści też się
+nie nadpisują.
+
+Dzięki temu trend (poprzednia suma wolnych miejsc) i data stanu ostatniego
+pliku są czytane z gotowego wyniku zamiast ponownego parsowania XLSX/PDF.
+Pliki datowane w katalogach województw zostają — na nie wskazują dziennik
+i import do bazy; git przechowuje identyczną treść tylko raz.
+"""
+
+import re
+import sys
+import json
+import hashlib
+from pathlib import Path
+
+STORE_DIR = Path(__file__).resolve().parent.parent.parent / "raw_dane" / ".store"
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def parser_key(parse) -> str:
+    """„<nazwa>.v<N>” — część nazwy pliku z wynikiem, np. "MalopolskieMonitor.parse.v1"."""
+    owner = getattr(parse, "__self__", None)
+    if owner is not None:
+        version = getattr(owner, "parse_version", 1)
+    else:
+        version = getattr(sys.modules.get(parse.__module__), "PARSE_VERSION", 1)
+    name = re.sub(r"[^\w.]", "_", parse.__qualname__)
+    return f"{name}.v{version}"
+
+
+class Store:
+    def __init__(self, root: Path = STORE_DIR):
+        self.root = root
+
+    def _dir(self, digest: str) -> Path:
+        return self.root / digest[:2]
+
+    def blob_path(self, digest: str, ext: str = "") -> Path:
+        return self._dir(digest) / f"{digest}{ext}"
+
+    def sidecar_path(self, digest: str, parser: str) -> Path:
+        return self._dir(digest) / f"{digest}.{parser}.json"
+
+    def put(self, data: bytes, ext: str = "") -> str:
+        """Zapisuje plik (o ile go jeszcze nie ma) i zwraca jego pełny SHA-256."""
+        digest = sha256(data)
+        path = self.blob_path(digest, ext)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        return digest
+
+    def parsed(self, digest: str, parser: str) -> dict | None:
+        path = self.sidecar_path(digest, parser)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put_parsed(self, digest: str, parser: str, parsed: dict):
+        path = self.sidecar_path(digest, parser)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(parsed, ensure_ascii=False, separators=(",", ":")),
+                        encoding="utf-8")
+
+    def parse_cached(self, data: bytes, parse, ext: str = "") -> dict:
+        """
+        Wynik `parse(data)` z magazynu — parsuje tylko przy pierwszym użyciu danej
+        treści przez daną wersję parsera (zob. `parser_key`).
+        """
+        digest = self.put(data, ext)
+        parser = parser_key(parse)
+        parsed = self.parsed(digest, parser)
+        if parsed is None:
+            parsed = parse(data)
+            self.put_parsed(digest, parser, parsed)
+        return parsed
+
+    def parse_file(self, path: Path, parse) -> dict:
+        """Jak `parse_cached`, dla pliku już zapisanego na dysku (np. archiwum województwa)."""
+        return self.parse_cached(path.read_bytes(), parse, path.suffix)
@@ -0,0 +1,178 @@
+"""
+Wolne miejsca DPS — wspólny schemat wierszy i zapis do "PlacowkaWolneMiejsca".
+
+Każdy monitor województwa parsuje plik po swojemu (XLS, PDF), ale do bazy
+trafia ten sam ujednolicony wiersz — `vacancy_row()`:
+
+  powiat, nazwa, typ_opieki, liczba_miejsc, wolne_ogolem, wolne_kobiety,
+  wolne_mezczyzni, oczekujacych, czas_oczekiwania_dni
+
+Brakujące w danym źródle kolumny to None. Data stanu jest wspólna dla pliku.
+Dopasowanie do "Placowka" robi `FacilityMatcher` (scripts/facility_matcher.py),
+zapis — jedno polecenie INSERT … ON CONFLICT na cały plik.
+"""
+
+import re
+import datetime
+
+from .core import require
+
+FIELDS = (
+    "powiat", "nazwa", "typ_opieki", "liczba_miejsc",
+    "wolne_ogolem", "wolne_kobiety", "wolne_mezczyzni",
+    "oczekujacych", "czas_oczekiwania_dni",
+)
+NUMERIC = FIELDS[3:]
+
+MATCH_THRESHOLD = 0.75
+
+MONTHS_PL = {
+    'stycznia': 1, 'lutego': 2, 'marca': 3, 'kwietnia': 4,
+    'maja': 5, 'czerwca': 6, 'lipca': 7, 'sierpnia': 8,
+    'września': 9, 'października': 10, 'listopada': 11, 'grudnia': 12,
+}
+
+
+def clean(s) -> str:
+    return re.sub(r'\s+', ' ', str(s or '')).strip()
+
+
+def norm_typ(s: str) -> str:
+    """Normalizuj typ opieki."""
+    return re.sub(r'\s+', ' ', (s or '').strip().lower())
+
+
+def vacancy_row(nazwa: str, powiat: str = "", typ_opieki: str = "", **values) -> dict:
+    """Wiersz w ujednoliconym schemacie; nieznane kolumny liczbowe = None."""
+    unknown = set(values) - set(NUMERIC)
+    if unknown:
+        raise ValueError(f"Nieznane kolumny wolnych miejsc: {', '.join(sorted(unknown))}")
+    row = {"powiat": clean(powiat), "nazwa": clean(nazwa), "typ_opieki": norm_typ(typ_opieki)}
+    row.update({k: values.get(k) for k in NUMERIC})
+    return row
+
+
+def parse_data_stanu(text: str) -> datetime.date | None:
+    """
+    Data stanu z nagłówka pliku. Obsługuje formaty spotykane w województwach:
+    '30 kwietnia 2026', 'stan na dzień\\n30 czerwca 2026 r.', 'wg. 30.06.2026', '31.03.2025'.
+    """
+    t = clean(text).lower()
+    m = re.search(r'(\d{1,2})\s+([a-ząćęłńóśźż]+)\s+(\d{4})', t)
+    if m and m.group(2) in MONTHS_PL:
+        try:
+            return datetime.date(int(m.group(3)), MONTHS_PL[m.group(2)], int(m.group(1)))
+        except ValueError:
+            pass
+    m = re.search(r'(\d{1,2})\s*[.\-/]\s*(\d{1,2})\s*[.\-/]\s*(\d{4})', t)
+    if m:
+        try:
+            return datetime.date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+        except ValueError:
+            pass
+    return None
+
+
+# ── dopasowanie ───────────────────────────────────────────────────────────────
+
+def load_facilities(conn, wojewodztwo: str) -> list[dict]:
+    """DPS-y województwa z tabeli "Placowka" (kolumny potrzebne do dopasowania)."""
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT id, nazwa, powiat, miejscowosc, ulica, liczba_miejsc
+        FROM "Placowka"
+        WHERE typ_placowki = 'DPS' AND wojewodztwo = %s
+        ORDER BY id
+    """, (wojewodztwo,))
+    cols = [d[0] for d in cur.description]
+    rows = [dict(zip(cols, r)) for r in cur.fetchall()]
+    cur.close()
+    return rows
+
+
+def match_rows(rows: list[dict], matcher, threshold: float = MATCH_THRESHOLD,
+               log=print) -> tuple[list[tuple[int, dict]], list[tuple[dict, float]]]:
+    """
+    Dopasowuje wiersze do placówek: po nazwie, a gdy to zawiedzie — po
+    miejscowości (źródła typu Lubuskie podają tylko nazwę miejscowości).
+    Zwraca (dopasowane [(placowka_id, wiersz)], niedopasowane [(wiersz, score)]).
+    """
+    matched, unmatched = [], []
+    cache: dict[str, tuple[dict | None, float]] = {}
+    for row in rows:
+        key = f"{row['powiat'].lower()}|{row['nazwa']}"
+        if key not in cache:
+            db_row, score = matcher.match(row['nazwa'])
+            if score < threshold:
+                by_town = matcher.by_locality(row['nazwa'], row['powiat'])
+                if by_town is not None:
+                    db_row, score = by_town, 1.0
+            cache[key] = (db_row, score)
+            mark = "✅" if score >= threshold else "❌"
+            log(f"  {mark} [{score:.2f}] {row['nazwa'][:50]}")
+        db_row, score = cache[key]
+        if db_row is not None and score >= threshold:
+            matched.append((db_row['id'], row))
+        else:
+            unmatched.append((row, score))
+    return matched, unmatched
+
+
+# ── zapis ─────────────────────────────────────────────────────────────────────
+
+UPSERT_SQL = """
+    INSERT INTO "PlacowkaWolneMiejsca"
+      ("placowkaId", data_stanu, typ_opieki, liczba_miejsc,
+       wolne_ogolem, wolne_kobiety, wolne_mezczyzni,
+       oczekujacych, czas_oczekiwania_dni, "createdAt")
+    VALUES %s
+    ON CONFLICT ("placowkaId", data_stanu, typ_opieki)
+    DO UPDATE SET
+      liczba_miejsc        = EXCLUDED.liczba_miejsc,
+      wolne_ogolem         = EXCLUDED.wolne_ogolem,
+      wolne_kobiety        = EXCLUDED.wolne_kobiety,
+      wolne_mezczyzni      = EXCLUDED.wolne_mezczyzni,
+      oczekujacych         = EXCLUDED.oczekujacych,
+      czas_oczekiwania_dni = EXCLUDED.czas_oczekiwania_dni
+    RETURNING (xmax = 0) AS inserted
+"""
+UPSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
+
+
+def record_values(placowka_id: int, data_stanu: datetime.date, row: dict) -> tuple:
+    """Krotka kolumn rekordu wolnych miejsc (kolejność jak w UPSERT_SQL)."""
+    return (
+        placowka_id,
+        data_stanu,
+        norm_typ(row['typ_opieki']),
+        row['liczba_miejsc'],
+        row['wolne_ogolem'],
+        row['wolne_kobiety'],
+        row['wolne_mezczyzni'],
+        row['oczekujacych'],
+        row['czas_oczekiwania_dni'],
+    )
+
+
+def upsert_records(conn, records: list[tuple]) -> tuple[int, int]:
+    """
+    INSERT lub UPDATE wszystkich rekordów jednym poleceniem (jeden round trip do bazy).
+    Zwraca (dodane, zaktualizowane) — `xmax = 0` oznacza wiersz świeżo wstawiony.
+    """
+    # Powtórzony klucz w jednym INSERT … ON CONFLICT to błąd Postgresa —
+    # zostawiamy ostatni wiersz, jak przy dawnych upsertach wiersz po wierszu
+    unique = {}
+    for rec in records:
+        unique[rec[:3]] = rec
+    if not unique:
+        return 0, 0
+
+    extras = require("psycopg2.extras", "psycopg2-binary")
+    cur = conn.cursor()
+    result = extras.execute_values(
+        cur, UPSERT_SQL, list(unique.values()),
+        template=UPSERT_TEMPLATE, page_size=len(unique), fetch=True,
+    )
+    cur.close()
+    inserted = sum(1 for (is_new,) in result if is_new)
+    return inserted, len(result) - inserted
@@ -0,0 +1,146 @@
+"""
+Wolne miejsca DPS — Wielkopolskie (UW Poznań).
+
+Format pliku: PDF (kilka stron), tabela (pdfplumber table extraction):
+  Lp. | Jednostka | Typ | Adres | Liczba miejsc | Powiat | Organ | Liczba wolnych miejsc
+Brak wiersza SUMA — sumy obliczane z wierszy.
+
+Harmonogram: 12. i 22. każdego miesiąca (PDF wychodzi ~10. bieżącego miesiąca).
+"""
+
+import re
+import datetime
+from pathlib import Path
+
+from .core import Monitor, FOOTER, today_pl
+from .pdf import read_pdf
+from .vacancies import vacancy_row, parse_data_stanu
+
+BIP_PAGE_URL = "https://poznan.uw.gov.pl/domy-pomocy-spolecznej"
+BASE_URL = "https://poznan.uw.gov.pl"
+PDF_URL_PATTERN = re.compile(
+    r'(?:https://poznan\.uw\.gov\.pl)?(/system/files/zalaczniki/wolne_miejsca_w_dps[^"\'>\s]+\.pdf)',
+    re.IGNORECASE,
+)
+
+
+def find_pdf_url(html: str) -> str | None:
+    matches = PDF_URL_PATTERN.findall(html)
+    if not matches:
+        return None
+    path = matches[-1]
+    return path if path.startswith("http") else BASE_URL + path
+
+
+def extract_wolne(raw: str) -> int:
+    """Parse wolne miejsca — handles both simple numbers and combined cells like 'DPS A: 3; DPS B: 0'."""
+    if not raw:
+        return 0
+    nums = re.findall(r'\d+', raw)
+    return sum(int(n) for n in nums) if nums else 0
+
+
+def parse_pdf(data: bytes) -> dict:
+    """
+    Parsuje PDF wolnych miejsc Wielkopolskie.
+
+    PDF ma tabelę z wyraźnymi komórkami — używamy pdfplumber table extraction.
+    Kolumny: Lp. | Jednostka | Typ | Adres | Liczba miejsc | Powiat | Organ | Liczba wolnych miejsc
+    Data stanu: pole Title w metadanych PDF.
+    """
+    rows = []
+    content = read_pdf(data)
+    date_header = (content["metadata"].get("Title", "") or "").strip()
+
+    for page_tables in content["tables"]:
+        for tbl in page_tables:
+            for row in tbl:
+                if not row or not any(row):
+                    continue
+                lp = (row[0] or "").strip()
+                # Skip header rows (no numeric Lp)
+                if not re.match(r"^\d+\.?$", lp):
+                    continue
+
+                miejsca_raw = row[4] if len(row) > 4 else ""
+                try:
+                    miejsca = int(str(miejsca_raw).strip())
+                except (ValueError, TypeError):
+                    miejsca = 0
+
+                rows.append({
+                    "lp": lp,
+                    "nazwa": ((row[1] if len(row) > 1 else "") or "").replace("\n", " ").strip(),
+                    "powiat": ((row[5] if len(row) > 5 else "") or "").replace("\n", " ").strip(),
+                    "miejsca": miejsca,
+                    "wolne": extract_wolne(str((row[7] if len(row) > 7 else "") or "")),
+                })
+
+    return {
+        "date_header": date_header,
+        "rows": rows,
+        "total_miejsca": sum(r["miejsca"] for r in rows),
+        "total_wolne": sum(r["wolne"] for r in rows),
+    }
+
+
+class WielkopolskieMonitor(Monitor):
+    name = "wielkopolskie"
+    region = "Wielkopolskie"
+    raw_dir_name = "wielkopolskie"
+    labels = ["data-monitoring", "wolne-miejsca-wielkopolskie"]
+    days = (12, 22)
+    page_url = BIP_PAGE_URL
+    file_label = "PDF"
+    file_pattern = "wolne_miejsca_{date}.pdf"
+    verify = False
+    log_title = "Dziennik monitoringu — wolne miejsca DPS Wielkopolskie"
+    wojewodztwo = "wielkopolskie"
+
+    def find_url(self, html: str) -> str | None:
+        return find_pdf_url(html)
+
+    def parse(self, data: bytes) -> dict:
+        return parse_pdf(data)
+
+    def vacancies(self, parsed: dict) -> tuple[datetime.date | None, list[dict]]:
+        return parse_data_stanu(parsed['date_header']), [
+            vacancy_row(r['nazwa'], r['powiat'], liczba_miejsc=r['miejsca'], wolne_ogolem=r['wolne'])
+            for r in parsed['rows']
+        ]
+
+    def summary(self, parsed: dict) -> str:
+        return f"{parsed['total_wolne']} wolnych miejsc"
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        status = "🆕 Nowy PDF — dane zaktualizowane" if is_new else "📄 PDF bez zmian"
+        dps_with = sum(1 for r in parsed["rows"] if r["wolne"] > 0)
+
+        lines = [
+            f"# Raport wolnych miejsc DPS Wielkopolskie — {today_pl()}",
+            "",
+            f"**Status:** {status}",
+            f"**Dane z pliku:** {parsed['date_header']}",
+            f"**Źródło:** [{url}]({url})",
+            f"**Strona:** [{BIP_PAGE_URL}]({BIP_PAGE_URL})",
+            f"**Hash:** `{h}`",
+            "",
+            "## Podsumowanie",
+            "",
+            "| | Wartość |",
+            "|---|---|",
+            f"| Łącznie wolnych miejsc | **{parsed['total_wolne']}** |",
+            f"| Łącznie miejsc ogółem | **{parsed['total_miejsca']}** |",
+            f"| DPS z wolnymi miejscami | **{dps_with} / {len(parsed['rows'])}** |",
+            "",
+            "## Szczegóły per placówka",
+            "",
+            "| # | Nazwa DPS | Powiat | Miejsca | Wolne |",
+            "|---|---|---|---|---|",
+        ]
+        for row in parsed["rows"]:
+            marker = " ✅" if row["wolne"] > 0 else ""
+            lines.append(f"| {row['lp']} | {row['nazwa']} | {row['powiat']} | {row['miejsca']} | {row['wolne']}{marker} |")
+
+        lines += ["", "---", FOOTER]
+        return "\n".join(lines)
@@ -0,0 +1,298 @@
+"""
+Porównanie urzędowych wykazów placówek (DPS, ŚDS, Senior+) z tabelą "Placowka".
+
+Wykaz opisuje deklaratywne odwzorowanie — `Wykaz`: które wiersze bazy mu
+odpowiadają (typ placówki, województwo), po czym łączymy rekordy (np. l.p. ↔
+oficjalne_id) i które pola porównujemy (`Field`: klucz w wierszu wykazu,
+kolumna w bazie, normalizacja).
+
+Różnice liczymy kolumnami — pole po polu po wspólnych kluczach; normalizacja
+(regexy) tylko dla par, których surowe wartości się różnią, a większość
+rekordów wykazu zgadza się z bazą co do znaku. Baza jest czytana jednym
+zapytaniem dla wszystkich wykazów naraz, na połączeniu podanym przez
+wywołującego:
+
+  diffs = diff_all(conn, [(DPS_MALOPOLSKA, pdf_rows), (SDS_MALOPOLSKA, sds_rows)])
+  diffs["dps-malopolskie"]  # {"missing_in_db": [...], "extra_in_db": [...], "nazwa_diff": [...], ...}
+"""
+
+import re
+
+_NORM_RE = re.compile(r"[\s\-./]+")
+
+
+def norm(s: str | None) -> str:
+    """Tekst do porównania: małe litery, bez spacji, myślników, kropek i ukośników."""
+    return _NORM_RE.sub("", (s or "").lower().strip())
+
+
+def norm_email(s: str | None) -> str:
+    return (s or "").lower()
+
+
+def same(v):
+    return v
+
+
+def sql_literal(v) -> str:
+    if isinstance(v, (int, float)):
+        return str(v)
+    return "'" + str(v).replace("'", "''") + "'"
+
+
+class Field:
+    """
+    Porównywane pole: `pdf` — klucz w wierszu wykazu, `db` — kolumna "Placowka".
+    `both=True` — różnicę zgłaszamy tylko, gdy wartość jest po obu stronach
+    (wykazy często nie podają telefonu czy liczby miejsc).
+    `title` / `sql_comment` — nagłówki sekcji raportu i SQL patcha.
+    """
+
+    def __init__(self, name: str, pdf: str, db: str, normalize=norm, both: bool = True,
+                 title: str = "", sql_comment: str = "", long: bool = False):
+        self.name = name
+        self.pdf = pdf
+        self.db = db
+        self.normalize = normalize
+        self.both = both
+        self.title = title or name
+        self.sql_comment = sql_comment or f"Aktualizacja {db} zgodnie z nowym PDF"
+        self.long = long   # w raporcie PDF i DB w osobnych liniach (długie nazwy)
+
+
+DPS_FIELDS = (
+    Field("nazwa", "nazwa", "nazwa_oficjalna", both=False, long=True,
+          title="📛 Niezgodne nazwy", sql_comment="Aktualizacja nazwa_oficjalna zgodnie z nowym PDF"),
+    Field("telefon", "telefon", "telefon",
+          title="📞 Niezgodne telefony", sql_comment="Aktualizacja telefonów zgodnie z nowym PDF"),
+    Field("email", "email", "email", normalize=norm_email,
+          title="📧 Niezgodne emaile", sql_comment="Aktualizacja emaili zgodnie z nowym PDF"),
+    Field("miejsca", "miejsca", "liczba_miejsc", normalize=same,
+          title="🛏️ Niezgodna liczba miejsc", sql_comment="Aktualizacja liczby miejsc zgodnie z nowym PDF"),
+)
+
+
+class Wykaz:
+    """
+    Odwzorowanie wykazu na "Placowka".
+
+    `key` — pary (klucz w wierszu wykazu, kolumna bazy) identyfikujące rekord;
+    przy jednej parze kluczem jest sama wartość (l.p.), przy kilku — krotka.
+    Wiersze bazy bez wartości klucza (placówki spoza wykazu) pomijamy.
+    """
+
+    def __init__(self, name: str, typ_placowki: str | tuple[str, ...], wojewodztwo: str,
+                 fields: tuple[Field, ...], key: tuple[tuple[str, str], ...] = (("lp", "oficjalne_id"),),
+                 label: str = "nazwa", key_label: str = "l.p."):
+        self.name = name
+        self.typy = (typ_placowki,) if isinstance(typ_placowki, str) else tuple(typ_placowki)
+        self.wojewodztwo = wojewodztwo
+        self.fields = fields
+        self.key = key
+        self.label = label
+        self.key_label = key_label
+
+    @property
+    def columns(self) -> list[str]:
+        """Kolumny "Placowka" potrzebne do porównania (bez powtórzeń)."""
+        cols = ["typ_placowki", "wojewodztwo", self.label]
+        cols += [col for _, col in self.key] + [f.db for f in self.fields]
+        return list(dict.fromkeys(cols))
+
+    def db_key(self, row: dict):
+        values = tuple(row[col] for _, col in self.key)
+        return values[0] if len(values) == 1 else values
+
+    def pdf_key(self, row: dict):
+        values = tuple(row[k] for k, _ in self.key)
+        return values[0] if len(values) == 1 else values
+
+    def index(self, rows) -> dict:
+        """Wiersze wykazu jako {klucz: wiersz} (lista albo słownik już po kluczu)."""
+        return rows if isinstance(rows, dict) else {self.pdf_key(r): r for r in rows}
+
+    def where(self, key) -> str:
+        """Warunek SQL wskazujący rekord w bazie."""
+        values = key if len(self.key) > 1 else (key,)
+        parts = [f"{col} = {sql_literal(v)}" for (_, col), v in zip(self.key, values)]
+        if "typ_placowki" not in (col for _, col in self.key):
+            if len(self.typy) == 1:
+                parts.append(f"typ_placowki = {sql_literal(self.typy[0])}")
+            else:
+                parts.append(f"typ_placowki IN ({', '.join(sql_literal(t) for t in self.typy)})")
+        parts.append(f"wojewodztwo = {sql_literal(self.wojewodztwo)}")
+        return " AND ".join(parts)
+
+    def key_text(self, key) -> str:
+        return ", ".join(map(str, key)) if isinstance(key, tuple) else str(key)
+
+
+# wykaz ŚDS nie podaje e-maili, a nazwa_oficjalna bywa pusta — porównujemy tylko wypełnione
+SDS_FIELDS = (
+    Field("nazwa", "nazwa", "nazwa_oficjalna", long=True,
+          title="📛 Niezgodne nazwy", sql_comment="Aktualizacja nazwa_oficjalna zgodnie z wykazem"),
+    Field("telefon", "telefon", "telefon",
+          title="📞 Niezgodne telefony", sql_comment="Aktualizacja telefonów zgodnie z wykazem"),
+    Field("miejsca", "miejsca", "liczba_miejsc", normalize=same,
+          title="🛏️ Niezgodna liczba miejsc", sql_comment="Aktualizacja liczby miejsc zgodnie z wykazem"),
+)
+
+DPS_MALOPOLSKA = Wykaz("dps-malopolskie", "DPS", "małopolskie", DPS_FIELDS)
+SDS_MALOPOLSKA = Wykaz("sds-malopolskie", "ŚDS", "małopolskie", SDS_FIELDS)
+SENIOR_PLUS_MALOPOLSKA = Wykaz(
+    "senior-plus-malopolskie", ("Klub Senior+", "Dzienny Dom Senior+"), "małopolskie",
+    fields=(
+        Field("telefon", "telefon", "telefon",
+              title="📞 Niezgodne telefony", sql_comment="Aktualizacja telefonów zgodnie z wykazem"),
+        Field("email", "email", "email", normalize=norm_email,
+              title="📧 Niezgodne emaile", sql_comment="Aktualizacja emaili zgodnie z wykazem"),
+        Field("miejsca", "liczba_miejsc", "liczba_miejsc", normalize=same,
+              title="🛏️ Niezgodna liczba miejsc", sql_comment="Aktualizacja liczby miejsc zgodnie z wykazem"),
+    ),
+    key=(("typ_placowki", "typ_placowki"), ("miejscowosc", "miejscowosc"), ("ulica", "ulica")),
+    label="miejscowosc", key_label="adres",
+)
+
+WYKAZY = {w.name: w for w in (DPS_MALOPOLSKA, SDS_MALOPOLSKA, SENIOR_PLUS_MALOPOLSKA)}
+
+
+# ── baza ──────────────────────────────────────────────────────────────────────
+
+def fetch_placowki(conn, wykazy) -> dict[str, dict]:
+    """
+    Wiersze "Placowka" dla wszystkich wykazów jednym zapytaniem:
+    {nazwa wykazu: {klucz: wiersz}}.
+    """
+    wykazy = list(wykazy)
+    result = {w.name: {} for w in wykazy}
+    if not wykazy:
+        return result
+
+    by_scope: dict[tuple[str, str], list[Wykaz]] = {}
+    for w in wykazy:
+        for typ in w.typy:
+            by_scope.setdefault((typ, w.wojewodztwo), []).append(w)
+    columns = list(dict.fromkeys(col for w in wykazy for col in w.columns))
+
+    cur = conn.cursor()
+    cur.execute(
+        f"SELECT {', '.join(columns)} FROM \"Placowka\""
+        f" WHERE (typ_placowki, wojewodztwo) IN %s ORDER BY id",
+        (tuple(by_scope),),
+    )
+    for values in cur.fetchall():
+        row = dict(zip(columns, values))
+        for w in by_scope.get((row["typ_placowki"], row["wojewodztwo"]), ()):
+            key = w.db_key(row)
+            if all(key if isinstance(key, tuple) else (key,)):
+                result[w.name][key] = row
+    cur.close()
+    return {name: dict(sorted(rows.items())) for name, rows in result.items()}
+
+
+# ── porównanie ───────────────────────────────────────────────────────────────
+
+def field_diff(f: Field, keys: list, pdf: dict, db: dict) -> list[dict]:
+    """
+    Różnice jednego pola po kluczach `keys`. Równe surowe wartości nie wymagają
+    normalizacji — regexy liczymy tylko dla par, które się różnią.
+    """
+    normalize, both = f.normalize, f.both
+    out = []
+    for k in keys:
+        a, b = pdf[k].get(f.pdf), db[k].get(f.db)
+        if a == b or (both and not (a and b)):
+            continue
+        if normalize(a) != normalize(b):
+            out.append({"lp": k, "pdf": a, "db": b})
+    return out
+
+
+def diff(wykaz: Wykaz, pdf: dict, db: dict) -> dict:
+    """
+    Różnice wykazu i bazy (słowniki {klucz: wiersz}):
+    missing_in_db, extra_in_db oraz <pole>_diff dla każdego pola odwzorowania.
+    """
+    pdf = wykaz.index(pdf)
+    diffs = {
+        "missing_in_db": [{"lp": k, "pdf": r.get(wykaz.label)} for k, r in pdf.items() if k not in db],
+        "extra_in_db": [{"lp": k, "db": r.get(wykaz.label)} for k, r in db.items() if k not in pdf],
+    }
+
+    common = sorted(pdf.keys() & db.keys())
+    for f in wykaz.fields:
+        diffs[f"{f.name}_diff"] = field_diff(f, common, pdf, db)
+    return diffs
+
+
+def diff_all(conn, sources) -> dict[str, dict]:
+    """
+    Porównuje wiele wykazów naraz — [(Wykaz, wiersze)] — jednym odczytem bazy.
+    Zwraca {nazwa wykazu: różnice}.
+    """
+    sources = [(w, w.index(rows)) for w, rows in sources]
+    db = fetch_placowki(conn, (w for w, _ in sources))
+    return {w.name: diff(w, rows, db[w.name]) for w, rows in sources}
+
+
+def count_diffs(diffs: dict) -> int:
+    return sum(len(v) for v in diffs.values())
+
+
+# ── raport ───────────────────────────────────────────────────────────────────
+
+def _fmt(v) -> str:
+    return str(v) if isinstance(v, (int, float)) else f"`{v}`"
+
+
+def report_sections(wykaz: Wykaz, diffs: dict) -> list[str]:
+    """Sekcje raportu Markdown dla pól odwzorowania."""
+    lines = []
+    for f in wykaz.fields:
+        items = diffs[f"{f.name}_diff"]
+        if not items:
+            lines.append(f"### {f.title}\n✅ Brak rozbieżności\n")
+            continue
+        lines.append(f"### {f.title} ({len(items)})\n")
+        for it in items:
+            head = f"- **{wykaz.key_label} {wykaz.key_text(it['lp'])}**"
+            if f.long:
+                lines.append(f"{head}\n  - PDF: `{it['pdf']}`\n  - DB: `{it['db']}`")
+            else:
+                lines.append(f"{head} — PDF: {_fmt(it['pdf'])} → DB: {_fmt(it['db'])}")
+        lines.append("")
+    return lines
+
+
+def sql_patch(wykaz: Wykaz, diffs: dict) -> str:
+    """Sugerowany SQL patch — UPDATE pól do wartości z wykazu, brakujące i nadmiarowe jako komentarz."""
+    lines = ["```sql", "BEGIN;", ""]
+
+    for f in wykaz.fields:
+        items = diffs[f"{f.name}_diff"]
+        if not items:
+            continue
+        lines.append(f"-- {f.sql_comment}")
+        for d in items:
+            lines.append(
+                f"UPDATE \"Placowka\" SET {f.db} = {sql_literal(d['pdf'])}"
+                f" WHERE {wykaz.where(d['lp'])};"
+            )
+        lines.append("")
+
+    # brakujące — tylko komentarz, wymagają ręcznej decyzji
+    if diffs["missing_in_db"]:
+        lines.append("-- ⚠️ BRAKUJĄCE W BAZIE — wymagają ręcznego dodania przez panel admina:")
+        for d in diffs["missing_in_db"]:
+            lines.append(f"-- {wykaz.key_label} {wykaz.key_text(d['lp'])}: {d['pdf']}")
+        lines.append("")
+
+    # extra — tylko komentarz
+    if diffs["extra_in_db"]:
+        lines.append("-- ⚠️ EXTRA W BAZIE — sprawdź czy nie usunięto z wykazu:")
+        for d in diffs["extra_in_db"]:
+            lines.append(f"-- {wykaz.key_label} {wykaz.key_text(d['lp'])}: {d['db']}")
+        lines.append("")
+
+    lines += ["COMMIT;", "```"]
+    return "\n".join(lines)
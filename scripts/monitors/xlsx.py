@@ -0,0 +1,81 @@
+"""
+Strumieniowe czytanie arkuszy XLSX (tryb tylko-do-odczytu).
+
+`openpyxl.load_workbook` w trybie domyślnym buduje pełny model arkusza
+(style, scalenia, formuły) — dla wykazów MUW to kilkadziesiąt MB RAM na plik.
+Tutaj czytamy `read_only=True, data_only=True` i oddajemy wiersze generatorem,
+a tytuł i wiersz nagłówka znajdujemy w jednym przejściu, trzymając w pamięci
+tylko kilka pierwszych wierszy.
+
+  rows = iter_rows(data)                        # wiersze jako listy napisów
+  title, headers, data_rows = split_table(rows) # tytuł, nagłówek, generator danych
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .core import require
+
+TITLE_ROWS = 8    # tytuł ("stan na dzień …") szukamy w pierwszych 8 wierszach
+HEADER_ROWS = 6   # wiersz nagłówka (LP / Powiat) w pierwszych 6
+
+
+def cell_text(value) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def iter_rows(source: bytes | Path | str, min_row: int = 1, text: bool = True) -> Iterator:
+    """
+    Wiersze pierwszego arkusza XLSX, jeden po drugim.
+    `text=True` — listy napisów (None → ""), `text=False` — surowe krotki wartości.
+    """
+    openpyxl = require("openpyxl")
+    wb = openpyxl.load_workbook(
+        BytesIO(source) if isinstance(source, bytes) else source,
+        read_only=True, data_only=True,
+    )
+    try:
+        for row in wb.active.iter_rows(min_row=min_row, values_only=True):
+            yield [cell_text(c) for c in row] if text else row
+    finally:
+        # w trybie read_only skoroszyt trzyma otwarty plik
+        wb.close()
+
+
+def is_header(row: list[str]) -> bool:
+    return any("lp" in c.lower() or "powiat" in c.lower() for c in row if c)
+
+
+def split_table(rows: Iterable[list[str]], default_header: int = 0,
+                header_test=is_header) -> tuple[str, list[str], Iterator[list[str]]]:
+    """
+    (tytuł, nagłówki, niepuste wiersze danych) w jednym przejściu.
+
+    Buforujemy tylko `TITLE_ROWS` pierwszych wierszy — resztę oddaje generator.
+    Gdy żaden z pierwszych `HEADER_ROWS` wierszy nie wygląda na nagłówek,
+    przyjmujemy wiersz `default_header` (jak dotychczasowe parsery).
+    """
+    it = iter(rows)
+    head = []
+    for row in it:
+        head.append(row)
+        if len(head) >= TITLE_ROWS:
+            break
+    if not head:
+        return "", [], iter(())
+
+    title = next((c for row in head for c in row if "stan na" in c.lower()), "")
+    header_idx = next((i for i, row in enumerate(head[:HEADER_ROWS]) if header_test(row)),
+                      default_header)
+    headers = head[header_idx] if header_idx < len(head) else []
+
+    def data_rows():
+        for row in head[header_idx + 1:]:
+            if any(c for c in row):
+                yield row
+        for row in it:
+            if any(c for c in row):
+                yield row
+
+    return title, headers, data_rows()
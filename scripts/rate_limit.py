@@ -0,0 +1,68 @@
+"""
+Limity zapytań per host — kubełek żetonów (token bucket) zamiast stałych `sleep`.
+
+Każdy host ma własny kubełek: `rate` żetonów na sekundę, najwyżej `burst`
+odłożonych. `acquire()` rezerwuje najbliższy wolny termin pod blokadą, więc
+wątki pobierające z tego samego hosta ustawiają się w kolejce, a zapytania do
+różnych hostów (np. strona źródłowa i Nominatim) nie czekają na siebie.
+
+`jitter` losuje koszt żetonu z przedziału 1 ± jitter — odstępy nie są
+równe co do milisekundy, średnie tempo zostaje bez zmian.
+
+  limiter = HostLimiter({"nominatim.openstreetmap.org": (1 / 1.1, 1)})
+  limiter.acquire("https://nominatim.openstreetmap.org/search")  # czeka, jeśli trzeba
+"""
+
+import time
+import random
+import threading
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1, jitter: float = 0.0):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Bierze żeton (także „na kredyt”) i zwraca, ile sekund trzeba odczekać."""
+        cost = random.uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else 1.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= cost
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class HostLimiter:
+    """
+    Kubełki per host: `limits` — {host: (rate, burst)} albo {host: (rate, burst, jitter)}.
+    Hosty spoza listy — `default` (None = bez limitu).
+    """
+
+    def __init__(self, limits: dict[str, tuple], default: tuple | None = None):
+        self.buckets = {host: TokenBucket(*spec) for host, spec in limits.items()}
+        self.default = default
+        self.lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        host = urlsplit(url).hostname or ""
+        with self.lock:
+            if host not in self.buckets and self.default is not None:
+                self.buckets[host] = TokenBucket(*self.default)
+            return self.buckets.get(host)
+
+    def acquire(self, url: str) -> float:
+        bucket = self.bucket(url)
+        return bucket.acquire() if bucket else 0.0
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Odświeżenie tabeli "PowiatStats" — wskaźnik dostępności DPS per powiat,
+dla wszystkich województw.
+
+Strona raportu czytała CSV z calculate-saturation-index.py, a ten za każdym
+razem liczył pojemność i mediany cen (okno ROW_NUMBER + PERCENTILE_CONT) i
+czytał plik populacji osobno dla każdej miary. Tu wynik jest trzymany w bazie
+— jeden wiersz na (województwo, powiat, rok), indeks (wojewodztwo, rok):
+
+  - dane wejściowe: pojemność DPS z "Placowka" (jedno GROUP BY), najnowsza
+    cena każdego DPS z "PlacowkaCena" (DISTINCT ON, mediana liczona tutaj),
+    populacja 80+ z kostki GUS (scripts/gus.py — wektor na cały kraj naraz),
+    emerytura ZUS z data/gus_emerytury_wojewodztwa.csv,
+  - każdy wiersz ma odcisk (`zrodla_hash`) swoich danych wejściowych —
+    zapisujemy tylko wiersze, których odcisk się zmienił, i usuwamy powiaty,
+    które zniknęły. Ponowne uruchomienie bez zmian w danych nic nie zapisuje,
+    więc można je wołać po każdym imporcie cen, placówek czy populacji.
+
+Użycie:
+  DATABASE_URL=... python scripts/refresh-powiat-stats.py
+  DATABASE_URL=... python scripts/refresh-powiat-stats.py --rok 2024 --dry-run
+"""
+
+import csv
+import sys
+import json
+import argparse
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+import gus
+from monitors.core import DATABASE_URL, require
+from monitors.store import sha256
+
+DATA_DIR     = Path(__file__).resolve().parent.parent / "data"
+EMERY_CSV    = DATA_DIR / "gus_emerytury_wojewodztwa.csv"
+PROGNOZY     = (2030, 2035)
+PER_10K      = 10_000
+
+CAPACITY_SQL = """
+    SELECT LOWER(TRIM(wojewodztwo)), TRIM(powiat),
+           COUNT(*), COALESCE(SUM(liczba_miejsc), 0)
+    FROM "Placowka"
+    WHERE typ_placowki = 'DPS'
+    GROUP BY 1, 2
+"""
+
+# najnowsza cena każdego DPS — jak ROW_NUMBER() … WHERE rn = 1, bez okna
+PRICES_SQL = """
+    SELECT DISTINCT ON (p.id)
+           LOWER(TRIM(p.wojewodztwo)), TRIM(p.powiat), pc.kwota
+    FROM "Placowka" p
+    JOIN "PlacowkaCena" pc ON pc."placowkaId" = p.id
+    WHERE p.typ_placowki = 'DPS'
+      AND pc.kwota IS NOT NULL
+    ORDER BY p.id, pc.rok DESC, pc.data_obowiazuje DESC NULLS LAST
+"""
+
+COLUMNS = (
+    "wojewodztwo", "powiat", "rok", "dps_placowki", "dps_miejsca",
+    "pop80", "pop80_2030", "pop80_2035",
+    "dostepnosc", "dostepnosc_2030", "dostepnosc_2035",
+    "cena_mediana", "cena_srednia", "n_cen", "emerytura", "luka", "zrodla_hash",
+)
+
+UPSERT_SQL = f"""
+    INSERT INTO "PowiatStats" ({", ".join(COLUMNS)}, "createdAt", "updatedAt")
+    VALUES %s
+    ON CONFLICT (wojewodztwo, powiat, rok)
+    DO UPDATE SET
+      {", ".join(f"{c} = EXCLUDED.{c}" for c in COLUMNS[3:])},
+      "updatedAt" = NOW()
+"""
+UPSERT_TEMPLATE = "(" + ", ".join(["%s"] * len(COLUMNS)) + ", NOW(), NOW())"
+
+
+# ── dane GUS ──────────────────────────────────────────────────────────────────
+
+def load_emerytury(path: Path = EMERY_CSV) -> dict[str, float]:
+    """Najnowsza przeciętna emerytura ZUS per województwo."""
+    latest = {}
+    with open(path, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["wskaznik"] != "emerytura_zus":
+                continue
+            woj, rok = row["wojewodztwo"].lower(), int(row["rok"])
+            if woj not in latest or rok > latest[woj][0]:
+                latest[woj] = (rok, float(row["wartosc_zl"]))
+    return {woj: value for woj, (_, value) in latest.items()}
+
+
+# ── wiersze tabeli ────────────────────────────────────────────────────────────
+
+def build_row(key: tuple, rok: int, caps: tuple, prices: list[float],
+              pop80: int | None, prognozy: list[int | None], emerytura: float | None) -> dict:
+    woj, powiat = key
+    placowki, miejsca = caps
+
+    def wsk(p):
+        return round(miejsca / p * PER_10K, 1) if p and miejsca else None
+
+    mediana = round(statistics.median(prices)) if prices else None
+    srednia = int(statistics.fmean(prices) + 0.5) if prices else None   # jak ROUND(AVG) w SQL
+    luka = round(mediana - emerytura) if mediana and emerytura else None
+
+    inputs = [caps, sorted(prices), pop80, prognozy, emerytura]
+    return {
+        "wojewodztwo":     woj,
+        "powiat":          powiat,
+        "rok":             rok,
+        "dps_placowki":    placowki,
+        "dps_miejsca":     miejsca,
+        "pop80":           pop80,
+        "pop80_2030":      prognozy[0],
+        "pop80_2035":      prognozy[1],
+        "dostepnosc":      wsk(pop80),
+        "dostepnosc_2030": wsk(prognozy[0]),
+        "dostepnosc_2035": wsk(prognozy[1]),
+        "cena_mediana":    mediana,
+        "cena_srednia":    srednia,
+        "n_cen":           len(prices),
+        "emerytura":       emerytura,
+        "luka":            luka,
+        "zrodla_hash":     sha256(json.dumps(inputs).encode())[:16],
+    }
+
+
+def build_rows(cur, rok: int, cube: gus.PopulationCube, emerytury: dict) -> list[dict]:
+    cur.execute(CAPACITY_SQL)
+    capacity = {(woj, powiat): (n, int(miejsca)) for woj, powiat, n, miejsca in cur.fetchall()}
+
+    cur.execute(PRICES_SQL)
+    prices = defaultdict(list)
+    for woj, powiat, kwota in cur.fetchall():
+        prices[(woj, powiat)].append(float(kwota))
+
+    keys = sorted(set(capacity) | set(cube.index))
+    idx = cube.take(keys)
+    # wektory populacji w kolejności `keys` (NaN → brak danych)
+    pop80 = cube.lookup(cube.pop("80plus", rok), idx)
+    prognozy = [cube.lookup(cube.pop("80plus", r, typ="prognoza"), idx) for r in PROGNOZY]
+
+    def value(x):
+        return None if np.isnan(x) else int(x)
+
+    return [
+        build_row(key, rok, capacity.get(key, (0, 0)), prices.get(key, []),
+                  value(pop80[i]), [value(p[i]) for p in prognozy], emerytury.get(key[0]))
+        for i, key in enumerate(keys)
+    ]
+
+
+# ── zapis ─────────────────────────────────────────────────────────────────────
+
+def refresh(conn, rows: list[dict], rok: int, dry_run: bool = False) -> dict[str, int]:
+    """Zapisuje wiersze o zmienionym odcisku, usuwa powiaty spoza `rows`. Zwraca liczniki."""
+    cur = conn.cursor()
+    cur.execute('SELECT wojewodztwo, powiat, zrodla_hash FROM "PowiatStats" WHERE rok = %s', (rok,))
+    existing = {(woj, powiat): h for woj, powiat, h in cur.fetchall()}
+
+    changed = [r for r in rows if existing.get((r["wojewodztwo"], r["powiat"])) != r["zrodla_hash"]]
+    current = {(r["wojewodztwo"], r["powiat"]) for r in rows}
+    stale = [key for key in existing if key not in current]
+    stats = {
+        "nowe":      sum(1 for r in changed if (r["wojewodztwo"], r["powiat"]) not in existing),
+        "zmienione": sum(1 for r in changed if (r["wojewodztwo"], r["powiat"]) in existing),
+        "bez zmian": len(rows) - len(changed),
+        "usunięte":  len(stale),
+    }
+    if dry_run:
+        cur.close()
+        return stats
+
+    if changed:
+        extras = require("psycopg2.extras", "psycopg2-binary")
+        extras.execute_values(
+            cur, UPSERT_SQL, [tuple(r[c] for c in COLUMNS) for r in changed],
+            template=UPSERT_TEMPLATE, page_size=len(changed),
+        )
+    for woj, powiat in stale:
+        cur.execute('DELETE FROM "PowiatStats" WHERE wojewodztwo = %s AND powiat = %s AND rok = %s',
+                    (woj, powiat, rok))
+    conn.commit()
+    cur.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Odświeżenie tabeli "PowiatStats"')
+    parser.add_argument("--rok", type=int, help="rok populacji GUS (domyślnie najnowszy w danych)")
+    parser.add_argument("--dry-run", action="store_true", help="tylko policz zmiany, bez zapisu")
+    args = parser.parse_args()
+
+    if not DATABASE_URL:
+        print("❌ Brak DATABASE_URL w środowisku!")
+        sys.exit(1)
+
+    cube = gus.load()
+    emerytury = load_emerytury()
+    rok = args.rok or cube.latest_year("80plus")
+    if rok is None:
+        print(f"❌ Brak danych o populacji 80+ ({gus.DATA_DIR / gus.GUS_GLOB})")
+        sys.exit(1)
+    print(f"📊 Populacja GUS: {len(cube)} powiatów, rok {rok}; emerytury: {len(emerytury)} województw")
+
+    psycopg2 = require("psycopg2", "psycopg2-binary")
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        rows = build_rows(conn.cursor(), rok, cube, emerytury)
+        stats = refresh(conn, rows, rok, dry_run=args.dry_run)
+    finally:
+        conn.close()
+
+    counts = ", ".join(f"{k}: {v}" for k, v in stats.items())
+    print(f"{'🔎 (dry-run) ' if args.dry_run else '✅ '}PowiatStats {rok}: {len(rows)} powiatów — {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,20 +9,38 @@ Uruchomienie:
 Wynik:
   raw_dane/utw_malopolska.csv  — dane gotowe do przejrzenia i importu
 
-Restart: skrypt pomija już zapisane URLe — bezpieczne uruchamianie wielokrotne.
+Szczegóły i geocoding to dwa nakładające się etapy: strony szczegółów pobierają
+wątki pod limitem senioralna.malopolska.pl, a gotowe wpisy od razu trafiają do
+geocodera pod osobnym limitem Nominatim (scripts/rate_limit.py) — zamiast
+naprzemiennych `sleep`. Geocoding przez wspólny cache (scripts/geocoder.py).
+
+Ponowne uruchomienie: strony wpisów już zapisanych w CSV pobieramy warunkowo
+(ETag / Last-Modified, a gdy serwer ich nie podaje — porównanie SHA-256 treści,
+raw_dane/.http_cache). Niezmienione wpisy zostają jak są; zmienione są parsowane
+od nowa, a geocodowane tylko wtedy, gdy zmienił się adres. CSV zapisujemy po
+każdym wpisie — przerwany przebieg można wznowić.
+
+  python3 scripts/scrape-utw-malopolska.py --only-new   # tylko wpisy spoza CSV
 """
 
+import argparse
 import csv
+import os
 import random
 import re
 import sys
 import time
-import unicodedata
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 
+from geocoder import Geocoder
+from monitors.http_cache import HttpCache
+from monitors.store import sha256
+from rate_limit import HostLimiter
+
 BASE_URL    = "https://www.senioralna.malopolska.pl"
 LISTING_URL = f"{BASE_URL}/wyszukiwarka-wsparcia-seniorow/"
 OUTPUT_CSV  = Path(__file__).resolve().parent.parent / 'raw_dane' / 'utw_malopolska.csv'
@@ -42,7 +60,15 @@ BROWSER_HEADERS = {
     'sec-ch-ua-platform':      '"macOS"',
 }
 
-NOMINATIM_HEADERS = {'User-Agent': 'geocoder-research/1.0'}
+# Limity per host: (żetony/s, zapas, rozrzut kosztu żetonu).
+# senioralna — średnio 1 strona / 5 s (jak dawne 3–7 s), najwyżej 3 pod rząd;
+# Nominatim ma własny kubełek w scripts/geocoder.py (max 1 zapytanie/s).
+RATE_LIMITS = {
+    'www.senioralna.malopolska.pl': (1 / 5.0, 3, 0.4),
+}
+DETAIL_WORKERS = 2   # pobierania i tak idą w tempie limitu — drugi wątek zasłania czas odpowiedzi
+
+limiter = HostLimiter(RATE_LIMITS)
 
 CSV_FIELDS = [
     'nazwa', 'typ_placowki', 'ulica', 'miejscowosc', 'kod_pocztowy',
@@ -63,24 +89,25 @@ POWIAT_MAP = {
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
-def human_delay():
-    time.sleep(random.uniform(3.0, 7.0))
-
-def long_break():
-    t = random.uniform(15.0, 30.0)
-    print(f"  ☕ przerwa {t:.0f}s...")
-    time.sleep(t)
-
 def normalize_powiat(raw: str) -> str:
     key = raw.strip().lower()
     return POWIAT_MAP.get(key, raw.strip())
 
-def load_done_urls() -> set[str]:
-    """Wczytaj URLe już zapisane w CSV — do pominięcia przy restarcie."""
+def load_saved() -> dict[str, dict]:
+    """Wpisy już zapisane w CSV: {zrodlo_url: wiersz} (kolejność z pliku)."""
     if not OUTPUT_CSV.exists():
-        return set()
+        return {}
     with open(OUTPUT_CSV, newline='', encoding='utf-8') as f:
-        return {row['zrodlo_url'] for row in csv.DictReader(f) if row.get('zrodlo_url')}
+        return {row['zrodlo_url']: row for row in csv.DictReader(f) if row.get('zrodlo_url')}
+
+def save_rows(rows: dict[str, dict]):
+    """Zapis całego CSV przez plik tymczasowy — przerwanie nie zostawia uciętego pliku."""
+    tmp = OUTPUT_CSV.with_suffix('.csv.tmp')
+    with open(tmp, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows.values())
+    os.replace(tmp, OUTPUT_CSV)
 
 
 # ── Krok 1: listing ────────────────────────────────────────────────────────
@@ -88,6 +115,7 @@ def load_done_urls() -> set[str]:
 def fetch_listing(session: requests.Session) -> list[dict]:
     print("📋 Pobieranie listingu...")
     session.headers['Sec-Fetch-Site'] = 'none'  # pierwsze wejście — brak referer
+    limiter.acquire(LISTING_URL)
     r = session.get(LISTING_URL, timeout=15)
     r.raise_for_status()
     soup = BeautifulSoup(r.text, 'html.parser')
@@ -122,21 +150,24 @@ def fetch_listing(session: requests.Session) -> list[dict]:
 
 # ── Krok 2: szczegóły ─────────────────────────────────────────────────────
 
-def fetch_with_retry(session: requests.Session, url: str, max_retries: int = 3) -> requests.Response:
+def fetch_with_retry(cache: HttpCache, url: str, known_hash: str | None = None,
+                     max_retries: int = 3):
+    """Pobranie (warunkowe, gdy znamy hash zapisanej wersji) pod limitem hosta."""
     for attempt in range(1, max_retries + 1):
-        r = session.get(url, timeout=15)
-        if r.status_code == 429:
-            wait = 30 * attempt
-            print(f"  ⏳ 429 rate limit — czekam {wait}s (próba {attempt}/{max_retries})")
-            time.sleep(wait)
-            continue
-        if r.status_code >= 500:
-            wait = 10 * attempt
-            print(f"  ⚠️  {r.status_code} błąd serwera — czekam {wait}s (próba {attempt}/{max_retries})")
-            time.sleep(wait)
-            continue
-        r.raise_for_status()
-        return r
+        limiter.acquire(url)
+        try:
+            return cache.get(url, known_hash=known_hash, timeout=15)
+        except requests.HTTPError as e:
+            status = e.response.status_code
+            if status == 429:
+                pause = 30 * attempt
+                print(f"  ⏳ 429 rate limit — czekam {pause}s (próba {attempt}/{max_retries})")
+            elif status >= 500:
+                pause = 10 * attempt
+                print(f"  ⚠️  {status} błąd serwera — czekam {pause}s (próba {attempt}/{max_retries})")
+            else:
+                raise
+            time.sleep(pause)
     raise RuntimeError(f"Nie udało się pobrać {url} po {max_retries} próbach")
 
 def parse_details(soup) -> dict:
@@ -172,142 +203,135 @@ def parse_address(adres: str | None) -> tuple[str | None, str | None, str | None
     return adres, None, None
 
 
-# ── Krok 3: geocoding ─────────────────────────────────────────────────────
-
-def clean_street(ulica: str) -> str:
-    """Usuwa śmieci z pola ulicy przed geocodingiem."""
-    original = ulica
-    # Jeśli zaczyna się od kodu pocztowego (np. "32-600 Oświęcim, ul. Foo 1")
-    # — wyciągnij ul./al. fragment z oryginału
-    if re.match(r'^\d{2}-\d{3}', ulica.strip()):
-        m = re.search(r'(ul\.|os\.|al\.|pl\.)\s*[\w\s]+\s+[\d\w/]+', ulica, re.IGNORECASE)
-        return m.group(0).strip() if m else ''
-    # Usuń numery pokojów, piętra, opisy
-    ulica = re.sub(r'\s*(pok\.?|pokój|piętro|parter|p\.)\s*[\w\d\-/]*', '', ulica, flags=re.IGNORECASE)
-    # Usuń kody pocztowe w środku/na końcu (np. "ul. Foo 1 32-600 Kraków")
-    ulica = re.sub(r'\s*\d{2}-\d{3}.*$', '', ulica)
-    # Usuń opisy za średnikiem lub w nawiasach
-    ulica = re.sub(r'\s*[;(].*$', '', ulica)
-    # Jeśli nadal jest "Dom Kultury X ul. Foo 1" — wyciągnij ul./al. fragment
-    m = re.search(r'(ul\.|os\.|al\.|pl\.)\s*[\w\s]+\s+[\d\w/]+', ulica, re.IGNORECASE)
-    if m:
-        ulica = m.group(0)
-    return ulica.strip() or original.strip()
-
-def ascii_query(s: str) -> str:
-    """Nominatim nie radzi sobie z polskimi znakami — normalizuj przed zapytaniem."""
-    s = s.replace('ł', 'l').replace('Ł', 'L')
-    return unicodedata.normalize('NFD', s).encode('ascii', 'ignore').decode('ascii')
-
-def geocode(ulica: str | None, miejscowosc: str) -> tuple[float | None, float | None]:
-    time.sleep(1.1)  # Nominatim: max 1 req/s
-    city  = ascii_query(re.sub(r'\s*,.*$', '', miejscowosc).strip())
-    queries = []
-    if ulica:
-        clean = ascii_query(clean_street(ulica))
-        if clean:
-            queries.append(f"{clean}, {city}, Poland")
-    queries.append(f"{city}, Poland")  # fallback
-
-    for query in queries:
-        try:
-            r = requests.get(
-                'https://nominatim.openstreetmap.org/search',
-                params={'q': query, 'format': 'json', 'limit': 1, 'countrycodes': 'pl'},
-                headers=NOMINATIM_HEADERS,
-                timeout=10,
-            )
-            data = r.json()
-            if data:
-                return float(data[0]['lat']), float(data[0]['lon'])
-        except Exception as e:
-            print(f"    ⚠️  geocoding error ({query[:40]}): {e}")
-        time.sleep(1.1)
-
-    return None, None
+# ── Pipeline ──────────────────────────────────────────────────────────────
+
+def fetch_entry(cache: HttpCache, entry: dict, saved: dict | None):
+    """
+    Etap 1 (wątki pod limitem senioralna): strona szczegółów.
+    Zwraca (details, fetch); details = None — wpis bez zmian od zapisu w CSV.
+    """
+    url = entry['url']
+    known = cache.load(url) if saved else None
+    known_hash = known.get('sha256') if known else None
+    try:
+        fetch = fetch_with_retry(cache, url, known_hash)
+    except Exception as e:
+        if saved:
+            print(f"  ❌ błąd pobierania ({entry['nazwa'][:40]}): {e} — zostawiam zapisany wpis")
+            return None, None
+        print(f"  ❌ błąd pobierania ({entry['nazwa'][:40]}): {e}")
+        return {}, None
+    if fetch.not_modified or (known_hash and sha256(fetch.content) == known_hash):
+        return None, fetch
+    return parse_details(BeautifulSoup(fetch.content, 'html.parser')), fetch
+
+def build_row(geo: Geocoder, entry: dict, details: dict,
+              saved: dict | None) -> tuple[dict, bool]:
+    """
+    Etap 2 (jeden wątek pod limitem Nominatim): wiersz CSV.
+    Geocoding (z cache) tylko dla nowego lub zmienionego adresu. Zwraca (wiersz, czy_geocodowano).
+    """
+    ulica, kod_pocztowy, miasto_z_adresu = parse_address(details.get('adres'))
+    miejscowosc = miasto_z_adresu or entry['miejscowosc']
+
+    if saved and saved['latitude'] and (saved['ulica'], saved['miejscowosc']) == (ulica or '', miejscowosc):
+        lat, lon, geocoded = saved['latitude'], saved['longitude'], False
+    else:
+        lat, lon = geo.geocode(ulica, miejscowosc, region='małopolskie')
+        geocoded = True
+
+    row = {
+        'nazwa':        entry['nazwa'],
+        'typ_placowki': 'UTW',
+        'ulica':        ulica        or '',
+        'miejscowosc':  miejscowosc,
+        'kod_pocztowy': kod_pocztowy or '',
+        'powiat':       entry['powiat'],
+        'wojewodztwo':  'małopolskie',
+        'telefon':      details.get('telefon') or '',
+        'email':        details.get('email')   or '',
+        'strona_www':   details.get('strona_www') or '',
+        'latitude':     lat or '',
+        'longitude':    lon or '',
+        'zrodlo_url':   entry['url'],
+    }
+    return row, geocoded
 
 
 # ── Main ───────────────────────────────────────────────────────────────────
 
 def main():
+    parser = argparse.ArgumentParser(description="Scraper UTW z senioralna.malopolska.pl")
+    parser.add_argument('--only-new', action='store_true',
+                        help="pomiń wpisy zapisane w CSV (bez sprawdzania zmian)")
+    args = parser.parse_args()
+
     OUTPUT_CSV.parent.mkdir(parents=True, exist_ok=True)
 
     # Sesja wspólna dla całego scrapingu (cookies, keep-alive)
     session = requests.Session()
     session.headers.update(BROWSER_HEADERS)
+    geo = Geocoder()
+    cache = HttpCache(session)
 
-    utw_list  = fetch_listing(session)
-    done_urls = load_done_urls()
+    utw_list = fetch_listing(session)
+    rows     = load_saved()
 
-    todo = [e for e in utw_list if e['url'] not in done_urls]
+    todo = [e for e in utw_list if not (args.only_new and e['url'] in rows)]
     if not todo:
         print("✅ Wszystkie UTW już zapisane w CSV.")
         return
 
-    if done_urls:
-        print(f"  ↩️  Wznawianie — pominięto {len(done_urls)} już zapisanych, pozostało {len(todo)}")
+    if rows:
+        new = sum(1 for e in todo if e['url'] not in rows)
+        print(f"  ↩️  W CSV: {len(rows)} — nowych: {new}, do sprawdzenia zmian: {len(todo) - new}")
 
     random.shuffle(todo)
 
-    # Otwórz CSV w trybie append — zapis po każdym wpisie
-    is_new = not OUTPUT_CSV.exists() or OUTPUT_CSV.stat().st_size == 0
-    with open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-        if is_new:
-            writer.writeheader()
-
-        for i, entry in enumerate(todo, 1):
-            print(f"\n[{i}/{len(todo)}] {entry['nazwa'][:60]}")
-
-            if i > 1 and (i - 1) % 10 == 0:
-                long_break()
-
-            human_delay()
-
-            # Pobierz szczegóły
-            details = {}
-            try:
-                session.headers['Referer']       = LISTING_URL
-                session.headers['Sec-Fetch-Site'] = 'same-origin'  # klik z listingu
-                r = fetch_with_retry(session, entry['url'])
-                soup = BeautifulSoup(r.text, 'html.parser')
-                details = parse_details(soup)
-            except Exception as e:
-                print(f"  ❌ błąd pobierania: {e}")
-
-            ulica, kod_pocztowy, miasto_z_adresu = parse_address(details.get('adres'))
-            miejscowosc = miasto_z_adresu or entry['miejscowosc']
-
-            print(f"  ulica: {ulica} | miasto: {miejscowosc} | tel: {details.get('telefon')}")
-
-            # Geocoding (bez dodatkowego human_delay — geocode() ma własny sleep)
-            lat, lon = geocode(ulica, miejscowosc)
-            print(f"  geo: {lat:.4f}, {lon:.4f}" if lat else "  ⚠️  brak geolokalizacji")
-
-            row = {
-                'nazwa':        entry['nazwa'],
-                'typ_placowki': 'UTW',
-                'ulica':        ulica        or '',
-                'miejscowosc':  miejscowosc,
-                'kod_pocztowy': kod_pocztowy or '',
-                'powiat':       entry['powiat'],
-                'wojewodztwo':  'małopolskie',
-                'telefon':      details.get('telefon') or '',
-                'email':        details.get('email')   or '',
-                'strona_www':   details.get('strona_www') or '',
-                'latitude':     lat or '',
-                'longitude':    lon or '',
-                'zrodlo_url':   entry['url'],
-            }
-            writer.writerow(row)
-            f.flush()  # zapisz natychmiast na dysk
-
-    # Podsumowanie
-    with open(OUTPUT_CSV, newline='', encoding='utf-8') as f:
-        all_rows = list(csv.DictReader(f))
-
+    # wszystkie strony szczegółów to klik z listingu
+    session.headers['Referer']        = LISTING_URL
+    session.headers['Sec-Fetch-Site'] = 'same-origin'
+
+    stats = {'nowe': 0, 'zmienione': 0, 'bez zmian': 0, 'geocodowane': 0}
+    start = time.monotonic()
+    with ThreadPoolExecutor(DETAIL_WORKERS) as fetchers, ThreadPoolExecutor(1) as geocoder:
+        pending = {fetchers.submit(fetch_entry, cache, e, rows.get(e['url'])): ('fetch', e, None)
+                   for e in todo}
+        done_count = 0
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                stage, entry, fetch = pending.pop(fut)
+                saved = rows.get(entry['url'])
+
+                if stage == 'fetch':
+                    details, fetch = fut.result()
+                    if details is None:
+                        stats['bez zmian'] += 1
+                        done_count += 1
+                        continue
+                    pending[geocoder.submit(build_row, geo, entry, details, saved)] = ('geo', entry, fetch)
+                    continue
+
+                row, geocoded = fut.result()
+                rows[entry['url']] = row
+                save_rows(rows)   # zapisz natychmiast na dysk
+                if fetch is not None:
+                    cache.commit(fetch, always=True)
+                stats['zmienione' if saved else 'nowe'] += 1
+                stats['geocodowane'] += geocoded
+                done_count += 1
+
+                coords = f"{float(row['latitude']):.4f}, {float(row['longitude']):.4f}" if row['latitude'] else "⚠️  brak"
+                print(f"[{done_count}/{len(todo)}] {'🔄' if saved else '🆕'} {entry['nazwa'][:60]}")
+                print(f"  ulica: {row['ulica']} | miasto: {row['miejscowosc']} | tel: {row['telefon']} | geo: {coords}")
+
+    all_rows = list(rows.values())
     print(f"\n{'='*60}")
-    print(f"✅ CSV: {len(all_rows)} UTW w {OUTPUT_CSV.name}")
+    print(f"✅ CSV: {len(all_rows)} UTW w {OUTPUT_CSV.name} ({time.monotonic() - start:.0f}s)")
+    print(f"   Nowe: {stats['nowe']} | zmienione: {stats['zmienione']} | bez zmian: {stats['bez zmian']}"
+          f" | geocodowane: {stats['geocodowane']}"
+          f" (z cache: {geo.stats['cache']}, zapytania Nominatim: {geo.stats['zapytania']})")
     print(f"   Geolokalizacja: {sum(1 for r in all_rows if r['latitude'])}/{len(all_rows)}")
     print(f"   Telefon:        {sum(1 for r in all_rows if r['telefon'])}/{len(all_rows)}")
     print(f"   Email:          {sum(1 for r in all_rows if r['email'])}/{len(all_rows)}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testy FacilityMatcher.match_address (scripts/facility_matcher.py).
+
+Uruchom: python -m pytest scripts/test_facility_matcher.py
+         python scripts/test_facility_matcher.py
+"""
+
+from facility_matcher import FacilityMatcher
+from localities import norm_unit
+
+ROWS = [
+    {"id": 1, "nazwa": "Dom Pomocy Społecznej", "powiat": "m. Tarnów", "ulica": "ul. Kościuszki 5"},
+    {"id": 2, "nazwa": "Dom Pomocy Społecznej im. Jana Pawła II", "powiat": "wadowicki",
+     "ulica": "ul. Wojska Polskiego 12"},
+    {"id": 3, "nazwa": "Dom Pomocy Społecznej w Andrychowie", "powiat": "wadowicki",
+     "ulica": "ul. Krakowska 40"},
+]
+
+
+def in_powiat(powiat):
+    return lambda row: norm_unit(row["powiat"]) == norm_unit(powiat)
+
+
+def test_address_in_other_powiat_is_not_a_match():
+    matcher = FacilityMatcher([dict(r) for r in ROWS])
+    row, score = matcher.match_address("Dom Pomocy Społecznej", "ul. Kościuszki 5 34-100 Wadowice",
+                                       accept=in_powiat("wadowicki"))
+    # ta sama ulica i numer, ale w Tarnowie — dalej po nazwie, a ta jest w powiecie dwa razy
+    assert row is None or row["id"] != 1
+    assert score < 1.0
+
+
+def test_address_in_same_powiat_matches():
+    matcher = FacilityMatcher([dict(r) for r in ROWS])
+    row, score = matcher.match_address("Dom Pomocy Społecznej", "ul. Kościuszki 5 33-100 Tarnów",
+                                       accept=in_powiat("m. Tarnów"))
+    assert row["id"] == 1 and score == 1.0
+
+
+def test_address_without_filter_matches():
+    matcher = FacilityMatcher([dict(r) for r in ROWS])
+    row, score = matcher.match_address("DPS", "ul. Krakowska 40 34-120 Andrychów")
+    assert row["id"] == 3 and score == 1.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Testy warunkowego pobierania (scripts/monitors/http_cache.py) na lokalnym
+serwerze-atrapie: ETag przy 200, 304 na pasujące If-None-Match.
+
+Uruchom: python -m pytest scripts/test_http_cache.py
+         python scripts/test_http_cache.py
+"""
+
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from monitors.core import Monitor, MonitorError
+from monitors.http_cache import HttpCache
+from monitors.store import Store
+
+BODY = b"wolne miejsca v1"
+ETAG = '"v1"'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests_seen: list[dict] = []
+
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def stub_server():
+    StubHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/plik.xlsx", StubHandler.requests_seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def session() -> requests.Session:
+    s = requests.Session()
+    s.trust_env = False   # bez proxy z otoczenia — serwer jest lokalny
+    return s
+
+
+def sent_validator(seen: list[dict]) -> bool:
+    return "If-None-Match" in seen[-1]
+
+
+# ── HttpCache ────────────────────────────────────────────────────────────────
+
+def test_validators_only_for_matching_sentinel():
+    with stub_server() as (url, seen), tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(session(), root=Path(tmp))
+        first = cache.get(url)
+        assert first.status == 200 and first.content == BODY and not sent_validator(seen)
+        cache.commit(first)
+
+        digest = hashlib.sha256(BODY).hexdigest()
+        # brak sentinela / sentinel innej wersji — 304 znaczyłby „bez zmian” względem pliku, którego nie mamy
+        for known in (None, "0123456789ab"):
+            fetch = cache.get(url, known_hash=known)
+            assert fetch.status == 200 and not sent_validator(seen)
+
+        fetch = cache.get(url, known_hash=digest[:12])
+        assert sent_validator(seen) and fetch.not_modified and fetch.content is None
+
+        fetch = cache.get(url, known_hash=digest, force=True)
+        assert fetch.status == 200 and not sent_validator(seen)
+
+
+def test_no_validators_without_commit():
+    with stub_server() as (url, seen), tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(session(), root=Path(tmp))
+        cache.get(url)
+        fetch = cache.get(url, known_hash=hashlib.sha256(BODY).hexdigest())
+        assert fetch.status == 200 and not sent_validator(seen)
+
+
+# ── Monitor: commit dopiero po przetworzeniu ─────────────────────────────────
+
+class StubMonitor(Monitor):
+    name = "stub"
+    region = "Atrapa"
+    file_pattern = "wolne_miejsca_{date}.xlsx"
+    month_name = None
+
+    def __init__(self, url: str, tmp: Path, fail: bool = False):
+        super().__init__(session())
+        self.url = url
+        self.tmp = tmp
+        self.fail = fail
+        self.cache = HttpCache(self.session, root=tmp / ".http_cache")
+        self.store = Store(tmp / ".store")
+        self.issues = []
+
+    @property
+    def raw_dir(self) -> Path:
+        return self.tmp / "raw"
+
+    def parse(self, data: bytes) -> dict:
+        if self.fail:
+            raise ValueError("zły format")
+        return {"bajty": len(data)}
+
+    def build_report(self, parsed: dict, is_new: bool, url: str, h: str, path: Path) -> str:
+        return ""
+
+    def issue(self, title: str, body: str, auto_close: bool = False, labels=None):
+        self.issues.append(title)
+
+
+def test_commit_after_successful_processing():
+    with stub_server() as (url, seen), tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        monitor = StubMonitor(url, tmp)
+        monitor.check()
+        assert monitor.cache.load(url)["etag"] == ETAG
+
+        again = StubMonitor(url, tmp)
+        again.check()
+        assert sent_validator(seen)
+        assert "brak nowego pliku" in again.issues[-1]
+
+
+def test_no_commit_when_processing_fails():
+    with stub_server() as (url, seen), tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        monitor = StubMonitor(url, tmp, fail=True)
+        try:
+            monitor.check()
+        except MonitorError as e:
+            assert "błąd parsowania" in e.title
+        else:
+            raise AssertionError("oczekiwano MonitorError")
+        assert monitor.cache.load(url) is None
+
+        # sentinel już wskazuje ten plik, ale bez wpisu w cache walidatorów nie wysyłamy
+        StubMonitor(url, tmp).check()
+        assert not sent_validator(seen)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Testy split_nazwa_adres (scripts/koszty_dps.py) — komórki „nazwa i adres” z PDF.
+
+Uruchom: python -m pytest scripts/test_koszty_dps.py
+         python scripts/test_koszty_dps.py
+"""
+
+from koszty_dps import split_nazwa_adres
+
+
+def test_street_line_starts_address():
+    assert split_nazwa_adres(["Dom Pomocy Społecznej", "ul. Karolina 14G", "32-700 Bochnia"]) == \
+        ("Dom Pomocy Społecznej", "ul. Karolina 14G 32-700 Bochnia")
+
+
+def test_locality_line_before_postal_code_is_address():
+    assert split_nazwa_adres(["Dom Pomocy Społecznej", "w Ojcowie", "Ojców Nr 64", "32-045 Sułoszowa"]) == \
+        ("Dom Pomocy Społecznej w Ojcowie", "Ojców Nr 64 32-045 Sułoszowa")
+
+
+def test_locality_tail_of_name_line_is_address():
+    # l.p. 11 w PDF 2025 — miejscowość z numerem doklejona do „w Wapiennem”
+    assert split_nazwa_adres(["Dom Pomocy Społecznej", "w Wapiennem Wapienne 70", "38-307 Sękowa"]) == \
+        ("Dom Pomocy Społecznej w Wapiennem", "Wapienne 70 38-307 Sękowa")
+
+
+def test_postal_code_only():
+    assert split_nazwa_adres(["Dom Pomocy Społecznej Nr 5", "33-300 Nowy Sącz"]) == \
+        ("Dom Pomocy Społecznej Nr 5", "33-300 Nowy Sącz")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Testy upsert_records (scripts/monitors/vacancies.py) — na atrapie połączenia,
+bez Postgresa. Atrapa kursora liczy wywołania `execute` i odpowiada jak
+RETURNING (xmax = 0): (True,) dla nowego klucza, (False,) dla istniejącego.
+
+Uruchom: python -m pytest scripts/test_vacancies.py
+         python scripts/test_vacancies.py
+"""
+
+import datetime
+
+from monitors.vacancies import upsert_records
+
+DZIEN = datetime.date(2026, 6, 1)
+
+
+class FakeConnection:
+    encoding = "UTF8"
+
+    def __init__(self, existing=()):
+        self.table = {rec[:3]: rec for rec in existing}   # (placowkaId, data_stanu, typ_opieki) → rekord
+        self.statements = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection):
+        self.connection = conn
+        self.pending = []
+        self.rows = []
+
+    def mogrify(self, template, args) -> bytes:
+        self.pending.append(args)
+        return repr(args).encode()
+
+    def execute(self, sql):
+        self.connection.statements += 1
+        keys = [args[:3] for args in self.pending]
+        if len(set(keys)) != len(keys):
+            raise AssertionError("ON CONFLICT DO UPDATE command cannot affect row a second time")
+        self.rows = [(key not in self.connection.table,) for key in keys]
+        for args in self.pending:
+            self.connection.table[args[:3]] = args
+        self.pending = []
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+def record(placowka_id, typ="stały", wolne=0):
+    return (placowka_id, DZIEN, typ, 100, wolne, None, None, None, None)
+
+
+def test_one_statement_for_all_records():
+    conn = FakeConnection()
+    records = [record(i) for i in range(1, 251)]
+    assert upsert_records(conn, records) == (250, 0)
+    assert conn.statements == 1
+
+
+def test_duplicate_key_last_wins():
+    conn = FakeConnection()
+    records = [record(1, wolne=3), record(2), record(1, wolne=7), record(1, typ="dzienny")]
+    assert upsert_records(conn, records) == (3, 0)
+    assert conn.statements == 1
+    assert conn.table[(1, DZIEN, "stały")][4] == 7
+
+
+def test_inserted_and_updated_counts():
+    conn = FakeConnection(existing=[record(1), record(2)])
+    records = [record(1, wolne=5), record(2, wolne=6), record(3), record(3, wolne=1)]
+    assert upsert_records(conn, records) == (1, 2)
+    assert conn.statements == 1
+    assert conn.table[(3, DZIEN, "stały")][4] == 1
+
+
+def test_no_records_no_statement():
+    conn = FakeConnection()
+    assert upsert_records(conn, []) == (0, 0)
+    assert conn.statements == 0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✅ {name}")
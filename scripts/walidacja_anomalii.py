@@ -1,87 +1,255 @@
-import pandas as pd
+"""
+Walidacja cen placówek — odporne statystyki (mediana / MAD) zamiast stałych progów.
+
+Dwa tryby:
+
+  python scripts/walidacja_anomalii.py                   # CSV z parsera PDF (jak dotąd)
+  DATABASE_URL=... python scripts/walidacja_anomalii.py --db [--dry-run]
+      # cała historia "PlacowkaCena" (wszystkie lata, cały kraj) jednym zapytaniem
+
+Zamiast średniej ± 30% w obrębie typu opieki z jednego pliku:
+
+  - ceny grupujemy po (typ placówki, województwo, powiat, rok, typ kosztu);
+    gdy w powiecie jest mniej niż `MIN_GROUP` cen, bierzemy szerszą grupę
+    (województwo, potem cały kraj) — wszystko przez `groupby().transform`
+    na całej tabeli naraz, bez `apply` po wierszach,
+  - odchylenie to odporny z-score: (cena − mediana) / (1,4826 · MAD), a MAD
+    ma dolną granicę `MIN_REL_SCALE` mediany, żeby grupa identycznych cen
+    nie flagowała każdej złotówki różnicy,
+  - skok rok do roku liczymy per placówka i typ kosztu (posortowane
+    tablice NumPy, bez pętli) — flagą jest zmiana większa niż `MAX_YOY`
+    na rok,
+  - flagi (`ZAKRES`, `ODCHYLENIE`, `SKOK_RDR`) trafiają do
+    "PlacowkaCena".anomalia jednym UPDATE … FROM (VALUES …), tylko dla
+    wierszy, w których się zmieniły. NULL = cena bez zastrzeżeń.
+"""
+
+import sys
 import csv
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from monitors.core import DATABASE_URL, require
 
 # --- STAŁE KONFIGURACYJNE ---
-# Upewnij się, że ta nazwa pasuje do pliku CSV z 76 rekordami
-INPUT_FILE_CSV = "dane_malopolska_2025_OCZYSZCZONE.csv" 
+# Tryb CSV: wynik parsera PDF Małopolski (76 rekordów)
+INPUT_FILE_CSV = "dane_malopolska_2025_OCZYSZCZONE.csv"
 # Ostateczny plik, który będzie Twoim Wzorcem (Blueprint)
-OUTPUT_FILE_CSV_VALIDATED = "dane_malopolska_2025_WALIDOWANE_ANOMALIE.csv" 
+OUTPUT_FILE_CSV_VALIDATED = "dane_malopolska_2025_WALIDOWANE_ANOMALIE.csv"
 DELIMITER = ';'
 
-# Parametry walidacji (możesz je dostosować po analizie)
-# 1. Twarde granice: Zbyt niskie/wysokie ceny (w zł)
-MIN_PRICE_THRESHOLD = 4000.00 
-MAX_PRICE_THRESHOLD = 12000.00 
-# 2. Statystyczne odchylenie: Cena jest podejrzana, jeśli odbiega o więcej niż 30% od średniej dla swojego typu opieki
-DEVIATION_THRESHOLD = 0.30 
+# Twarde granice (zł / miesiąc): CSV — DPS w Małopolsce, baza — cały kraj, wszystkie typy
+MIN_PRICE_THRESHOLD = 4000.00
+MAX_PRICE_THRESHOLD = 12000.00
+KWOTA_RANGE = (1000.00, 30000.00)
+
+# Odporny z-score (Iglewicz–Hoaglin: |z| > 3,5 → obserwacja odstająca)
+Z_THRESHOLD   = 3.5
+MAD_SCALE     = 1.4826      # MAD → odchylenie standardowe dla rozkładu normalnego
+MIN_REL_SCALE = 0.05        # skala nie mniejsza niż 5% mediany grupy
+MIN_GROUP     = 5           # mniej cen w grupie → statystyki z grupy nadrzędnej
+
+# Skok rok do roku: więcej niż +35% (albo odpowiednio w dół) na rok
+MAX_YOY = 0.35
+
+# Poziomy grupowania od najwęższego; ostatni używany zawsze
+DB_LEVELS = [
+    ["typ_placowki", "wojewodztwo", "powiat", "rok", "typ_kosztu"],
+    ["typ_placowki", "wojewodztwo", "rok", "typ_kosztu"],
+    ["typ_placowki", "rok", "typ_kosztu"],
+]
+
+PRICES_SQL = """
+    SELECT pc.id, pc."placowkaId", pc.rok, pc.kwota, pc.typ_kosztu, pc.anomalia,
+           p.typ_placowki, LOWER(TRIM(p.wojewodztwo)), TRIM(p.powiat)
+    FROM "PlacowkaCena" pc
+    JOIN "Placowka" p ON p.id = pc."placowkaId"
+"""
+PRICE_COLUMNS = ["id", "placowkaId", "rok", "kwota", "typ_kosztu", "anomalia",
+                 "typ_placowki", "wojewodztwo", "powiat"]
+
+UPDATE_SQL = """
+    UPDATE "PlacowkaCena" AS pc
+    SET anomalia = v.anomalia
+    FROM (VALUES %s) AS v(id, anomalia)
+    WHERE pc.id = v.id
+"""
 
-# --- LOGIKA WALIDACJI ---
+FLAGS = ("ZAKRES", "ODCHYLENIE", "SKOK_RDR")
+
+
+# --- STATYSTYKI ---
+
+def robust_z(df: pd.DataFrame, levels: list[list[str]], value: str = "kwota") -> np.ndarray:
+    """
+    Odporny z-score każdej ceny względem mediany jej grupy. Grupa to pierwszy
+    poziom z `levels`, w którym jest co najmniej MIN_GROUP cen (ostatni — zawsze).
+    """
+    x = df[value].to_numpy(dtype=float)
+    median = np.full(len(df), np.nan)
+    mad = np.full(len(df), np.nan)
+    for i, cols in enumerate(levels):
+        codes = df.groupby(cols, sort=False, dropna=False).ngroup().to_numpy()
+        values = pd.Series(x)
+        med = values.groupby(codes).transform("median").to_numpy()
+        dev = (values - med).abs().groupby(codes).transform("median").to_numpy()
+        size = np.bincount(codes)[codes]
+        take = np.isnan(median) & ((size >= MIN_GROUP) | (i == len(levels) - 1))
+        median[take] = med[take]
+        mad[take] = dev[take]
+    scale = np.maximum(MAD_SCALE * mad, MIN_REL_SCALE * np.abs(median))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(scale > 0, (x - median) / scale, 0.0)
+
+
+def yoy_jumps(df: pd.DataFrame, keys: list[str], year: str = "rok", value: str = "kwota") -> np.ndarray:
+    """Cena zmieniła się o więcej niż MAX_YOY na rok względem poprzedniego roku tej samej placówki."""
+    order = np.lexsort([df[year].to_numpy()] + [df[k].to_numpy() for k in reversed(keys)])
+    codes = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()[order]
+    x = df[value].to_numpy(dtype=float)[order]
+    years = df[year].to_numpy()[order]
+
+    same = codes[1:] == codes[:-1]
+    gap = np.maximum(years[1:] - years[:-1], 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.abs(np.log(x[1:] / x[:-1]))
+    jump = same & (x[:-1] > 0) & (change > gap * np.log1p(MAX_YOY))
+
+    result = np.zeros(len(df), dtype=bool)
+    result[order[1:][jump]] = True
+    return result
+
+
+def flag_prices(df: pd.DataFrame, levels: list[list[str]], price_range: tuple[float, float],
+                history_keys: list[str] | None = None) -> pd.Series:
+    """Flagi per wiersz ("ZAKRES,SKOK_RDR"…) albo None, gdy cena bez zastrzeżeń."""
+    x = df["kwota"].to_numpy(dtype=float)
+    masks = {
+        "ZAKRES":     (x < price_range[0]) | (x > price_range[1]),
+        "ODCHYLENIE": np.abs(robust_z(df, levels)) > Z_THRESHOLD,
+        "SKOK_RDR":   yoy_jumps(df, history_keys) if history_keys else np.zeros(len(df), dtype=bool),
+    }
+    flags = np.full(len(df), "", dtype=object)
+    for name in FLAGS:
+        flags = np.where(masks[name], np.where(flags == "", name, flags + "," + name), flags)
+    return pd.Series(np.where(flags == "", None, flags), index=df.index, dtype=object)
+
+
+# --- TRYB CSV ---
 
 def validate_prices(df: pd.DataFrame) -> pd.DataFrame:
-    """Sprawdza ceny pod kątem anomalii i dodaje kolumnę walidacyjną."""
-    
-    # Inicjalizacja statusu dla wszystkich rekordów
-    df['Status_Weryfikacji'] = 'OK'
-    
-    # Krok 1: Walidacja twardego zakresu (np. 1 zł lub 50000 zł)
-    df.loc[
-        (df['Cena_Num'] < MIN_PRICE_THRESHOLD) | 
-        (df['Cena_Num'] > MAX_PRICE_THRESHOLD), 
-        'Status_Weryfikacji'
-    ] = 'ANOMALIA_CENA_ZAKRES'
-
-    # Krok 2: Walidacja statystyczna (na podstawie Typu Opieki)
-    
-    # 1. Obliczanie statystyk (średnia i odchylenie) dla każdego Typu Opieki
-    stats = df.groupby('Typ_Opieki')['Cena_Num'].agg(['mean', 'std']).reset_index()
-    stats.columns = ['Typ_Opieki', 'Cena_Srednia_Typ', 'Cena_Std_Typ']
-    
-    # 2. Łączenie statystyk
-    df = pd.merge(df, stats, on='Typ_Opieki', how='left')
-    
-    # 3. Obliczanie progu odchylenia (np. Średnia +/- 30%)
-    df['Cena_Gorna_Granica'] = df['Cena_Srednia_Typ'] * (1 + DEVIATION_THRESHOLD)
-    df['Cena_Dolna_Granica'] = df['Cena_Srednia_Typ'] * (1 - DEVIATION_THRESHOLD)
-
-    # 4. Flagowanie anomalii statystycznej (tylko tych, które przeszły Krok 1)
-    df.loc[
-        (df['Status_Weryfikacji'] == 'OK') & 
-        ((df['Cena_Num'] < df['Cena_Dolna_Granica']) | 
-         (df['Cena_Num'] > df['Cena_Gorna_Granica'])), 
-        'Status_Weryfikacji'
-    ] = 'ANOMALIA_CENA_STATYSTYCZNA'
-
-    # Usuń kolumny pomocnicze przed zapisem
-    df = df.drop(columns=['Cena_Srednia_Typ', 'Cena_Std_Typ', 'Cena_Gorna_Granica', 'Cena_Dolna_Granica'])
+    """Sprawdza ceny z CSV parsera pod kątem anomalii i dodaje kolumnę walidacyjną."""
+    prices = pd.DataFrame({
+        "kwota": df["Cena_Num"],
+        "typ":   df["Typ_Opieki"].astype(str).str.split().str.join(" "),
+        "rok":   df["Rok_Danych"],
+    })
+    flags = flag_prices(prices, [["typ", "rok"], ["rok"]], (MIN_PRICE_THRESHOLD, MAX_PRICE_THRESHOLD))
 
+    df['Status_Weryfikacji'] = 'OK'
+    df.loc[flags.str.contains("ODCHYLENIE", na=False), 'Status_Weryfikacji'] = 'ANOMALIA_CENA_STATYSTYCZNA'
+    df.loc[flags.str.contains("ZAKRES", na=False), 'Status_Weryfikacji'] = 'ANOMALIA_CENA_ZAKRES'
     return df
 
-# --- URUCHOMIENIE SKRYPTU ---
-if __name__ == "__main__":
-    
+
+def run_csv():
     print("--- Moduł 3: Uruchamianie Walidacji Anomali Ceny ---")
-    
+
     try:
         df_input = pd.read_csv(INPUT_FILE_CSV, sep=DELIMITER)
     except FileNotFoundError:
         print(f"BŁĄD: Plik wejściowy {INPUT_FILE_CSV} nie znaleziony. Upewnij się, że plik z 76 rekordami jest na miejscu.")
-        exit()
-    
+        sys.exit(1)
+
     # Walidacja
     df_validated = validate_prices(df_input)
-    
+
     # Eksport
     df_validated.to_csv(OUTPUT_FILE_CSV_VALIDATED, sep=DELIMITER, index=False, quoting=csv.QUOTE_MINIMAL)
-    
+
     anomalies = df_validated[df_validated['Status_Weryfikacji'].str.contains('ANOMALIA')]
-    
+
     print(f"\n✅ SUKCES: Walidacja zakończona. {len(df_validated)} rekordów przetworzono.")
     print(f"Znaleziono {len(anomalies)} rekordów oznaczonych jako ANOMALIA.")
     print(f"Plik Blueprint/Wzorzec: {OUTPUT_FILE_CSV_VALIDATED}")
-    
+
     # Weryfikacja anomalii
     print("\n--- Rekordy wymagające ręcznej weryfikacji (TOP 10) ---")
     if not anomalies.empty:
-        print(anomalies[['Powiat', 'Nazwa_Placowki', 'Typ_Opieki', 'Cena_Num', 'Status_Weryfikacji']].head(10).to_markdown(index=False, numalign="left", stralign="left"))
+        print(anomalies[['Powiat', 'Nazwa_Placowki', 'Cena_Num', 'Status_Weryfikacji']].head(10).to_string(index=False))
+    else:
+        print("Brak anomalii w tych 76 rekordach!")
+
+
+# --- TRYB BAZY ---
+
+def load_prices(cur) -> pd.DataFrame:
+    cur.execute(PRICES_SQL)
+    df = pd.DataFrame(cur.fetchall(), columns=PRICE_COLUMNS)
+    df["kwota"] = df["kwota"].astype(float)
+    return df
+
+
+def validate_history(df: pd.DataFrame) -> pd.Series:
+    """Flagi dla całej historii cen (wszystkie lata, wszystkie województwa)."""
+    return flag_prices(df, DB_LEVELS, KWOTA_RANGE, history_keys=["placowkaId", "typ_kosztu"])
+
+
+def write_flags(conn, df: pd.DataFrame, flags: pd.Series, dry_run: bool = False) -> int:
+    """Zapisuje flagi tylko tam, gdzie się zmieniły. Zwraca liczbę zmienionych wierszy."""
+    changed = df["anomalia"].fillna("").to_numpy() != flags.fillna("").to_numpy()
+    values = list(zip(df.loc[changed, "id"].astype(int), flags[changed]))
+    if values and not dry_run:
+        extras = require("psycopg2.extras", "psycopg2-binary")
+        cur = conn.cursor()
+        extras.execute_values(cur, UPDATE_SQL, values, template="(%s, %s::text)", page_size=len(values))
+        conn.commit()
+        cur.close()
+    return len(values)
+
+
+def run_db(dry_run: bool):
+    if not DATABASE_URL:
+        print("❌ Brak DATABASE_URL w środowisku!")
+        sys.exit(1)
+
+    psycopg2 = require("psycopg2", "psycopg2-binary")
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        start = time.perf_counter()
+        df = load_prices(conn.cursor())
+        loaded = time.perf_counter()
+        flags = validate_history(df)
+        validated = time.perf_counter()
+        changed = write_flags(conn, df, flags, dry_run=dry_run)
+    finally:
+        conn.close()
+
+    print(f"📊 PlacowkaCena: {len(df)} cen, {df['placowkaId'].nunique()} placówek, "
+          f"lata {df['rok'].min()}–{df['rok'].max()} "
+          f"(odczyt {loaded - start:.2f} s, walidacja {validated - loaded:.2f} s)")
+    for name in FLAGS:
+        print(f"   {name:11} {int(flags.str.contains(name, na=False).sum()):>6}")
+    print(f"{'🔎 (dry-run) ' if dry_run else '✅ '}Zmienione flagi: {changed}")
+
+    flagged = df[flags.notna()].assign(flagi=flags[flags.notna()])
+    if not flagged.empty:
+        print("\n--- Ceny do ręcznej weryfikacji (TOP 20) ---")
+        cols = ["id", "placowkaId", "wojewodztwo", "powiat", "typ_placowki", "rok", "typ_kosztu", "kwota", "flagi"]
+        print(flagged.sort_values(["wojewodztwo", "powiat", "placowkaId", "rok"])[cols].head(20).to_string(index=False))
+
+
+# --- URUCHOMIENIE SKRYPTU ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Walidacja anomalii cen placówek")
+    parser.add_argument("--db", action="store_true", help='cała historia "PlacowkaCena" z bazy')
+    parser.add_argument("--dry-run", action="store_true", help="tylko policz zmiany flag, bez zapisu")
+    args = parser.parse_args()
+
+    if args.db:
+        run_db(args.dry_run)
     else:
-        print("Brak anomalii w tych 76 rekordach!")
\ No newline at end of file
+        run_csv()